@@ -0,0 +1,5 @@
+"""Benchmarks for the SDF-WoT-Converter.
+
+The individual benchmarks are meant to be run as modules from the repository root,
+e.g. ``python -m benchmarks.import_time``.
+"""
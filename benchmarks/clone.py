@@ -0,0 +1,97 @@
+"""Measures the cost of copying input documents before converting them.
+
+A Thing Description with the given number of properties is copied with
+copy.deepcopy() and with clone_json(), and converted to a Thing Model with and
+without copying the input first.
+"""
+
+import argparse
+import copy
+import json
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+from sdf_wot_converter import convert_wot_td_to_wot_tm
+from sdf_wot_converter.converters.utility import clone_json
+
+
+def _thing_description(affordances: int) -> Dict:
+    properties = {
+        f"property{index}": {
+            "type": "object",
+            "properties": {
+                "value": {"type": "number", "minimum": 0, "maximum": 100},
+                "unit": {"type": "string", "enum": ["percent", "ratio"]},
+            },
+            "forms": [{"href": f"https://example.org/properties/{index}"}],
+        }
+        for index in range(affordances)
+    }
+    return {
+        "@context": "https://www.w3.org/2022/wot/td/v1.1",
+        "title": "Benchmark Thing",
+        "securityDefinitions": {"nosec_sc": {"scheme": "nosec"}},
+        "security": "nosec_sc",
+        "properties": properties,
+    }
+
+
+def _median_time(function: Callable, repeat: int) -> float:
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def measure(affordances: int, repeat: int):
+    thing_description = _thing_description(affordances)
+    variants = {
+        "copy.deepcopy": lambda: copy.deepcopy(thing_description),
+        "clone_json": lambda: clone_json(thing_description),
+        "convert_wot_td_to_wot_tm, copy_input=True": (
+            lambda: convert_wot_td_to_wot_tm(thing_description, validation="none")
+        ),
+        "convert_wot_td_to_wot_tm, copy_input=False": (
+            lambda: convert_wot_td_to_wot_tm(
+                thing_description, validation="none", copy_input=False
+            )
+        ),
+    }
+
+    return [
+        {
+            "variant": variant,
+            "affordances": affordances,
+            "seconds": _median_time(function, repeat),
+        }
+        for variant, function in variants.items()
+    ]
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--affordances", type=int, default=1000)
+    parser.add_argument(
+        "--json", action="store_true", help="Print the results as JSON."
+    )
+    parsed_args = parser.parse_args(args)
+
+    results = measure(parsed_args.affordances, parsed_args.repeat)
+
+    if parsed_args.json:
+        json.dump(results, sys.stdout, indent=4)
+        print()
+        return
+
+    print(f"{parsed_args.affordances} affordances")
+    for result in results:
+        print(f"{result['variant']:<50} {result['seconds'] * 1000:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""Measures the public conversion functions on synthetic documents.
+
+The input documents are created by `benchmarks.generator`, whose options are
+available as arguments. The results include the commit and Python version they
+were measured with, so that results stored with `--output` can be compared across
+commits with `--compare`:
+
+    python -m benchmarks.conversions --output before.json
+    git checkout other-branch
+    python -m benchmarks.conversions --compare before.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+from sdf_wot_converter import (
+    convert_sdf_to_wot_td,
+    convert_sdf_to_wot_tm,
+    convert_wot_td_to_sdf,
+    convert_wot_td_to_wot_tm,
+    convert_wot_tm_to_sdf,
+    convert_wot_tm_to_wot_td,
+)
+
+from benchmarks.generator import ModelOptions, generate_conversion_inputs
+
+CONVERTERS: Dict[str, Callable] = {
+    "sdf-to-tm": convert_sdf_to_wot_tm,
+    "sdf-to-td": convert_sdf_to_wot_td,
+    "tm-to-sdf": convert_wot_tm_to_sdf,
+    "tm-to-td": convert_wot_tm_to_wot_td,
+    "td-to-tm": convert_wot_td_to_wot_tm,
+    "td-to-sdf": convert_wot_td_to_sdf,
+}
+
+
+def _median_time(function: Callable, repeat: int) -> float:
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def metadata(options: ModelOptions) -> Dict:
+    return {
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "options": options._asdict(),
+    }
+
+
+def measure(options: ModelOptions, directions: List[str], repeat: int):
+    """Measures the median time of every conversion direction. The converters
+    copy their inputs, so that every repetition starts from the same document."""
+    inputs = generate_conversion_inputs(options)
+    results = []
+    for direction in directions:
+        document, kwargs = inputs[direction]
+        converter = CONVERTERS[direction]
+        seconds = _median_time(lambda: converter(document, **kwargs), repeat)
+        input_bytes = len(json.dumps(document))
+        results.append(
+            {
+                "direction": direction,
+                "input_bytes": input_bytes,
+                "seconds": seconds,
+                "microseconds_per_kilobyte": seconds / input_bytes * 1e9,
+            }
+        )
+    return results
+
+
+def compare(baseline: Dict, results: List[Dict]) -> List[Dict]:
+    """Returns the ratio of the current and the baseline time of every direction
+    measured in both runs."""
+    baseline_seconds = {
+        result["direction"]: result["seconds"] for result in baseline["results"]
+    }
+    return [
+        {
+            "direction": result["direction"],
+            "baseline_seconds": baseline_seconds[result["direction"]],
+            "seconds": result["seconds"],
+            "ratio": result["seconds"] / baseline_seconds[result["direction"]],
+        }
+        for result in results
+        if result["direction"] in baseline_seconds
+    ]
+
+
+def _add_option_arguments(parser: argparse.ArgumentParser):
+    defaults = ModelOptions()
+    parser.add_argument("--objects", type=int, default=defaults.objects)
+    parser.add_argument("--things", type=int, default=defaults.things)
+    parser.add_argument("--affordances", type=int, default=defaults.affordances)
+    parser.add_argument("--depth", type=int, default=defaults.depth)
+    parser.add_argument(
+        "--reference-density", type=float, default=defaults.reference_density
+    )
+    parser.add_argument("--choice-width", type=int, default=defaults.choice_width)
+    parser.add_argument("--placeholders", type=int, default=defaults.placeholders)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+
+
+def _print_results(report: Dict):
+    for result in report["results"]:
+        print(
+            f"{result['direction']:<10} {result['input_bytes']:>9} bytes"
+            f" {result['seconds'] * 1000:>10.2f} ms"
+            f" {result['microseconds_per_kilobyte']:>8.2f} µs/kB"
+        )
+    for comparison in report.get("comparison", []):
+        print(
+            f"{comparison['direction']:<10}"
+            f" {comparison['baseline_seconds'] * 1000:>10.2f} ms"
+            f" -> {comparison['seconds'] * 1000:>10.2f} ms"
+            f" ({comparison['ratio']:.2f}x)"
+        )
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--directions",
+        type=lambda value: value.split(","),
+        default=list(CONVERTERS),
+        help="Comma-separated conversion directions. Defaults to all of them.",
+    )
+    _add_option_arguments(parser)
+    parser.add_argument("--output", help="Write the results as JSON to this file.")
+    parser.add_argument(
+        "--compare", help="Compare the results with those stored in this file."
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print the results as JSON."
+    )
+    parsed_args = parser.parse_args(args)
+
+    unknown_directions = set(parsed_args.directions) - set(CONVERTERS)
+    if len(unknown_directions) > 0:
+        parser.error(f"Unknown directions: {', '.join(sorted(unknown_directions))}")
+
+    options = ModelOptions(
+        objects=parsed_args.objects,
+        things=parsed_args.things,
+        affordances=parsed_args.affordances,
+        depth=parsed_args.depth,
+        reference_density=parsed_args.reference_density,
+        choice_width=parsed_args.choice_width,
+        placeholders=parsed_args.placeholders,
+        seed=parsed_args.seed,
+    )
+    report = {
+        "metadata": metadata(options),
+        "results": measure(options, parsed_args.directions, parsed_args.repeat),
+    }
+
+    if parsed_args.compare:
+        with open(parsed_args.compare) as baseline_file:
+            report["comparison"] = compare(json.load(baseline_file), report["results"])
+
+    if parsed_args.output:
+        with open(parsed_args.output, "w") as output_file:
+            json.dump(report, output_file, indent=4)
+
+    if parsed_args.json:
+        json.dump(report, sys.stdout, indent=4)
+        print()
+        return
+
+    _print_results(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Measures how the conversion scales with the number of extension fields.
+
+Every property of the converted models carries the given number of fields that
+are not part of the mapping and therefore have to be copied as additional
+fields (SDF -> WoT) or moved to the mapping file (WoT -> SDF). Since mapped
+fields are tracked in sets, the time per field should stay roughly constant as
+the number of extension fields increases.
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+from sdf_wot_converter import convert_sdf_to_wot_tm, convert_wot_tm_to_sdf
+
+
+def _extension_fields(extension_fields: int) -> Dict:
+    return {f"ext:field{index}": index for index in range(extension_fields)}
+
+
+def _sdf_model(properties: int, extension_fields: int) -> Dict:
+    return {
+        "sdfObject": {
+            "Benchmark": {
+                "sdfProperty": {
+                    f"property{index}": {
+                        "type": "number",
+                        "minimum": 0,
+                        "maximum": 100,
+                        "writable": False,
+                        **_extension_fields(extension_fields),
+                    }
+                    for index in range(properties)
+                }
+            }
+        }
+    }
+
+
+def _thing_model(properties: int, extension_fields: int) -> Dict:
+    return {
+        "@context": "https://www.w3.org/2022/wot/td/v1.1",
+        "@type": "tm:ThingModel",
+        "title": "Benchmark Thing",
+        "properties": {
+            f"property{index}": {
+                "type": "number",
+                "minimum": 0,
+                "maximum": 100,
+                "readOnly": True,
+                **_extension_fields(extension_fields),
+            }
+            for index in range(properties)
+        },
+    }
+
+
+def _median_time(function: Callable, repeat: int) -> float:
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def measure(extension_field_counts: List[int], properties: int, repeat: int):
+    results = []
+    for extension_fields in extension_field_counts:
+        sdf_model = _sdf_model(properties, extension_fields)
+        thing_model = _thing_model(properties, extension_fields)
+        variants = {
+            "sdf-to-tm": lambda: convert_sdf_to_wot_tm(sdf_model, validation="none"),
+            "tm-to-sdf": lambda: convert_wot_tm_to_sdf(thing_model, validation="none"),
+        }
+        fields = properties * (extension_fields + 4)
+
+        for variant, function in variants.items():
+            seconds = _median_time(function, repeat)
+            results.append(
+                {
+                    "variant": variant,
+                    "properties": properties,
+                    "extension_fields": extension_fields,
+                    "seconds": seconds,
+                    "microseconds_per_field": seconds / fields * 1e6,
+                }
+            )
+    return results
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--properties", type=int, default=50)
+    parser.add_argument(
+        "--extension-fields",
+        type=lambda value: [int(count) for count in value.split(",")],
+        default=[10, 100, 400, 1000],
+        help="Comma-separated numbers of extension fields per property. "
+        "Defaults to 10,100,400,1000.",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print the results as JSON."
+    )
+    parsed_args = parser.parse_args(args)
+
+    results = measure(
+        parsed_args.extension_fields, parsed_args.properties, parsed_args.repeat
+    )
+
+    if parsed_args.json:
+        json.dump(results, sys.stdout, indent=4)
+        print()
+        return
+
+    for result in results:
+        print(
+            f"{result['variant']:<10} {result['extension_fields']:>5} fields"
+            f" {result['seconds'] * 1000:>10.2f} ms"
+            f" {result['microseconds_per_field']:>8.3f} µs/field"
+        )
+
+
+if __name__ == "__main__":
+    main()
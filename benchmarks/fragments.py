@@ -0,0 +1,125 @@
+"""Compares whole-document and fragment-wise validation of a large TD.
+
+The document is a synthetic Thing Description with many property affordances,
+a few of which are invalid. The benchmark measures how long it takes to find
+the first error and to collect a bounded number of errors with jsonschema on the
+whole document and with the fragment validators, sequentially and in parallel.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+from jsonschema import ValidationError
+
+from sdf_wot_converter import validation
+from sdf_wot_converter.validation.fragments import validate_fragments
+
+
+def _thing_description(size: int, invalid: int) -> Dict:
+    properties = {
+        f"property{index}": {
+            "type": "number",
+            "minimum": 0,
+            "observable": True,
+            "forms": [{"href": f"https://example.org/properties/{index}"}],
+        }
+        for index in range(size)
+    }
+    # Spread the invalid affordances over the second half of the document.
+    for number in range(invalid):
+        index = size // 2 + number * (size // 2) // invalid
+        properties[f"property{index}"]["readOnly"] = "yes"
+
+    return {
+        "@context": "https://www.w3.org/2022/wot/td/v1.1",
+        "title": "Benchmark Thing",
+        "securityDefinitions": {"nosec_sc": {"scheme": "nosec"}},
+        "security": "nosec_sc",
+        "properties": properties,
+    }
+
+
+def _median_time(function: Callable, repeat: int) -> float:
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def _first_jsonschema_error(document: Dict):
+    try:
+        validation.get_validator("td_validator").validate(document)
+    except ValidationError:
+        pass
+
+
+def _jsonschema_errors(document: Dict, max_errors: int):
+    errors = validation.get_validator("td_validator").iter_errors(document)
+    return [error for error, _ in zip(errors, range(max_errors))]
+
+
+def measure(size: int, invalid: int, max_errors: int, workers: int, repeat: int):
+    document = _thing_description(size, invalid)
+    variants = {
+        "jsonschema, first error": lambda: _first_jsonschema_error(document),
+        f"jsonschema, {max_errors} errors": lambda: _jsonschema_errors(
+            document, max_errors
+        ),
+        "fragments, first error": lambda: validate_fragments(document, max_errors=1),
+        f"fragments, {max_errors} errors": lambda: validate_fragments(
+            document, max_errors=max_errors
+        ),
+        f"fragments, {max_errors} errors, {workers} workers": lambda: (
+            validate_fragments(document, max_errors=max_errors, workers=workers)
+        ),
+    }
+    return [
+        {
+            "variant": variant,
+            "size": size,
+            "invalid": invalid,
+            "seconds": _median_time(function, repeat),
+        }
+        for variant, function in variants.items()
+    ]
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--size", type=int, default=5000)
+    parser.add_argument("--invalid", type=int, default=20)
+    parser.add_argument("--max-errors", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument(
+        "--json", action="store_true", help="Print the results as JSON."
+    )
+    parsed_args = parser.parse_args(args)
+
+    results = measure(
+        parsed_args.size,
+        parsed_args.invalid,
+        parsed_args.max_errors,
+        parsed_args.workers,
+        parsed_args.repeat,
+    )
+
+    if parsed_args.json:
+        json.dump(results, sys.stdout, indent=4)
+        print()
+        return
+
+    print(f"{parsed_args.size} properties, {parsed_args.invalid} of them invalid")
+    for result in results:
+        print(f"{result['variant']:<40} {result['seconds'] * 1000:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+"""Seeded generator of synthetic SDF models, Thing Models, and Thing Descriptions.
+
+The size and shape of the generated documents are controlled by `ModelOptions`:
+
+- `objects`: number of sdfObjects (per sdfThing, if there are any) or, for Thing
+  Models and Thing Descriptions, of submodels of a Thing Collection.
+- `things`: number of sdfThings. Without sdfThings, the sdfObjects are placed at
+  the top level.
+- `affordances`: number of properties, actions, and events per object.
+- `depth`: nesting depth of the object data schemas.
+- `reference_density`: share of data schemas that refer to a shared definition
+  (via sdfRef in SDF models and tm:ref in Thing Models) instead of being inlined.
+  In SDF models, the shared definition is an sdfProperty of the same sdfObject.
+- `choice_width`: number of sdfChoice alternatives used by one in four SDF
+  properties (or of enum values in Thing Models and Thing Descriptions).
+- `placeholders`: number of placeholders used in the Thing Models.
+
+The same options and seed always produce the same documents.
+"""
+
+import random
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+TD_CONTEXT = "https://www.w3.org/2022/wot/td/v1.1"
+
+PRIMITIVE_TYPES = ("string", "number", "integer", "boolean")
+
+AFFORDANCE_TYPES = ("property", "action", "event")
+
+
+class ModelOptions(NamedTuple):
+    objects: int = 2
+    things: int = 0
+    affordances: int = 12
+    depth: int = 2
+    reference_density: float = 0.2
+    choice_width: int = 3
+    placeholders: int = 2
+    seed: int = 0
+
+
+class _Generator:
+    def __init__(self, options: ModelOptions):
+        self.options = options
+        self.random = random.Random(options.seed)
+
+    def _placeholder(self, index: int) -> str:
+        return "{{PLACEHOLDER%d}}" % (index % self.options.placeholders)
+
+    def _primitive_schema(self) -> Dict:
+        data_type = self.random.choice(PRIMITIVE_TYPES)
+        schema: Dict[str, Any] = {"type": data_type}
+        if data_type in ("number", "integer"):
+            minimum = self.random.randint(-100, 0)
+            schema["minimum"] = minimum
+            schema["maximum"] = minimum + self.random.randint(1, 1000)
+        elif data_type == "string":
+            schema["maxLength"] = self.random.randint(8, 64)
+        return schema
+
+    def _uses_reference(self) -> bool:
+        return self.random.random() < self.options.reference_density
+
+    def data_schema(self, depth: int, reference: Dict) -> Dict:
+        """Returns a data schema nested `depth` levels deep, in which some of the
+        leaves are replaced by the given reference."""
+        if depth <= 0:
+            if self._uses_reference():
+                return dict(reference)
+            return self._primitive_schema()
+
+        return {
+            "type": "object",
+            "properties": {
+                f"field{index}": self.data_schema(depth - 1, reference)
+                for index in range(2)
+            },
+        }
+
+
+class _SdfGenerator(_Generator):
+    def _reference(self, object_pointer: str) -> Dict:
+        return {"sdfRef": f"{object_pointer}/sdfProperty/shared"}
+
+    def _property(self, index: int, object_pointer: str) -> Dict:
+        options = self.options
+        if options.choice_width > 0 and index % 4 == 0:
+            sdf_property: Dict[str, Any] = {
+                "sdfChoice": {
+                    f"choice{choice}": {"type": "string", "const": f"value{choice}"}
+                    for choice in range(options.choice_width)
+                }
+            }
+        elif self._uses_reference():
+            sdf_property = self._reference(object_pointer)
+        else:
+            sdf_property = self._data(object_pointer)
+
+        sdf_property["description"] = f"Property {index}"
+        sdf_property["observable"] = index % 2 == 0
+        return sdf_property
+
+    def _data(self, object_pointer: str) -> Dict:
+        return self.data_schema(self.options.depth, self._reference(object_pointer))
+
+    def sdf_object(self, object_pointer: str) -> Dict:
+        sdf_object: Dict[str, Any] = {
+            "label": "Generated object",
+            "description": "A generated object",
+        }
+        properties: Dict = {"shared": self._primitive_schema()}
+        actions: Dict = {}
+        events: Dict = {}
+        for index in range(self.options.affordances):
+            affordance_type = AFFORDANCE_TYPES[index % 3]
+            if affordance_type == "property":
+                properties[f"property{index}"] = self._property(index, object_pointer)
+            elif affordance_type == "action":
+                actions[f"action{index}"] = {
+                    "description": f"Action {index}",
+                    "sdfInputData": self._data(object_pointer),
+                    "sdfOutputData": self._data(object_pointer),
+                }
+            else:
+                events[f"event{index}"] = {
+                    "description": f"Event {index}",
+                    "sdfOutputData": self._data(object_pointer),
+                }
+
+        for key, definitions in [
+            ("sdfProperty", properties),
+            ("sdfAction", actions),
+            ("sdfEvent", events),
+        ]:
+            if len(definitions) > 0:
+                sdf_object[key] = definitions
+        return sdf_object
+
+    def sdf_objects(self, parent_pointer: str) -> Dict:
+        return {
+            f"object{index}": self.sdf_object(
+                f"{parent_pointer}/sdfObject/object{index}"
+            )
+            for index in range(self.options.objects)
+        }
+
+    def sdf_model(self) -> Dict:
+        sdf_model: Dict[str, Any] = {
+            "info": {
+                "title": "Generated SDF model",
+                "version": "2022-01-01",
+                "copyright": "Copyright 2022",
+                "license": "BSD-3-Clause",
+            },
+            "namespace": {"generated": "https://example.org/generated"},
+            "defaultNamespace": "generated",
+        }
+        if self.options.things == 0:
+            sdf_model["sdfObject"] = self.sdf_objects("#")
+            return sdf_model
+
+        sdf_model["sdfThing"] = {
+            f"thing{index}": {
+                "label": "Generated thing",
+                "description": "A generated thing",
+                "sdfObject": self.sdf_objects(f"#/sdfThing/thing{index}"),
+            }
+            for index in range(self.options.things)
+        }
+        return sdf_model
+
+
+class _WotGenerator(_Generator):
+    def __init__(self, options: ModelOptions, thing_model: bool):
+        super().__init__(options)
+        self.thing_model = thing_model
+
+    def _reference(self) -> Dict:
+        if self.thing_model:
+            return {"tm:ref": "#/schemaDefinitions/shared"}
+        return {"type": "string"}
+
+    def _form(self, path: str) -> List[Dict]:
+        host = "example.org"
+        if self.thing_model and self.options.placeholders > 0:
+            host = self._placeholder(0)
+        return [{"href": f"https://{host}/{path}"}]
+
+    def _description(self, name: str, index: int) -> str:
+        if self.thing_model and self.options.placeholders > 0:
+            return f"{name} {index} of {self._placeholder(index)}"
+        return f"{name} {index}"
+
+    def _property(self, index: int) -> Dict:
+        options = self.options
+        if options.choice_width > 0 and index % 4 == 0:
+            wot_property: Dict[str, Any] = {
+                "type": "string",
+                "enum": [f"value{choice}" for choice in range(options.choice_width)],
+            }
+        elif self.thing_model and self._uses_reference():
+            wot_property = self._reference()
+        else:
+            wot_property = self.data_schema(options.depth, self._reference())
+
+        wot_property["description"] = self._description("Property", index)
+        wot_property["observable"] = index % 2 == 0
+        wot_property["forms"] = self._form(f"properties/{index}")
+        return wot_property
+
+    def affordances(self) -> Dict:
+        depth = self.options.depth
+        affordances: Dict[str, Dict] = {"properties": {}, "actions": {}, "events": {}}
+        for index in range(self.options.affordances):
+            affordance_type = AFFORDANCE_TYPES[index % 3]
+            if affordance_type == "property":
+                affordances["properties"][f"property{index}"] = self._property(index)
+            elif affordance_type == "action":
+                affordances["actions"][f"action{index}"] = {
+                    "description": self._description("Action", index),
+                    "input": self.data_schema(depth, self._reference()),
+                    "output": self.data_schema(depth, self._reference()),
+                    "forms": self._form(f"actions/{index}"),
+                }
+            else:
+                affordances["events"][f"event{index}"] = {
+                    "description": self._description("Event", index),
+                    "data": self.data_schema(depth, self._reference()),
+                    "forms": self._form(f"events/{index}"),
+                }
+        return {key: value for key, value in affordances.items() if len(value) > 0}
+
+    def thing(self, index: int) -> Dict:
+        thing: Dict[str, Any] = {
+            "@context": TD_CONTEXT,
+            "title": f"Generated Thing {index}",
+            "securityDefinitions": {"nosec_sc": {"scheme": "nosec"}},
+            "security": "nosec_sc",
+        }
+        if self.thing_model:
+            thing["@type"] = "tm:ThingModel"
+            thing["schemaDefinitions"] = {"shared": self._primitive_schema()}
+            if self.options.placeholders > 0:
+                thing["title"] = f"Generated Thing {index} {self._placeholder(1)}"
+        else:
+            thing["id"] = f"urn:dev:generated:{index}"
+        thing.update(self.affordances())
+        return thing
+
+    def document(self) -> Dict:
+        if self.options.objects <= 1:
+            return self.thing(0)
+        return {
+            f"thing{index}": self.thing(index) for index in range(self.options.objects)
+        }
+
+
+def generate_sdf_model(options=ModelOptions()) -> Dict:
+    return _SdfGenerator(options).sdf_model()
+
+
+def _map_sdf_objects(sdf_objects: Dict, parent_pointer: str, mapping: Dict):
+    for object_key, sdf_object in sdf_objects.items():
+        object_pointer = f"{parent_pointer}/sdfObject/{object_key}"
+        mapping[object_pointer] = {
+            "securityDefinitions": {"nosec_sc": {"scheme": "nosec"}},
+            "security": "nosec_sc",
+        }
+        for quality in ("sdfProperty", "sdfAction", "sdfEvent"):
+            for key in sdf_object.get(quality, {}):
+                href = f"https://example.org/{object_key}/{key}"
+                mapping[f"{object_pointer}/{quality}/{key}"] = {
+                    "forms": [{"href": href}]
+                }
+
+
+def generate_sdf_mapping_file(sdf_model: Dict) -> Dict:
+    """Returns a mapping file adding the security definitions and forms that are
+    needed to convert the SDF model to a Thing Description."""
+    mapping: Dict[str, Dict] = {}
+    _map_sdf_objects(sdf_model.get("sdfObject", {}), "#", mapping)
+    for thing_key, sdf_thing in sdf_model.get("sdfThing", {}).items():
+        thing_pointer = f"#/sdfThing/{thing_key}"
+        mapping[thing_pointer] = {
+            "securityDefinitions": {"nosec_sc": {"scheme": "nosec"}},
+            "security": "nosec_sc",
+        }
+        _map_sdf_objects(sdf_thing.get("sdfObject", {}), thing_pointer, mapping)
+    return {"map": mapping}
+
+
+def generate_thing_model(options=ModelOptions()) -> Dict:
+    """Returns a Thing Model or, with more than one object, a collection of Thing
+    Models with the object names as keys."""
+    return _WotGenerator(options, thing_model=True).document()
+
+
+def generate_placeholder_map(options=ModelOptions()) -> Dict[str, str]:
+    return {
+        f"PLACEHOLDER{index}": f"value{index}" for index in range(options.placeholders)
+    }
+
+
+def generate_thing_description(options=ModelOptions()) -> Dict:
+    """Returns a Thing Description or, with more than one object, a collection of
+    Thing Descriptions."""
+    return _WotGenerator(options, thing_model=False).document()
+
+
+def generate_conversion_inputs(
+    options=ModelOptions(),
+) -> Dict[str, Tuple[Dict, Dict[str, Any]]]:
+    """Returns the input document and the keyword arguments of the converter for
+    every conversion direction."""
+    sdf_model = generate_sdf_model(options)
+    sdf_mapping_files = {"sdf_mapping_files": [generate_sdf_mapping_file(sdf_model)]}
+    thing_model = generate_thing_model(options)
+    placeholder_map = {"placeholder_map": generate_placeholder_map(options)}
+    thing_description = generate_thing_description(options)
+    return {
+        "sdf-to-tm": (sdf_model, {}),
+        "sdf-to-td": (sdf_model, sdf_mapping_files),
+        "tm-to-sdf": (thing_model, placeholder_map),
+        "tm-to-td": (thing_model, placeholder_map),
+        "td-to-tm": (thing_description, {}),
+        "td-to-sdf": (thing_description, {}),
+    }
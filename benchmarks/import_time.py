@@ -0,0 +1,276 @@
+"""Measures the start-up cost of the package and of every CLI subcommand.
+
+First, `import sdf_wot_converter` and `sdf-wot-converter --help` are timed in
+fresh interpreters and compared to an interpreter that only imports the
+dependencies of the package. The benchmark exits with status 1 if either takes
+more than `--max-overhead` milliseconds longer than the dependencies, or if
+importing the package loads one of the modules that are only needed by some
+commands (e.g., the server, the schema compiler, or the schema modules).
+
+Then, each subcommand is run in a fresh interpreter, once with the lazily
+constructed validators and once with all four schema modules imported and their
+validators constructed up front (which is what importing the library used to
+do). The benchmark reports the median wall time of both variants and lists the
+schema modules that were actually loaded by the lazy variant.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+# Milliseconds the package import and --help may take longer than importing the
+# dependencies of the package.
+DEFAULT_MAX_OVERHEAD = 100
+
+DEPENDENCIES = (
+    "argparse",
+    "json_merge_patch",
+    "jsonpointer",
+    "jsonschema",
+    "urllib.request",
+    "validators",
+)
+
+STARTUP_COMMANDS: Dict[str, List[str]] = {
+    "dependencies": ["-c", f"import {', '.join(DEPENDENCIES)}"],
+    "import": ["-c", "import sdf_wot_converter"],
+    "help": ["-m", "sdf_wot_converter", "--help"],
+}
+
+# Modules that must not be loaded by importing the package.
+DEFERRED_MODULES = (
+    "sdf_wot_converter.cli.batch",
+    "sdf_wot_converter.cli.bulk",
+    "sdf_wot_converter.cli.server",
+    "sdf_wot_converter.cli.streaming",
+    "sdf_wot_converter.profiling",
+    "sdf_wot_converter.validation.cache",
+    "sdf_wot_converter.validation.compiler",
+    "sdf_wot_converter.validation.sdf_framework_schema",
+    "sdf_wot_converter.validation.sdf_validation_schema",
+    "sdf_wot_converter.validation.td_schema",
+    "sdf_wot_converter.validation.tm_schema",
+    "concurrent.futures",
+    "cProfile",
+    "http.server",
+    "orjson",
+)
+
+_LOADED_MODULES_RUNNER = """
+import json
+import sys
+
+import sdf_wot_converter
+
+json.dump(sorted(sys.modules), sys.stdout)
+"""
+
+SUBCOMMANDS: Dict[str, List[str]] = {
+    "sdf-to-tm": ["-i", "examples/sdf/example.sdf.json"],
+    "sdf-to-td": [
+        "-i",
+        "examples/sdf/example.sdf.json",
+        "--mapping-files",
+        "examples/sdf/example.sdf-mapping.json",
+    ],
+    "tm-to-sdf": ["-i", "examples/wot/example.tm.jsonld"],
+    "tm-to-td": ["-i", "examples/wot/example-with-bindings.tm.jsonld"],
+    "td-to-sdf": ["-i", "examples/wot/example.td.jsonld"],
+    "td-to-tm": ["-i", "examples/wot/example.td.jsonld"],
+}
+
+_RUNNER = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+import sdf_wot_converter
+from sdf_wot_converter import validation
+
+if {eager}:
+    for name in validation._SCHEMAS:
+        validation.get_validator(name)
+imported = time.perf_counter()
+
+sdf_wot_converter.use_converter_cli(sdf_wot_converter.parse_arguments({argv!r}))
+finished = time.perf_counter()
+
+schema_modules = sorted(
+    name.rsplit(".", 1)[1]
+    for name in sys.modules
+    if name.startswith("sdf_wot_converter.validation.")
+)
+json.dump(
+    {{
+        "import": imported - start,
+        "total": finished - start,
+        "schemas": schema_modules,
+    }},
+    sys.stderr,
+)
+"""
+
+
+def _time_command(arguments: List[str]) -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, *arguments],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return time.perf_counter() - start
+
+
+def measure_startup(repeat: int) -> Dict:
+    """Returns the median wall time of every start-up command and the deferred
+    modules that were loaded by importing the package."""
+    timings: Dict[str, List[float]] = {name: [] for name in STARTUP_COMMANDS}
+    # Alternate between the commands so that drift affects them equally.
+    for _ in range(repeat):
+        for name, arguments in STARTUP_COMMANDS.items():
+            timings[name].append(_time_command(arguments))
+
+    completed = subprocess.run(
+        [sys.executable, "-c", _LOADED_MODULES_RUNNER],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    loaded_modules = set(json.loads(completed.stdout))
+
+    return {
+        **{name: statistics.median(values) for name, values in timings.items()},
+        "deferred_modules_loaded": [
+            module for module in DEFERRED_MODULES if module in loaded_modules
+        ],
+    }
+
+
+def check_startup(startup: Dict, max_overhead: float) -> List[str]:
+    """Returns a message for every violated start-up requirement."""
+    violations = [
+        f"Importing the package loads {module}"
+        for module in startup["deferred_modules_loaded"]
+    ]
+    for name in ("import", "help"):
+        overhead = (startup[name] - startup["dependencies"]) * 1000
+        if overhead > max_overhead:
+            violations.append(
+                f"{name} takes {overhead:.0f} ms longer than the dependencies, "
+                f"the limit is {max_overhead:.0f} ms"
+            )
+    return violations
+
+
+def _run_once(subcommand: str, eager: bool, output_path: str) -> Dict:
+    argv = [subcommand, *SUBCOMMANDS[subcommand], "-o", output_path]
+    if subcommand in ("tm-to-sdf", "td-to-sdf"):
+        argv += ["--mapping-file-output", output_path + ".mapping"]
+    code = _RUNNER.format(eager=eager, argv=argv)
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(completed.stderr.strip().splitlines()[-1])
+
+
+def measure(subcommand: str, repeat: int) -> Dict:
+    with tempfile.TemporaryDirectory() as directory:
+        output_path = os.path.join(directory, "output.json")
+        lazy, eager = [], []
+        # Alternate between both variants so that drift affects them equally.
+        for _ in range(repeat):
+            lazy.append(_run_once(subcommand, False, output_path))
+            eager.append(_run_once(subcommand, True, output_path))
+
+    return {
+        "subcommand": subcommand,
+        "lazy_import": statistics.median(run["import"] for run in lazy),
+        "eager_import": statistics.median(run["import"] for run in eager),
+        "lazy_total": statistics.median(run["total"] for run in lazy),
+        "eager_total": statistics.median(run["total"] for run in eager),
+        "schemas": lazy[0]["schemas"],
+    }
+
+
+def _format_pair(lazy: float, eager: float) -> str:
+    return f"{lazy * 1000:.1f}/{eager * 1000:.1f}"
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=9)
+    parser.add_argument(
+        "--max-overhead",
+        type=float,
+        default=DEFAULT_MAX_OVERHEAD,
+        help="Milliseconds the package import and --help may take longer than "
+        f"importing the dependencies. Defaults to {DEFAULT_MAX_OVERHEAD}.",
+    )
+    parser.add_argument(
+        "--startup-only",
+        action="store_true",
+        help="Only measure the package import and --help.",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print the results as JSON."
+    )
+    parsed_args = parser.parse_args(args)
+
+    startup = measure_startup(parsed_args.repeat)
+    violations = check_startup(startup, parsed_args.max_overhead)
+    results = []
+    if not parsed_args.startup_only:
+        results = [
+            measure(subcommand, parsed_args.repeat) for subcommand in SUBCOMMANDS
+        ]
+
+    if parsed_args.json:
+        report = {
+            "startup": startup,
+            "subcommands": results,
+            "violations": violations,
+        }
+        json.dump(report, sys.stdout, indent=4)
+        print()
+    else:
+        _print_results(startup, results)
+
+    for violation in violations:
+        print(violation, file=sys.stderr)
+    if len(violations) > 0:
+        sys.exit(1)
+
+
+def _print_results(startup: Dict, results: List[Dict]):
+    for name in STARTUP_COMMANDS:
+        print(f"{name:<14} {startup[name] * 1000:>8.1f} ms")
+    if len(results) == 0:
+        return
+
+    print()
+    print(
+        f"{'subcommand':<10} {'import (lazy/eager) ms':>24} "
+        f"{'total (lazy/eager) ms':>24}  schemas loaded"
+    )
+    for result in results:
+        imports = _format_pair(result["lazy_import"], result["eager_import"])
+        totals = _format_pair(result["lazy_total"], result["eager_total"])
+        print(
+            f"{result['subcommand']:<10} {imports:>24} {totals:>24}  "
+            f"{', '.join(result['schemas'])}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Measures the memory allocated by every conversion direction with tracemalloc.
+
+Every direction is run on each document of a small synthetic corpus. For every
+conversion, the following numbers are reported relative to the size of the input
+document serialized as JSON:
+
+- `peak`: the highest amount of memory allocated during the conversion,
+- `result`: the memory still allocated when the conversion returns, which mostly
+  belongs to the converted document, and
+- `retained`: the memory still allocated after the converted document has been
+  released, which should stay close to zero.
+
+Every conversion is run once before it is measured, so that validators and other
+caches that are filled on first use are not counted as retained memory.
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from typing import Callable, Dict, List
+
+from benchmarks.conversions import CONVERTERS, metadata
+from benchmarks.generator import ModelOptions, generate_conversion_inputs
+
+CORPUS = {
+    "default": ModelOptions(),
+    "wide": ModelOptions(affordances=48),
+    "deep": ModelOptions(depth=5),
+    "references": ModelOptions(reference_density=0.8),
+    "things": ModelOptions(things=2),
+}
+
+
+def _measure_allocations(function: Callable) -> Dict[str, int]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        result = function()
+        after, peak = tracemalloc.get_traced_memory()
+        del result
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "peak": peak - before,
+        "result": after - before,
+        "retained": retained - before,
+    }
+
+
+def measure(corpus: Dict[str, ModelOptions], directions: List[str]):
+    results = []
+    for name, options in corpus.items():
+        inputs = generate_conversion_inputs(options)
+        for direction in directions:
+            document, kwargs = inputs[direction]
+            converter = CONVERTERS[direction]
+            converter(document, **kwargs)
+            allocations = _measure_allocations(lambda: converter(document, **kwargs))
+            input_bytes = len(json.dumps(document))
+            result = {
+                "document": name,
+                "direction": direction,
+                "input_bytes": input_bytes,
+            }
+            for key, value in allocations.items():
+                result[f"{key}_bytes"] = value
+                result[f"{key}_per_input_byte"] = value / input_bytes
+            results.append(result)
+    return results
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--directions",
+        type=lambda value: value.split(","),
+        default=list(CONVERTERS),
+        help="Comma-separated conversion directions. Defaults to all of them.",
+    )
+    parser.add_argument(
+        "--documents",
+        type=lambda value: value.split(","),
+        default=list(CORPUS),
+        help="Comma-separated documents of the corpus. Defaults to all of them.",
+    )
+    parser.add_argument("--output", help="Write the results as JSON to this file.")
+    parser.add_argument(
+        "--json", action="store_true", help="Print the results as JSON."
+    )
+    parsed_args = parser.parse_args(args)
+
+    unknown_directions = set(parsed_args.directions) - set(CONVERTERS)
+    if len(unknown_directions) > 0:
+        parser.error(f"Unknown directions: {', '.join(sorted(unknown_directions))}")
+    unknown_documents = set(parsed_args.documents) - set(CORPUS)
+    if len(unknown_documents) > 0:
+        parser.error(f"Unknown documents: {', '.join(sorted(unknown_documents))}")
+
+    corpus = {name: CORPUS[name] for name in parsed_args.documents}
+    report = {
+        "metadata": {
+            **metadata(ModelOptions()),
+            "options": {name: options._asdict() for name, options in corpus.items()},
+        },
+        "results": measure(corpus, parsed_args.directions),
+    }
+
+    if parsed_args.output:
+        with open(parsed_args.output, "w") as output_file:
+            json.dump(report, output_file, indent=4)
+
+    if parsed_args.json:
+        json.dump(report, sys.stdout, indent=4)
+        print()
+        return
+
+    for result in report["results"]:
+        print(
+            f"{result['document']:<12} {result['direction']:<10}"
+            f" {result['input_bytes']:>8} bytes"
+            f" peak {result['peak_per_input_byte']:>6.1f}x"
+            f" result {result['result_per_input_byte']:>6.1f}x"
+            f" retained {result['retained_per_input_byte']:>6.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""Measures the SDF to WoT conversion of the oneDM playground models in one process.
+
+Every model matching the pattern is loaded, converted to a Thing Model, and
+serialized within the same Python process, so that the measured times do not
+include the startup of the interpreter. Before the measurement, the validators
+are constructed and the first model is converted once to initialize the
+libraries used by the conversion. The validation and document caches are
+cleared afterwards, so that the first model is not measured with documents
+cached during its own warm-up.
+
+The results are written in the CSV format of `evaluate.sh` (with the columns
+"Filename", "SDF <-> WoT", and "SDF <-> YANG"). The YANG column is only measured
+if the path of the sdf-yang-converter executable is given and is empty otherwise.
+With `--phases`, the time of every conversion phase is written to a second CSV
+file.
+"""
+
+import argparse
+import csv
+import glob
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from sdf_wot_converter import convert_sdf_to_wot_tm
+from sdf_wot_converter.converters.retrieval import clear_document_cache
+from sdf_wot_converter.timings import OTHER_PHASE, PHASES, phase, record_timings
+from sdf_wot_converter.validation import clear_validation_cache, preload_validators
+
+DEFAULT_PATTERN = "sdfObject/sdfobject*.sdf.json"
+
+RESULT_COLUMNS = ["Filename", "SDF <-> WoT", "SDF <-> YANG"]
+
+FAILED = "Failed"
+
+
+def convert_to_wot(path: str, output_path: Optional[str] = None) -> Dict:
+    """Converts the SDF model at the path to a Thing Model and returns the time
+    of every phase, including the total time."""
+    with record_timings() as timings:
+        with phase("load"):
+            with open(path) as sdf_file:
+                sdf_model = json.load(sdf_file)
+        thing_model = convert_sdf_to_wot_tm(sdf_model, copy_input=False)
+        with phase("serialization"):
+            serialized_model = json.dumps(thing_model, indent=4)
+            if output_path is not None:
+                with open(output_path, "w") as output_file:
+                    output_file.write(serialized_model)
+
+    seconds = {
+        phase_name: timing["seconds"]
+        for phase_name, timing in timings.as_dict().items()
+    }
+    seconds["total"] = timings.total_seconds
+    return seconds
+
+
+def convert_to_yang(path: str, converter: str, yang_directory: str) -> Optional[float]:
+    """Runs the sdf-yang-converter on the SDF model and returns its wall time,
+    or None if the conversion failed."""
+    with tempfile.TemporaryDirectory() as output_directory:
+        output_path = os.path.join(output_directory, "yang.yang")
+        start = time.perf_counter()
+        subprocess.run(
+            [converter, "-f", path, "-o", output_path, "-c", yang_directory],
+            cwd=os.path.dirname(converter) or None,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        seconds = time.perf_counter() - start
+        if not os.path.exists(output_path):
+            return None
+    return seconds
+
+
+def warm_up(path: str):
+    preload_validators()
+    try:
+        convert_to_wot(path)
+    except Exception as exception:
+        message = str(exception).splitlines()[0]
+        print(f"Warm-up conversion of {path} failed: {message}", file=sys.stderr)
+    clear_validation_cache()
+    clear_document_cache()
+
+
+def measure(
+    paths: List[str],
+    yang_converter: Optional[str] = None,
+    yang_directory: Optional[str] = None,
+    output_directory: Optional[str] = None,
+):
+    if len(paths) > 0:
+        warm_up(paths[0])
+
+    results = []
+    for path in paths:
+        result: Dict = {"filename": path, "wot": None, "yang": None, "phases": None}
+        output_path = None
+        if output_directory is not None:
+            file_name = os.path.basename(path).replace(".sdf.json", ".tm.jsonld")
+            output_path = os.path.join(output_directory, file_name)
+
+        try:
+            result["phases"] = convert_to_wot(path, output_path)
+            result["wot"] = result["phases"]["total"]
+        except Exception as exception:
+            message = str(exception).splitlines()[0]
+            print(f"Converting {path} failed: {message}", file=sys.stderr)
+
+        if yang_converter is not None:
+            result["yang"] = convert_to_yang(
+                os.path.abspath(path),
+                os.path.abspath(yang_converter),
+                os.path.abspath(yang_directory or "yang"),
+            )
+        results.append(result)
+    return results
+
+
+def _format_seconds(seconds: Optional[float], measured: bool) -> str:
+    if not measured:
+        return ""
+    if seconds is None:
+        return FAILED
+    return f"{seconds:.9f}"
+
+
+def write_results(results: List[Dict], output_path: str, yang_measured: bool):
+    with open(output_path, "w", newline="") as output_file:
+        writer = csv.writer(output_file)
+        writer.writerow(RESULT_COLUMNS)
+        for result in results:
+            writer.writerow(
+                [
+                    result["filename"],
+                    _format_seconds(result["wot"], True),
+                    _format_seconds(result["yang"], yang_measured),
+                ]
+            )
+
+
+def write_phases(results: List[Dict], output_path: str):
+    phase_names = [*PHASES, OTHER_PHASE, "total"]
+    with open(output_path, "w", newline="") as output_file:
+        writer = csv.writer(output_file)
+        writer.writerow(["Filename", *phase_names])
+        for result in results:
+            phases = result["phases"]
+            if phases is None:
+                writer.writerow([result["filename"], *[FAILED] * len(phase_names)])
+                continue
+            writer.writerow(
+                [
+                    result["filename"],
+                    *[f"{phases[phase_name]:.9f}" for phase_name in phase_names],
+                ]
+            )
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "playground", help="Path of a local clone of the oneDM playground."
+    )
+    parser.add_argument(
+        "--pattern",
+        default=DEFAULT_PATTERN,
+        help=f"Glob pattern of the models within the playground. "
+        f"Defaults to {DEFAULT_PATTERN}.",
+    )
+    parser.add_argument("--output", default="results.csv")
+    parser.add_argument("--phases", help="Write the phase timings to this file.")
+    parser.add_argument(
+        "--output-directory", help="Write the converted Thing Models to this directory."
+    )
+    parser.add_argument(
+        "--yang-converter", help="Path of the sdf-yang-converter executable."
+    )
+    parser.add_argument(
+        "--yang-directory",
+        default="yang",
+        help="Path of the YANG models used by the sdf-yang-converter.",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print the results as JSON."
+    )
+    parsed_args = parser.parse_args(args)
+
+    paths = sorted(glob.glob(os.path.join(parsed_args.playground, parsed_args.pattern)))
+    if len(paths) == 0:
+        parser.error(
+            f"No models match {parsed_args.pattern} in {parsed_args.playground}"
+        )
+    if parsed_args.output_directory is not None:
+        os.makedirs(parsed_args.output_directory, exist_ok=True)
+
+    results = measure(
+        paths,
+        parsed_args.yang_converter,
+        parsed_args.yang_directory,
+        parsed_args.output_directory,
+    )
+    write_results(results, parsed_args.output, parsed_args.yang_converter is not None)
+    if parsed_args.phases:
+        write_phases(results, parsed_args.phases)
+
+    if parsed_args.json:
+        json.dump(results, sys.stdout, indent=4)
+        print()
+        return
+
+    for result in results:
+        wot = _format_seconds(result["wot"], True)
+        yang = _format_seconds(result["yang"], parsed_args.yang_converter is not None)
+        print(f"{result['filename']}: WoT {wot} YANG {yang or '-'}")
+
+
+if __name__ == "__main__":
+    main()
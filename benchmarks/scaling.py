@@ -0,0 +1,195 @@
+"""Fits how the conversion time of every direction scales with the input size.
+
+Starting from the default generator options, one option (the number of
+affordances per object by default) is multiplied by a constant factor in every
+step. For every conversion direction, the exponent k of `seconds ~ bytes^k` is
+fitted to the measurements by least squares on a log-log scale. A linear path
+has an exponent close to 1, a quadratic path one close to 2.
+
+The benchmark exits with status 1 if the exponent of a direction exceeds its
+bound, which can be set for all directions with `--max-exponent` and for single
+ones with `--bound`, e.g. `--bound tm-to-td=1.5`.
+"""
+
+import argparse
+import json
+import math
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Sequence
+
+from benchmarks.conversions import CONVERTERS, metadata
+from benchmarks.generator import ModelOptions, generate_conversion_inputs
+
+SCALABLE_OPTIONS = ("affordances", "objects", "things")
+
+DEFAULT_MAX_EXPONENT = 1.3
+
+
+def fit_exponent(sizes: Sequence[float], seconds: Sequence[float]) -> float:
+    """Returns the slope of the least squares line through the logarithms of the
+    sizes and times."""
+    log_sizes = [math.log(size) for size in sizes]
+    log_seconds = [math.log(value) for value in seconds]
+    mean_size = statistics.mean(log_sizes)
+    mean_seconds = statistics.mean(log_seconds)
+    covariance = sum(
+        (size - mean_size) * (value - mean_seconds)
+        for size, value in zip(log_sizes, log_seconds)
+    )
+    variance = sum((size - mean_size) ** 2 for size in log_sizes)
+    return covariance / variance
+
+
+def _median_time(function: Callable, repeat: int) -> float:
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def _scaled_options(option: str, start: int, factor: int, steps: int):
+    return [
+        ModelOptions()._replace(**{option: start * factor**step})
+        for step in range(steps)
+    ]
+
+
+def measure(
+    directions: List[str],
+    option: str,
+    start: int,
+    factor: int,
+    steps: int,
+    repeat: int,
+):
+    curves: Dict[str, List[Dict]] = {direction: [] for direction in directions}
+    for options in _scaled_options(option, start, factor, steps):
+        inputs = generate_conversion_inputs(options)
+        for direction in directions:
+            document, kwargs = inputs[direction]
+            converter = CONVERTERS[direction]
+            # The first call also compiles the validators of the direction.
+            converter(document, **kwargs)
+            seconds = _median_time(lambda: converter(document, **kwargs), repeat)
+            curves[direction].append(
+                {
+                    option: getattr(options, option),
+                    "input_bytes": len(json.dumps(document)),
+                    "seconds": seconds,
+                }
+            )
+
+    return [
+        {
+            "direction": direction,
+            "exponent": fit_exponent(
+                [point["input_bytes"] for point in points],
+                [point["seconds"] for point in points],
+            ),
+            "points": points,
+        }
+        for direction, points in curves.items()
+    ]
+
+
+def check_bounds(
+    results: List[Dict], max_exponent: float, bounds: Dict[str, float]
+) -> List[str]:
+    """Returns a message for every direction whose exponent exceeds its bound."""
+    return [
+        f"{result['direction']} scales with exponent {result['exponent']:.2f},"
+        f" bound is {bounds.get(result['direction'], max_exponent):.2f}"
+        for result in results
+        if result["exponent"] > bounds.get(result["direction"], max_exponent)
+    ]
+
+
+def _parse_bound(value: str):
+    direction, separator, exponent = value.partition("=")
+    if separator == "" or direction not in CONVERTERS:
+        raise argparse.ArgumentTypeError(
+            f"Expected <direction>=<exponent> with one of {', '.join(CONVERTERS)}."
+        )
+    return direction, float(exponent)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--directions",
+        type=lambda value: value.split(","),
+        default=list(CONVERTERS),
+        help="Comma-separated conversion directions. Defaults to all of them.",
+    )
+    parser.add_argument(
+        "--scale",
+        choices=SCALABLE_OPTIONS,
+        default="affordances",
+        help="Generator option that is scaled. Defaults to affordances.",
+    )
+    parser.add_argument("--start", type=int, default=16)
+    parser.add_argument("--factor", type=int, default=2)
+    parser.add_argument("--steps", type=int, default=4)
+    parser.add_argument("--max-exponent", type=float, default=DEFAULT_MAX_EXPONENT)
+    parser.add_argument(
+        "--bound",
+        type=_parse_bound,
+        action="append",
+        default=[],
+        help="Exponent bound of a single direction as <direction>=<exponent>.",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print the results as JSON."
+    )
+    parsed_args = parser.parse_args(args)
+
+    unknown_directions = set(parsed_args.directions) - set(CONVERTERS)
+    if len(unknown_directions) > 0:
+        parser.error(f"Unknown directions: {', '.join(sorted(unknown_directions))}")
+    if parsed_args.steps < 2:
+        parser.error("At least two steps are needed to fit an exponent.")
+
+    results = measure(
+        parsed_args.directions,
+        parsed_args.scale,
+        parsed_args.start,
+        parsed_args.factor,
+        parsed_args.steps,
+        parsed_args.repeat,
+    )
+    violations = check_bounds(
+        results, parsed_args.max_exponent, dict(parsed_args.bound)
+    )
+
+    if parsed_args.json:
+        report = {
+            "metadata": metadata(ModelOptions()),
+            "scale": parsed_args.scale,
+            "start": parsed_args.start,
+            "factor": parsed_args.factor,
+            "results": results,
+            "violations": violations,
+        }
+        json.dump(report, sys.stdout, indent=4)
+        print()
+    else:
+        for result in results:
+            sizes = " ".join(str(point["input_bytes"]) for point in result["points"])
+            print(
+                f"{result['direction']:<10} exponent {result['exponent']:>5.2f}"
+                f" (bytes: {sizes})"
+            )
+
+    for violation in violations:
+        print(violation, file=sys.stderr)
+    if len(violations) > 0:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Measures how many Thing Descriptions per second can be derived from one TM.
+
+Every device has its own placeholder map and meta data. The Thing Descriptions are
+derived once by converting the Thing Model for every device and once by
+instantiating a template compiled with compile_thing_model(), with and without
+validating the resulting Thing Descriptions.
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import Callable, Dict, List
+
+from sdf_wot_converter import compile_thing_model, convert_wot_tm_to_wot_td
+
+
+def _thing_model(affordances: int) -> Dict:
+    properties = {
+        f"property{index}": {
+            "type": "number",
+            "minimum": 0,
+            "maximum": "{{MAXIMUM}}",
+            "unit": "percent",
+            "forms": [{"href": f"https://{{{{HOST}}}}/properties/{index}"}],
+        }
+        for index in range(affordances)
+    }
+    return {
+        "@context": "https://www.w3.org/2022/wot/td/v1.1",
+        "@type": "tm:ThingModel",
+        "title": "Device {{NUMBER}}",
+        "version": {"model": "1.0.0"},
+        "securityDefinitions": {"nosec_sc": {"scheme": "nosec"}},
+        "security": "nosec_sc",
+        "properties": properties,
+    }
+
+
+def _device_parameters(devices: int):
+    return [
+        (
+            {
+                "NUMBER": number,
+                "HOST": f"device{number}.example.org",
+                "MAXIMUM": 100 + number,
+            },
+            {"id": f"urn:dev:benchmark:{number}"},
+        )
+        for number in range(devices)
+    ]
+
+
+def _throughput(function: Callable, devices: List) -> float:
+    start = time.perf_counter()
+    for placeholder_map, meta_data in devices:
+        function(placeholder_map, meta_data)
+    return len(devices) / (time.perf_counter() - start)
+
+
+def measure(devices: int, affordances: int):
+    thing_model = _thing_model(affordances)
+    device_parameters = _device_parameters(devices)
+    results = []
+
+    for validation in ["full", "none"]:
+        results.append(
+            {
+                "variant": f"convert_wot_tm_to_wot_td, validation={validation}",
+                "tds_per_second": _throughput(
+                    lambda placeholder_map, meta_data: convert_wot_tm_to_wot_td(
+                        thing_model,
+                        placeholder_map=placeholder_map,
+                        meta_data=meta_data,
+                        validation=validation,
+                    ),
+                    device_parameters,
+                ),
+            }
+        )
+
+        template = compile_thing_model(thing_model, validation=validation)
+        results.append(
+            {
+                "variant": f"template.instantiate, validation={validation}",
+                "tds_per_second": _throughput(
+                    lambda placeholder_map, meta_data: template.instantiate(
+                        placeholder_map, meta_data=meta_data
+                    ),
+                    device_parameters,
+                ),
+            }
+        )
+
+    for result in results:
+        result.update(devices=devices, affordances=affordances)
+    return results
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=1000)
+    parser.add_argument("--affordances", type=int, default=20)
+    parser.add_argument(
+        "--json", action="store_true", help="Print the results as JSON."
+    )
+    parsed_args = parser.parse_args(args)
+
+    results = measure(parsed_args.devices, parsed_args.affordances)
+
+    if parsed_args.json:
+        json.dump(results, sys.stdout, indent=4)
+        print()
+        return
+
+    print(f"{parsed_args.devices} devices, {parsed_args.affordances} affordances")
+    for result in results:
+        print(f"{result['variant']:<50} {result['tds_per_second']:>10.0f} TDs/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Measures how tm:ref resolution scales with the depth of nested data schemas.
+
+The Thing Models contain a single schema definition that nests object schemas
+up to the given depth. Every level has a few plain properties, one of which
+references another schema definition via tm:ref. Since only the definitions
+containing a tm:ref and their ancestors are copied, the time per schema node
+should stay roughly constant as the depth increases.
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+from sdf_wot_converter.converters.wot_common import resolve_extension
+
+
+def _nested_schema(depth: int, width: int) -> Dict:
+    properties: Dict = {
+        f"value{index}": {"type": "number", "minimum": index} for index in range(width)
+    }
+    properties["reference"] = {"tm:ref": "#/schemaDefinitions/leaf"}
+    if depth > 1:
+        properties["child"] = _nested_schema(depth - 1, width)
+    return {"type": "object", "properties": properties}
+
+
+def _thing_model(depth: int, width: int) -> Dict:
+    return {
+        "@context": "https://www.w3.org/2022/wot/td/v1.1",
+        "@type": "tm:ThingModel",
+        "title": "Benchmark Thing",
+        "schemaDefinitions": {
+            "leaf": {"type": "string", "enum": ["on", "off"]},
+            "tree": _nested_schema(depth, width),
+        },
+    }
+
+
+def _count_nodes(value) -> int:
+    if not isinstance(value, dict):
+        return 0
+    return 1 + sum(_count_nodes(child) for child in value.values())
+
+
+def _median_time(function: Callable, repeat: int) -> float:
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def measure(depths: List[int], width: int, repeat: int):
+    results = []
+    for depth in depths:
+        thing_model = _thing_model(depth, width)
+        seconds = _median_time(lambda: resolve_extension(thing_model), repeat)
+        nodes = _count_nodes(thing_model)
+        results.append(
+            {
+                "depth": depth,
+                "width": width,
+                "nodes": nodes,
+                "seconds": seconds,
+                "microseconds_per_node": seconds / nodes * 1e6,
+            }
+        )
+    return results
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--depths",
+        type=lambda value: [int(depth) for depth in value.split(",")],
+        default=[10, 20, 40, 80],
+        help="Comma-separated nesting depths. Defaults to 10,20,40,80.",
+    )
+    parser.add_argument("--width", type=int, default=10)
+    parser.add_argument(
+        "--json", action="store_true", help="Print the results as JSON."
+    )
+    parsed_args = parser.parse_args(args)
+
+    results = measure(parsed_args.depths, parsed_args.width, parsed_args.repeat)
+
+    if parsed_args.json:
+        json.dump(results, sys.stdout, indent=4)
+        print()
+        return
+
+    for result in results:
+        print(
+            f"depth {result['depth']:>4} {result['nodes']:>7} nodes"
+            f" {result['seconds'] * 1000:>10.2f} ms"
+            f" {result['microseconds_per_node']:>8.2f} µs/node"
+        )
+
+
+if __name__ == "__main__":
+    main()
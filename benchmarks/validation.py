@@ -0,0 +1,152 @@
+"""Compares the compiled validators with jsonschema on documents of growing size.
+
+The documents are synthetic Thing Descriptions, Thing Models, and SDF models
+with an increasing number of affordances. For every document, the benchmark
+reports the median time jsonschema needs to validate it and the median time the
+compiled validator needs to decide that it is valid.
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+from sdf_wot_converter import validation
+
+SIZES = [10, 100, 1000]
+
+
+def _thing_description(size: int) -> Dict:
+    return {
+        "@context": "https://www.w3.org/2022/wot/td/v1.1",
+        "title": "Benchmark Thing",
+        "securityDefinitions": {"nosec_sc": {"scheme": "nosec"}},
+        "security": "nosec_sc",
+        "properties": {
+            f"property{index}": {
+                "type": "object",
+                "properties": {
+                    "value": {"type": "number", "minimum": 0, "maximum": 100},
+                    "unit": {"type": "string", "enum": ["a", "b", "c"]},
+                },
+                "observable": True,
+                "forms": [{"href": f"https://example.org/properties/{index}"}],
+            }
+            for index in range(size)
+        },
+        "actions": {
+            f"action{index}": {
+                "input": {"type": "integer"},
+                "forms": [{"href": f"https://example.org/actions/{index}"}],
+            }
+            for index in range(size)
+        },
+    }
+
+
+def _thing_model(size: int) -> Dict:
+    thing_model = _thing_description(size)
+    thing_model["@type"] = "tm:ThingModel"
+    thing_model["title"] = "{{TITLE}}"
+    return thing_model
+
+
+def _sdf_model(size: int) -> Dict:
+    return {
+        "info": {"title": "Benchmark Model", "version": "2022-01-01"},
+        "namespace": {"example": "https://example.org"},
+        "defaultNamespace": "example",
+        "sdfObject": {
+            "BenchmarkObject": {
+                "sdfProperty": {
+                    f"property{index}": {
+                        "type": "number",
+                        "minimum": 0,
+                        "maximum": 100,
+                        "writable": False,
+                    }
+                    for index in range(size)
+                },
+                "sdfAction": {
+                    f"action{index}": {"sdfInputData": {"type": "integer"}}
+                    for index in range(size)
+                },
+            }
+        },
+    }
+
+
+DOCUMENTS: Dict[str, Callable[[int], Dict]] = {
+    "td_validator": _thing_description,
+    "tm_validator": _thing_model,
+    "sdf_validator": _sdf_model,
+    "sdf_framework_validator": _sdf_model,
+}
+
+
+def _median_time(function: Callable, repeat: int) -> float:
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def measure(validator_name: str, size: int, repeat: int) -> Dict:
+    document = DOCUMENTS[validator_name](size)
+    validator = validation.get_validator(validator_name)
+    fast_validator = validation.get_fast_validator(validator_name)
+    assert fast_validator(document), f"{validator_name} rejected a valid document"
+
+    return {
+        "validator": validator_name,
+        "size": size,
+        "bytes": len(json.dumps(document)),
+        "jsonschema": _median_time(lambda: validator.validate(document), repeat),
+        "compiled": _median_time(lambda: fast_validator(document), repeat),
+    }
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=SIZES,
+        help="Number of affordances per document.",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print the results as JSON."
+    )
+    parsed_args = parser.parse_args(args)
+
+    results = [
+        measure(validator_name, size, parsed_args.repeat)
+        for validator_name in DOCUMENTS
+        for size in parsed_args.sizes
+    ]
+
+    if parsed_args.json:
+        json.dump(results, sys.stdout, indent=4)
+        print()
+        return
+
+    print(
+        f"{'validator':<24} {'size':>6} {'bytes':>9} "
+        f"{'jsonschema ms':>14} {'compiled ms':>12} {'speedup':>8}"
+    )
+    for result in results:
+        print(
+            f"{result['validator']:<24} {result['size']:>6} {result['bytes']:>9} "
+            f"{result['jsonschema'] * 1000:>14.2f} {result['compiled'] * 1000:>12.2f} "
+            f"{result['jsonschema'] / result['compiled']:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
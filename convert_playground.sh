@@ -4,7 +4,4 @@ git clone https://github.com/one-data-model/playground.git
 rm -fR playground/tm
 mkdir -p output/tm
 cd playground
-for filename in sdfObject/sdfobject*.sdf.json; do
-    echo "Converting $filename ..."
-    sdf-wot-converter sdf-to-tm -i "$filename" -o "../output/tm/$(basename "$filename" .sdf.json).tm.jsonld" --origin-url $origin/$filename
-done
+sdf-wot-converter batch sdf-to-tm -i "sdfObject/sdfobject*.sdf.json" -o ../output/tm --origin-url-base $origin -j 0 --keep-going
@@ -2,6 +2,7 @@ import sys
 from .cli import parse_arguments, use_converter_cli
 
 from .converters import (
+    compile_thing_model,
     convert_wot_tm_to_sdf,
     convert_wot_tm_to_wot_td,
     convert_sdf_to_wot_td,
@@ -13,10 +14,11 @@ from .converters import (
 
 def main():  # pragma: no cover
     args = parse_arguments(sys.argv[1:])
-    use_converter_cli(args)
+    sys.exit(use_converter_cli(args))
 
 
 __all__ = [
+    "compile_thing_model",
     "convert_wot_tm_to_sdf",
     "convert_wot_tm_to_wot_td",
     "convert_sdf_to_wot_td",
@@ -1,12 +1,17 @@
 import argparse
+import contextlib
+import functools
 import json
-from pprint import pprint
+import os
+import socket
 import sys
-from typing import Dict, List, Optional, Union
+import time
+from typing import Callable, Dict, List, Optional, Union
 import urllib.request
 import validators
 
 from ..converters import (
+    compile_thing_model,
     convert_sdf_to_wot_td,
     convert_sdf_to_wot_tm,
     convert_wot_td_to_sdf,
@@ -14,6 +19,31 @@ from ..converters import (
     convert_wot_tm_to_sdf,
     convert_wot_tm_to_wot_td,
 )
+from ..converters.retrieval import DEFAULT_TTL, configure_document_cache
+from ..converters.tm_to_td import UnsupportedThingModelError
+from ..timings import record_timings, timed_phase
+from .defaults import (
+    BATCH_DIRECTIONS,
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    DEFAULT_SERVER_CACHE_TTL,
+    DEFAULT_SHARD_SIZE,
+    DEFAULT_WORKERS,
+)
+from .encoding import (
+    DEFAULT_JSON_ENCODER,
+    JSON_ENCODERS,
+    JsonEncoder,
+    get_json_encoder,
+    stdout_stream,
+)
+from ..validation import VALIDATION_LEVELS, enable_validation_cache
+
+# The modules implementing the batch, serve, and JSON Lines commands, as well as
+# the profiler, are only imported by the commands that use them, which keeps the
+# start-up time of single conversions low.
+
+INPUT_FORMATS = ("json", "jsonl")
 
 
 class CommandException(Exception):
@@ -44,6 +74,7 @@ def _load_model_from_url(input_url: str) -> Dict:
         return retrieved_model
 
 
+@timed_phase("load")
 def _load_model(paths_or_urls: str) -> Dict:
     if validators.url(paths_or_urls):
         return _load_model_from_url(paths_or_urls)
@@ -78,25 +109,45 @@ def _load_sdf_mapping_files(paths_or_urls: Optional[List[str]]) -> Optional[List
     return result
 
 
-def save_model(output_path: str, model: Dict, indent=4):
-    file = open(output_path, "w")
-    json.dump(model, file, indent=indent)
-    file.close()
+@timed_phase("serialization")
+def save_model(
+    output_path: str,
+    model: Dict,
+    indent: Optional[int] = 4,
+    encoder: Optional[JsonEncoder] = None,
+):
+    encoder = encoder or get_json_encoder(indent=indent)
+    with open(output_path, "wb") as file:
+        encoder.dump(model, file, indent)
+
+
+@timed_phase("serialization")
+def print_model(
+    model: Dict, indent: Optional[int] = 4, encoder: Optional[JsonEncoder] = None
+):
+    encoder = encoder or get_json_encoder(indent=indent)
+    output = stdout_stream()
+    encoder.dump(model, output, indent)
+    output.write(b"\n")
+    output.flush()
 
 
 def save_or_print_model(
     output_path: Optional[str],
     model: Optional[Dict],
-    indent=4,
+    indent: Optional[int] = 4,
     print_enabled=True,
+    encoder: Optional[JsonEncoder] = None,
 ):
+    """Writes the model to the given path or, if no path is given, as JSON to the
+    standard output. An indent of None produces compact output."""
     if model is None:
         return
 
     if output_path is not None:
-        save_model(output_path, model, indent=indent)
+        save_model(output_path, model, indent=indent, encoder=encoder)
     elif print_enabled:
-        pprint(model, indent=indent)
+        print_model(model, indent=indent, encoder=encoder)
 
 
 def _add_input_argument(
@@ -219,6 +270,34 @@ def _add_tm_arguments(subparser):
         "tm:required array.",
     )
 
+    wot_tm_to_wot_td.add_argument(
+        "--devices",
+        dest="devices",
+        help="JSON Lines file (or - for the standard input) with the parameters of "
+        "one device per line, i.e., an object with the optional members "
+        '"placeholder_map", "meta_data", and "bindings". One Thing Description is '
+        "derived per device and written as one line of JSON, while the Thing Model "
+        "is only prepared once. The values of the files passed via "
+        "--placeholder-map, --meta-data, and --bindings apply to all devices. "
+        "Cannot be combined with --input-format or --output-format jsonl.",
+    )
+
+    wot_tm_to_wot_td.add_argument(
+        "--output-dir",
+        dest="output_dir",
+        help="Directory to which the Thing Descriptions derived with --devices are "
+        "written in shards of --shard-size lines.",
+    )
+
+    wot_tm_to_wot_td.add_argument(
+        "--shard-size",
+        dest="shard_size",
+        default=DEFAULT_SHARD_SIZE,
+        type=int,
+        help="Maximum number of Thing Descriptions per file in the --output-dir. "
+        f"Defaults to {DEFAULT_SHARD_SIZE}.",
+    )
+
     for parser in [wot_tm_to_sdf, wot_tm_to_wot_td]:
         _add_input_argument(
             parser,
@@ -281,6 +360,138 @@ def _add_td_arguments(subparser):
         )
 
 
+def _add_batch_arguments(subparser):
+    batch = subparser.add_parser(
+        "batch",
+        help="Converts many models in a single run, optionally using several "
+        "worker processes.",
+    )
+
+    batch.add_argument(
+        "direction",
+        choices=BATCH_DIRECTIONS,
+        help="The conversion that is applied to every input file.",
+    )
+
+    batch.add_argument(
+        "--input",
+        "-i",
+        dest="batch_inputs",
+        metavar="INPUT",
+        required=True,
+        nargs="+",
+        help="Input files, directories, or glob patterns. Directories are searched "
+        "recursively for files with the usual suffix of the input format, e.g., "
+        ".sdf.json for SDF models.",
+    )
+
+    batch.add_argument(
+        "--output-dir",
+        "-o",
+        dest="output_dir",
+        required=True,
+        help="Directory to which the converted models are written.",
+    )
+
+    batch.add_argument(
+        "--manifest",
+        dest="manifest_path",
+        metavar="PATH",
+        help="Write a manifest listing the outputs, errors, and conversion times of "
+        "every input file to this path. No manifest is written unless this option "
+        "is given.",
+    )
+
+    batch.add_argument(
+        "--keep-going",
+        dest="keep_going",
+        action="store_true",
+        help="Exit with status 0 even if some input files could not be converted. "
+        "By default, the exit status is 1 if any file failed.",
+    )
+
+    batch.add_argument(
+        "--jobs",
+        "-j",
+        dest="jobs",
+        default=1,
+        type=int,
+        help="Number of worker processes. 0 uses one process per CPU. Defaults to "
+        "1, i.e., all files are converted in the current process.",
+    )
+
+    batch.add_argument(
+        "--origin-url-base",
+        dest="origin_url_base",
+        help="Base URL from which the SDF models originate. The origin URL of "
+        "each model is the base URL followed by its path relative to the current "
+        "working directory.",
+    )
+
+
+def _add_serve_arguments(subparser):
+    serve = subparser.add_parser(
+        "serve",
+        help="Serves all conversions over a local HTTP endpoint, keeping validators "
+        "and retrieved models in memory between requests.",
+    )
+
+    serve.add_argument(
+        "--host",
+        dest="host",
+        default=DEFAULT_HOST,
+        help=f"Host name or address to listen on. Defaults to {DEFAULT_HOST}.",
+    )
+
+    serve.add_argument(
+        "--port",
+        dest="port",
+        default=DEFAULT_PORT,
+        type=int,
+        help=f"Port to listen on. Defaults to {DEFAULT_PORT}.",
+    )
+
+    serve.add_argument(
+        "--unix-socket",
+        dest="unix_socket",
+        help="Path of a Unix socket to listen on instead of a TCP port. Not "
+        "available on platforms without Unix sockets, such as Windows.",
+    )
+
+    serve.add_argument(
+        "--workers",
+        "-j",
+        dest="workers",
+        default=DEFAULT_WORKERS,
+        type=int,
+        help="Number of worker threads handling requests. "
+        f"Defaults to {DEFAULT_WORKERS}.",
+    )
+
+    serve.add_argument(
+        "--access-log",
+        action="store_true",
+        help="Logs every request to the standard error.",
+    )
+
+    serve.add_argument(
+        "--no-local-files",
+        dest="local_files",
+        action="store_false",
+        help="Do not read local files referenced by the models in requests. "
+        "Without this flag, any client can make the server read JSON files on "
+        "its host via sdfRef, tm:extends, or tm:ref.",
+    )
+
+    serve.add_argument(
+        "--no-remote-documents",
+        dest="remote_documents",
+        action="store_false",
+        help="Do not retrieve remote documents referenced by the models in "
+        "requests.",
+    )
+
+
 def _add_sdf_infoblock_arguments(parser):
     parser.add_argument(
         "--title",
@@ -339,6 +550,8 @@ def parse_arguments(args):
     _add_sdf_arguments(subparser)
     _add_tm_arguments(subparser)
     _add_td_arguments(subparser)
+    _add_batch_arguments(subparser)
+    _add_serve_arguments(subparser)
 
     parser.add_argument(
         "--indent",
@@ -348,6 +561,24 @@ def parse_arguments(args):
         help="Indentation depth for the output JSON files.",
     )
 
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Writes the output JSON without any whitespace. Overrides --indent.",
+    )
+
+    parser.add_argument(
+        "--json-encoder",
+        dest="json_encoder",
+        default=DEFAULT_JSON_ENCODER,
+        choices=["auto", *JSON_ENCODERS],
+        help='JSON encoder used for the output. "auto" uses orjson if it is '
+        "installed and supports the indent, and the encoder of the standard "
+        'library ("json") otherwise. orjson only supports an indent of 2 or '
+        "compact output, so selecting it explicitly requires --indent 2 or "
+        '--compact unless the output is JSON Lines. Defaults to "auto".',
+    )
+
     parser.add_argument(
         "--suppress-roundtripping",
         action="store_true",
@@ -355,7 +586,155 @@ def parse_arguments(args):
         'like "sdf:objectKey".',
     )
 
-    return parser.parse_args(args)
+    parser.add_argument(
+        "--validation",
+        dest="validation",
+        default="full",
+        choices=VALIDATION_LEVELS,
+        help="Determines which documents are validated during the conversion: "
+        'inputs, outputs, and intermediate documents ("full"), only the input '
+        'documents ("inputs"), only the converted documents ("outputs"), or '
+        'nothing at all ("none"). Defaults to "full".',
+    )
+
+    parser.add_argument(
+        "--input-format",
+        dest="input_format",
+        default="json",
+        choices=INPUT_FORMATS,
+        help='Format of the input. With "jsonl", the input is a JSON Lines file (or '
+        "- for the standard input) with one model per line, each of which is "
+        'converted on its own. Defaults to "json".',
+    )
+
+    parser.add_argument(
+        "--output-format",
+        dest="output_format",
+        choices=INPUT_FORMATS,
+        help='Format of the output. With "jsonl", every input model is converted on '
+        "its own and the result is written as one line, or an error record with "
+        "the line number of the JSON Lines input or the path of the input file if "
+        "the conversion fails. Results consisting of an "
+        "SDF model and a mapping file are written as an object with the members "
+        '"sdf_model" and "mapping_file". Defaults to the input format.',
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        dest="cache_dir",
+        help="Directory in which retrieved remote documents (e.g., the SDF models "
+        "referenced by sdfRefs or the Thing Models extended by a TM) are cached "
+        "across invocations. If omitted, remote documents are only cached for the "
+        "duration of a single run.",
+    )
+
+    parser.add_argument(
+        "--cache-ttl",
+        dest="cache_ttl",
+        type=int,
+        help="Number of seconds a cached remote document is used before it is "
+        "revalidated with the server. Defaults to one day, or to "
+        f"{DEFAULT_SERVER_CACHE_TTL // 60} minutes for the serve command, which "
+        "keeps documents in memory for as long as it runs.",
+    )
+
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Only use remote documents from the cache directory and never "
+        "contact any server.",
+    )
+
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Prints the time spent loading, validating, resolving references, "
+        "mapping, and serializing documents to the standard error. Conversions in "
+        "worker processes (batch --jobs) are not included.",
+    )
+
+    parser.add_argument(
+        "--profile",
+        dest="profile",
+        metavar="PREFIX",
+        help="Runs the command under cProfile and writes the results to "
+        "PREFIX.pstats and, as collapsed stacks for flame graph tools, to "
+        "PREFIX.collapsed. Conversions in worker processes (batch --jobs) are not "
+        "included.",
+    )
+
+    parsed_args = parser.parse_args(args)
+    _check_format_arguments(parser, parsed_args)
+    _check_json_encoder_arguments(parser, parsed_args)
+    if parsed_args.command == "serve":
+        _check_serve_arguments(parser, parsed_args)
+    return parsed_args
+
+
+def _check_serve_arguments(parser, args):
+    # Requests are handled by worker threads, which are neither timed nor
+    # profiled.
+    if args.timings:
+        parser.error("--timings cannot be combined with the serve command.")
+    if args.profile is not None:
+        parser.error("--profile cannot be combined with the serve command.")
+    if args.unix_socket is not None and not hasattr(socket, "AF_UNIX"):
+        parser.error("Unix sockets are not supported on this platform.")
+
+
+def _check_format_arguments(parser, args):
+    if args.output_format is None:
+        args.output_format = args.input_format
+
+    # The Thing Descriptions derived with --devices are always written as JSON
+    # Lines by their own writer.
+    if getattr(args, "devices", None) is not None and "jsonl" in (
+        args.input_format,
+        args.output_format,
+    ):
+        parser.error("--devices cannot be combined with JSON Lines input or output.")
+    # Thing Descriptions can only be derived in bulk from a single Thing Model.
+    # Thing Collections within a single file are only detected once it is loaded.
+    if getattr(args, "devices", None) is not None and len(args.wot_tms) != 1:
+        parser.error("--devices requires exactly one Thing Model as input.")
+
+    if args.input_format != "jsonl":
+        return
+
+    if args.command in ("batch", "serve"):
+        parser.error(f"The {args.command} command only supports JSON input files.")
+    if args.output_format != "jsonl":
+        parser.error("JSON Lines input can only be converted to JSON Lines output.")
+    if len(_get_input_paths(args)) != 1:
+        parser.error("JSON Lines input must be given as a single file.")
+
+
+def _check_json_encoder_arguments(parser, args):
+    # Requests of the serve command and JSON Lines are always written compactly.
+    if args.command == "serve" or (
+        args.command != "batch" and args.output_format == "jsonl"
+    ):
+        return
+
+    indent = _get_indent(args)
+    if not get_json_encoder(args.json_encoder, indent).supports_indent(indent):
+        parser.error(
+            f"The {args.json_encoder} JSON encoder does not support an indent of "
+            f"{indent}. Use --indent 2 or --compact."
+        )
+
+
+def _get_indent(args) -> Optional[int]:
+    if getattr(args, "compact", False):
+        return None
+    return args.indent
+
+
+def _get_json_encoder(args, indent: Optional[int]) -> JsonEncoder:
+    """Returns the encoder selected for documents written with the given indent,
+    which is None for JSON Lines and other compact output."""
+    name = getattr(args, "json_encoder", DEFAULT_JSON_ENCODER)
+    return get_json_encoder(name, indent)
 
 
 def _get_origin_url(path: str, url: Optional[str]):
@@ -369,8 +748,30 @@ def _get_origin_url(path: str, url: Optional[str]):
         return None
 
 
+def _get_cache_ttl(args) -> int:
+    cache_ttl = getattr(args, "cache_ttl", None)
+    if cache_ttl is not None:
+        return cache_ttl
+    if args.command == "serve":
+        return DEFAULT_SERVER_CACHE_TTL
+    return DEFAULT_TTL
+
+
+def _get_document_cache_configuration(args) -> Dict:
+    return {
+        "directory": getattr(args, "cache_dir", None),
+        "ttl": _get_cache_ttl(args),
+        "offline": getattr(args, "offline", False),
+    }
+
+
+# The documents loaded by the CLI are only used for a single conversion, so the
+# converters do not need to copy them.
+
+
 def _handle_from_sdf(args):
-    indent = args.indent
+    indent = _get_indent(args)
+    encoder = _get_json_encoder(args, indent)
     input_path = args.sdf_model
     output_path = args.output_path
     mapping_file_input_path = args.mapping_file_input_path
@@ -388,6 +789,8 @@ def _handle_from_sdf(args):
             origin_url=origin_url,
             sdf_mapping_files=sdf_mapping_files,
             suppress_roundtripping=suppress_roundtripping,
+            validation=args.validation,
+            copy_input=False,
         )
     elif command == "sdf-to-tm":
         output = convert_sdf_to_wot_tm(
@@ -395,15 +798,70 @@ def _handle_from_sdf(args):
             sdf_mapping_files=sdf_mapping_files,
             origin_url=origin_url,
             suppress_roundtripping=suppress_roundtripping,
+            validation=args.validation,
+            copy_input=False,
         )
     else:
         raise CommandException()
 
-    save_or_print_model(output_path, output, indent=indent)
+    save_or_print_model(output_path, output, indent=indent, encoder=encoder)
+
+
+def _open_input_stream(path: str):
+    if path == "-":
+        return contextlib.nullcontext(sys.stdin)
+    return open(path)
+
+
+def _derive_thing_descriptions_in_bulk(
+    args, thing_model: Dict, placeholder_map, meta_data, bindings
+):
+    from .bulk import (
+        derive_thing_descriptions,
+        read_device_records,
+        write_json_lines,
+        write_json_lines_shards,
+    )
+
+    encoder = _get_json_encoder(args, None)
+    try:
+        template = compile_thing_model(
+            thing_model,
+            remove_not_required_affordances=args.remove_not_required_affordances,
+            validation=args.validation,
+            copy_input=False,
+            # The Thing Descriptions are serialized right away and never modified.
+            copy_output=False,
+        )
+    except UnsupportedThingModelError as error:
+        sys.exit(f"--devices requires a single Thing Model: {error}")
+
+    with _open_input_stream(args.devices) as device_records_file:
+        thing_descriptions = derive_thing_descriptions(
+            template,
+            read_device_records(device_records_file),
+            placeholder_map=placeholder_map,
+            meta_data=meta_data,
+            bindings=bindings,
+        )
+
+        if args.output_dir is not None:
+            write_json_lines_shards(
+                thing_descriptions,
+                args.output_dir,
+                shard_size=args.shard_size,
+                encoder=encoder,
+            )
+        elif args.output_path is not None:
+            with open(args.output_path, "wb") as output_file:
+                write_json_lines(thing_descriptions, output_file, encoder=encoder)
+        else:
+            write_json_lines(thing_descriptions, stdout_stream(), encoder=encoder)
 
 
 def _handle_from_tm(args):
-    indent = args.indent
+    indent = _get_indent(args)
+    encoder = _get_json_encoder(args, indent)
 
     command = args.command
     input_path = args.wot_tms
@@ -421,6 +879,8 @@ def _handle_from_tm(args):
             placeholder_map=placeholder_map,
             suppress_roundtripping=suppress_roundtripping,
             infoblock=infoblock,
+            validation=args.validation,
+            copy_input=False,
         )
         mapping_file_output_path = args.mapping_file_output_path
         if isinstance(output, dict):
@@ -428,7 +888,7 @@ def _handle_from_tm(args):
         else:
             sdf_model, sdf_mapping_file = output
 
-        save_or_print_model(output_path, sdf_model, indent=indent)
+        save_or_print_model(output_path, sdf_model, indent=indent, encoder=encoder)
 
         print_enabled = output_path is None
         save_or_print_model(
@@ -436,6 +896,12 @@ def _handle_from_tm(args):
             sdf_mapping_file,
             indent=indent,
             print_enabled=print_enabled,
+            encoder=encoder,
+        )
+
+    elif command == "tm-to-td" and args.devices is not None:
+        _derive_thing_descriptions_in_bulk(
+            args, thing_models, placeholder_map, meta_data, bindings
         )
 
     elif command == "tm-to-td":
@@ -446,32 +912,39 @@ def _handle_from_tm(args):
             meta_data=meta_data,
             bindings=bindings,
             remove_not_required_affordances=remove_not_required_affordances,
+            validation=args.validation,
+            copy_input=False,
         )
 
-        save_or_print_model(output_path, output, indent=indent)
+        save_or_print_model(output_path, output, indent=indent, encoder=encoder)
 
     else:
         raise CommandException()
 
 
 def _handle_from_td(args):
-    indent = args.indent
+    indent = _get_indent(args)
+    encoder = _get_json_encoder(args, indent)
     command = args.command
     suppress_roundtripping = args.suppress_roundtripping
 
     thing_description = _load_model_or_collection(args.wot_tds, "ThingDescription")
     output_path = args.output_path
     if command == "td-to-tm":
-        thing_model = convert_wot_td_to_wot_tm(thing_description)
-        save_or_print_model(output_path, thing_model, indent=indent)
+        thing_model = convert_wot_td_to_wot_tm(
+            thing_description, validation=args.validation, copy_input=False
+        )
+        save_or_print_model(output_path, thing_model, indent=indent, encoder=encoder)
     elif command == "td-to-sdf":
         infoblock = _get_sdf_infoblock(args)
         sdf_model, mapping_file = convert_wot_td_to_sdf(
             thing_description,
             suppress_roundtripping=suppress_roundtripping,
             infoblock=infoblock,
+            validation=args.validation,
+            copy_input=False,
         )
-        save_or_print_model(output_path, sdf_model, indent=indent)
+        save_or_print_model(output_path, sdf_model, indent=indent, encoder=encoder)
 
         print_enabled = output_path is None
         save_or_print_model(
@@ -479,11 +952,194 @@ def _handle_from_td(args):
             mapping_file,
             indent=indent,
             print_enabled=print_enabled,
+            encoder=encoder,
+        )
+    else:
+        raise CommandException()
+
+
+def _get_input_paths(args) -> List[str]:
+    command = args.command
+    if command.startswith("sdf-to"):
+        return [args.sdf_model]
+    elif command.startswith("tm-to"):
+        return args.wot_tms
+    elif command.startswith("td-to"):
+        return args.wot_tds
+    else:
+        raise CommandException()
+
+
+def _create_sdf_stream_converter(args) -> Callable[[Dict], Dict]:
+    convert_sdf = convert_sdf_to_wot_tm
+    if args.command == "sdf-to-td":
+        convert_sdf = convert_sdf_to_wot_td
+    # The mapping files are shared by all records, so the inputs are copied.
+    return functools.partial(
+        convert_sdf,
+        sdf_mapping_files=_load_sdf_mapping_files(args.mapping_file_input_path),
+        origin_url=_get_origin_url(args.sdf_model, args.origin_url),
+        suppress_roundtripping=args.suppress_roundtripping,
+        validation=args.validation,
+    )
+
+
+def _create_tm_stream_converter(args) -> Callable[[Dict], Dict]:
+    from .streaming import create_sdf_output_record
+
+    placeholder_map = _load_optional_json_file(args.placeholder_map)
+
+    if args.command == "tm-to-sdf":
+        infoblock = _get_sdf_infoblock(args)
+        return lambda thing_model: create_sdf_output_record(
+            convert_wot_tm_to_sdf(
+                thing_model,
+                placeholder_map=placeholder_map,
+                suppress_roundtripping=args.suppress_roundtripping,
+                infoblock=infoblock,
+                validation=args.validation,
+                copy_input=False,
+            )
+        )
+
+    return functools.partial(
+        convert_wot_tm_to_wot_td,
+        placeholder_map=placeholder_map,
+        meta_data=_load_optional_json_file(args.meta_data),
+        bindings=_load_optional_json_file(args.bindings),
+        remove_not_required_affordances=args.remove_not_required_affordances,
+        validation=args.validation,
+        copy_input=False,
+    )
+
+
+def _create_td_stream_converter(args) -> Callable[[Dict], Dict]:
+    from .streaming import create_sdf_output_record
+
+    if args.command == "td-to-sdf":
+        infoblock = _get_sdf_infoblock(args)
+        return lambda thing_description: create_sdf_output_record(
+            convert_wot_td_to_sdf(
+                thing_description,
+                suppress_roundtripping=args.suppress_roundtripping,
+                infoblock=infoblock,
+                validation=args.validation,
+                copy_input=False,
+            )
         )
+
+    return functools.partial(
+        convert_wot_td_to_wot_tm, validation=args.validation, copy_input=False
+    )
+
+
+def _create_stream_converter(args) -> Callable[[Dict], Dict]:
+    command = args.command
+    if command.startswith("sdf-to"):
+        return _create_sdf_stream_converter(args)
+    elif command.startswith("tm-to"):
+        return _create_tm_stream_converter(args)
+    elif command.startswith("td-to"):
+        return _create_td_stream_converter(args)
     else:
         raise CommandException()
 
 
+def _handle_json_lines(args):
+    from .bulk import write_json_lines
+    from .streaming import (
+        convert_records,
+        read_json_file_records,
+        read_json_line_records,
+    )
+
+    # Records of one stream typically share mapping files and Thing Models.
+    enable_validation_cache()
+    convert = _create_stream_converter(args)
+    input_paths = _get_input_paths(args)
+
+    with contextlib.ExitStack() as stack:
+        if args.input_format == "jsonl":
+            input_stream = stack.enter_context(_open_input_stream(input_paths[0]))
+            records = read_json_line_records(input_stream)
+        else:
+            records = read_json_file_records(input_paths, _load_model)
+
+        output = stdout_stream()
+        if args.output_path is not None:
+            output = stack.enter_context(open(args.output_path, "wb"))
+
+        write_json_lines(
+            convert_records(records, convert),
+            output,
+            encoder=_get_json_encoder(args, None),
+        )
+
+
+def _handle_batch(args) -> int:
+    from .batch import (
+        BatchOptions,
+        OutputConflictError,
+        create_tasks,
+        find_input_files,
+        run_batch,
+        write_manifest,
+    )
+
+    options = BatchOptions(
+        direction=args.direction,
+        output_dir=args.output_dir,
+        indent=_get_indent(args),
+        validation=args.validation,
+        suppress_roundtripping=args.suppress_roundtripping,
+        origin_url_base=args.origin_url_base,
+        json_encoder=args.json_encoder,
+    )
+    cache_configuration = _get_document_cache_configuration(args)
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count() or 1
+
+    try:
+        tasks = create_tasks(find_input_files(args.batch_inputs, args.direction))
+    except OutputConflictError as error:
+        sys.exit(str(error))
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    results = []
+    for result in run_batch(tasks, options, jobs, cache_configuration):
+        if result.error is not None:
+            print(f"{result.input_path}: {result.error}", file=sys.stderr)
+        results.append(result)
+    seconds = time.perf_counter() - start
+
+    if args.manifest_path is not None:
+        write_manifest(results, options, seconds, args.manifest_path)
+    failed = sum(1 for result in results if result.error is not None)
+    print(
+        f"Converted {len(results) - failed} of {len(results)} files in "
+        f"{seconds:.2f} s, {failed} failed.",
+        file=sys.stderr,
+    )
+
+    return 1 if failed > 0 and not args.keep_going else 0
+
+
+def _handle_serve(args):
+    from .server import create_server, run_server
+
+    server = create_server(
+        host=args.host,
+        port=args.port,
+        unix_socket=args.unix_socket,
+        workers=args.workers,
+        encoder=_get_json_encoder(args, None),
+        log_requests=args.access_log,
+        local_files=args.local_files,
+        remote_documents=args.remote_documents,
+    )
+    run_server(server)
+
+
 def _load_optional_json_file(path: Optional[str]) -> Optional[Dict]:
     if path is None:
         return None
@@ -492,8 +1148,36 @@ def _load_optional_json_file(path: Optional[str]) -> Optional[Dict]:
 
 
 def use_converter_cli(args):
+    """Runs the command given by the parsed arguments. Returns the exit status of
+    commands that can partially fail, i.e., the batch command, and None
+    otherwise."""
+    timings = None
+    try:
+        with contextlib.ExitStack() as stack:
+            if getattr(args, "profile", None) is not None:
+                from ..profiling import profile
+
+                stack.enter_context(profile(args.profile))
+            if getattr(args, "timings", False):
+                timings = stack.enter_context(record_timings())
+            return _run_command(args)
+    finally:
+        if timings is not None:
+            print(timings.format_table(), file=sys.stderr)
+
+
+def _run_command(args):
+    # The batch command passes the same configuration on to its workers.
+    configure_document_cache(**_get_document_cache_configuration(args))
+
     command = args.command
-    if command.startswith("sdf-to"):
+    if command == "batch":
+        return _handle_batch(args)
+    elif command == "serve":
+        _handle_serve(args)
+    elif getattr(args, "output_format", "json") == "jsonl":
+        _handle_json_lines(args)
+    elif command.startswith("sdf-to"):
         _handle_from_sdf(args)
     elif command.startswith("tm-to"):
         _handle_from_tm(args)
@@ -505,4 +1189,4 @@ def use_converter_cli(args):
 
 def main():  # pragma: no cover
     args = parse_arguments(sys.argv[1:])
-    use_converter_cli(args)
+    sys.exit(use_converter_cli(args))
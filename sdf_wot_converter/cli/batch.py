@@ -0,0 +1,303 @@
+"""Conversion of many models within a single process or a pool of processes.
+
+The inputs are given as files, directories, or glob patterns. Every input file is
+converted independently and the results are written to an output directory,
+preserving the directory structure below the common parent directory of the
+inputs. Input files that would be converted to the same output files (e.g.,
+foo.tm.json and foo.tm.jsonld) are rejected before the run. Errors do not stop
+the run. Optionally, a manifest lists the outputs of every input file or the
+error that prevented its conversion. Since it contains the timings of the run,
+it is only written to an explicitly given path.
+"""
+
+import concurrent.futures
+import glob
+import json
+import os
+import time
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from ..converters import (
+    convert_sdf_to_wot_td,
+    convert_sdf_to_wot_tm,
+    convert_wot_td_to_sdf,
+    convert_wot_td_to_wot_tm,
+    convert_wot_tm_to_sdf,
+    convert_wot_tm_to_wot_td,
+)
+from ..converters.retrieval import configure_document_cache
+from ..timings import phase
+from ..validation import enable_validation_cache
+from .encoding import DEFAULT_JSON_ENCODER, get_json_encoder
+from .errors import describe_error
+
+# The file name patterns of the input files searched for in input directories.
+INPUT_FILE_PATTERNS = {
+    "sdf": ("*.sdf.json",),
+    "tm": ("*.tm.jsonld", "*.tm.json"),
+    "td": ("*.td.jsonld", "*.td.json"),
+}
+
+OUTPUT_FILE_SUFFIXES = {
+    "sdf": ".sdf.json",
+    "sdf-mapping": ".sdf-mapping.json",
+    "tm": ".tm.jsonld",
+    "td": ".td.jsonld",
+}
+
+KNOWN_FILE_SUFFIXES = (
+    ".sdf.json",
+    ".tm.jsonld",
+    ".tm.json",
+    ".td.jsonld",
+    ".td.json",
+    ".jsonld",
+    ".json",
+)
+
+
+class BatchOptions(NamedTuple):
+    direction: str
+    output_dir: str
+    indent: Optional[int] = 4
+    validation: str = "full"
+    suppress_roundtripping: bool = False
+    origin_url_base: Optional[str] = None
+    json_encoder: str = DEFAULT_JSON_ENCODER
+
+
+class BatchTask(NamedTuple):
+    input_path: str
+    # The path of the outputs relative to the output directory, without suffix.
+    output_stem: str
+
+
+class BatchResult(NamedTuple):
+    input_path: str
+    outputs: List[str]
+    error: Optional[str]
+    seconds: float
+
+
+class OutputConflictError(Exception):
+    """Raised when several input files would be converted to the same output
+    files, e.g., foo.tm.json and foo.tm.jsonld."""
+
+    pass
+
+
+def _input_kind(direction: str) -> str:
+    return direction.split("-to-")[0]
+
+
+def find_input_files(inputs: Iterable[str], direction: str) -> List[str]:
+    """Expands directories and glob patterns to a sorted list of input files.
+
+    Directories are searched recursively for files with the usual suffix of the
+    input format of the given direction."""
+    input_files = set()
+
+    for input in inputs:
+        if os.path.isdir(input):
+            for pattern in INPUT_FILE_PATTERNS[_input_kind(direction)]:
+                input_files.update(
+                    glob.glob(os.path.join(input, "**", pattern), recursive=True)
+                )
+        elif os.path.isfile(input):
+            input_files.add(input)
+        else:
+            input_files.update(
+                path
+                for path in glob.glob(input, recursive=True)
+                if os.path.isfile(path)
+            )
+
+    return sorted(input_files)
+
+
+def _strip_suffix(file_name: str) -> str:
+    for suffix in KNOWN_FILE_SUFFIXES:
+        if file_name.endswith(suffix):
+            return file_name[: -len(suffix)]
+    return os.path.splitext(file_name)[0]
+
+
+def create_tasks(input_files: List[str]) -> List[BatchTask]:
+    if len(input_files) == 0:
+        return []
+
+    base_directory = os.path.commonpath(
+        [os.path.dirname(os.path.abspath(path)) for path in input_files]
+    )
+    tasks = [
+        BatchTask(
+            path,
+            _strip_suffix(os.path.relpath(os.path.abspath(path), base_directory)),
+        )
+        for path in input_files
+    ]
+    _check_output_conflicts(tasks)
+    return tasks
+
+
+def _check_output_conflicts(tasks: List[BatchTask]):
+    input_paths: Dict[str, List[str]] = {}
+    for task in tasks:
+        input_paths.setdefault(task.output_stem, []).append(task.input_path)
+
+    conflicts = [paths for paths in input_paths.values() if len(paths) > 1]
+    if len(conflicts) > 0:
+        raise OutputConflictError(
+            "The following input files would overwrite each other's outputs: "
+            + "; ".join(", ".join(paths) for paths in conflicts)
+        )
+
+
+def _origin_url(task: BatchTask, options: BatchOptions) -> Optional[str]:
+    if options.origin_url_base is None:
+        return None
+    relative_path = os.path.relpath(task.input_path).replace(os.sep, "/")
+    return f"{options.origin_url_base.rstrip('/')}/{relative_path}"
+
+
+def _split_sdf_output(output) -> Dict[str, Dict]:
+    if isinstance(output, dict):
+        return {"sdf": output}
+    sdf_model, sdf_mapping_file = output
+    return {"sdf": sdf_model, "sdf-mapping": sdf_mapping_file}
+
+
+def _convert(model: Dict, task: BatchTask, options: BatchOptions) -> Dict[str, Dict]:
+    """Converts a model, returning the resulting documents by their kind."""
+    direction = options.direction
+    common_arguments = {"validation": options.validation, "copy_input": False}
+    roundtripping = {"suppress_roundtripping": options.suppress_roundtripping}
+
+    if direction == "sdf-to-tm":
+        return {
+            "tm": convert_sdf_to_wot_tm(
+                model,
+                origin_url=_origin_url(task, options),
+                **roundtripping,
+                **common_arguments,
+            )
+        }
+    elif direction == "sdf-to-td":
+        return {
+            "td": convert_sdf_to_wot_td(
+                model,
+                origin_url=_origin_url(task, options),
+                **roundtripping,
+                **common_arguments,
+            )
+        }
+    elif direction == "tm-to-sdf":
+        return _split_sdf_output(
+            convert_wot_tm_to_sdf(model, **roundtripping, **common_arguments)
+        )
+    elif direction == "tm-to-td":
+        return {"td": convert_wot_tm_to_wot_td(model, **common_arguments)}
+    elif direction == "td-to-tm":
+        return {"tm": convert_wot_td_to_wot_tm(model, **common_arguments)}
+    elif direction == "td-to-sdf":
+        return _split_sdf_output(
+            convert_wot_td_to_sdf(model, **roundtripping, **common_arguments)
+        )
+
+    raise ValueError(f"Unknown conversion direction {direction}.")
+
+
+def convert_file(task: BatchTask, options: BatchOptions) -> BatchResult:
+    """Converts a single input file and writes the results to the output
+    directory. Errors are returned as part of the result instead of being
+    raised."""
+    start = time.perf_counter()
+    outputs: List[str] = []
+    encoder = get_json_encoder(options.json_encoder, options.indent)
+
+    try:
+        with open(task.input_path) as input_file, phase("load"):
+            model = json.load(input_file)
+
+        for kind, document in _convert(model, task, options).items():
+            output = task.output_stem + OUTPUT_FILE_SUFFIXES[kind]
+            output_path = os.path.join(options.output_dir, output)
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            with open(output_path, "wb") as output_file, phase("serialization"):
+                encoder.dump(document, output_file, options.indent)
+            outputs.append(output)
+    except Exception as error:
+        return BatchResult(
+            task.input_path,
+            outputs,
+            describe_error(error),
+            time.perf_counter() - start,
+        )
+
+    return BatchResult(task.input_path, outputs, None, time.perf_counter() - start)
+
+
+def _convert_file_with_options(arguments: Tuple[BatchTask, BatchOptions]):
+    return convert_file(*arguments)
+
+
+def _configure_worker(cache_configuration: Dict):
+    configure_document_cache(**cache_configuration)
+    enable_validation_cache()
+
+
+def run_batch(
+    tasks: List[BatchTask], options: BatchOptions, jobs=1, cache_configuration=None
+) -> Iterator[BatchResult]:
+    """Converts all tasks, yielding the results in the order of the tasks.
+
+    With more than one job, the files are converted by a pool of worker
+    processes. Every worker keeps its validators and retrieved documents for all
+    files it converts. The keyword arguments in `cache_configuration` are passed
+    to `configure_document_cache` in every worker. The validation cache is
+    enabled, so that documents shared by several files are only validated once.
+    """
+    if jobs <= 1:
+        enable_validation_cache()
+        for task in tasks:
+            yield convert_file(task, options)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_configure_worker,
+        initargs=(cache_configuration or {},),
+    ) as executor:
+        yield from executor.map(
+            _convert_file_with_options,
+            [(task, options) for task in tasks],
+            chunksize=max(1, len(tasks) // (jobs * 4)),
+        )
+
+
+def write_manifest(
+    results: List[BatchResult], options: BatchOptions, seconds: float, path: str
+):
+    """Writes the manifest of a run to the path. The outputs of every input file
+    are given relative to the output directory."""
+    failed = [result for result in results if result.error is not None]
+    manifest = {
+        "direction": options.direction,
+        "output_dir": options.output_dir,
+        "validation": options.validation,
+        "succeeded": len(results) - len(failed),
+        "failed": len(failed),
+        "seconds": seconds,
+        "files": [
+            {
+                "input": result.input_path,
+                "outputs": result.outputs,
+                "error": result.error,
+                "seconds": result.seconds,
+            }
+            for result in results
+        ],
+    }
+
+    with open(path, "w") as manifest_file:
+        json.dump(manifest, manifest_file, indent=4)
@@ -0,0 +1,147 @@
+"""Derivation of one Thing Description per device from a single Thing Model.
+
+The device parameters are read from a JSON Lines stream: every line is a JSON
+object with the optional members "placeholder_map", "meta_data", and "bindings".
+The Thing Model is compiled once, after which every record only instantiates the
+template. The Thing Descriptions are written as JSON Lines as well, either to a
+single stream or to a directory of shards with a fixed number of lines each.
+"""
+
+import json
+import os
+from typing import IO, Dict, Iterable, Iterator, Optional, Tuple
+
+from ..converters.tm_to_td import ThingModelTemplate
+from ..converters.wot_common import apply_merge_patch
+from ..timings import phase
+from .defaults import DEFAULT_SHARD_SIZE
+from .encoding import JsonEncoder, get_json_encoder
+
+DEVICE_RECORD_FIELDS = ("placeholder_map", "meta_data", "bindings")
+
+DeviceRecord = Tuple[int, Dict]
+
+
+class InvalidDeviceRecordError(Exception):
+    """Raised when a line of the device parameter stream is not a valid record."""
+
+    pass
+
+
+class DeviceConversionError(Exception):
+    """Raised when the Thing Description for a device record cannot be derived."""
+
+    pass
+
+
+def read_device_records(lines: Iterable[str]) -> Iterator[DeviceRecord]:
+    """Parses a JSON Lines stream of device parameters, yielding the line number
+    and the record for every non-empty line."""
+    for line_number, line in enumerate(lines, start=1):
+        if line.strip() == "":
+            continue
+
+        try:
+            record = json.loads(line)
+        except ValueError as error:
+            raise InvalidDeviceRecordError(f"Line {line_number}: {error}")
+
+        if not isinstance(record, dict):
+            raise InvalidDeviceRecordError(
+                f"Line {line_number}: Device records must be JSON objects."
+            )
+        unknown_fields = sorted(set(record).difference(DEVICE_RECORD_FIELDS))
+        if len(unknown_fields) > 0:
+            raise InvalidDeviceRecordError(
+                f"Line {line_number}: Unknown fields {', '.join(unknown_fields)}."
+            )
+
+        yield line_number, record
+
+
+def _combine_placeholder_maps(
+    defaults: Optional[Dict], placeholder_map: Optional[Dict]
+) -> Optional[Dict]:
+    if defaults is None or placeholder_map is None:
+        return placeholder_map if defaults is None else defaults
+    return {**defaults, **placeholder_map}
+
+
+def _combine_overlays(defaults: Optional[Dict], overlay: Optional[Dict]):
+    if defaults is None or overlay is None:
+        return overlay if defaults is None else defaults
+    return apply_merge_patch(defaults, overlay)
+
+
+def derive_thing_descriptions(
+    template: ThingModelTemplate,
+    device_records: Iterable[DeviceRecord],
+    placeholder_map: Optional[Dict] = None,
+    meta_data: Optional[Dict] = None,
+    bindings: Optional[Dict] = None,
+) -> Iterator[Dict]:
+    """Instantiates the template once per device record.
+
+    The placeholder map, meta data, and bindings passed to this function apply to
+    all devices. The values of the individual records take precedence.
+    """
+    for line_number, record in device_records:
+        try:
+            yield template.instantiate(
+                placeholder_map=_combine_placeholder_maps(
+                    placeholder_map, record.get("placeholder_map")
+                ),
+                meta_data=_combine_overlays(meta_data, record.get("meta_data")),
+                bindings=_combine_overlays(bindings, record.get("bindings")),
+            )
+        except Exception as error:
+            raise DeviceConversionError(f"Line {line_number}: {error}") from error
+
+
+def write_json_lines(
+    documents: Iterable[Dict],
+    output: IO[bytes],
+    encoder: Optional[JsonEncoder] = None,
+) -> int:
+    """Writes one document per line and returns the number of documents."""
+    encoder = encoder or get_json_encoder()
+    count = 0
+    for document in documents:
+        with phase("serialization"):
+            encoder.dump_line(document, output)
+        count += 1
+    return count
+
+
+def shard_path(directory: str, shard_number: int) -> str:
+    return os.path.join(directory, f"thing-descriptions-{shard_number:05d}.jsonl")
+
+
+def write_json_lines_shards(
+    documents: Iterable[Dict],
+    directory: str,
+    shard_size=DEFAULT_SHARD_SIZE,
+    encoder: Optional[JsonEncoder] = None,
+) -> int:
+    """Writes the documents to JSON Lines files in the given directory, each
+    containing up to `shard_size` documents. Returns the number of documents."""
+    if shard_size < 1:
+        raise ValueError("The shard size must be positive.")
+
+    encoder = encoder or get_json_encoder()
+    os.makedirs(directory, exist_ok=True)
+    count = 0
+    shard: Optional[IO[bytes]] = None
+    try:
+        for document in documents:
+            if count % shard_size == 0:
+                if shard is not None:
+                    shard.close()
+                shard = open(shard_path(directory, count // shard_size), "wb")
+            with phase("serialization"):
+                encoder.dump_line(document, shard)
+            count += 1
+    finally:
+        if shard is not None:
+            shard.close()
+    return count
@@ -0,0 +1,24 @@
+"""Defaults and choices of command line options.
+
+They are kept apart from the modules implementing the commands, so that building
+the argument parser does not import the batch runner, the server, or the bulk
+writer, which only few invocations need.
+"""
+
+BATCH_DIRECTIONS = (
+    "sdf-to-tm",
+    "sdf-to-td",
+    "tm-to-sdf",
+    "tm-to-td",
+    "td-to-tm",
+    "td-to-sdf",
+)
+
+DEFAULT_SHARD_SIZE = 10000
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+DEFAULT_WORKERS = 4
+
+# Seconds a long-running server uses remote documents before revalidating them.
+DEFAULT_SERVER_CACHE_TTL = 5 * 60
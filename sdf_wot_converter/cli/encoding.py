@@ -0,0 +1,148 @@
+"""Serialization of the documents written by the command line interface.
+
+Documents are written to binary streams by a JSON encoder that can be selected by
+name. The encoder of the standard library is always available, orjson is used
+instead if it is installed and supports the requested indent. Further encoders
+can be registered with `register_json_encoder`.
+
+orjson is only imported once a document is encoded with it.
+"""
+
+import abc
+import importlib.util
+import io
+import json
+import sys
+from typing import IO, Any, Dict, Optional
+
+DEFAULT_JSON_ENCODER = "auto"
+
+COMPACT_SEPARATORS = (",", ":")
+
+
+class UnknownJsonEncoderError(Exception):
+    """Raised when a JSON encoder is requested that has not been registered."""
+
+    pass
+
+
+class JsonEncoder(abc.ABC):
+    """Writes JSON documents to binary streams.
+
+    An indent of None produces compact output without any whitespace."""
+
+    def supports_indent(self, indent: Optional[int]) -> bool:
+        return True
+
+    @abc.abstractmethod
+    def dump(self, document: Any, stream: IO[bytes], indent: Optional[int]):
+        pass
+
+    def dump_line(self, document: Any, stream: IO[bytes]):
+        """Writes the document in compact form, followed by a line break."""
+        self.dump(document, stream, None)
+        stream.write(b"\n")
+
+
+class StandardJsonEncoder(JsonEncoder):
+    """Uses the json module. Like orjson, it writes non-ASCII characters as UTF-8
+    instead of escaping them, so that both encoders produce the same bytes."""
+
+    def dump(self, document: Any, stream: IO[bytes], indent: Optional[int]):
+        if indent is None:
+            # The C accelerated encoder of the json module is only used when the
+            # whole document is encoded at once without indentation.
+            serialized = json.dumps(
+                document, separators=COMPACT_SEPARATORS, ensure_ascii=False
+            )
+            stream.write(serialized.encode("utf-8"))
+            return
+
+        text_stream = io.TextIOWrapper(stream, encoding="utf-8")
+        try:
+            json.dump(document, text_stream, indent=indent, ensure_ascii=False)
+            text_stream.flush()
+        finally:
+            text_stream.detach()
+
+
+def _import_orjson():
+    import orjson
+
+    return orjson
+
+
+class OrjsonEncoder(JsonEncoder):
+    """Uses orjson, which only supports an indent of two spaces or compact output.
+    Documents with other indents or values orjson cannot serialize are passed on
+    to the encoder of the standard library."""
+
+    def __init__(self):
+        self._fallback = StandardJsonEncoder()
+
+    def supports_indent(self, indent: Optional[int]) -> bool:
+        return indent in (None, 2)
+
+    def _options(self, indent: Optional[int]) -> Optional[int]:
+        orjson = _import_orjson()
+        if indent is None:
+            return 0
+        if indent == 2:
+            return orjson.OPT_INDENT_2
+        return None
+
+    def dump(self, document: Any, stream: IO[bytes], indent: Optional[int]):
+        orjson = _import_orjson()
+        options = self._options(indent)
+        if options is not None:
+            try:
+                stream.write(orjson.dumps(document, option=options))
+                return
+            except orjson.JSONEncodeError:
+                pass
+
+        self._fallback.dump(document, stream, indent)
+
+    def dump_line(self, document: Any, stream: IO[bytes]):
+        orjson = _import_orjson()
+        try:
+            serialized = orjson.dumps(document, option=orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            self._fallback.dump_line(document, stream)
+            return
+        stream.write(serialized)
+
+
+JSON_ENCODERS: Dict[str, JsonEncoder] = {"json": StandardJsonEncoder()}
+
+if importlib.util.find_spec("orjson") is not None:
+    JSON_ENCODERS["orjson"] = OrjsonEncoder()
+
+
+def register_json_encoder(name: str, encoder: JsonEncoder):
+    JSON_ENCODERS[name] = encoder
+
+
+def get_json_encoder(
+    name=DEFAULT_JSON_ENCODER, indent: Optional[int] = None
+) -> JsonEncoder:
+    """Returns the encoder registered under the given name. "auto" selects orjson
+    if it is installed and supports the indent the documents are written with,
+    and the standard library otherwise."""
+    if name == "auto":
+        orjson_encoder = JSON_ENCODERS.get("orjson")
+        if orjson_encoder is not None and orjson_encoder.supports_indent(indent):
+            return orjson_encoder
+        name = "json"
+
+    encoder = JSON_ENCODERS.get(name)
+    if encoder is None:
+        raise UnknownJsonEncoderError(f"Unknown JSON encoder {name}.")
+    return encoder
+
+
+def stdout_stream() -> IO[bytes]:
+    """Returns the binary stream behind the standard output, after flushing any
+    text that has already been written to it."""
+    sys.stdout.flush()
+    return sys.stdout.buffer
@@ -0,0 +1,10 @@
+"""Descriptions of conversion errors shared by the batch, serve, and JSON Lines
+commands, which report errors instead of stopping at the first one.
+"""
+
+
+def describe_error(error: Exception) -> str:
+    # Validation errors include the whole schema, only the first line is needed.
+    lines = str(error).splitlines()
+    message = lines[0] if len(lines) > 0 else ""
+    return f"{type(error).__name__}: {message}"
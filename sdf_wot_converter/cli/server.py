@@ -0,0 +1,406 @@
+"""Local HTTP server for clients that convert many models.
+
+Every conversion is available as an endpoint that accepts POST requests, e.g.,
+`/sdf-to-tm`. The request body is a JSON object with the model as its "input"
+member and, optionally, the keyword arguments of the corresponding library
+function, e.g., "placeholder_map" for `/tm-to-td`. Conversions to SDF respond with
+an object with the members "sdf_model" and "mapping_file".
+
+The server runs in a single process, so the validators, the validation cache, and
+all retrieved SDF models and Thing Models stay available across requests.
+Requests are handled by a fixed pool of worker threads. `/metrics` reports the
+number of requests and a histogram of their latencies per endpoint, in the
+Prometheus text format or, with `?format=json`, as a JSON object.
+
+The models in requests may reference local files and URLs (via sdfRef,
+tm:extends, and tm:ref), which the server reads on behalf of its clients. Servers
+that are reachable by untrusted clients should therefore be created with
+`local_files=False` and, if necessary, `remote_documents=False`.
+"""
+
+import bisect
+import concurrent.futures
+import http.server
+import io
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+import urllib.parse
+from typing import Callable, Dict, Optional, Tuple
+
+from ..converters import (
+    convert_sdf_to_wot_td,
+    convert_sdf_to_wot_tm,
+    convert_wot_td_to_sdf,
+    convert_wot_td_to_wot_tm,
+    convert_wot_tm_to_sdf,
+    convert_wot_tm_to_wot_td,
+)
+from ..converters.retrieval import configure_document_sources
+from ..validation import enable_validation_cache, preload_validators
+from .defaults import DEFAULT_HOST, DEFAULT_PORT, DEFAULT_WORKERS
+from .encoding import JsonEncoder, get_json_encoder
+from .errors import describe_error
+from .streaming import create_sdf_output_record
+
+MAX_REQUEST_SIZE = 64 * 1024 * 1024
+
+# Upper bounds (in seconds) of the buckets of the latency histograms.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+METRICS_ENDPOINT = "metrics"
+
+# The conversion function and its keyword arguments that may be passed in a
+# request, for every endpoint.
+CONVERSIONS: Dict[str, Tuple[Callable, Tuple[str, ...]]] = {
+    "sdf-to-tm": (
+        convert_sdf_to_wot_tm,
+        (
+            "sdf_mapping_files",
+            "origin_url",
+            "set_instance_version",
+            "suppress_roundtripping",
+            "validation",
+        ),
+    ),
+    "sdf-to-td": (
+        convert_sdf_to_wot_td,
+        ("sdf_mapping_files", "origin_url", "suppress_roundtripping", "validation"),
+    ),
+    "tm-to-sdf": (
+        convert_wot_tm_to_sdf,
+        ("placeholder_map", "suppress_roundtripping", "infoblock", "validation"),
+    ),
+    "tm-to-td": (
+        convert_wot_tm_to_wot_td,
+        (
+            "placeholder_map",
+            "meta_data",
+            "bindings",
+            "remove_not_required_affordances",
+            "validation",
+        ),
+    ),
+    "td-to-tm": (convert_wot_td_to_wot_tm, ("validation",)),
+    "td-to-sdf": (
+        convert_wot_td_to_sdf,
+        ("suppress_roundtripping", "infoblock", "validation"),
+    ),
+}
+
+
+class InvalidConversionRequestError(Exception):
+    """Raised when the body of a conversion request is malformed."""
+
+    pass
+
+
+def convert_request(endpoint: str, request) -> Dict:
+    """Performs the conversion of the given endpoint for a parsed request body."""
+    if not isinstance(request, dict) or "input" not in request:
+        raise InvalidConversionRequestError(
+            'Requests must be JSON objects with an "input" member.'
+        )
+
+    convert, parameters = CONVERSIONS[endpoint]
+    unknown_parameters = sorted(set(request).difference(["input", *parameters]))
+    if len(unknown_parameters) > 0:
+        raise InvalidConversionRequestError(
+            f"Unknown parameters {', '.join(unknown_parameters)}."
+        )
+
+    arguments = {key: value for key, value in request.items() if key != "input"}
+    output = convert(request["input"], copy_input=False, **arguments)
+    if endpoint.endswith("-to-sdf"):
+        return create_sdf_output_record(output)
+    return output
+
+
+class _LatencyHistogram:
+    def __init__(self, buckets: Tuple[float, ...]):
+        # The last count belongs to the implicit bucket without upper bound.
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+
+class RequestMetrics:
+    """Counts the requests per endpoint and status code and records a histogram
+    of their latencies per endpoint. Safe to use from several threads."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._requests: Dict[Tuple[str, int], int] = {}
+        self._latencies: Dict[str, _LatencyHistogram] = {}
+
+    def record(self, endpoint: str, status: int, seconds: float):
+        bucket = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            key = (endpoint, status)
+            self._requests[key] = self._requests.get(key, 0) + 1
+            histogram = self._latencies.get(endpoint)
+            if histogram is None:
+                histogram = _LatencyHistogram(self.buckets)
+                self._latencies[endpoint] = histogram
+            histogram.counts[bucket] += 1
+            histogram.sum += seconds
+            histogram.count += 1
+
+    def snapshot(self) -> Dict:
+        """Returns the request counts and the cumulative latency histograms."""
+        with self._lock:
+            requests = [
+                {"endpoint": endpoint, "status": status, "count": count}
+                for (endpoint, status), count in sorted(self._requests.items())
+            ]
+            latencies = {
+                endpoint: {
+                    "buckets": self._cumulative_buckets(histogram),
+                    "sum": histogram.sum,
+                    "count": histogram.count,
+                }
+                for endpoint, histogram in sorted(self._latencies.items())
+            }
+        return {"requests": requests, "latency_seconds": latencies}
+
+    def _cumulative_buckets(self, histogram: _LatencyHistogram) -> Dict[str, int]:
+        buckets: Dict[str, int] = {}
+        total = 0
+        for upper_bound, count in zip([*self.buckets, "+Inf"], histogram.counts):
+            total += count
+            buckets[str(upper_bound)] = total
+        return buckets
+
+    def render(self) -> str:
+        """Returns the metrics in the Prometheus text format."""
+        snapshot = self.snapshot()
+        lines = [
+            "# HELP sdf_wot_converter_requests_total Number of handled requests.",
+            "# TYPE sdf_wot_converter_requests_total counter",
+        ]
+        for entry in snapshot["requests"]:
+            lines.append(
+                "sdf_wot_converter_requests_total"
+                f'{{endpoint="{entry["endpoint"]}",status="{entry["status"]}"}} '
+                f'{entry["count"]}'
+            )
+
+        name = "sdf_wot_converter_request_duration_seconds"
+        lines.append(f"# HELP {name} Time spent handling requests.")
+        lines.append(f"# TYPE {name} histogram")
+        for endpoint, histogram in snapshot["latency_seconds"].items():
+            for upper_bound, count in histogram["buckets"].items():
+                lines.append(
+                    f'{name}_bucket{{endpoint="{endpoint}",le="{upper_bound}"}} '
+                    f"{count}"
+                )
+            lines.append(f'{name}_sum{{endpoint="{endpoint}"}} {histogram["sum"]}')
+            lines.append(f'{name}_count{{endpoint="{endpoint}"}} {histogram["count"]}')
+
+        return "\n".join(lines) + "\n"
+
+
+class ConversionRequestHandler(http.server.BaseHTTPRequestHandler):
+    server_version = "sdf-wot-converter"
+
+    def address_string(self) -> str:
+        # Clients of Unix sockets have no address.
+        if isinstance(self.client_address, tuple):
+            return super().address_string()
+        return "unix"
+
+    def log_request(self, code="-", size="-"):
+        if self.server.log_requests:
+            super().log_request(code, size)
+
+    def _endpoint(self) -> str:
+        return urllib.parse.urlsplit(self.path).path.strip("/")
+
+    def _send(self, status: int, body: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, document):
+        body = io.BytesIO()
+        self.server.encoder.dump(document, body, None)
+        self._send(status, body.getvalue(), "application/json")
+
+    def _send_error(self, status: int, message: str):
+        self._send_json(status, {"error": message})
+
+    def _send_metrics(self):
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query)
+        if query.get("format") == ["json"]:
+            self._send_json(200, self.server.metrics.snapshot())
+            return
+
+        body = self.server.metrics.render().encode("utf-8")
+        self._send(200, body, "text/plain; version=0.0.4")
+
+    def _read_request(self):
+        content_length = self.headers.get("Content-Length")
+        if content_length is None or not content_length.isdigit():
+            raise InvalidConversionRequestError("A Content-Length header is required.")
+        if int(content_length) > self.server.max_request_size:
+            raise InvalidConversionRequestError("The request body is too large.")
+
+        try:
+            return json.loads(self.rfile.read(int(content_length)))
+        except ValueError as error:
+            raise InvalidConversionRequestError(f"Invalid JSON: {error}")
+
+    def _handle_conversion(self, endpoint: str) -> int:
+        try:
+            output = convert_request(endpoint, self._read_request())
+        except InvalidConversionRequestError as error:
+            self._send_error(400, str(error))
+            return 400
+        except Exception as error:
+            self._send_error(422, describe_error(error))
+            return 422
+
+        self._send_json(200, output)
+        return 200
+
+    def do_GET(self):
+        start = time.perf_counter()
+        endpoint = self._endpoint()
+        if endpoint == METRICS_ENDPOINT:
+            status = 200
+            self._send_metrics()
+        elif endpoint in CONVERSIONS:
+            status = 405
+            self._send_error(status, "Conversions require POST requests.")
+        else:
+            status = 404
+            self._send_error(status, f"Unknown endpoint /{endpoint}.")
+        self._record(endpoint, status, start)
+
+    def do_POST(self):
+        start = time.perf_counter()
+        endpoint = self._endpoint()
+        if endpoint in CONVERSIONS:
+            status = self._handle_conversion(endpoint)
+        elif endpoint == METRICS_ENDPOINT:
+            status = 405
+            self._send_error(status, "The metrics require GET requests.")
+        else:
+            status = 404
+            self._send_error(status, f"Unknown endpoint /{endpoint}.")
+        self._record(endpoint, status, start)
+
+    def _record(self, endpoint: str, status: int, start: float):
+        # Unknown paths share a label, so that they cannot inflate the metrics.
+        if endpoint not in CONVERSIONS and endpoint != METRICS_ENDPOINT:
+            endpoint = "unknown"
+        self.server.metrics.record(endpoint, status, time.perf_counter() - start)
+
+
+class _WorkerPoolMixIn:
+    """Handles every connection in a fixed pool of worker threads instead of
+    starting a new thread per connection."""
+
+    def __init__(self, *args, workers=DEFAULT_WORKERS, **kwargs):
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+        self.metrics = RequestMetrics()
+        self.encoder: JsonEncoder = get_json_encoder()
+        self.log_requests = False
+        self.max_request_size = MAX_REQUEST_SIZE
+        super().__init__(*args, **kwargs)
+
+    def process_request(self, request, client_address):
+        self._executor.submit(self._process_request_in_worker, request, client_address)
+
+    def _process_request_in_worker(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self._executor.shutdown(wait=True)
+
+
+class ConversionServer(_WorkerPoolMixIn, http.server.HTTPServer):
+    pass
+
+
+if hasattr(socketserver, "UnixStreamServer"):
+
+    class UnixConversionServer(_WorkerPoolMixIn, socketserver.UnixStreamServer):
+        def server_close(self):
+            super().server_close()
+            if os.path.exists(self.server_address):
+                os.remove(self.server_address)
+
+
+def unix_sockets_supported() -> bool:
+    return hasattr(socketserver, "UnixStreamServer")
+
+
+def create_server(
+    host=DEFAULT_HOST,
+    port=DEFAULT_PORT,
+    unix_socket: Optional[str] = None,
+    workers=DEFAULT_WORKERS,
+    encoder: Optional[JsonEncoder] = None,
+    log_requests=False,
+    local_files=True,
+    remote_documents=True,
+):
+    """Creates a server listening on the given host and port or, if a path is
+    given, on a Unix socket. The server is started with `serve_forever()`.
+
+    `local_files` and `remote_documents` control whether the documents referenced
+    by the models in requests may be read from files or retrieved from URLs,
+    respectively (see `configure_document_sources()`).
+    """
+    if unix_socket is not None:
+        if not unix_sockets_supported():
+            raise ValueError("Unix sockets are not supported on this platform.")
+        server = UnixConversionServer(
+            unix_socket, ConversionRequestHandler, workers=workers
+        )
+    else:
+        server = ConversionServer(
+            (host, port), ConversionRequestHandler, workers=workers
+        )
+
+    server.encoder = encoder or get_json_encoder()
+    server.log_requests = log_requests
+    configure_document_sources(
+        local_files=local_files, remote_documents=remote_documents
+    )
+    enable_validation_cache()
+    return server
+
+
+def server_url(server) -> str:
+    if isinstance(server.server_address, tuple):
+        host, port = server.server_address[:2]
+        return f"http://{host}:{port}"
+    return f"unix:{server.server_address}"
+
+
+def run_server(server, preload=True):
+    """Serves requests until the process is interrupted."""
+    if preload:
+        preload_validators()
+
+    print(f"Serving conversions on {server_url(server)}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,68 @@
+"""Conversion of streams of models with one JSON document per line.
+
+Every input record is converted on its own and produces exactly one output line:
+either the converted document or an error record with the location of the input
+record, i.e., its line number or the path of its file, and a description of the
+error. Since records are read, converted, and written one at a time, the memory
+usage does not depend on the length of the stream.
+"""
+
+import functools
+import json
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple
+
+from ..timings import phase
+from .errors import describe_error
+
+RecordLoader = Callable[[], Any]
+
+
+class InputRecord(NamedTuple):
+    # The members identifying the record in its error record, e.g., {"line": 3}.
+    location: Dict[str, Any]
+    load: RecordLoader
+
+
+def read_json_line_records(lines: Iterable[str]) -> Iterator[InputRecord]:
+    """Yields a record for every non-empty line, located by its (one-based) line
+    number. The line is only parsed once the record is loaded, so that invalid
+    lines only affect their own record."""
+    for line_number, line in enumerate(lines, start=1):
+        if line.strip() == "":
+            continue
+        yield InputRecord({"line": line_number}, functools.partial(json.loads, line))
+
+
+def read_json_file_records(
+    paths: List[str], load: Callable[[str], Any]
+) -> Iterator[InputRecord]:
+    """Yields a record for every input file, located by its path."""
+    for path in paths:
+        yield InputRecord({"input": path}, functools.partial(load, path))
+
+
+def create_error_record(location: Dict[str, Any], error: Exception) -> Dict:
+    return {**location, "error": describe_error(error)}
+
+
+def create_sdf_output_record(output) -> Dict:
+    """Combines the results of a conversion to SDF, which may or may not include
+    a mapping file, into a single document."""
+    if isinstance(output, dict):
+        return {"sdf_model": output, "mapping_file": None}
+    sdf_model, mapping_file = output
+    return {"sdf_model": sdf_model, "mapping_file": mapping_file}
+
+
+def convert_records(
+    records: Iterable[InputRecord], convert: Callable[[Any], Any]
+) -> Iterator[Any]:
+    """Loads and converts every record, yielding either the result or an error
+    record."""
+    for input_record in records:
+        try:
+            with phase("load"):
+                record = input_record.load()
+            yield convert(record)
+        except Exception as error:
+            yield create_error_record(input_record.location, error)
@@ -1,25 +1,66 @@
 from typing import Dict, List, Optional, Tuple, Union
 
-from .tm_to_td import convert_tm_to_td as _convert_tm_to_td
+from .tm_to_td import ThingModelTemplate, convert_tm_to_td as _convert_tm_to_td
 from .td_to_tm import convert_td_to_tm as _convert_td_to_tm
 from .tm_to_sdf import convert_wot_tm_to_sdf as _convert_wot_tm_to_sdf
 from .sdf_to_tm import convert_sdf_to_wot_tm as _convert_sdf_to_wot_tm
+from ..validation import (
+    validates_inputs,
+    validates_intermediates,
+    validates_outputs,
+)
 
 ThingCollection = Dict[str, Dict]
 
-
-def convert_wot_td_to_wot_tm(input: Union[Dict, ThingCollection]):
-    return _convert_td_to_tm(input)
+# All convert_* functions accept a `validation` argument which determines which
+# documents are validated during the conversion:
+#
+# - "full": inputs, outputs, and intermediate documents (default)
+# - "inputs": only the documents passed to the converter
+# - "outputs": only the documents returned by the converter
+# - "none": no validation at all
+#
+# Regardless of the level, every document is validated at most once.
+#
+# By default, the converters copy their input documents, so that neither the
+# inputs are modified nor the results share any values with them. Callers that do
+# not use an input document again after the conversion can pass
+# `copy_input=False` to skip the copy. The input may then be modified by the
+# conversion and share values with the result.
+
+
+def convert_wot_td_to_wot_tm(
+    input: Union[Dict, ThingCollection], validation="full", copy_input=True
+) -> Union[Dict, ThingCollection]:
+    return _convert_td_to_tm(
+        input,
+        validate_input=validates_inputs(validation),
+        validate_output=validates_outputs(validation),
+        copy_input=copy_input,
+    )
 
 
 def convert_wot_td_to_sdf(
     input: Union[Dict, ThingCollection],
     suppress_roundtripping=False,
     infoblock: Optional[Dict] = None,
+    validation="full",
+    copy_input=True,
 ):
-    thing_model = convert_wot_td_to_wot_tm(input)
-    return convert_wot_tm_to_sdf(
-        thing_model, suppress_roundtripping=suppress_roundtripping, infoblock=infoblock
+    thing_model = _convert_td_to_tm(
+        input,
+        validate_input=validates_inputs(validation),
+        validate_output=validates_intermediates(validation),
+        copy_input=copy_input,
+    )
+    # The intermediate Thing Model is not used anywhere else.
+    return _convert_wot_tm_to_sdf(
+        thing_model,
+        suppress_roundtripping=suppress_roundtripping,
+        infoblock=infoblock,
+        validate_input=False,
+        validate_output=validates_outputs(validation),
+        copy_input=False,
     )
 
 
@@ -29,6 +70,8 @@ def convert_sdf_to_wot_tm(
     origin_url=None,
     set_instance_version=False,
     suppress_roundtripping=False,
+    validation="full",
+    copy_input=True,
 ):
     return _convert_sdf_to_wot_tm(
         sdf_model,
@@ -36,6 +79,9 @@ def convert_sdf_to_wot_tm(
         sdf_mapping_files=sdf_mapping_files,
         set_instance_version=set_instance_version,
         suppress_roundtripping=suppress_roundtripping,
+        validate_input=validates_inputs(validation),
+        validate_output=validates_outputs(validation),
+        copy_input=copy_input,
     )
 
 
@@ -44,6 +90,8 @@ def convert_sdf_to_wot_td(
     sdf_mapping_files: Optional[List[Dict]] = None,
     origin_url: Optional[str] = None,
     suppress_roundtripping=False,
+    validation="full",
+    copy_input=True,
 ) -> Dict:
     """Converts an SDF model and one or more SDF mapping files to a Thing Description or
     Thing Description collection.
@@ -54,22 +102,35 @@ def convert_sdf_to_wot_td(
         mapping files. Defaults to None.
         origin_url (str, optional): The URL the SDF model originated from. Defaults to
         None.
+        validation (str, optional): The validation level ("full", "inputs",
+        "outputs", or "none"). Defaults to "full".
+        copy_input (bool, optional): Copy the SDF model and mapping files before
+        converting them. Defaults to True.
 
     Returns:
         Dict: A Thing Description or Thing Description collection that is equivalent to
         the input SDF model and (optional) SDF mapping file(s).
     """
 
-    wot_tm = convert_sdf_to_wot_tm(
+    wot_tm = _convert_sdf_to_wot_tm(
         sdf_model,
         sdf_mapping_files=sdf_mapping_files,
         origin_url=origin_url,
         set_instance_version=True,
         suppress_roundtripping=suppress_roundtripping,
+        validate_input=validates_inputs(validation),
+        validate_output=validates_intermediates(validation),
+        copy_input=copy_input,
     )
 
     # TODO: Deal with Thing Collections
-    return convert_wot_tm_to_wot_td(wot_tm)
+    # The intermediate Thing Model is not used anywhere else.
+    return _convert_tm_to_td(
+        wot_tm,
+        validate_input=False,
+        validate_output=validates_outputs(validation),
+        copy_input=False,
+    )
 
 
 def convert_wot_tm_to_sdf(
@@ -77,6 +138,8 @@ def convert_wot_tm_to_sdf(
     placeholder_map: Optional[Dict] = None,
     suppress_roundtripping=False,
     infoblock: Optional[Dict] = None,
+    validation="full",
+    copy_input=True,
 ) -> Union[Dict, Tuple[Dict, Dict]]:
     # TODO: Also deal with bindings and metadata
 
@@ -85,6 +148,9 @@ def convert_wot_tm_to_sdf(
         placeholder_map=placeholder_map,
         suppress_roundtripping=suppress_roundtripping,
         infoblock=infoblock,
+        validate_input=validates_inputs(validation),
+        validate_output=validates_outputs(validation),
+        copy_input=copy_input,
     )
 
 
@@ -94,6 +160,8 @@ def convert_wot_tm_to_wot_td(
     meta_data: Optional[Dict] = None,
     bindings: Optional[Dict] = None,
     remove_not_required_affordances=False,
+    validation="full",
+    copy_input=True,
 ):
     # TODO: Also deal with extensions
 
@@ -103,4 +171,51 @@ def convert_wot_tm_to_wot_td(
         meta_data=meta_data,
         bindings=bindings,
         remove_not_required_affordances=remove_not_required_affordances,
+        validate_input=validates_inputs(validation),
+        validate_output=validates_outputs(validation),
+        copy_input=copy_input,
+    )
+
+
+def compile_thing_model(
+    thing_model: Dict,
+    remove_not_required_affordances=False,
+    validation="full",
+    copy_input=True,
+    copy_output=True,
+) -> ThingModelTemplate:
+    """Compiles a Thing Model to a template from which Thing Descriptions can be
+    derived repeatedly with `template.instantiate(placeholder_map, meta_data,
+    bindings)`.
+
+    The Thing Model is validated and its extensions and references are resolved
+    once, so that each instantiation only has to fill the placeholders and apply
+    the meta data and bindings.
+
+    Args:
+        thing_model (Dict): A Thing Model. Thing Collections and Thing Models with
+        submodels are not supported.
+        remove_not_required_affordances (bool, optional): Remove the affordances
+        listed in "tm:optional" from the Thing Descriptions. Defaults to False.
+        validation (str, optional): The validation level ("full", "inputs",
+        "outputs", or "none"). The Thing Model is validated once when it is
+        compiled, the Thing Descriptions every time they are instantiated.
+        Defaults to "full".
+        copy_input (bool, optional): Copy the Thing Model before compiling it. If
+        False, the Thing Model must not be modified afterwards. Defaults to True.
+        copy_output (bool, optional): Copy every Thing Description once it has been
+        derived. If False, the Thing Descriptions share the parts of the Thing
+        Model without placeholders with the template and with each other, and must
+        be copied before their nested values are modified. Defaults to True.
+
+    Returns:
+        ThingModelTemplate: The compiled template.
+    """
+    return ThingModelTemplate(
+        thing_model,
+        remove_not_required_affordances=remove_not_required_affordances,
+        validate_input=validates_inputs(validation),
+        validate_output=validates_outputs(validation),
+        copy_input=copy_input,
+        copy_output=copy_output,
     )
@@ -0,0 +1,260 @@
+"""Retrieval of remote JSON documents (e.g., the SDF models sdfRefs point to).
+
+Retrieved documents are cached on two levels:
+
+1. In memory, for the lifetime of the process. Every URL is only retrieved once,
+   no matter how many references point to it.
+2. Optionally on disk, in a directory which is shared between processes.
+
+Entries of both levels which are younger than the TTL are used without contacting
+the server. Older entries are revalidated with a conditional request using their
+ETag and Last-Modified headers, so that unchanged documents are not downloaded
+again.
+
+In offline mode, documents are only taken from the caches, regardless of their
+age.
+
+Services converting models from untrusted clients can forbid the retrieval of
+local files and remote documents with `configure_document_sources()`, since the
+references within a model may point to any file or URL.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, NamedTuple, Optional
+import urllib.error
+import urllib.parse
+import urllib.request
+
+from ..timings import timed_phase
+
+DEFAULT_TTL = 24 * 60 * 60
+
+
+class DocumentRetrievalError(Exception):
+    """Raised when a document is neither cached nor allowed to be retrieved."""
+
+    pass
+
+
+class DocumentSources(NamedTuple):
+    local_files: bool = True
+    remote_documents: bool = True
+
+
+_document_sources = DocumentSources()
+
+
+def configure_document_sources(local_files=True, remote_documents=True):
+    """Configures from which sources referenced documents may be retrieved.
+
+    Args:
+        local_files (bool, optional): Allow reading files (including file:// URLs)
+        referenced by models. Defaults to True.
+        remote_documents (bool, optional): Allow retrieving documents from other
+        URLs. Defaults to True.
+    """
+    global _document_sources
+    _document_sources = DocumentSources(local_files, remote_documents)
+
+
+def is_local_file(url: str) -> bool:
+    return urllib.parse.urlparse(url).scheme in ("", "file")
+
+
+def check_document_source(url: str):
+    """Raises a DocumentRetrievalError if documents may not be retrieved from the
+    URL or file path."""
+    if is_local_file(url):
+        if not _document_sources.local_files:
+            raise DocumentRetrievalError(f"Reading the local file {url} is disabled.")
+    elif not _document_sources.remote_documents:
+        raise DocumentRetrievalError(f"Retrieving the document {url} is disabled.")
+
+
+class DocumentCacheInfo(NamedTuple):
+    memory_hits: int
+    disk_hits: int
+    revalidations: int
+    """Disk entries which were confirmed to be up to date by the server."""
+    downloads: int
+
+
+class DocumentCache:
+    def __init__(self, directory: Optional[str] = None, ttl=DEFAULT_TTL, offline=False):
+        self.directory = directory
+        self.ttl = ttl
+        self.offline = offline
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._reset_statistics()
+
+    def _reset_statistics(self):
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.revalidations = 0
+        self.downloads = 0
+
+    def info(self) -> DocumentCacheInfo:
+        # The statistics are updated by concurrent retrievals, e.g., of the server.
+        with self._lock:
+            return DocumentCacheInfo(
+                self.memory_hits, self.disk_hits, self.revalidations, self.downloads
+            )
+
+    def clear(self, disk=False):
+        """Empties the in-memory cache and resets the statistics. If `disk` is
+        True, the entries in the cache directory are removed as well."""
+        with self._lock:
+            self._entries.clear()
+            self._reset_statistics()
+
+        if disk and self.directory is not None and os.path.isdir(self.directory):
+            for file_name in os.listdir(self.directory):
+                if file_name.endswith(".json"):
+                    os.remove(os.path.join(self.directory, file_name))
+
+    def retrieve(self, url: str):
+        """Returns the JSON document available at the given URL.
+
+        The returned document is shared between all callers and must not be
+        modified. The same object is returned for as long as the document has not
+        changed on the server.
+        """
+        check_document_source(url)
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None and self._is_fresh(entry):
+                self.memory_hits += 1
+                return entry["document"]
+
+        if entry is None:
+            entry = self._retrieve_from_disk_or_network(url)
+        else:
+            entry = self._download(url, entry)
+
+        with self._lock:
+            self._entries[url] = entry
+            return entry["document"]
+
+    def _is_fresh(self, entry: Dict) -> bool:
+        return self.offline or time.time() - entry["retrieved"] < self.ttl
+
+    def _retrieve_from_disk_or_network(self, url: str) -> Dict:
+        entry = self._read_entry(url)
+
+        if entry is not None:
+            if self._is_fresh(entry):
+                with self._lock:
+                    self.disk_hits += 1
+                return entry
+        elif self.offline:
+            raise DocumentRetrievalError(f"{url} is not cached (offline mode)")
+
+        return self._download(url, entry)
+
+    def _download(self, url: str, entry: Optional[Dict]) -> Dict:
+        headers = {}
+        if entry is not None:
+            if entry.get("etag") is not None:
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified") is not None:
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        try:
+            with urllib.request.urlopen(
+                urllib.request.Request(url, headers=headers)
+            ) as response:
+                document = json.loads(response.read().decode())
+                response_headers = response.headers
+        except urllib.error.HTTPError as error:
+            if error.code != 304 or entry is None:
+                raise
+            with self._lock:
+                self.revalidations += 1
+            entry = {**entry, "retrieved": time.time()}
+            self._write_entry(url, entry)
+            return entry
+
+        with self._lock:
+            self.downloads += 1
+        entry = {
+            "url": url,
+            "etag": response_headers.get("ETag"),
+            "last_modified": response_headers.get("Last-Modified"),
+            "retrieved": time.time(),
+            "document": document,
+        }
+        self._write_entry(url, entry)
+        return entry
+
+    def _entry_path(self, url: str) -> str:
+        file_name = hashlib.sha256(url.encode("utf-8")).hexdigest() + ".json"
+        return os.path.join(self.directory, file_name)
+
+    def _read_entry(self, url: str) -> Optional[Dict]:
+        if self.directory is None:
+            return None
+
+        try:
+            with open(self._entry_path(url)) as entry_file:
+                entry = json.load(entry_file)
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("url") != url:
+            return None
+        return entry
+
+    def _write_entry(self, url: str, entry: Dict):
+        if self.directory is None:
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+        # Write to a temporary file first so that concurrent processes never read
+        # a partially written entry.
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=self.directory, suffix=".tmp"
+        )
+        with os.fdopen(file_descriptor, "w") as entry_file:
+            json.dump(entry, entry_file)
+        os.replace(temporary_path, self._entry_path(url))
+
+
+_document_cache = DocumentCache()
+
+
+def configure_document_cache(
+    directory: Optional[str] = None, ttl=DEFAULT_TTL, offline=False
+):
+    """Configures the cache for remote documents.
+
+    Args:
+        directory (Optional[str], optional): The directory for the persistent
+        cache. Defaults to None, which only caches documents in memory.
+        ttl (int, optional): The number of seconds cached documents are used
+        without revalidation. Defaults to one day.
+        offline (bool, optional): Never contact any server and only use cached
+        documents. Defaults to False.
+    """
+    _document_cache.directory = directory
+    _document_cache.ttl = ttl
+    _document_cache.offline = offline
+
+
+def document_cache_info() -> DocumentCacheInfo:
+    return _document_cache.info()
+
+
+def clear_document_cache(disk=False):
+    _document_cache.clear(disk=disk)
+
+
+@timed_phase("load")
+def retrieve_json_document(url: str):
+    """Retrieves a JSON document using the configured document cache."""
+    return _document_cache.retrieve(url)
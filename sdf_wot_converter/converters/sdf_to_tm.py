@@ -1,26 +1,50 @@
-import copy
 from typing import (
     Dict,
     List,
     Optional,
+    Set,
 )
 from jsonpointer import resolve_pointer
 import json_merge_patch
-import urllib.request
 
 from ..validation import validate_sdf_model, validate_thing_model
+from ..timings import timed_phase
 
-from .jsonschema import map_common_json_schema_fields
+from .jsonschema import COMMON_JSON_SCHEMA_FIELD_MAPPINGS
+from .retrieval import retrieve_json_document
 from .utility import (
+    FieldMapping,
+    clone_json,
     initialize_list_field,
     initialize_object_field,
-    map_common_field,
     map_field,
+    map_fields,
     negate,
 )
-import json
 import validators
 
+COMMON_QUALITY_FIELD_MAPPINGS = {
+    "label": FieldMapping("title"),
+    "description": FieldMapping("description"),
+    "$comment": FieldMapping("sdf:$comment", roundtripping=True),
+}
+
+DATA_QUALITY_FIELD_MAPPINGS = {
+    **COMMON_QUALITY_FIELD_MAPPINGS,
+    **COMMON_JSON_SCHEMA_FIELD_MAPPINGS,
+    "enum": FieldMapping("enum"),
+    "uniqueItems": FieldMapping("sdf:uniqueItems", roundtripping=True),
+    "nullable": FieldMapping("sdf:nullable", roundtripping=True),
+    "sdfType": FieldMapping("sdf:sdfType", roundtripping=True),
+    "contentFormat": FieldMapping("contentMediaType"),
+}
+
+PROPERTY_DATA_QUALITY_FIELD_MAPPINGS = {
+    **DATA_QUALITY_FIELD_MAPPINGS,
+    "writable": FieldMapping("readOnly", conversion_function=negate),
+    "readable": FieldMapping("writeOnly", conversion_function=negate),
+}
+
 
 class SdfRefLoopError(Exception):
     """Raised when an sdfRef cannot be resolved due to a loop"""
@@ -46,57 +70,129 @@ def resolve_namespace(sdf_model: dict, namespace: Optional[str]):
     return namespace
 
 
+class SdfRefTable:
+    """Memoizes the resolution of the sdfRefs of an SDF model.
+
+    Every distinct sdfRef is only resolved once: Local references are checked for
+    loops and unresolvable pointers, while the definitions referenced in other
+    namespaces are retrieved, validated, and resolved recursively. Referencing
+    definitions are then resolved by a lookup in this table, so the resolution
+    cost grows with the number of distinct targets instead of the number of
+    references.
+    """
+
+    def __init__(
+        self,
+        sdf_model: Dict,
+        namespace: Optional[str] = None,
+        validate=True,
+        sdf_ref_list: Optional[List[str]] = None,
+        remote_tables: Optional[Dict[str, "SdfRefTable"]] = None,
+    ):
+        self.sdf_model = sdf_model
+        self.namespace = resolve_namespace(sdf_model, namespace)
+        self.validate = validate
+        # The references which are currently being resolved. Shared with the
+        # tables of remote models so that loops spanning several models are
+        # detected as well.
+        self._sdf_ref_list = sdf_ref_list if sdf_ref_list is not None else []
+        self._remote_tables = remote_tables if remote_tables is not None else {}
+        # Maps every resolved sdfRef to the resolved definition it points to, or
+        # to None for local references, which are not inlined.
+        self._targets: Dict[str, Optional[Dict]] = {}
+
+    def resolve(self, sdf_definition: Dict) -> Dict:
+        if "sdfRef" not in sdf_definition:
+            return sdf_definition
+
+        target = self._resolve_target(sdf_definition["sdfRef"])
+        if target is None:
+            return sdf_definition
+
+        # The target is shared between all references (and possibly cached
+        # remotely), so it must not be modified by the merge.
+        return json_merge_patch.merge(clone_json(target), sdf_definition)
+
+    def _resolve_target(self, sdf_ref: str) -> Optional[Dict]:
+        if sdf_ref in self._targets:
+            return self._targets[sdf_ref]
+
+        root, pointer = tuple(sdf_ref.split("/", 1))
+        resolved_sdf_ref = sdf_ref.replace("#", self.namespace)
+
+        if resolved_sdf_ref in self._sdf_ref_list:
+            raise SdfRefLoopError(f"Encountered a looping sdfRef: {resolved_sdf_ref}")
+
+        self._sdf_ref_list.append(resolved_sdf_ref)
+        try:
+            if root == "#":
+                self.resolve(resolve_pointer(self.sdf_model, "/" + pointer))
+                target = None
+            elif root.endswith(":"):
+                target = self._resolve_remote_target(root[:-1], pointer)
+            else:
+                raise InvalidSdfRefError(
+                    f"sdfRef {resolved_sdf_ref} could not be resolved"
+                )
+        finally:
+            self._sdf_ref_list.pop()
+
+        self._targets[sdf_ref] = target
+        return target
+
+    def _resolve_remote_target(self, prefix: str, pointer: str) -> Dict:
+        resolved_url = self.sdf_model.get("namespace", {}).get(prefix)
+        try:
+            remote_table = self._remote_table(resolved_url)
+            original = resolve_pointer(remote_table.sdf_model, "/" + pointer)
+            return remote_table.resolve(original)
+        except Exception:
+            raise SdfRefUrlRetrievalError(
+                f"No valid SDF model could be retrieved from {resolved_url}"
+            )
+
+    def _remote_table(self, url: str) -> "SdfRefTable":
+        if url not in self._remote_tables:
+            retrieved_sdf_model = retrieve_json_document(url)
+            if self.validate:
+                validate_sdf_model(retrieved_sdf_model)
+            self._remote_tables[url] = SdfRefTable(
+                retrieved_sdf_model,
+                namespace=url,
+                validate=self.validate,
+                sdf_ref_list=self._sdf_ref_list,
+                remote_tables=self._remote_tables,
+            )
+        return self._remote_tables[url]
+
+
 def resolve_sdf_ref(
     sdf_model: Dict,
     sdf_definition: Dict,
     namespace: Optional[str],
     sdf_ref_list: List[str],
 ):
-    if "sdfRef" in sdf_definition:
-        sdf_ref = sdf_definition["sdfRef"]
-        root, pointer = tuple(sdf_ref.split("/", 1))
-
-        namespace = resolve_namespace(sdf_model, namespace)
-        resolved_sdf_ref = sdf_ref.replace("#", namespace)
-
-        if resolved_sdf_ref in sdf_ref_list:
-            raise SdfRefLoopError(f"Encountered a looping sdfRef: {resolved_sdf_ref}")
-        if root == "#":
-            original = resolve_pointer(sdf_model, "/" + pointer)
-            original = resolve_sdf_ref(
-                sdf_model, original, namespace, sdf_ref_list + [resolved_sdf_ref]
-            )
-        elif root.endswith(":"):
-            root = root[:-1]
-            resolved_url = sdf_model.get("namespace", {}).get(root)
-            try:
-                with urllib.request.urlopen(resolved_url) as url:
-                    retrieved_sdf_model = json.loads(url.read().decode())
-                    validate_sdf_model(retrieved_sdf_model)
-                    original = resolve_pointer(retrieved_sdf_model, "/" + pointer)
-                    original = resolve_sdf_ref(
-                        retrieved_sdf_model, original, resolved_url, sdf_ref_list
-                    )
-            except Exception:
-                raise SdfRefUrlRetrievalError(
-                    f"No valid SDF model could be retrieved from {resolved_url}"
-                )
+    sdf_ref_table = SdfRefTable(sdf_model, namespace, sdf_ref_list=list(sdf_ref_list))
+    return sdf_ref_table.resolve(sdf_definition)
 
-            return json_merge_patch.merge(original, sdf_definition)
-        else:
-            raise InvalidSdfRefError(f"sdfRef {resolved_sdf_ref} could not be resolved")
 
-    return sdf_definition
+@timed_phase("resolve")
+def _resolve_sdf_ref(
+    sdf_model: Dict, sdf_definition: Dict, sdf_ref_table: Optional[SdfRefTable]
+):
+    if sdf_ref_table is None:
+        return resolve_sdf_ref(sdf_model, sdf_definition, None, [])
+    return sdf_ref_table.resolve(sdf_definition)
 
 
 def map_namespace(
     sdf_model: Dict,
     thing_model: Dict,
     suppress_roundtripping: bool,
-    mapped_fields: List[str],
+    mapped_fields: Set[str],
 ):
     namespaces = sdf_model.get("namespace", {}).copy()
-    mapped_fields.append("namespace")
+    mapped_fields.add("namespace")
     if not suppress_roundtripping:
         namespaces["sdf"] = "https://example.com/sdf"
     if len(namespaces) > 0:
@@ -107,7 +203,7 @@ def map_default_namespace(
     sdf_model: Dict,
     thing_model: Dict,
     suppress_roundtripping: bool,
-    mapped_fields: List[str],
+    mapped_fields: Set[str],
 ):
     if suppress_roundtripping:
         return
@@ -183,11 +279,11 @@ def map_infoblock(
     thing_model: Dict,
     set_instance_version: bool,
     suppress_roundtripping: bool,
-    mapped_fields: List[str],
+    mapped_fields: Set[str],
 ):
     infoblock = sdf_model.get("info")
     if infoblock:
-        mapped_fields.append("info")
+        mapped_fields.add("info")
         map_title(thing_model, infoblock, suppress_roundtripping)
         map_copyright(thing_model, infoblock, suppress_roundtripping)
         map_license(infoblock, thing_model, suppress_roundtripping)
@@ -212,73 +308,49 @@ def map_common_qualities(
     sdf_definition: Dict,
     wot_definition: Dict,
     suppress_roundtripping,
-    mapped_fields: List[str],
+    mapped_fields: Set[str],
 ):
-    map_label(sdf_definition, wot_definition, mapped_fields)
-    map_description(sdf_definition, wot_definition, mapped_fields)
-    map_comment(sdf_definition, wot_definition, suppress_roundtripping, mapped_fields)
+    map_fields(
+        sdf_definition,
+        wot_definition,
+        COMMON_QUALITY_FIELD_MAPPINGS,
+        mapped_fields,
+        suppress_roundtripping=suppress_roundtripping,
+    )
     copy_sdf_ref(sdf_definition, wot_definition, mapped_fields)
 
 
-def copy_sdf_ref(sdf_definition, wot_definition, mapped_fields: List[str]):
+def copy_sdf_ref(sdf_definition, wot_definition, mapped_fields: Set[str]):
     sdf_ref = sdf_definition.get("sdfRef")
     if sdf_ref is not None:
-        mapped_fields.append("sdfRef")
+        mapped_fields.add("sdfRef")
         if sdf_ref.startswith("#"):
             wot_definition["tm:ref"] = sdf_definition["sdfRef"]
 
 
-def map_comment(
-    sdf_definition,
-    wot_definition,
-    suppress_roundtripping: bool,
-    mapped_fields: List[str],
-):
-    if suppress_roundtripping:
-        return
-
-    map_field(
-        sdf_definition,
-        wot_definition,
-        "$comment",
-        "sdf:$comment",
-        mapped_fields=mapped_fields,
-    )
-
-
-def map_description(sdf_definition, wot_definition, mapped_fields: List[str]):
-    map_common_field(
-        sdf_definition, wot_definition, "description", mapped_fields=mapped_fields
-    )
-
-
-def map_label(sdf_definition: Dict, wot_definition: Dict, mapped_fields: List[str]):
-    map_field(
-        sdf_definition, wot_definition, "label", "title", mapped_fields=mapped_fields
-    )
-
-
 def map_sdf_choice(
     sdf_model: Dict,
     data_qualities: Dict,
     data_schema: Dict,
     suppress_roundtripping: bool,
-    mapped_fields: List[str],
+    mapped_fields: Set[str],
+    sdf_ref_table: Optional[SdfRefTable] = None,
 ):
     if "sdfChoice" in data_qualities:
-        mapped_fields.append("sdfChoice")
+        mapped_fields.add("sdfChoice")
         enum = initialize_list_field(data_schema, "enum", raise_error_if_exists=True)
         for choice_name, choice in data_qualities["sdfChoice"].items():
             mapped_choice = {}
             if not suppress_roundtripping:
                 mapped_choice["sdf:choiceName"] = choice_name
-            mapped_choice_fields: List[str] = []
+            mapped_choice_fields: Set[str] = set()
             map_data_qualities(
                 sdf_model,
                 choice,
                 mapped_choice,
                 suppress_roundtripping,
                 mapped_choice_fields,
+                sdf_ref_table=sdf_ref_table,
             )
             enum.append(mapped_choice)
 
@@ -288,170 +360,115 @@ def map_data_qualities(
     data_qualities: Dict,
     data_schema: Dict,
     suppress_roundtripping: bool,
-    mapped_fields: List[str],
+    mapped_fields: Set[str],
     is_property=False,
     is_choice=False,
+    sdf_ref_table: Optional[SdfRefTable] = None,
 ):
-    data_qualities = resolve_sdf_ref(sdf_model, data_qualities, None, [])
+    data_qualities = _resolve_sdf_ref(sdf_model, data_qualities, sdf_ref_table)
 
-    map_common_qualities(
-        data_qualities, data_schema, suppress_roundtripping, mapped_fields
+    field_mappings = DATA_QUALITY_FIELD_MAPPINGS
+    if is_property:
+        field_mappings = PROPERTY_DATA_QUALITY_FIELD_MAPPINGS
+    map_fields(
+        data_qualities,
+        data_schema,
+        field_mappings,
+        mapped_fields,
+        suppress_roundtripping=suppress_roundtripping,
     )
-
-    map_common_json_schema_fields(data_qualities, data_schema, mapped_fields)
-    map_enum(data_qualities, data_schema, mapped_fields)
-
-    map_unique_items(data_qualities, data_schema, suppress_roundtripping, mapped_fields)
-    map_nullable(data_qualities, data_schema, suppress_roundtripping, mapped_fields)
-    map_sdf_type(data_qualities, data_schema, suppress_roundtripping, mapped_fields)
+    copy_sdf_ref(data_qualities, data_schema, mapped_fields)
 
     map_sdf_choice(
-        sdf_model, data_qualities, data_schema, suppress_roundtripping, mapped_fields
+        sdf_model,
+        data_qualities,
+        data_schema,
+        suppress_roundtripping,
+        mapped_fields,
+        sdf_ref_table=sdf_ref_table,
     )
-    map_content_format(data_qualities, data_schema, mapped_fields)
 
     map_items(
-        sdf_model, data_qualities, data_schema, suppress_roundtripping, mapped_fields
+        sdf_model,
+        data_qualities,
+        data_schema,
+        suppress_roundtripping,
+        mapped_fields,
+        sdf_ref_table=sdf_ref_table,
     )
 
     map_properties(
-        sdf_model, data_qualities, data_schema, suppress_roundtripping, mapped_fields
+        sdf_model,
+        data_qualities,
+        data_schema,
+        suppress_roundtripping,
+        mapped_fields,
+        sdf_ref_table=sdf_ref_table,
     )
 
     if is_property:
         map_observable(data_qualities, data_schema, mapped_fields)
-        map_writable(data_qualities, data_schema, mapped_fields)
-        map_readable(data_qualities, data_schema, mapped_fields)
 
     map_additional_fields(data_schema, data_qualities, mapped_fields)
 
 
-def map_writable(sdf_property, wot_property, mapped_fields):
-    map_field(
-        sdf_property,
-        wot_property,
-        "writable",
-        "readOnly",
-        conversion_function=negate,
-        mapped_fields=mapped_fields,
-    )
-
-
-def map_readable(sdf_property, wot_property, mapped_fields):
-    map_field(
-        sdf_property,
-        wot_property,
-        "readable",
-        "writeOnly",
-        conversion_function=negate,
-        mapped_fields=mapped_fields,
-    )
-
-
 def map_properties(
-    sdf_model, data_qualities, data_schema, suppress_roundtripping: bool, mapped_fields
+    sdf_model,
+    data_qualities,
+    data_schema,
+    suppress_roundtripping: bool,
+    mapped_fields,
+    sdf_ref_table: Optional[SdfRefTable] = None,
 ):
     sdf_properties = data_qualities.get("properties")
 
     if sdf_properties is None:
         return
 
-    mapped_fields.append("properties")
+    mapped_fields.add("properties")
 
     for key, sdf_property in sdf_properties.items():
         wot_properties = initialize_object_field(data_schema, "properties")
         wot_property = initialize_object_field(wot_properties, key)
-        mapped_property_fields: List[str] = []
+        mapped_property_fields: Set[str] = set()
         map_data_qualities(
             sdf_model,
             sdf_property,
             wot_property,
             suppress_roundtripping,
             mapped_property_fields,
+            sdf_ref_table=sdf_ref_table,
         )
 
 
 def map_items(
-    sdf_model, data_qualities, data_schema, suppress_roundtripping: bool, mapped_fields
+    sdf_model,
+    data_qualities,
+    data_schema,
+    suppress_roundtripping: bool,
+    mapped_fields,
+    sdf_ref_table: Optional[SdfRefTable] = None,
 ):
     if "items" in data_qualities:
-        mapped_fields.append("items")
+        mapped_fields.add("items")
         sdf_items = data_qualities["items"]
         wot_items = initialize_object_field(data_schema, "items")
-        mapped_item_fields: List[str] = []
+        mapped_item_fields: Set[str] = set()
         map_data_qualities(
             sdf_model,
             sdf_items,
             wot_items,
             suppress_roundtripping,
             mapped_item_fields,
+            sdf_ref_table=sdf_ref_table,
         )
 
 
 def map_observable(wot_property: Dict, sdf_property: Dict, mapped_fields):
-    mapped_fields.append("observable")
+    mapped_fields.add("observable")
     sdf_property["observable"] = wot_property.get("observable", True)
 
 
-def map_sdf_type(
-    data_qualities, data_schema, suppress_roundtripping: bool, mapped_fields
-):
-    if suppress_roundtripping:
-        return
-
-    map_field(
-        data_qualities,
-        data_schema,
-        "sdfType",
-        "sdf:sdfType",
-        mapped_fields=mapped_fields,
-    )
-
-
-def map_unique_items(
-    data_qualities, data_schema, suppress_roundtripping: bool, mapped_fields: List[str]
-):
-    if suppress_roundtripping:
-        return
-
-    map_field(
-        data_qualities,
-        data_schema,
-        "uniqueItems",
-        "sdf:uniqueItems",
-        mapped_fields=mapped_fields,
-    )
-
-
-def map_nullable(
-    data_qualities, data_schema, suppress_roundtripping: bool, mapped_fields
-):
-    if suppress_roundtripping:
-        return
-
-    map_field(
-        data_qualities,
-        data_schema,
-        "nullable",
-        "sdf:nullable",
-        mapped_fields=mapped_fields,
-    )
-
-
-def map_content_format(data_qualities, data_schema, mapped_fields):
-    map_field(
-        data_qualities,
-        data_schema,
-        "contentFormat",
-        "contentMediaType",
-        mapped_fields=mapped_fields,
-    )
-
-
-def map_enum(data_qualities, data_schema, mapped_fields):
-    map_common_field(data_qualities, data_schema, "enum", mapped_fields=mapped_fields)
-
-
 def map_action_qualities(
     sdf_model: Dict,
     thing_model: Dict,
@@ -459,12 +476,13 @@ def map_action_qualities(
     action_key: str,
     json_pointer: str,
     suppress_roundtripping: bool,
+    sdf_ref_table: Optional[SdfRefTable] = None,
 ):
-    sdf_action = resolve_sdf_ref(sdf_model, sdf_action, None, [])
+    sdf_action = _resolve_sdf_ref(sdf_model, sdf_action, sdf_ref_table)
 
     wot_actions = initialize_object_field(thing_model, "actions")
     wot_action = initialize_object_field(wot_actions, action_key)
-    mapped_fields: List[str] = []
+    mapped_fields: Set[str] = set()
 
     collect_sdf_required(thing_model, sdf_action, mapped_fields)
     collect_mapping(thing_model, json_pointer, "actions", action_key)
@@ -475,16 +493,17 @@ def map_action_qualities(
 
     for sdf_field_name, wot_field_name in data_map_pairs:
         if sdf_field_name in sdf_action:
-            mapped_fields.append(sdf_field_name)
+            mapped_fields.add(sdf_field_name)
             sdf_data_qualities = sdf_action[sdf_field_name]
             wot_data_schema = initialize_object_field(wot_action, wot_field_name)
-            mapped_data_quality_fields: List[str] = []
+            mapped_data_quality_fields: Set[str] = set()
             map_data_qualities(
                 sdf_model,
                 sdf_data_qualities,
                 wot_data_schema,
                 suppress_roundtripping,
                 mapped_data_quality_fields,
+                sdf_ref_table=sdf_ref_table,
             )
 
     map_sdf_data(
@@ -494,6 +513,7 @@ def map_action_qualities(
         json_pointer,
         suppress_roundtripping,
         mapped_fields,
+        sdf_ref_table=sdf_ref_table,
     )
 
     map_additional_fields(wot_action, sdf_action, mapped_fields)
@@ -506,11 +526,12 @@ def map_property_qualities(
     property_key: str,
     json_pointer: str,
     suppress_roundtripping: bool,
+    sdf_ref_table: Optional[SdfRefTable] = None,
 ):
     wot_properties = initialize_object_field(thing_model, "properties")
     wot_property = initialize_object_field(wot_properties, property_key)
 
-    mapped_fields: List[str] = []
+    mapped_fields: Set[str] = set()
     collect_sdf_required(thing_model, sdf_property, mapped_fields)
     collect_mapping(thing_model, json_pointer, "properties", property_key)
 
@@ -521,6 +542,7 @@ def map_property_qualities(
         suppress_roundtripping,
         mapped_fields,
         is_property=True,
+        sdf_ref_table=sdf_ref_table,
     )
 
     map_additional_fields(wot_property, sdf_property, mapped_fields)
@@ -532,6 +554,7 @@ def map_sdf_data_qualities(
     sdf_data: Dict,
     json_pointer: str,
     suppress_roundtripping: bool,
+    sdf_ref_table: Optional[SdfRefTable] = None,
 ):
     schema_definitions = initialize_object_field(thing_model, "schemaDefinitions")
     schema_definition_key = json_pointer[2:].replace("/", "~1")
@@ -539,7 +562,7 @@ def map_sdf_data_qualities(
         schema_definitions, schema_definition_key
     )
 
-    mapped_fields: List[str] = []
+    mapped_fields: Set[str] = set()
     collect_sdf_required(thing_model, sdf_data, mapped_fields)
     collect_mapping(
         thing_model, json_pointer, "schemaDefinitions", schema_definition_key
@@ -552,6 +575,7 @@ def map_sdf_data_qualities(
         suppress_roundtripping,
         mapped_fields,
         is_property=False,
+        sdf_ref_table=sdf_ref_table,
     )
 
     map_common_qualities(
@@ -567,14 +591,15 @@ def map_sdf_data(
     thing_model: Dict,
     json_pointer_prefix: str,
     suppress_roundtripping: bool,
-    mapped_fields: List[str],
+    mapped_fields: Set[str],
+    sdf_ref_table: Optional[SdfRefTable] = None,
 ):
     sdf_data = sdf_definition.get("sdfData")
 
     if sdf_data is None:
         return
 
-    mapped_fields.append("sdfData")
+    mapped_fields.add("sdfData")
 
     for key, sdf_property in sdf_data.items():
         json_pointer = get_json_pointer(json_pointer_prefix, "sdfData", key)
@@ -584,6 +609,7 @@ def map_sdf_data(
             sdf_property,
             json_pointer,
             suppress_roundtripping,
+            sdf_ref_table=sdf_ref_table,
         )
 
 
@@ -593,14 +619,15 @@ def map_sdf_action(
     thing_model: Dict,
     json_pointer_prefix: str,
     suppress_roundtripping: bool,
-    mapped_fields: List[str],
+    mapped_fields: Set[str],
+    sdf_ref_table: Optional[SdfRefTable] = None,
 ):
     sdf_actions = sdf_definition.get("sdfAction")
 
     if sdf_actions is None:
         return
 
-    mapped_fields.append("sdfAction")
+    mapped_fields.add("sdfAction")
 
     for key, sdf_action in sdf_actions.items():
         json_pointer = get_json_pointer(json_pointer_prefix, "sdfAction", key)
@@ -611,6 +638,7 @@ def map_sdf_action(
             key,
             json_pointer,
             suppress_roundtripping,
+            sdf_ref_table=sdf_ref_table,
         )
 
 
@@ -625,14 +653,15 @@ def map_sdf_property(
     thing_model: Dict,
     json_pointer_prefix: str,
     suppress_roundtripping: bool,
-    mapped_fields: List[str],
+    mapped_fields: Set[str],
+    sdf_ref_table: Optional[SdfRefTable] = None,
 ):
     sdf_properties = sdf_definition.get("sdfProperty")
 
     if sdf_properties is None:
         return
 
-    mapped_fields.append("sdfProperty")
+    mapped_fields.add("sdfProperty")
 
     for key, sdf_property in sdf_properties.items():
         json_pointer = get_json_pointer(json_pointer_prefix, "sdfProperty", key)
@@ -643,6 +672,7 @@ def map_sdf_property(
             key,
             json_pointer,
             suppress_roundtripping,
+            sdf_ref_table=sdf_ref_table,
         )
 
 
@@ -653,27 +683,29 @@ def map_event_qualities(
     event_key: str,
     json_pointer: str,
     suppress_roundtripping: bool,
+    sdf_ref_table: Optional[SdfRefTable] = None,
 ):
     wot_events = initialize_object_field(thing_model, "events")
     wot_event = initialize_object_field(wot_events, event_key)
 
-    mapped_fields: List[str] = []
+    mapped_fields: Set[str] = set()
     collect_sdf_required(thing_model, sdf_event, mapped_fields)
     collect_mapping(thing_model, json_pointer, "events", event_key)
-    sdf_event = resolve_sdf_ref(sdf_model, sdf_event, None, [])
+    sdf_event = _resolve_sdf_ref(sdf_model, sdf_event, sdf_ref_table)
 
     map_common_qualities(sdf_event, wot_event, suppress_roundtripping, mapped_fields)
 
     if "sdfOutputData" in sdf_event:
-        mapped_fields.append("sdfOutputData")
+        mapped_fields.add("sdfOutputData")
         wot_data_schema = initialize_object_field(wot_event, "data")
-        mapped_output_data_fields: List[str] = []
+        mapped_output_data_fields: Set[str] = set()
         map_data_qualities(
             sdf_model,
             sdf_event["sdfOutputData"],
             wot_data_schema,
             suppress_roundtripping,
             mapped_output_data_fields,
+            sdf_ref_table=sdf_ref_table,
         )
 
     map_sdf_data(
@@ -683,15 +715,16 @@ def map_event_qualities(
         json_pointer,
         suppress_roundtripping,
         mapped_fields,
+        sdf_ref_table=sdf_ref_table,
     )
 
     map_additional_fields(wot_event, sdf_event, mapped_fields)
 
 
 def collect_sdf_required(
-    thing_model: Dict, sdf_definition: Dict, mapped_fields: List[str]
+    thing_model: Dict, sdf_definition: Dict, mapped_fields: Set[str]
 ):
-    mapped_fields.append("sdfRequired")
+    mapped_fields.add("sdfRequired")
     # TODO: Rework initial initialization of tm:optional
     tm_required = initialize_list_field(thing_model, "tm:required")
     tm_required.extend(sdf_definition.get("sdfRequired", []))
@@ -707,14 +740,15 @@ def map_sdf_event(
     thing_model: Dict,
     json_pointer_prefix: str,
     suppress_roundtripping: bool,
-    mapped_fields: List[str],
+    mapped_fields: Set[str],
+    sdf_ref_table: Optional[SdfRefTable] = None,
 ):
     sdf_events = sdf_definition.get("sdfEvent")
 
     if sdf_events is None:
         return
 
-    mapped_fields.append("sdfEvent")
+    mapped_fields.add("sdfEvent")
 
     for key, sdf_event in sdf_events.items():
         json_pointer = get_json_pointer(json_pointer_prefix, "sdfEvent", key)
@@ -725,6 +759,7 @@ def map_sdf_event(
             key,
             json_pointer,
             suppress_roundtripping,
+            sdf_ref_table=sdf_ref_table,
         )
 
 
@@ -792,14 +827,15 @@ def map_sdf_objects(
     parent_mapped_fields=None,
     set_instance_version=False,
     suppress_roundtripping=False,
+    sdf_ref_table: Optional[SdfRefTable] = None,
 ) -> None:
     if parent_mapped_fields is not None:
-        parent_mapped_fields.append("sdfObject")
+        parent_mapped_fields.add("sdfObject")
 
     for object_key, sdf_object in sdf_definition.get("sdfObject", {}).items():
         json_pointer = f"{pointer_prefix}/sdfObject/{object_key}"
 
-        mapped_fields: List[str] = []
+        mapped_fields: Set[str] = set()
 
         thing_model: Dict = create_basic_thing_model()
         if not suppress_roundtripping:
@@ -826,6 +862,7 @@ def map_sdf_objects(
             json_pointer,
             suppress_roundtripping,
             mapped_fields,
+            sdf_ref_table=sdf_ref_table,
         )
         map_sdf_action(
             sdf_model,
@@ -834,6 +871,7 @@ def map_sdf_objects(
             json_pointer,
             suppress_roundtripping,
             mapped_fields,
+            sdf_ref_table=sdf_ref_table,
         )
         map_sdf_property(
             sdf_model,
@@ -842,6 +880,7 @@ def map_sdf_objects(
             json_pointer,
             suppress_roundtripping,
             mapped_fields,
+            sdf_ref_table=sdf_ref_table,
         )
         map_sdf_event(
             sdf_model,
@@ -850,6 +889,7 @@ def map_sdf_objects(
             json_pointer,
             suppress_roundtripping,
             mapped_fields,
+            sdf_ref_table=sdf_ref_table,
         )
 
         map_sdf_required(thing_model)
@@ -865,7 +905,7 @@ def map_sdf_objects(
 
 
 def map_additional_fields(
-    wot_definition: dict, sdf_definition: dict, mapped_fields: List[str]
+    wot_definition: dict, sdf_definition: dict, mapped_fields: Set[str]
 ):
     for key, value in sdf_definition.items():
         if key in mapped_fields:
@@ -895,14 +935,15 @@ def map_sdf_things(
     parent_mapped_fields=None,
     set_instance_version=False,
     suppress_roundtripping=False,
+    sdf_ref_table: Optional[SdfRefTable] = None,
 ) -> None:
     if parent_mapped_fields is not None:
-        parent_mapped_fields.append("sdfThing")
+        parent_mapped_fields.add("sdfThing")
 
     for thing_key, sdf_thing in sdf_definition.get("sdfThing", {}).items():
         thing_prefix = f"{current_prefix}/sdfThing/{thing_key}"
 
-        mapped_fields: List[str] = []
+        mapped_fields: Set[str] = set()
 
         thing_model: Dict = create_basic_thing_model()
         if not suppress_roundtripping:
@@ -929,6 +970,7 @@ def map_sdf_things(
             thing_prefix,
             suppress_roundtripping,
             mapped_fields,
+            sdf_ref_table=sdf_ref_table,
         )
         map_sdf_action(
             sdf_model,
@@ -937,6 +979,7 @@ def map_sdf_things(
             thing_prefix,
             suppress_roundtripping,
             mapped_fields,
+            sdf_ref_table=sdf_ref_table,
         )
         map_sdf_property(
             sdf_model,
@@ -945,6 +988,7 @@ def map_sdf_things(
             thing_prefix,
             suppress_roundtripping,
             mapped_fields,
+            sdf_ref_table=sdf_ref_table,
         )
         map_sdf_event(
             sdf_model,
@@ -953,6 +997,7 @@ def map_sdf_things(
             thing_prefix,
             suppress_roundtripping,
             mapped_fields,
+            sdf_ref_table=sdf_ref_table,
         )
 
         map_sdf_required(thing_model)
@@ -973,6 +1018,7 @@ def map_sdf_things(
             origin_url=origin_url,
             parent_mapped_fields=mapped_fields,
             suppress_roundtripping=suppress_roundtripping,
+            sdf_ref_table=sdf_ref_table,
         )
         map_sdf_objects(
             thing_models,
@@ -983,6 +1029,7 @@ def map_sdf_things(
             origin_url=origin_url,
             parent_mapped_fields=mapped_fields,
             suppress_roundtripping=suppress_roundtripping,
+            sdf_ref_table=sdf_ref_table,
         )
 
         map_additional_fields(thing_model, sdf_thing, mapped_fields)
@@ -997,11 +1044,14 @@ def _apply_mapping_file(sdf_model: Dict, sdf_mapping_file: Dict):
         json_merge_patch.merge(original, value)
 
 
-def consolidate_sdf_model(sdf_model: Dict, sdf_mapping_files: List[Dict]):
+def consolidate_sdf_model(
+    sdf_model: Dict, sdf_mapping_files: List[Dict], validate=True
+):
     for sdf_mapping_file in sdf_mapping_files:
         _apply_mapping_file(sdf_model, sdf_mapping_file)
 
-    validate_sdf_model(sdf_model, framework=True)
+    if validate:
+        validate_sdf_model(sdf_model, framework=True)
 
 
 def _fix_thing_model_json_ld_types(thing_models: Dict):
@@ -1016,21 +1066,30 @@ def _validate_thing_models(thing_models: Dict):
         validate_thing_model(thing_model)
 
 
+@timed_phase("mapping")
 def convert_sdf_to_wot_tm(
     sdf_model: Dict,
     sdf_mapping_files: Optional[List[Dict]] = None,
     origin_url=None,
     set_instance_version=False,
     suppress_roundtripping=False,
+    validate_input=True,
+    validate_output=True,
+    copy_input=True,
 ) -> Dict[str, Dict]:
 
-    sdf_model = copy.deepcopy(sdf_model)
-    validate_sdf_model(sdf_model)
+    # The mapping files are applied to the SDF model in place.
+    if copy_input:
+        sdf_model = clone_json(sdf_model)
+    if validate_input:
+        validate_sdf_model(sdf_model)
 
     if sdf_mapping_files is not None:
-        sdf_mapping_files = copy.deepcopy(sdf_mapping_files)
-        consolidate_sdf_model(sdf_model, sdf_mapping_files)
+        if copy_input:
+            sdf_mapping_files = clone_json(sdf_mapping_files)
+        consolidate_sdf_model(sdf_model, sdf_mapping_files, validate=validate_input)
 
+    sdf_ref_table = SdfRefTable(sdf_model, validate=validate_input)
     thing_models: Dict[str, Dict] = {}
     map_sdf_objects(
         thing_models,
@@ -1040,6 +1099,7 @@ def convert_sdf_to_wot_tm(
         origin_url=origin_url,
         set_instance_version=set_instance_version,
         suppress_roundtripping=suppress_roundtripping,
+        sdf_ref_table=sdf_ref_table,
     )
     map_sdf_things(
         thing_models,
@@ -1049,10 +1109,12 @@ def convert_sdf_to_wot_tm(
         origin_url=origin_url,
         set_instance_version=set_instance_version,
         suppress_roundtripping=suppress_roundtripping,
+        sdf_ref_table=sdf_ref_table,
     )
 
     _fix_thing_model_json_ld_types(thing_models)
-    _validate_thing_models(thing_models)
+    if validate_output:
+        _validate_thing_models(thing_models)
 
     if len(thing_models) == 1:
         thing_models = list(thing_models.values())[0]
@@ -1,9 +1,9 @@
 from typing import Dict
-import copy
 
-from .utility import ensure_value_is_list
+from .utility import clone_json, ensure_value_is_list
 from .wot_common import is_thing_collection
 
+from ..timings import timed_phase
 from ..validation import (
     validate_thing_description,
     validate_thing_model,
@@ -19,30 +19,54 @@ def _replace_type(thing_model: Dict):
         return
 
     json_ld_type = ensure_value_is_list(thing_model["@type"])
-    json_ld_type.append(thing_model_type)
-    thing_model["@type"] = json_ld_type
+    thing_model["@type"] = [*json_ld_type, thing_model_type]
 
 
 def convert_td_collection_to_tm_collection(
-    thing_collection: Dict[str, Dict]
+    thing_collection: Dict[str, Dict],
+    validate_input=True,
+    validate_output=True,
+    copy_input=True,
 ) -> Dict[str, Dict]:
     result = {}
 
     for key, value in thing_collection.items():
-        result[key] = convert_td_to_tm(value)
+        result[key] = convert_td_to_tm(
+            value,
+            validate_input=validate_input,
+            validate_output=validate_output,
+            copy_input=copy_input,
+        )
 
     return result
 
 
-def convert_td_to_tm(thing_description: Dict) -> Dict:
+@timed_phase("mapping")
+def convert_td_to_tm(
+    thing_description: Dict,
+    validate_input=True,
+    validate_output=True,
+    copy_input=True,
+) -> Dict:
     if is_thing_collection(thing_description):
-        return convert_td_collection_to_tm_collection(thing_description)
-
-    validate_thing_description(thing_description)
-    thing_model: Dict = copy.deepcopy(thing_description)
+        return convert_td_collection_to_tm_collection(
+            thing_description,
+            validate_input=validate_input,
+            validate_output=validate_output,
+            copy_input=copy_input,
+        )
+
+    if validate_input:
+        validate_thing_description(thing_description)
+    # Only the top level is modified, so the Thing Model may share all other
+    # values with the Thing Description if the input is not copied.
+    thing_model: Dict = (
+        clone_json(thing_description) if copy_input else dict(thing_description)
+    )
     # TODO: Deal with item links
 
     _replace_type(thing_model)
-    validate_thing_model(thing_model)
+    if validate_output:
+        validate_thing_model(thing_model)
 
     return thing_model
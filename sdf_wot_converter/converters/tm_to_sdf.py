@@ -1,7 +1,5 @@
-import copy
 from typing import (
     Dict,
-    List,
     Optional,
     Set,
     Tuple,
@@ -9,15 +7,19 @@ from typing import (
 )
 
 from .jsonschema import (
-    map_common_json_schema_fields,
+    COMMON_JSON_SCHEMA_FIELD_MAPPINGS,
 )
 from ..validation import validate_sdf_model, validate_thing_model
+from ..timings import timed_phase
 from .utility import (
+    FieldMapping,
+    clone_json,
     ensure_value_is_list,
     initialize_list_field,
     initialize_object_field,
     map_field,
     map_common_field,
+    map_fields,
     negate,
 )
 from .wot_common import (
@@ -27,23 +29,51 @@ from .wot_common import (
     resolve_sub_things,
 )
 
+DATA_SCHEMA_FIELD_MAPPINGS = {
+    **COMMON_JSON_SCHEMA_FIELD_MAPPINGS,
+    "sdf:$comment": FieldMapping("$comment"),
+    "title": FieldMapping("label"),
+    "description": FieldMapping("description"),
+    "sdf:uniqueItems": FieldMapping("uniqueItems"),
+    "contentMediaType": FieldMapping("contentFormat"),
+    "sdf:nullable": FieldMapping("nullable"),
+    "sdf:sdfType": FieldMapping("sdfType"),
+}
+
+PROPERTY_DATA_SCHEMA_FIELD_MAPPINGS = {
+    **DATA_SCHEMA_FIELD_MAPPINGS,
+    "readOnly": FieldMapping("writable", conversion_function=negate),
+    "writeOnly": FieldMapping("readable", conversion_function=negate),
+}
+
+# Fields of a Thing Model that are mapped to the infoblock or the namespace of
+# the SDF model instead of the corresponding sdfObject or sdfThing.
+INFOBLOCK_EXTENSION_FIELDS = frozenset(
+    {
+        "sdf:defaultNamespace",
+        "sdf:title",
+        "sdf:copyright",
+        "sdf:license",
+    }
+)
+
 
 def map_properties(
     thing_model: Dict,
     sdf_model: Dict,
     sdf_mapping_file,
     current_path: str,
-    mapped_fields: List[str],
+    mapped_fields: Set[str],
 ):
     if "properties" not in thing_model:
         return
 
-    mapped_fields.append("properties")
+    mapped_fields.add("properties")
 
     for key, wot_property in thing_model["properties"].items():
         sdf_properties = initialize_object_field(sdf_model, "sdfProperty")
         sdf_property = initialize_object_field(sdf_properties, key)
-        mapped_property_fields: List[str] = []
+        mapped_property_fields: Set[str] = set()
         property_path = f"{current_path}/sdfProperty/{key}"
 
         map_interaction_affordance_fields(
@@ -68,7 +98,7 @@ def map_items(
     sdf_definition: Dict,
     sdf_mapping_file: Dict,
     current_path: str,
-    mapped_fields: List[str],
+    mapped_fields: Set[str],
 ):
     wot_items = wot_definition.get("items")
 
@@ -76,7 +106,7 @@ def map_items(
         return
 
     sdf_items = initialize_object_field(sdf_definition, "items")
-    mapped_fields.append("items")
+    mapped_fields.add("items")
     map_data_schema_fields(
         thing_model,
         wot_items,
@@ -92,12 +122,12 @@ def map_dataschema_properties(
     sdf_definition: Dict,
     sdf_mapping_file: Dict,
     current_path: str,
-    mapped_fields: List[str],
+    mapped_fields: Set[str],
 ):
     if "properties" not in wot_definition:
         return
 
-    mapped_fields.append("properties")
+    mapped_fields.add("properties")
 
     for key, property in wot_definition["properties"].items():
         properties = initialize_object_field(sdf_definition, "properties")
@@ -116,17 +146,17 @@ def map_actions(
     sdf_model: Dict,
     sdf_mapping_file,
     current_path: str,
-    mapped_fields: List[str],
+    mapped_fields: Set[str],
 ):
     if "actions" not in thing_model:
         return
 
-    mapped_fields.append("actions")
+    mapped_fields.add("actions")
 
     for action_key, wot_action in thing_model["actions"].items():
         sdf_actions = initialize_object_field(sdf_model, "sdfAction")
         sdf_action = initialize_object_field(sdf_actions, action_key)
-        mapped_action_fields: List[str] = []
+        mapped_action_fields: Set[str] = set()
         action_path = f"{current_path}/sdfAction/{action_key}"
 
         map_sdf_comment(wot_action, sdf_action, mapped_action_fields)
@@ -154,11 +184,11 @@ def map_action_fields(
     sdf_action,
     sdf_mapping_file,
     current_path: str,
-    mapped_fields: List[str],
+    mapped_fields: Set[str],
 ):
     if "input" in wot_action:
         sdf_input_data = initialize_object_field(sdf_action, "sdfInputData")
-        mapped_fields.append("input")
+        mapped_fields.add("input")
         map_data_schema_fields(
             thing_model,
             wot_action["input"],
@@ -168,7 +198,7 @@ def map_action_fields(
         )
     if "output" in wot_action:
         sdf_output_data = initialize_object_field(sdf_action, "sdfOutputData")
-        mapped_fields.append("output")
+        mapped_fields.add("output")
         map_data_schema_fields(
             thing_model,
             wot_action["output"],
@@ -183,18 +213,18 @@ def map_events(
     sdf_model: Dict,
     sdf_mapping_file,
     current_path: str,
-    mapped_fields: List[str],
+    mapped_fields: Set[str],
 ):
     if "events" not in thing_model:
         return
 
-    mapped_fields.append("events")
+    mapped_fields.add("events")
 
     for event_key, wot_event in thing_model["events"].items():
         sdf_events = initialize_object_field(sdf_model, "sdfEvent")
         sdf_event = initialize_object_field(sdf_events, event_key)
         event_path = f"{current_path}/sdfEvent/{event_key}"
-        mapped_event_fields: List[str] = []
+        mapped_event_fields: Set[str] = set()
 
         map_sdf_comment(wot_event, sdf_event, mapped_event_fields)
         map_interaction_affordance_fields(wot_event, sdf_event, mapped_event_fields)
@@ -219,7 +249,7 @@ def map_event_fields(
     sdf_event,
     sdf_mapping_file: Dict,
     current_path: str,
-    mapped_fields: List[str],
+    mapped_fields: Set[str],
 ):
     wot_event_data = wot_event.get("data")
 
@@ -227,7 +257,7 @@ def map_event_fields(
         return
 
     sdf_output_data = initialize_object_field(sdf_event, "sdfOutputData")
-    mapped_fields.append("data")
+    mapped_fields.add("data")
     map_data_schema_fields(
         thing_model,
         wot_event_data,
@@ -249,26 +279,17 @@ def map_data_schema_fields(
     property_path=None,
 ):
     if mapped_fields is None:
-        mapped_fields = []
+        mapped_fields = set()
 
     mapping_file_path = current_path
     if property_path is not None:
         mapping_file_path = property_path
 
-    map_sdf_comment(wot_definition, sdf_definition, mapped_fields)
-
-    map_common_json_schema_fields(wot_definition, sdf_definition, mapped_fields)
-
-    map_title(wot_definition, sdf_definition, mapped_fields)
-    map_description(wot_definition, sdf_definition, mapped_fields)
-    map_enum(wot_definition, sdf_definition, mapped_fields)
+    field_mappings = DATA_SCHEMA_FIELD_MAPPINGS
     if is_property:
-        map_read_only(wot_definition, sdf_definition, mapped_fields)
-        map_write_only(wot_definition, sdf_definition, mapped_fields)
-    map_unique_items(wot_definition, sdf_definition, mapped_fields)
-    map_content_format(wot_definition, sdf_definition, mapped_fields)
-    map_nullable(wot_definition, sdf_definition, mapped_fields)
-    map_sdf_type(wot_definition, sdf_definition, mapped_fields)
+        field_mappings = PROPERTY_DATA_SCHEMA_FIELD_MAPPINGS
+    map_fields(wot_definition, sdf_definition, field_mappings, mapped_fields)
+    map_enum(wot_definition, sdf_definition, mapped_fields)
 
     map_items(
         thing_model,
@@ -294,53 +315,9 @@ def map_data_schema_fields(
     )
 
 
-def map_nullable(wot_definition: Dict, sdf_definition: Dict, mapped_fields: List[str]):
-    map_field(
-        wot_definition,
-        sdf_definition,
-        "sdf:nullable",
-        "nullable",
-        mapped_fields=mapped_fields,
-    )
-
-
-def map_sdf_type(wot_definition: Dict, sdf_definition: Dict, mapped_fields: List[str]):
-    map_field(
-        wot_definition,
-        sdf_definition,
-        "sdf:sdfType",
-        "sdfType",
-        mapped_fields=mapped_fields,
-    )
-
-
-def map_unique_items(
-    wot_definition: Dict, sdf_definition: Dict, mapped_fields: List[str]
-):
-    map_field(
-        wot_definition,
-        sdf_definition,
-        "sdf:uniqueItems",
-        "uniqueItems",
-        mapped_fields=mapped_fields,
-    )
-
-
-def map_content_format(
-    wot_definition: Dict, sdf_definition: Dict, mapped_fields: List[str]
-):
-    map_field(
-        wot_definition,
-        sdf_definition,
-        "contentMediaType",
-        "contentFormat",
-        mapped_fields=mapped_fields,
-    )
-
-
-def map_enum(wot_definition: Dict, sdf_definition: Dict, mapped_fields: List[str]):
+def map_enum(wot_definition: Dict, sdf_definition: Dict, mapped_fields: Set[str]):
     if "enum" in wot_definition:
-        mapped_fields.append("enum")
+        mapped_fields.add("enum")
         for enum in wot_definition["enum"]:
             if type(enum) is dict and "sdf:choiceName" in enum:
                 sdf_choice = initialize_object_field(sdf_definition, "sdfChoice")
@@ -352,50 +329,26 @@ def map_enum(wot_definition: Dict, sdf_definition: Dict, mapped_fields: List[str
                 sdf_enum.append(enum)
 
 
-def map_read_only(wot_definition: Dict, sdf_definition: Dict, mapped_fields: List[str]):
-    map_field(
-        wot_definition,
-        sdf_definition,
-        "readOnly",
-        "writable",
-        conversion_function=negate,
-        mapped_fields=mapped_fields,
-    )
-
-
-def map_write_only(
-    wot_definition: Dict, sdf_definition: Dict, mapped_fields: List[str]
-):
-    map_field(
-        wot_definition,
-        sdf_definition,
-        "writeOnly",
-        "readable",
-        conversion_function=negate,
-        mapped_fields=mapped_fields,
-    )
-
-
-def map_observable(wot_property: Dict, sdf_property: Dict, mapped_fields: List[str]):
-    mapped_fields.append("observable")
+def map_observable(wot_property: Dict, sdf_property: Dict, mapped_fields: Set[str]):
+    mapped_fields.add("observable")
     sdf_property["observable"] = wot_property.get("observable", False)
 
 
 def map_interaction_affordance_fields(
-    wot_definition: Dict, sdf_definition: Dict, mapped_fields: List[str]
+    wot_definition: Dict, sdf_definition: Dict, mapped_fields: Set[str]
 ):
     map_title(wot_definition, sdf_definition, mapped_fields)
     map_description(wot_definition, sdf_definition, mapped_fields)
 
 
-def map_title(wot_definition: Dict, sdf_definition: Dict, mapped_fields: List[str]):
+def map_title(wot_definition: Dict, sdf_definition: Dict, mapped_fields: Set[str]):
     map_field(
         wot_definition, sdf_definition, "title", "label", mapped_fields=mapped_fields
     )
 
 
 def map_description(
-    wot_definition: Dict, sdf_definition: Dict, mapped_fields: List[str]
+    wot_definition: Dict, sdf_definition: Dict, mapped_fields: Set[str]
 ):
     map_common_field(
         wot_definition, sdf_definition, "description", mapped_fields=mapped_fields
@@ -407,18 +360,18 @@ def map_schema_definitions(
     sdf_model: Dict,
     sdf_mapping_file,
     current_path: str,
-    mapped_fields: List[str],
+    mapped_fields: Set[str],
 ):
     wot_schema_definitions = thing_model.get("schemaDefinitions")
     if wot_schema_definitions is None:
         return
 
-    mapped_fields.append("schemaDefinitions")
+    mapped_fields.add("schemaDefinitions")
     sdf_data = initialize_object_field(sdf_model, "sdfData")
 
     for schema_definition_key, wot_schema_definition in wot_schema_definitions.items():
         sdf_data_field = initialize_object_field(sdf_data, schema_definition_key)
-        mapped_schema_definitions_fields: List[str] = []
+        mapped_schema_definitions_fields: Set[str] = set()
         map_sdf_comment(
             wot_schema_definition, sdf_data_field, mapped_schema_definitions_fields
         )
@@ -443,7 +396,7 @@ def map_links(
     wot_definition: Dict,
     sdf_definition: Dict,
     sdf_mapping_file,
-    mapped_fields: List[str],
+    mapped_fields: Set[str],
 ):
     if "links" not in wot_definition:
         return
@@ -466,7 +419,7 @@ def map_version(
     wot_definition: Dict,
     sdf_definition: Dict,
     sdf_mapping_file: Dict,
-    mapped_fields: List[str],
+    mapped_fields: Set[str],
 ):
     if "version" not in wot_definition:
         return
@@ -483,12 +436,12 @@ def map_context_to_namespaces(
     wot_definition: Dict,
     sdf_model: Dict,
     suppress_roundtripping: bool,
-    mapped_fields: List[str],
+    mapped_fields: Set[str],
 ):
     context = wot_definition["@context"]
 
     if suppress_roundtripping:
-        mapped_fields.append("@context")
+        mapped_fields.add("@context")
 
     if isinstance(context, str):
         return
@@ -526,7 +479,7 @@ def map_default_namespace(wot_definition: Dict, sdf_definition: Dict):
 
 
 def map_sdf_comment(
-    wot_definition: Dict, sdf_definition: Dict, mapped_fields: List[str]
+    wot_definition: Dict, sdf_definition: Dict, mapped_fields: Set[str]
 ):
     map_field(
         wot_definition,
@@ -557,14 +510,14 @@ def map_tm_ref(
     wot_definition: Dict,
     sdf_definition: Dict,
     current_path: str,
-    mapped_fields: List[str],
+    mapped_fields: Set[str],
 ):
     pointer = wot_definition.get("tm:ref")
 
     if pointer is None:
         return
 
-    mapped_fields.append("tm:ref")
+    mapped_fields.add("tm:ref")
     sdf_definition["sdfRef"] = convert_pointer(pointer, current_path)
 
 
@@ -573,7 +526,7 @@ def map_tm_optional(
     wot_definition: Dict,
     sdf_definition: Dict,
     current_path: str,
-    mapped_fields: List[str],
+    mapped_fields: Set[str],
 ):
     pointers = wot_definition.get("tm:optional", [])
 
@@ -590,7 +543,7 @@ def map_tm_optional(
 
     pointers = ["#" + pointer for pointer in pointers]
 
-    mapped_fields.append("tm:optional")
+    mapped_fields.add("tm:optional")
     converted_pointers = [convert_pointer(x, current_path) for x in pointers]
     if len(converted_pointers) > 0:
         sdf_definition["sdfRequired"] = converted_pointers
@@ -605,14 +558,11 @@ def map_thing_model_to_sdf_object(
     current_path: str,
     placeholder_map=None,
     suppress_roundtripping=False,
+    copy_input=True,
 ):
-    thing_model = copy.deepcopy(thing_model)
-    mapped_fields: List[str] = [
-        "sdf:defaultNamespace",
-        "sdf:title",
-        "sdf:copyright",
-        "sdf:license",
-    ]
+    if copy_input:
+        thing_model = clone_json(thing_model)
+    mapped_fields = set(INFOBLOCK_EXTENSION_FIELDS)
 
     sdf_object_key = determine_thing_model_key(
         thing_model, thing_model_key, sdf_definition, mapped_fields, is_sdf_thing=False
@@ -655,14 +605,14 @@ def determine_thing_model_key(
     thing_model,
     thing_model_key,
     sdf_definition,
-    mapped_fields: List[str],
+    mapped_fields: Set[str],
     is_sdf_thing=False,
 ):
     wot_key = "sdf:thingKey" if is_sdf_thing else "sdf:objectKey"
     prefix = "sdfThing" if is_sdf_thing else "sdfObject"
 
     sdf_thing_key = thing_model.get(wot_key)
-    mapped_fields.append(wot_key)
+    mapped_fields.add(wot_key)
     if sdf_thing_key is not None:
         thing_model_key = sdf_thing_key
     elif thing_model_key is None:
@@ -683,7 +633,7 @@ def map_additional_fields(
     mapping_file: dict,
     wot_definition: dict,
     current_sdf_path: str,
-    mapped_fields: List[str],
+    mapped_fields: Set[str],
 ):
 
     for key, value in wot_definition.items():
@@ -704,14 +654,12 @@ def map_thing_model_to_sdf_thing(
     placeholder_map=None,
     thing_model_collection=None,
     suppress_roundtripping=False,
+    validate=True,
+    copy_input=True,
 ):
-    thing_model = copy.deepcopy(thing_model)
-    mapped_fields: List[str] = [
-        "sdf:defaultNamespace",
-        "sdf:title",
-        "sdf:copyright",
-        "sdf:license",
-    ]
+    if copy_input:
+        thing_model = clone_json(thing_model)
+    mapped_fields = set(INFOBLOCK_EXTENSION_FIELDS)
 
     thing_model_key = determine_thing_model_key(
         thing_model, thing_model_key, sdf_definition, mapped_fields, is_sdf_thing=True
@@ -750,6 +698,7 @@ def map_thing_model_to_sdf_thing(
             sub_model,
             placeholder_map=placeholder_map,
             thing_collection=thing_model_collection,
+            validate=validate,
         )
         map_thing_model(
             sub_model,
@@ -762,6 +711,8 @@ def map_thing_model_to_sdf_thing(
             placeholder_map=placeholder_map,
             thing_model_collection=thing_model_collection,
             suppress_roundtripping=suppress_roundtripping,
+            validate=validate,
+            copy_input=copy_input,
         )
 
 
@@ -776,6 +727,8 @@ def map_thing_model(
     placeholder_map=None,
     thing_model_collection=None,
     suppress_roundtripping=False,
+    validate=True,
+    copy_input=True,
 ):
     if len(sub_models) > 0 or "sdf:thingKey" in thing_model:
         sdf_things = initialize_object_field(sdf_definition, "sdfThing")
@@ -791,6 +744,8 @@ def map_thing_model(
             placeholder_map=placeholder_map,
             thing_model_collection=thing_model_collection,
             suppress_roundtripping=suppress_roundtripping,
+            validate=validate,
+            copy_input=copy_input,
         )
     else:
         sdf_objects = initialize_object_field(sdf_definition, "sdfObject")
@@ -804,6 +759,7 @@ def map_thing_model(
             current_path,
             placeholder_map=placeholder_map,
             suppress_roundtripping=suppress_roundtripping,
+            copy_input=copy_input,
         )
 
 
@@ -838,6 +794,7 @@ def map_infoblock_fields(thing_model, sdf_model, custom_infoblock: Optional[Dict
         sdf_model["info"] = infoblock
 
 
+@timed_phase("mapping")
 def convert_wot_tm_to_sdf(
     thing_model: Dict,
     thing_model_key=None,
@@ -846,6 +803,9 @@ def convert_wot_tm_to_sdf(
     top_model_keys: Union[Set[str], None] = None,
     suppress_roundtripping=False,
     infoblock: Optional[Dict] = None,
+    validate_input=True,
+    validate_output=True,
+    copy_input=True,
 ) -> Union[Dict, Tuple[Dict, Dict]]:
     if is_thing_collection(thing_model):
         return convert_wot_tm_collection_to_sdf(
@@ -853,15 +813,25 @@ def convert_wot_tm_to_sdf(
             top_model_keys=top_model_keys,
             suppress_roundtripping=suppress_roundtripping,
             infoblock=infoblock,
+            validate_input=validate_input,
+            validate_output=validate_output,
+            copy_input=copy_input,
         )
 
     sdf_model: Dict = {}
     sdf_mapping_file: Dict = {"map": {}}
 
-    validate_thing_model(thing_model)
-    thing_model = resolve_extension(thing_model, resolve_relative_pointers=False)
-    thing_model = replace_placeholders(thing_model, placeholder_map)
-    validate_thing_model(thing_model)
+    if validate_input:
+        validate_thing_model(thing_model)
+    resolved_thing_model = resolve_extension(
+        thing_model, resolve_relative_pointers=False, validate=validate_input
+    )
+    resolved_thing_model = replace_placeholders(resolved_thing_model, placeholder_map)
+    # The resolved model only needs to be validated again if the resolution of
+    # extensions, references or placeholders actually changed it.
+    if validate_input and resolved_thing_model != thing_model:
+        validate_thing_model(resolved_thing_model)
+    thing_model = resolved_thing_model
 
     map_default_namespace(thing_model, sdf_model)
     map_infoblock_fields(thing_model, sdf_model, infoblock)
@@ -872,6 +842,7 @@ def convert_wot_tm_to_sdf(
             thing_model,
             thing_collection=thing_model_collection,
             placeholder_map=placeholder_map,
+            validate=validate_input,
         )
         map_thing_model(
             thing_model,
@@ -884,6 +855,8 @@ def convert_wot_tm_to_sdf(
             placeholder_map=placeholder_map,
             thing_model_collection=thing_model_collection,
             suppress_roundtripping=suppress_roundtripping,
+            validate=validate_input,
+            copy_input=copy_input,
         )
     else:
         top_level_models = [thing_model_collection[x] for x in top_model_keys]
@@ -893,6 +866,7 @@ def convert_wot_tm_to_sdf(
                 model,
                 thing_collection=thing_model_collection,
                 placeholder_map=placeholder_map,
+                validate=validate_input,
             )
             map_thing_model(
                 model,
@@ -904,9 +878,12 @@ def convert_wot_tm_to_sdf(
                 "#",
                 placeholder_map=placeholder_map,
                 thing_model_collection=thing_model_collection,
+                validate=validate_input,
+                copy_input=copy_input,
             )
 
-    validate_sdf_model(sdf_model)
+    if validate_output:
+        validate_sdf_model(sdf_model)
 
     if len(sdf_mapping_file["map"]) == 0:
         return sdf_model
@@ -915,7 +892,7 @@ def convert_wot_tm_to_sdf(
         field = sdf_model.get(field_name)
         if field is None:
             continue
-        sdf_mapping_file[field_name] = copy.deepcopy(field)
+        sdf_mapping_file[field_name] = clone_json(field)
 
     return sdf_model, sdf_mapping_file
 
@@ -945,6 +922,9 @@ def convert_wot_tm_collection_to_sdf(
     top_model_keys: Union[Set[str], None] = None,
     suppress_roundtripping=False,
     infoblock: Optional[Dict] = None,
+    validate_input=True,
+    validate_output=True,
+    copy_input=True,
 ) -> Union[Dict, Tuple[Dict, Dict]]:
 
     if top_model_keys is None:
@@ -965,4 +945,7 @@ def convert_wot_tm_collection_to_sdf(
         top_model_keys=top_model_keys,
         suppress_roundtripping=suppress_roundtripping,
         infoblock=infoblock,
+        validate_input=validate_input,
+        validate_output=validate_output,
+        copy_input=copy_input,
     )
@@ -1,15 +1,17 @@
 from typing import (
     Dict,
-    List,
+    Optional,
 )
-import copy
-import json_merge_patch
 from jsonpointer import resolve_pointer
 from jsonschema import ValidationError
 
-from .utility import ensure_value_is_list
+from .utility import clone_json, ensure_value_is_list
 from ..validation import validate_thing_description, validate_thing_model
+from ..timings import timed_phase
 from .wot_common import (
+    apply_merge_patch,
+    PlaceholderIndex,
+    index_placeholders,
     is_thing_collection,
     replace_placeholders,
     resolve_extension,
@@ -17,6 +19,12 @@ from .wot_common import (
 )
 
 
+class UnsupportedThingModelError(ValueError):
+    """Raised when a Thing Model cannot be compiled to a template."""
+
+    pass
+
+
 def replace_type(thing_description: Dict):
     json_ld_type = ensure_value_is_list(thing_description["@type"])
     result = list(filter(lambda item: item != "tm:ThingModel", json_ld_type))
@@ -34,7 +42,7 @@ def _replace_version(partial_td):
         return
 
     if "model" in version and "instance" not in version:
-        version["instance"] = version["model"]
+        partial_td["version"] = {**version, "instance": version["model"]}
 
 
 def _assert_tm_optional(partial_td: Dict, remove_not_required_affordances: bool):
@@ -51,23 +59,23 @@ def _assert_tm_optional(partial_td: Dict, remove_not_required_affordances: bool)
         ]
         all_affordances.update(affordances)
 
-    tm_required = list(all_affordances.difference(optional_affordances))
+    tm_required = all_affordances.difference(optional_affordances)
 
-    for required_affordance_pointer in list(tm_required):
+    for required_affordance_pointer in tm_required:
         assert (
             resolve_pointer(partial_td, required_affordance_pointer, None) is not None
         )
 
     if remove_not_required_affordances:
         for affordance_type in ["properties", "actions", "events"]:
-            affordances = partial_td.get(affordance_type, {})
-            not_required_affordance_keys: List[str] = []
-            for affordance_key in affordances:
-                affordance_pointer = f"/{affordance_type}/{affordance_key}"
-                if affordance_pointer not in tm_required:
-                    not_required_affordance_keys.append(affordance_key)
-            for affordance_key in not_required_affordance_keys:
-                del affordances[affordance_key]
+            if affordance_type not in partial_td:
+                continue
+            # The affordances might be shared with a ThingModelTemplate.
+            partial_td[affordance_type] = {
+                affordance_key: affordance
+                for affordance_key, affordance in partial_td[affordance_type].items()
+                if f"/{affordance_type}/{affordance_key}" in tm_required
+            }
 
     del partial_td["tm:optional"]
 
@@ -95,7 +103,7 @@ def _replace_meta_data(partial_td, meta_data) -> Dict:
 
     _prevent_required_tm_field_removal(meta_data)
 
-    return json_merge_patch.merge(partial_td, meta_data)
+    return apply_merge_patch(partial_td, meta_data)
 
 
 def _replace_bindings(partial_td: dict, bindings: dict) -> Dict:
@@ -104,35 +112,135 @@ def _replace_bindings(partial_td: dict, bindings: dict) -> Dict:
 
     _prevent_required_tm_field_removal(bindings)
 
-    return json_merge_patch.merge(partial_td, bindings)
+    return apply_merge_patch(partial_td, bindings)
 
 
-def _resolve_submodels(thing_model: dict, thing_collection: dict):
+def _resolve_submodels(thing_model: dict, thing_collection: dict) -> dict:
     links = thing_model.get("links")
 
     if links is None:
-        return
+        return thing_model
+
+    # TODO: Apply proper mapping
+    # The Thing Model might be shared with the input after resolving the
+    # extensions, so it is not modified in place.
+    return {
+        **thing_model,
+        "links": [
+            {**link, "rel": "item"} if link.get("rel") == "tm:submodel" else link
+            for link in links
+        ],
+    }
 
-    for link in links:
-        if link.get("rel") == "tm:submodel":
-            # TODO: Apply proper mapping
-            link["rel"] = "item"
+
+def _has_submodels(thing_model: dict) -> bool:
+    return any(
+        link.get("rel") == "tm:submodel" for link in thing_model.get("links", [])
+    )
 
 
 def convert_tm_collection_to_td_collection(
-    thing_collection, remove_not_required_affordances=False
+    thing_collection,
+    remove_not_required_affordances=False,
+    validate_input=True,
+    validate_output=True,
+    copy_input=True,
 ):
     result = {}
 
     for key, value in thing_collection.items():
-        _resolve_submodels(value, result)
         result[key] = convert_tm_to_td(
-            value, remove_not_required_affordances=remove_not_required_affordances
+            _resolve_submodels(value, result),
+            remove_not_required_affordances=remove_not_required_affordances,
+            validate_input=validate_input,
+            validate_output=validate_output,
+            copy_input=copy_input,
         )
 
     return result
 
 
+class ThingModelTemplate:
+    """A Thing Model whose extensions and references have been resolved, from which
+    any number of Thing Descriptions can be instantiated.
+
+    The Thing Model is validated and resolved only once. Instantiating a Thing
+    Description then only applies the meta data and bindings, fills the
+    placeholders, and validates the result. Since the parts of the Thing Model
+    without placeholders are known in advance, only the values containing
+    placeholders are visited and copied.
+
+    Every Thing Description is copied once it has been derived, so that it can be
+    modified without affecting the template or other Thing Descriptions. If
+    `copy_output` is False, this copy is skipped and all values without
+    placeholders are shared between the template and the Thing Descriptions, which
+    must then be copied before their nested values are modified.
+
+    If `copy_input` is False, the template is built from the given Thing Model
+    without copying it first, so the Thing Model must not be modified afterwards.
+    """
+
+    def __init__(
+        self,
+        thing_model: Dict,
+        remove_not_required_affordances=False,
+        validate_input=True,
+        validate_output=True,
+        placeholder_index=True,
+        copy_input=True,
+        copy_output=True,
+    ):
+        if is_thing_collection(thing_model):
+            raise UnsupportedThingModelError(
+                "Thing Collections cannot be compiled to a template."
+            )
+        if _has_submodels(thing_model):
+            raise UnsupportedThingModelError(
+                "Thing Models with submodels cannot be compiled."
+            )
+
+        if validate_input:
+            validate_thing_model(thing_model)
+        # The template must not change if the input is modified afterwards.
+        partial_td: Dict = clone_json(thing_model) if copy_input else thing_model
+
+        self._thing_model = resolve_extension(partial_td, validate=validate_input)
+        self._placeholder_index: Optional[PlaceholderIndex] = None
+        if placeholder_index:
+            self._placeholder_index = index_placeholders(self._thing_model)
+        self.remove_not_required_affordances = remove_not_required_affordances
+        self.validate_output = validate_output
+        self.copy_output = copy_output
+
+    @timed_phase("mapping")
+    def instantiate(self, placeholder_map=None, meta_data=None, bindings=None) -> Dict:
+        """Derives a Thing Description using the given placeholder map, meta data,
+        and bindings."""
+        partial_td = _replace_meta_data(self._thing_model, meta_data)
+        partial_td = _replace_bindings(partial_td, bindings)
+        # Only the top level is modified in place by the following steps.
+        partial_td = dict(partial_td)
+
+        replace_type(partial_td)
+
+        partial_td = replace_placeholders(
+            partial_td, placeholder_map, self._placeholder_index
+        )
+
+        _replace_version(partial_td)
+
+        _assert_tm_optional(partial_td, self.remove_not_required_affordances)
+
+        if self.validate_output:
+            validate_thing_description(partial_td)
+
+        if self.copy_output:
+            return clone_json(partial_td)
+
+        return partial_td
+
+
+@timed_phase("mapping")
 def convert_tm_to_td(
     thing_model: Dict,
     placeholder_map=None,
@@ -140,36 +248,53 @@ def convert_tm_to_td(
     bindings=None,
     root_model_key="root",
     remove_not_required_affordances=False,
+    validate_input=True,
+    validate_output=True,
+    copy_input=True,
 ) -> Dict:
     if is_thing_collection(thing_model):
         return convert_tm_collection_to_td_collection(
-            thing_model, remove_not_required_affordances=remove_not_required_affordances
+            thing_model,
+            remove_not_required_affordances=remove_not_required_affordances,
+            validate_input=validate_input,
+            validate_output=validate_output,
+            copy_input=copy_input,
         )
 
-    sub_models = resolve_sub_things(thing_model, replace_href=True)
+    # The hrefs of the submodel links are replaced in place, while the submodels
+    # themselves are always retrieved as copies.
+    if copy_input and _has_submodels(thing_model):
+        thing_model = clone_json(thing_model)
+        copy_input = False
+
+    # Submodels are validated once they are converted as part of the collection.
+    sub_models = resolve_sub_things(thing_model, replace_href=True, validate=False)
     if len(sub_models) > 0:
         sub_models[root_model_key] = thing_model
         for key, value in sub_models.items():
-            sub_models[key] = resolve_extension(value, resolve_relative_pointers=True)
+            sub_models[key] = resolve_extension(
+                value, resolve_relative_pointers=True, validate=validate_input
+            )
         return convert_tm_collection_to_td_collection(
-            sub_models, remove_not_required_affordances=remove_not_required_affordances
+            sub_models,
+            remove_not_required_affordances=remove_not_required_affordances,
+            validate_input=validate_input,
+            validate_output=validate_output,
+            copy_input=copy_input,
         )
 
-    validate_thing_model(thing_model)
-    partial_td: Dict = copy.deepcopy(thing_model)
-
-    partial_td = resolve_extension(partial_td)
-    partial_td = _replace_meta_data(partial_td, meta_data)
-    partial_td = _replace_bindings(partial_td, bindings)
-
-    replace_type(partial_td)
-
-    partial_td = replace_placeholders(partial_td, placeholder_map)
-
-    _replace_version(partial_td)
-
-    _assert_tm_optional(partial_td, remove_not_required_affordances)
-
-    validate_thing_description(partial_td)
-
-    return partial_td
+    # A template which is only instantiated once does not need to know which parts
+    # of the Thing Model are free of placeholders. The template does not modify the
+    # Thing Model, and copying the Thing Description instead of the Thing Model
+    # also separates it from resolved extensions and the meta data and bindings.
+    template = ThingModelTemplate(
+        thing_model,
+        remove_not_required_affordances=remove_not_required_affordances,
+        validate_input=validate_input,
+        validate_output=validate_output,
+        placeholder_index=False,
+        copy_input=False,
+    )
+    return template.instantiate(
+        placeholder_map=placeholder_map, meta_data=meta_data, bindings=bindings
+    )
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Callable, Dict, Mapping, NamedTuple, Optional, Set
 
 from jsonschema import ValidationError
 
@@ -22,6 +22,28 @@ def initialize_list_field(
     return model[field_name]
 
 
+def clone_json(value):
+    """Creates a deep copy of a JSON value consisting of dicts, lists, and
+    immutable scalars.
+
+    In contrast to `copy.deepcopy`, no memo of already copied objects is kept,
+    which makes copying considerably faster. Objects that are referenced several
+    times within the value are copied once per reference, which is fine for
+    documents that have been parsed from JSON.
+    """
+    if isinstance(value, dict):
+        return {
+            key: clone_json(item) if isinstance(item, (dict, list)) else item
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [
+            clone_json(item) if isinstance(item, (dict, list)) else item
+            for item in value
+        ]
+    return value
+
+
 def ensure_value_is_list(value):
     if isinstance(value, list):
         return value
@@ -54,7 +76,7 @@ def map_field(
         source_value = conversion_function(source_value)
 
     if mapped_fields is not None:
-        mapped_fields.append(source_key)
+        mapped_fields.add(source_key)
 
     target_definition[target_key] = source_value
 
@@ -76,3 +98,49 @@ def map_common_field(
         conversion_function=conversion_function,
         mapped_fields=mapped_fields,
     )
+
+
+class FieldMapping(NamedTuple):
+    """Describes how a field of a source definition is mapped to a target
+    definition by `map_fields`."""
+
+    target_key: str
+    conversion_function: Optional[Callable] = None
+    # Fields that are only mapped to preserve information for a roundtrip are
+    # skipped if roundtripping is suppressed.
+    roundtripping: bool = False
+
+
+FieldMappingTable = Mapping[str, FieldMapping]
+
+
+def common_field_mappings(field_names) -> Dict[str, FieldMapping]:
+    """Creates a table for fields that have the same name in both definitions."""
+    return {field_name: FieldMapping(field_name) for field_name in field_names}
+
+
+def map_fields(
+    source_definition: Dict,
+    target_definition: Dict,
+    field_mappings: FieldMappingTable,
+    mapped_fields: Set[str],
+    suppress_roundtripping=False,
+):
+    """Maps all fields of a source definition that are contained in a field mapping
+    table in a single pass over the source definition.
+
+    Fields with a value of None are skipped, just like with `map_field`.
+    """
+    for source_key, source_value in source_definition.items():
+        field_mapping = field_mappings.get(source_key)
+
+        if field_mapping is None or source_value is None:
+            continue
+        if suppress_roundtripping and field_mapping.roundtripping:
+            continue
+
+        if field_mapping.conversion_function is not None:
+            source_value = field_mapping.conversion_function(source_value)
+
+        mapped_fields.add(source_key)
+        target_definition[field_mapping.target_key] = source_value
@@ -1,24 +1,57 @@
 import os
-from typing import Any, Dict, List, Optional
+import re
+import threading
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 import urllib.parse
-import urllib.request
 import json_merge_patch
 import json
-import copy
-from jsonpointer import resolve_pointer
+from jsonpointer import JsonPointer, resolve_pointer
+from .retrieval import check_document_source, retrieve_json_document
+from .utility import clone_json
 from ..validation import validate_thing_model
+from ..timings import timed_phase
+
+PLACEHOLDER_PATTERN = re.compile(r"{{([^{}]+)}}")
+
+# Matches what is left of a placeholder that does not match PLACEHOLDER_PATTERN,
+# e.g., one with an empty name, nested braces, or without closing braces.
+MALFORMED_PLACEHOLDER_PATTERN = re.compile(r"{{(.*?)(?:}}|$)", re.DOTALL)
+
+
+class UnresolvedPlaceholder(NamedTuple):
+    pointer: str
+    """The JSON pointer of the string or member containing the placeholder."""
+    placeholder: str
 
 
 class PlaceholderException(Exception):
     """Raised when an error occurs during the placeholder replacement process."""
 
-    pass
+    def __init__(self, message: str, unresolved_placeholders=None):
+        super().__init__(message)
+        self.unresolved_placeholders: List[UnresolvedPlaceholder] = (
+            unresolved_placeholders or []
+        )
+
 
+class ThingModelCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    """Thing Models which had to be (re)loaded from their file or URL."""
+    currsize: int
 
-def _retrieve_thing_model_from_url(tm_url: str):
-    with urllib.request.urlopen(tm_url) as url:
-        retrieved_thing_model = json.loads(url.read().decode())
-        return retrieved_thing_model
+
+def _is_url(tm_url: str) -> bool:
+    return urllib.parse.urlparse(tm_url).scheme.startswith("http")
 
 
 def _retrieve_thing_model_from_file_path(file_path: str):
@@ -27,18 +60,125 @@ def _retrieve_thing_model_from_file_path(file_path: str):
         return read_thing_model
 
 
-def retrieve_thing_model(tm_url: str, thing_collection=None):
-    url_scheme = urllib.parse.urlparse(tm_url).scheme
+class ThingModelCache:
+    """Caches the Thing Models referenced via tm:extends, tm:ref, and tm:submodel.
+
+    Thing Models read from files are reloaded once the modification time or the
+    size of the file changes. Thing Models from URLs are taken from the document
+    cache, which revalidates them with the server using their ETag and
+    Last-Modified headers. Every version of a Thing Model is only parsed and
+    validated once. Preloaded Thing Models are used until the cache is cleared.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(tm_url: str) -> str:
+        if _is_url(tm_url):
+            return tm_url
+        return os.path.abspath(tm_url)
+
+    def retrieve(self, tm_url: str, validate=True, shared=False) -> Dict:
+        """Returns a copy of the Thing Model, which may be modified freely. If
+        `shared` is True, the cached Thing Model itself is returned instead, which
+        must not be modified."""
+        key = self.key(tm_url)
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is None or not entry["preloaded"]:
+            entry = self._refresh(key, entry)
+
+        if validate and not entry["validated"]:
+            validate_thing_model(entry["thing_model"])
+            entry["validated"] = True
+
+        if shared:
+            return entry["thing_model"]
+        return clone_json(entry["thing_model"])
+
+    def _refresh(self, key: str, entry: Optional[Dict]) -> Dict:
+        if _is_url(key):
+            # The document cache returns the same object until the document changes.
+            thing_model = retrieve_json_document(key)
+            version: Any = id(thing_model)
+        else:
+            check_document_source(key)
+            stat_result = os.stat(key)
+            version = (stat_result.st_mtime_ns, stat_result.st_size)
+            thing_model = None
+
+        with self._lock:
+            if entry is not None and entry["version"] == version:
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        if thing_model is None:
+            thing_model = _retrieve_thing_model_from_file_path(key)
+
+        entry = self._create_entry(thing_model, version)
+        with self._lock:
+            self._entries[key] = entry
+        return entry
+
+    @staticmethod
+    def _create_entry(thing_model: Dict, version: Any, preloaded=False) -> Dict:
+        return {
+            "thing_model": thing_model,
+            "version": version,
+            "preloaded": preloaded,
+            "validated": False,
+        }
 
-    if url_scheme.startswith("http"):
-        thing_model = _retrieve_thing_model_from_url(tm_url)
-    elif tm_url.startswith("#/") and thing_collection is not None:
+    def preload(self, tm_url: str, thing_model: Dict):
+        entry = self._create_entry(clone_json(thing_model), None, preloaded=True)
+        with self._lock:
+            self._entries[self.key(tm_url)] = entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> ThingModelCacheInfo:
+        with self._lock:
+            return ThingModelCacheInfo(self.hits, self.misses, len(self._entries))
+
+
+_thing_model_cache = ThingModelCache()
+
+
+def preload_thing_model(tm_url: str, thing_model: Dict):
+    """Adds a Thing Model to the cache, so that references to the given file path or
+    URL are resolved without reading the file or contacting the server."""
+    _thing_model_cache.preload(tm_url, thing_model)
+
+
+def thing_model_cache_info() -> ThingModelCacheInfo:
+    return _thing_model_cache.info()
+
+
+def clear_thing_model_cache():
+    _thing_model_cache.clear()
+
+
+@timed_phase("load")
+def retrieve_thing_model(
+    tm_url: str, thing_collection=None, validate=True, shared=False
+):
+    if tm_url.startswith("#/") and thing_collection is not None:
         thing_model = resolve_pointer(thing_collection, tm_url[1:])
-    else:
-        thing_model = _retrieve_thing_model_from_file_path(tm_url)
+        if validate:
+            validate_thing_model(thing_model)
+        return thing_model
 
-    validate_thing_model(thing_model)
-    return thing_model
+    return _thing_model_cache.retrieve(tm_url, validate=validate, shared=shared)
 
 
 def _perform_extension(
@@ -47,26 +187,37 @@ def _perform_extension(
     extension_link_list: List[str],
     resolve_relative_pointers: bool,
     thing_collection=None,
+    validate=True,
 ):
     retrieved_thing_model = retrieve_thing_model(
-        extension_href, thing_collection=thing_collection
+        extension_href, thing_collection=thing_collection, validate=validate
     )
     merged_partial_td = json_merge_patch.merge(retrieved_thing_model, partial_td)
     return resolve_extension(
         merged_partial_td,
         resolve_relative_pointers=resolve_relative_pointers,
         extension_link_list=extension_link_list,
+        validate=validate,
     )
 
 
+@timed_phase("resolve")
 def resolve_extension(
-    partial_td: Dict, resolve_relative_pointers=True, extension_link_list=None
+    partial_td: Dict,
+    resolve_relative_pointers=True,
+    extension_link_list=None,
+    validate=True,
 ):
-    partial_td = _resolve_tm_ref(partial_td, partial_td, resolve_relative_pointers)
+    partial_td = _resolve_tm_ref(
+        partial_td, partial_td, resolve_relative_pointers, validate=validate
+    )
 
     if "links" not in partial_td:
         return partial_td
 
+    # The resolved TM might be the input itself, which must not be modified.
+    partial_td = dict(partial_td)
+
     if extension_link_list is None:
         extension_link_list = []
 
@@ -88,65 +239,240 @@ def resolve_extension(
         assert extension_href not in extension_link_list
         extension_link_list.append(extension_href)
         partial_td = _perform_extension(
-            partial_td, extension_href, extension_link_list, resolve_relative_pointers
+            partial_td,
+            extension_href,
+            extension_link_list,
+            resolve_relative_pointers,
+            validate=validate,
         )
 
     return partial_td
 
 
-def _stringify_boolean(boolean: bool) -> str:
-    if boolean:
-        return "true"
-    else:
-        return "false"
-
-
-def _has_placeholders(serialized_thing_model: str) -> bool:
-    return "{{" in serialized_thing_model
+def _format_embedded_placeholder_value(placeholder_value) -> str:
+    if isinstance(placeholder_value, str):
+        return placeholder_value
 
+    return json.dumps(placeholder_value)
 
-def _format_placeholder_value(placeholer_value) -> str:
-    if isinstance(placeholer_value, bool):
-        return _stringify_boolean(placeholer_value)
 
-    if isinstance(placeholer_value, str):
-        return f'"{placeholer_value}"'
+PlaceholderIndex = Mapping[int, Tuple]
 
-    return str(placeholer_value)
 
+class _PlaceholderReplacer:
+    def __init__(
+        self,
+        placeholders: Dict[str, Any],
+        placeholder_index: Optional[PlaceholderIndex] = None,
+    ):
+        self.placeholders = placeholders
+        self.placeholder_index = placeholder_index or {}
+        self.path: List = []
+        self.unresolved_placeholders: List[UnresolvedPlaceholder] = []
 
-def _format_placeholder_key(placeholder_key: str) -> str:
-    prefix = "{{"
-    suffix = "}}"
-    return f'"{prefix}{placeholder_key}{suffix}"'
+    def replace_in_value(self, value):
+        if isinstance(value, str):
+            return self.replace_in_string(value)
+        if isinstance(value, dict):
+            return self.replace_in_object(value)
+        if isinstance(value, list):
+            return self.replace_in_array(value)
+        return value
+
+    def replace_in_string(self, string: str, member_name=False):
+        if "{{" not in string:
+            return string
+
+        match = PLACEHOLDER_PATTERN.fullmatch(string)
+        if (
+            match is not None
+            and not member_name
+            and match.group(1) in self.placeholders
+        ):
+            # The value replaces the whole string and keeps its JSON type.
+            value = self.placeholders[match.group(1)]
+            return clone_json(value)
+
+        result = PLACEHOLDER_PATTERN.sub(self._replace_match, string)
+        self._check_malformed_placeholders(string)
+        return result
+
+    def _replace_match(self, match) -> str:
+        placeholder = match.group(1)
+        if placeholder not in self.placeholders:
+            self._add_unresolved_placeholder(placeholder)
+            return match.group(0)
+        return _format_embedded_placeholder_value(self.placeholders[placeholder])
+
+    def _check_malformed_placeholders(self, string: str):
+        """Reports the parts of the string that start like a placeholder but are
+        not valid placeholders, which therefore cannot be replaced."""
+        remainder = PLACEHOLDER_PATTERN.sub("", string)
+        if "{{" not in remainder:
+            return
+
+        for placeholder in MALFORMED_PLACEHOLDER_PATTERN.findall(remainder):
+            self._add_unresolved_placeholder(placeholder)
+
+    def _add_unresolved_placeholder(self, placeholder: str):
+        pointer = JsonPointer.from_parts(self.path).path
+        self.unresolved_placeholders.append(UnresolvedPlaceholder(pointer, placeholder))
+
+    def replace_in_object(self, json_object: Dict):
+        keys = self.placeholder_index.get(id(json_object))
+        if keys is None:
+            keys = tuple(json_object)
+
+        replaced_members = {}
+        for key in keys:
+            value = json_object[key]
+            self.path.append(key)
+            new_key = self.replace_in_string(key, member_name=True)
+            new_value = self.replace_in_value(value)
+            self.path.pop()
+
+            if new_key is not key or new_value is not value:
+                replaced_members[key] = (new_key, new_value)
+
+        if len(replaced_members) == 0:
+            return json_object
+
+        # Rebuild the object to retain the order of its members.
+        result = dict(
+            replaced_members.get(key, (key, value))
+            for key, value in json_object.items()
+        )
+        if len(result) < len(json_object):
+            self._raise_member_name_collision(json_object, replaced_members)
+        return result
+
+    def _raise_member_name_collision(self, json_object: Dict, replaced_members):
+        keys: Dict[str, str] = {}
+        for key in json_object:
+            new_key = replaced_members.get(key, (key,))[0]
+            if new_key in keys:
+                pointer = JsonPointer.from_parts(self.path).path
+                raise PlaceholderException(
+                    f'Replacing the placeholders in the member names "{keys[new_key]}" '
+                    f'and "{key}" at "{pointer}" results in the same member name '
+                    f'"{new_key}".'
+                )
+            keys[new_key] = key
+
+    def replace_in_array(self, json_array: List):
+        indices = self.placeholder_index.get(id(json_array))
+        if indices is None:
+            indices = range(len(json_array))
+
+        result = None
+        for index in indices:
+            value = json_array[index]
+            self.path.append(index)
+            new_value = self.replace_in_value(value)
+            self.path.pop()
+
+            if new_value is not value:
+                if result is None:
+                    result = list(json_array)
+                result[index] = new_value
+
+        return json_array if result is None else result
+
+
+def index_placeholders(document) -> Dict[int, Tuple]:
+    """Determines where the placeholders within a document are located.
+
+    Returns a dictionary which maps the id of every object and array within the
+    document to the member names or indices of its values that (directly or
+    within nested values) contain a placeholder. replace_placeholders() only
+    visits these values, which requires the indexed containers to stay alive and
+    unchanged.
+    """
+    placeholder_index: Dict[int, Tuple] = {}
+    _index_placeholders(document, placeholder_index)
+    return placeholder_index
 
 
-def _replace_placeholder(
-    serialized_thing_model: str, placeholder: str, value: Any
-) -> str:
-    value = _format_placeholder_value(value)
-    placeholder = _format_placeholder_key(placeholder)
+def _index_placeholders(value, placeholder_index: Dict[int, Tuple]) -> bool:
+    if isinstance(value, str):
+        return "{{" in value
 
-    return serialized_thing_model.replace(placeholder, value)
+    if isinstance(value, dict):
+        members: Iterable = value.items()
+    elif isinstance(value, list):
+        members = enumerate(value)
+    else:
+        return False
+
+    # All members are indexed so that nested containers are recorded as well.
+    keys = tuple(
+        [
+            key
+            for key, member in members
+            if _index_placeholders(member, placeholder_index)
+            or (isinstance(key, str) and "{{" in key)
+        ]
+    )
+    placeholder_index[id(value)] = keys
+    return len(keys) > 0
 
 
-def replace_placeholders(thing_model: dict, placeholders: Optional[Dict[str, Any]]):
+def replace_placeholders(
+    thing_model: dict,
+    placeholders: Optional[Dict[str, Any]],
+    placeholder_index: Optional[PlaceholderIndex] = None,
+):
+    """Replaces the placeholders (e.g., "{{PLACEHOLDER}}") within a Thing Model in
+    a single traversal.
+
+    A string consisting of a single placeholder is replaced by the value from the
+    placeholder map, which keeps its JSON type. Placeholders embedded in longer
+    strings or in member names are replaced by the string representation of their
+    value. Only the strings containing placeholders and their ancestors are
+    copied, all other values are shared with the input. Within the containers
+    recorded in `placeholder_index` (see index_placeholders()), only the indexed
+    values are visited.
+
+    Raises a PlaceholderException listing every placeholder that is missing from
+    the map, together with the JSON pointer of its location.
+    """
     if placeholders is None:
         return thing_model
 
-    serialized_thing_model = json.dumps(thing_model)
+    replacer = _PlaceholderReplacer(placeholders, placeholder_index)
+    result = replacer.replace_in_value(thing_model)
 
-    for placeholder, value in placeholders.items():
-        serialized_thing_model = _replace_placeholder(
-            serialized_thing_model,
-            placeholder,
-            value,
+    unresolved_placeholders = replacer.unresolved_placeholders
+    if len(unresolved_placeholders) > 0:
+        locations = ", ".join(
+            "{{" + placeholder + "}} at " + pointer
+            for pointer, placeholder in unresolved_placeholders
+        )
+        raise PlaceholderException(
+            f"Not all placeholders have been replaced: {locations}",
+            unresolved_placeholders,
         )
 
-    if _has_placeholders(serialized_thing_model):
-        raise PlaceholderException("Not all placeholders have been replaced!")
+    return result
 
-    return json.loads(serialized_thing_model)
+
+def apply_merge_patch(target, patch):
+    """Applies a JSON Merge Patch (RFC 7396) like json_merge_patch.merge(), but
+    without modifying the target. Only the objects along the patched paths are
+    copied, all other values are shared with the target and the patch."""
+    if not isinstance(patch, dict):
+        return patch
+
+    result = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        elif isinstance(value, dict):
+            result[key] = apply_merge_patch(result.get(key), value)
+        else:
+            result[key] = value
+
+    return result
 
 
 def _resolve_tm_ref(
@@ -155,8 +481,16 @@ def _resolve_tm_ref(
     resolve_relative_pointers,
     pointer_list=None,
     thing_collection=None,
+    validate=True,
 ):
-    result = copy.deepcopy(current_definition)
+    """Resolves all tm:refs within the current definition.
+
+    Neither the current definition nor the referenced definitions are modified:
+    Only the definitions containing a tm:ref and their ancestors are copied, all
+    other values are shared with the input. The current definition itself is
+    returned if it does not contain any tm:ref.
+    """
+    result = current_definition
 
     if pointer_list is None:
         pointer_list = []
@@ -170,15 +504,17 @@ def _resolve_tm_ref(
         original = None
         if root:
             retrieved_thing_model = retrieve_thing_model(
-                root, thing_collection=thing_collection
+                root, thing_collection=thing_collection, validate=validate, shared=True
             )
-            original = resolve_pointer(retrieved_thing_model, pointer)
+            # The retrieved model is shared with the cache, so only the referenced
+            # definition is copied into the result.
+            original = clone_json(resolve_pointer(retrieved_thing_model, pointer))
         elif resolve_relative_pointers:
             original = resolve_pointer(partial_td, pointer)
 
         if original:
-            del result["tm:ref"]
-            result = json_merge_patch.merge(original, result)
+            patch = {key: value for key, value in result.items() if key != "tm:ref"}
+            result = apply_merge_patch(original, patch)
 
             if "tm:ref" in result:
                 if root:
@@ -187,6 +523,7 @@ def _resolve_tm_ref(
                         result,
                         resolve_relative_pointers,
                         pointer_list=pointer_list,
+                        validate=validate,
                     )
                 else:
                     result = _resolve_tm_ref(
@@ -194,13 +531,29 @@ def _resolve_tm_ref(
                         result,
                         True,
                         pointer_list=pointer_list,
+                        validate=validate,
                     )
 
-    for key, value in result.items():
+    return _resolve_nested_tm_refs(
+        partial_td, result, resolve_relative_pointers, validate=validate
+    )
+
+
+def _resolve_nested_tm_refs(
+    partial_td, definition: Dict, resolve_relative_pointers, validate=True
+):
+    resolved_values = {}
+    for key, value in definition.items():
         if isinstance(value, dict):
-            result[key] = _resolve_tm_ref(partial_td, value, resolve_relative_pointers)
+            resolved_value = _resolve_tm_ref(
+                partial_td, value, resolve_relative_pointers, validate=validate
+            )
+            if resolved_value is not value:
+                resolved_values[key] = resolved_value
 
-    return result
+    if not resolved_values:
+        return definition
+    return {**definition, **resolved_values}
 
 
 def is_thing_collection(thing_collection: Optional[Dict]) -> bool:
@@ -213,17 +566,22 @@ def is_thing_collection(thing_collection: Optional[Dict]) -> bool:
     return thing_collection is not None and "@context" not in thing_collection
 
 
+@timed_phase("resolve")
 def resolve_sub_things(
-    thing_model: Dict, thing_collection=None, placeholder_map=None, replace_href=False
+    thing_model: Dict,
+    thing_collection=None,
+    placeholder_map=None,
+    replace_href=False,
+    validate=True,
 ):
     sub_models: Dict = {}
 
     for link in thing_model.get("links", []):
         if link.get("rel") == "tm:submodel":
             sub_model = retrieve_thing_model(
-                link["href"], thing_collection=thing_collection
+                link["href"], thing_collection=thing_collection, validate=validate
             )
-            replace_placeholders(sub_model, placeholder_map)
+            sub_model = replace_placeholders(sub_model, placeholder_map)
             key = _get_submodel_key_from_link(link)
             sub_models[key] = sub_model
             if replace_href:
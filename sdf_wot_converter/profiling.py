@@ -0,0 +1,174 @@
+"""Profiling of conversions with cProfile.
+
+A profile is written to two files sharing a common prefix:
+
+- `<prefix>.pstats`, which can be read with `pstats` or tools like snakeviz, and
+- `<prefix>.collapsed`, which contains one line per call stack with the time
+  spent in its innermost function (in microseconds), in the format read by
+  flamegraph.pl, inferno, and speedscope.
+
+cProfile only records callers and callees, not complete call stacks. The time of
+a function is therefore distributed over its call stacks in proportion to the
+time its callers spent calling it.
+
+Profiling is opt-in: the `profiled` decorator returns the undecorated function
+unless an output prefix is given or set in the environment variable
+SDF_WOT_CONVERTER_PROFILE, so that it costs nothing when it is off.
+"""
+
+import contextlib
+import cProfile
+import functools
+import os
+import pstats
+import sys
+import threading
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+PROFILE_ENVIRONMENT_VARIABLE = "SDF_WOT_CONVERTER_PROFILE"
+
+PSTATS_SUFFIX = ".pstats"
+COLLAPSED_SUFFIX = ".collapsed"
+
+# Call stacks with less time than this (in seconds) are left out of the
+# collapsed stacks.
+MINIMUM_STACK_TIME = 1e-6
+
+FunctionKey = Tuple[str, int, str]
+
+_state = threading.local()
+
+
+def _shorten_file_name(file_name: str) -> str:
+    """Removes the longest entry of sys.path the file name starts with."""
+    prefixes = [
+        os.path.join(path, "") for path in sys.path if path and os.path.isabs(path)
+    ]
+    matching_prefixes = [prefix for prefix in prefixes if file_name.startswith(prefix)]
+    if len(matching_prefixes) == 0:
+        return file_name
+    prefix_length = max(len(prefix) for prefix in matching_prefixes)
+    return file_name[prefix_length:]
+
+
+def _frame_label(function: FunctionKey) -> str:
+    file_name, line_number, function_name = function
+    if file_name == "~":
+        label = function_name
+    else:
+        label = f"{function_name} ({_shorten_file_name(file_name)}:{line_number})"
+    return label.replace(";", ",")
+
+
+def _callees(stats: Dict) -> Dict[FunctionKey, Dict[FunctionKey, float]]:
+    """Maps every function to the cumulative time spent in each of its callees
+    when called by it."""
+    callees: Dict[FunctionKey, Dict[FunctionKey, float]] = {}
+    for function, (_, _, _, _, callers) in stats.items():
+        for caller, caller_stats in callers.items():
+            callees.setdefault(caller, {})[function] = caller_stats[3]
+    return callees
+
+
+def collapsed_stacks(stats: Dict) -> Dict[str, int]:
+    """Converts the statistics of a `pstats.Stats` object to the time (in
+    microseconds) spent in the innermost function of every call stack."""
+    callees = _callees(stats)
+    stacks: Dict[str, int] = {}
+
+    def visit(function: FunctionKey, stack: List[str], on_stack: Set, share: float):
+        _, _, own_time, cumulative_time, _ = stats[function]
+        stack = [*stack, _frame_label(function)]
+        microseconds = round(own_time * share * 1e6)
+        if microseconds > 0:
+            key = ";".join(stack)
+            stacks[key] = stacks.get(key, 0) + microseconds
+
+        on_stack = on_stack | {function}
+        for callee, time_in_callee in callees.get(function, {}).items():
+            callee_cumulative_time = stats[callee][3]
+            if callee in on_stack or callee_cumulative_time <= 0:
+                continue
+            callee_share = share * time_in_callee / callee_cumulative_time
+            if callee_share * callee_cumulative_time < MINIMUM_STACK_TIME:
+                continue
+            visit(callee, stack, on_stack, min(callee_share, 1.0))
+
+    for function, (_, _, _, _, callers) in stats.items():
+        if len(callers) == 0:
+            visit(function, [], set(), 1.0)
+
+    return stacks
+
+
+def write_profile(profiler: cProfile.Profile, output_prefix: str):
+    """Writes the pstats and collapsed stack files of a profile."""
+    directory = os.path.dirname(output_prefix)
+    if directory != "":
+        os.makedirs(directory, exist_ok=True)
+
+    profiler.dump_stats(output_prefix + PSTATS_SUFFIX)
+
+    stacks = collapsed_stacks(pstats.Stats(profiler).stats)
+    with open(output_prefix + COLLAPSED_SUFFIX, "w") as collapsed_file:
+        for stack, microseconds in sorted(stacks.items()):
+            collapsed_file.write(f"{stack} {microseconds}\n")
+
+
+def _is_profiling() -> bool:
+    return getattr(_state, "profiling", False)
+
+
+@contextlib.contextmanager
+def profile(output_prefix: str) -> Iterator[Optional[cProfile.Profile]]:
+    """Profiles the block and writes the results with the given prefix.
+
+    Blocks within an already profiled block of the same thread are not profiled
+    on their own, since only one profiler can be active at a time."""
+    if _is_profiling():
+        yield None
+        return
+
+    profiler = cProfile.Profile()
+    _state.profiling = True
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        _state.profiling = False
+        write_profile(profiler, output_prefix)
+
+
+def profiled(output_prefix: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """Decorator profiling every call of the function. The profile accumulates
+    over all calls and is written after each of them.
+
+    Without an output prefix, the prefix is read from the environment variable
+    SDF_WOT_CONVERTER_PROFILE when the function is decorated. If neither is set,
+    the function is returned as it is."""
+
+    def decorator(function: Callable) -> Callable:
+        prefix = output_prefix or os.environ.get(PROFILE_ENVIRONMENT_VARIABLE)
+        if not prefix:
+            return function
+
+        profiler = cProfile.Profile()
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if _is_profiling():
+                return function(*args, **kwargs)
+
+            _state.profiling = True
+            profiler.enable()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                profiler.disable()
+                _state.profiling = False
+                write_profile(profiler, prefix)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,150 @@
+"""Measurement of the time spent in the phases of a conversion.
+
+The converters mark the code belonging to each phase (loading documents,
+validation, resolving references and extensions, mapping, and serialization).
+Within a `record_timings()` block, the wall time and the number of calls of every
+phase are recorded:
+
+    with record_timings() as timings:
+        convert_sdf_to_wot_tm(sdf_model)
+    print(timings.format_table())
+
+Phases can be nested, e.g., Thing Models retrieved during the resolution of an
+extension are validated. The time of a nested phase is only attributed to the
+innermost phase, so that the times of all phases add up to the time spent in the
+block. Outside of a `record_timings()` block, marking a phase costs a single
+lookup of a context variable.
+"""
+
+import contextlib
+import contextvars
+import functools
+import time
+from typing import Callable, Dict, Iterator, List, Optional, TypeVar
+
+PHASES = ("load", "validation", "resolve", "mapping", "serialization")
+
+# Time within a `record_timings()` block that does not belong to any phase.
+OTHER_PHASE = "other"
+
+Function = TypeVar("Function", bound=Callable)
+
+
+class PhaseTimings:
+    """Wall time and number of calls of every phase."""
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = {phase: 0.0 for phase in PHASES}
+        self.calls: Dict[str, int] = {phase: 0 for phase in PHASES}
+        self.total_seconds = 0.0
+        self._stack: List[str] = []
+        self._last_change = 0.0
+
+    def _charge(self, now: float):
+        if len(self._stack) > 0:
+            phase = self._stack[-1]
+            self.seconds[phase] = self.seconds.get(phase, 0.0) + now - self._last_change
+        self._last_change = now
+
+    def enter(self, phase: str):
+        self._charge(time.perf_counter())
+        self._stack.append(phase)
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+
+    def exit(self):
+        self._charge(time.perf_counter())
+        self._stack.pop()
+
+    def as_dict(self) -> Dict[str, Dict[str, float]]:
+        """Returns the seconds and calls of every phase, including the time that
+        was not spent in any phase as "other"."""
+        result: Dict[str, Dict[str, float]] = {
+            phase: {"seconds": seconds, "calls": self.calls[phase]}
+            for phase, seconds in self.seconds.items()
+        }
+        result[OTHER_PHASE] = {
+            "seconds": max(0.0, self.total_seconds - sum(self.seconds.values())),
+            "calls": 0,
+        }
+        return result
+
+    def format_table(self) -> str:
+        lines = [f"{'Phase':<15}{'Calls':>10}{'Seconds':>12}{'Share':>9}"]
+        for phase, timing in self.as_dict().items():
+            share = timing["seconds"] / self.total_seconds if self.total_seconds else 0
+            lines.append(
+                f"{phase:<15}{timing['calls']:>10}{timing['seconds']:>12.4f}"
+                f"{share:>9.1%}"
+            )
+        lines.append(f"{'total':<15}{'':>10}{self.total_seconds:>12.4f}")
+        return "\n".join(lines)
+
+
+_active_timings: "contextvars.ContextVar[Optional[PhaseTimings]]" = (
+    contextvars.ContextVar("active_timings", default=None)
+)
+
+
+@contextlib.contextmanager
+def record_timings() -> Iterator[PhaseTimings]:
+    """Records the phases of all conversions performed by the current thread
+    within the block."""
+    timings = PhaseTimings()
+    token = _active_timings.set(timings)
+    start = time.perf_counter()
+    try:
+        yield timings
+    finally:
+        timings.total_seconds = time.perf_counter() - start
+        _active_timings.reset(token)
+
+
+class _Phase:
+    def __init__(self, timings: PhaseTimings, phase: str):
+        self._timings = timings
+        self._phase = phase
+
+    def __enter__(self):
+        self._timings.enter(self._phase)
+
+    def __exit__(self, *exc_info):
+        self._timings.exit()
+
+
+_NO_PHASE = contextlib.nullcontext()
+
+
+def phase(name: str):
+    """Returns a context manager marking the code within as part of a phase."""
+    timings = _active_timings.get()
+    if timings is None:
+        return _NO_PHASE
+    return _Phase(timings, name)
+
+
+def timed_phase(name: str) -> Callable[[Function], Function]:
+    """Decorator marking every call of the function as part of a phase."""
+
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            timings = _active_timings.get()
+            if timings is None:
+                return function(*args, **kwargs)
+
+            timings.enter(name)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                timings.exit()
+
+        # cProfile identifies functions by their code objects, which would merge
+        # the wrappers of all decorated functions into a single node.
+        if hasattr(wrapper.__code__, "replace"):
+            wrapper.__code__ = wrapper.__code__.replace(
+                co_name=f"timed_phase({function.__qualname__})"
+            )
+
+        return wrapper
+
+    return decorator
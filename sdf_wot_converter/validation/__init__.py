@@ -1,30 +1,203 @@
-from typing import Dict
+from functools import lru_cache
+import importlib
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
 from jsonschema import Draft7Validator
-from .sdf_validation_schema import sdf_validation_schema
-from .td_schema import td_schema
-from .tm_schema import tm_schema
-from .sdf_framework_schema import sdf_framework_schema
 
+from ..timings import timed_phase
 
-sdf_framework_validator = Draft7Validator(sdf_framework_schema)
+if TYPE_CHECKING:  # pragma: no cover
+    from .cache import CacheInfo, ValidationCache
 
-sdf_validator = Draft7Validator(sdf_validation_schema)
+VALIDATION_LEVELS = ("full", "inputs", "outputs", "none")
 
-tm_validator = Draft7Validator(tm_schema)
+# Maps the name of each validator to the module and attribute holding its schema.
+# The schema modules consist of several thousand lines of dictionary literals,
+# which is why they are only imported once a validator is actually needed.
+_SCHEMAS = {
+    "sdf_framework_validator": ("sdf_framework_schema", "sdf_framework_schema"),
+    "sdf_validator": ("sdf_validation_schema", "sdf_validation_schema"),
+    "tm_validator": ("tm_schema", "tm_schema"),
+    "td_validator": ("td_schema", "td_schema"),
+}
 
-td_validator = Draft7Validator(td_schema)
+
+def load_schema(validator_name: str) -> Dict:
+    """Imports and returns the JSON schema used by the given validator."""
+    module_name, attribute_name = _SCHEMAS[validator_name]
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    return getattr(module, attribute_name)
+
+
+@lru_cache(maxsize=None)
+def get_validator(validator_name: str) -> Draft7Validator:
+    """Returns the validator with the given name, constructing it on first use."""
+    return Draft7Validator(load_schema(validator_name))
+
+
+@lru_cache(maxsize=None)
+def get_fast_validator(validator_name: str) -> Optional[Callable[[Any], bool]]:
+    """Returns a function generated by the schema compiler that determines if a
+    document is valid, or None if the schema could not be compiled.
+
+    The generated modules are part of the package. Should one of them be missing,
+    the schema is compiled in memory instead.
+    """
+    from .compiler import compiled_module_name
+
+    schema_module_name, _ = _SCHEMAS[validator_name]
+    module_name = compiled_module_name(schema_module_name)
+    try:
+        module = importlib.import_module(f"{__name__}.{module_name}")
+        return module.is_valid
+    except ImportError:
+        pass
+
+    from .compiler import SchemaCompilationError, compile_validator
+
+    try:
+        return compile_validator(get_validator(validator_name), validator_name)
+    except SchemaCompilationError:
+        return None
+
+
+def preload_validators():
+    """Constructs all validators in advance, so that the first conversions of a
+    long-running process do not have to wait for them."""
+    for validator_name in _SCHEMAS:
+        get_fast_validator(validator_name)
+        get_validator(validator_name)
+
+
+# The cache is disabled by default, since computing the digest of a document
+# only pays off for documents that are validated repeatedly.
+_validation_cache: "Optional[ValidationCache]" = None
+
+
+def _get_validation_cache() -> "ValidationCache":
+    global _validation_cache
+    if _validation_cache is None:
+        from .cache import ValidationCache
+
+        _validation_cache = ValidationCache(maxsize=0)
+    return _validation_cache
+
+
+def set_validation_cache_size(maxsize: int):
+    """Sets the number of validated documents that are remembered. A size of 0
+    disables the cache."""
+    _get_validation_cache().resize(maxsize)
+
+
+def enable_validation_cache():
+    """Enables the cache with its default size, unless it is already enabled.
+    Used by the commands that validate recurring documents, e.g., batch and
+    serve."""
+    from .cache import DEFAULT_MAXSIZE
+
+    cache = _get_validation_cache()
+    if not cache.enabled:
+        cache.resize(DEFAULT_MAXSIZE)
+
+
+def validation_cache_info() -> "CacheInfo":
+    """Returns the hits, misses, maximum and current size of the cache."""
+    return _get_validation_cache().info()
+
+
+def clear_validation_cache():
+    if _validation_cache is not None:
+        _validation_cache.clear()
+
+
+def _validate_uncached(validator_name: str, document: Dict):
+    is_valid = get_fast_validator(validator_name)
+    if is_valid is not None and is_valid(document):
+        return
+
+    get_validator(validator_name).validate(document)
+
+
+@timed_phase("validation")
+def validate(validator_name: str, document: Dict):
+    """Validates a document using the compiled validator for the given schema.
+
+    Only if the compiled validator rejects the document, jsonschema is used to
+    validate it again, so that the raised ValidationError is identical to the
+    one of a plain jsonschema validation.
+
+    If the validation cache is enabled, documents that have passed validation
+    are remembered and are not validated again. Invalid documents are never
+    cached.
+    """
+    cache = _validation_cache
+    key = None
+    if cache is not None and cache.enabled:
+        key = cache.key(validator_name, document)
+
+    if key is None:
+        _validate_uncached(validator_name, document)
+        return
+
+    if cache.lookup(key):
+        return
+
+    _validate_uncached(validator_name, document)
+    cache.add(key)
+
+
+class ValidationLevelError(ValueError):
+    """Raised when an unknown validation level is passed to a converter."""
+
+    pass
+
+
+def check_validation_level(validation: str):
+    if validation not in VALIDATION_LEVELS:
+        raise ValidationLevelError(
+            f'Unknown validation level "{validation}". '
+            f"Valid levels are: {', '.join(VALIDATION_LEVELS)}."
+        )
+
+
+def validates_inputs(validation: str) -> bool:
+    """Determines if the documents passed to a converter should be validated."""
+    check_validation_level(validation)
+    return validation in ("full", "inputs")
+
+
+def validates_outputs(validation: str) -> bool:
+    """Determines if the documents returned by a converter should be validated."""
+    check_validation_level(validation)
+    return validation in ("full", "outputs")
+
+
+def validates_intermediates(validation: str) -> bool:
+    """Determines if documents which are only created in the middle of a
+    conversion chain (e.g., the TM during a TD to SDF conversion) should be
+    validated."""
+    check_validation_level(validation)
+    return validation == "full"
+
+
+def __getattr__(name: str):
+    # Keeps the module-level validator attributes of previous versions available
+    # without constructing them at import time.
+    if name in _SCHEMAS:
+        return get_validator(name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def validate_sdf_model(sdf_model: Dict, framework=False):
     if framework:
-        sdf_framework_validator.validate(sdf_model)
+        validate("sdf_framework_validator", sdf_model)
     else:
-        sdf_validator.validate(sdf_model)
+        validate("sdf_validator", sdf_model)
 
 
 def validate_thing_model(thing_model: Dict):
-    tm_validator.validate(thing_model)
+    validate("tm_validator", thing_model)
 
 
 def validate_thing_description(thing_description: Dict):
-    td_validator.validate(thing_description)
+    validate("td_validator", thing_description)
@@ -0,0 +1,133 @@
+"""Least-recently-used cache for documents which have passed validation.
+
+Documents are identified by the SHA-256 digest of their canonical JSON
+serialization (sorted keys, no insignificant whitespace) together with the name
+of the validator, so that equal documents share an entry regardless of their
+key order or object identity, while any modification results in a new key.
+"""
+
+from collections import OrderedDict
+import hashlib
+import json
+import math
+import threading
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+DEFAULT_MAXSIZE = 1024
+
+CacheKey = Tuple[str, bytes]
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+def _contains_non_finite_number(value: Any) -> bool:
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_contains_non_finite_number(item) for item in value.values())
+    if isinstance(value, list):
+        return any(_contains_non_finite_number(item) for item in value)
+    return False
+
+
+def document_digest(document: Dict) -> Optional[bytes]:
+    """Returns the digest of the canonical JSON serialization of a document, or
+    None if the document cannot be serialized.
+
+    If available, orjson is used for the serialization, which is several times
+    faster than the json module. The digests only need to be consistent within
+    one process, so slight differences between both serializations do not matter.
+    """
+    if orjson is not None:
+        try:
+            serialized = orjson.dumps(document, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            # Raised for integers exceeding 64 bits, for example
+            serialized = None
+        # orjson serializes NaN and infinite numbers as null, which would make
+        # these documents indistinguishable from documents containing null.
+        # Only documents that might contain such numbers are searched for them.
+        if serialized is not None and (
+            b"null" not in serialized or not _contains_non_finite_number(document)
+        ):
+            return hashlib.sha256(serialized).digest()
+
+    try:
+        serialized = json.dumps(
+            document, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(serialized.encode("utf-8")).digest()
+
+
+class ValidationCache:
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        self._entries: "OrderedDict[CacheKey, None]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._maxsize = 0
+        self.hits = 0
+        self.misses = 0
+        self.resize(maxsize)
+
+    @property
+    def enabled(self) -> bool:
+        return self._maxsize > 0
+
+    def key(self, validator_name: str, document: Dict) -> Optional[CacheKey]:
+        """Returns the cache key of a document, or None if the cache is disabled
+        or the document is not JSON serializable."""
+        if not self.enabled:
+            return None
+        digest = document_digest(document)
+        if digest is None:
+            return None
+        return validator_name, digest
+
+    def lookup(self, key: CacheKey) -> bool:
+        """Determines if the document with the given key has passed validation
+        before and updates the hit/miss statistics accordingly."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True
+            self.misses += 1
+            return False
+
+    def add(self, key: CacheKey):
+        with self._lock:
+            self._entries[key] = None
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def resize(self, maxsize: int):
+        if maxsize < 0:
+            raise ValueError("The cache size must not be negative")
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self._maxsize, len(self._entries))
+
+    def _evict(self):
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
@@ -0,0 +1,2212 @@
+# Generated from sdf_framework_schema.py by the schema compiler in
+# sdf_wot_converter/validation/compiler.py. Do not edit this file manually;
+# run `python -m sdf_wot_converter.validation.compiler` instead.
+import re
+
+from .compiler import _equal, _in_enum, _multiple_of, _unique
+
+_MISSING = object()
+_c0 = frozenset([])
+_c1 = frozenset(['boolean', 'integer', 'number', 'string'])
+_c2 = frozenset(['array', 'boolean', 'integer', 'number', 'string'])
+
+
+def _v0(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('sdfProperty', _MISSING)
+    if x is not _MISSING and not (_v1(x)):
+        return False
+    x = i.get('sdfAction', _MISSING)
+    if x is not _MISSING and not (_v2(x)):
+        return False
+    x = i.get('sdfEvent', _MISSING)
+    if x is not _MISSING and not (_v3(x)):
+        return False
+    x = i.get('sdfData', _MISSING)
+    if x is not _MISSING and not (_v4(x)):
+        return False
+    x = i.get('info', _MISSING)
+    if x is not _MISSING and not (_v5(x)):
+        return False
+    x = i.get('namespace', _MISSING)
+    if x is not _MISSING and not (_v6(x)):
+        return False
+    x = i.get('defaultNamespace', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfThing', _MISSING)
+    if x is not _MISSING and not (_v7(x)):
+        return False
+    x = i.get('sdfObject', _MISSING)
+    if x is not _MISSING and not (_v8(x)):
+        return False
+    return True
+
+def _v8(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v9(x)):
+            return False
+    return True
+
+def _v9(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('minItems', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxItems', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('sdfProperty', _MISSING)
+    if x is not _MISSING and not (_v11(x)):
+        return False
+    x = i.get('sdfAction', _MISSING)
+    if x is not _MISSING and not (_v12(x)):
+        return False
+    x = i.get('sdfEvent', _MISSING)
+    if x is not _MISSING and not (_v13(x)):
+        return False
+    x = i.get('sdfData', _MISSING)
+    if x is not _MISSING and not (_v14(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('label', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRequired', _MISSING)
+    if x is not _MISSING and not (_v15(x)):
+        return False
+    return True
+
+def _v15(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v14(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v16(i):
+    if not (_v17(i) or _v18(i) or _v19(i)): return False
+    return True
+
+def _v19(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v20(x)):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v21(x)):
+        return False
+    x = i.get('const', _MISSING)
+    if x is not _MISSING and not (_v22(x)):
+        return False
+    x = i.get('default', _MISSING)
+    if x is not _MISSING and not (_v22(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('exclusiveMinimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('exclusiveMaximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('multipleOf', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('pattern', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not (_v23(x)):
+        return False
+    x = i.get('minItems', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxItems', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('uniqueItems', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('items', _MISSING)
+    if x is not _MISSING and not (_v24(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('label', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRequired', _MISSING)
+    if x is not _MISSING and not (_v15(x)):
+        return False
+    x = i.get('units', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('unit', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('scaleMinimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('scaleMaximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('nullable', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('subtype', _MISSING)
+    if x is not _MISSING and not (_v25(x)):
+        return False
+    x = i.get('sdfType', _MISSING)
+    if x is not _MISSING and not (_v26(x)):
+        return False
+    x = i.get('contentFormat', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    return True
+
+def _v26(i):
+    if not ((isinstance(i, str)) and i == 'byte-string' or (isinstance(i, str)) and i == 'unix-time' or (isinstance(i, str))): return False
+    return True
+
+def _v25(i):
+    if not ((isinstance(i, str)) and i == 'byte-string' or (isinstance(i, str)) and i == 'unix-time' or (isinstance(i, str))): return False
+    return True
+
+def _v24(i):
+    if not (_v27(i) or _v28(i) or _v29(i)): return False
+    return True
+
+def _v29(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v30(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v31(x)):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    return True
+
+def _v31(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    return True
+
+def _v30(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v28(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and x == 'object'):
+        return False
+    x = i.get('required', _MISSING)
+    if x is not _MISSING and not (_v32(x)):
+        return False
+    x = i.get('properties', _MISSING)
+    if x is not _MISSING and not (_v33(x)):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v34(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v35(x)):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    return True
+
+def _v35(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    return True
+
+def _v34(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v33(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v32(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v27(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c1)):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v36(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v37(x)):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    return True
+
+def _v37(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    return True
+
+def _v36(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v23(i):
+    if not ((isinstance(i, str)) and i == 'date-time' or (isinstance(i, str)) and i == 'date' or (isinstance(i, str)) and i == 'time' or (isinstance(i, str)) and i == 'uri' or (isinstance(i, str)) and i == 'uri-reference' or (isinstance(i, str)) and i == 'uuid' or (isinstance(i, str))): return False
+    return True
+
+def _v22(i):
+    if not (((isinstance(i, (int, float)) and not isinstance(i, bool))) or (isinstance(i, str)) or (isinstance(i, bool)) or (i is None) or _v38(i) or _v39(i) or _v40(i) or _v41(i) or True): return False
+    return True
+
+def _v41(i):
+    if not (isinstance(i, dict)): return False
+    return True
+
+def _v40(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not ((isinstance(x, bool))): return False
+    return True
+
+def _v39(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v38(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not (((isinstance(x, (int, float)) and not isinstance(x, bool)))): return False
+    return True
+
+def _v21(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not (_v22(x)): return False
+    return True
+
+def _v20(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v18(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and x == 'object'):
+        return False
+    x = i.get('required', _MISSING)
+    if x is not _MISSING and not (_v42(x)):
+        return False
+    x = i.get('properties', _MISSING)
+    if x is not _MISSING and not (_v43(x)):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v44(x)):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v45(x)):
+        return False
+    x = i.get('const', _MISSING)
+    if x is not _MISSING and not (_v22(x)):
+        return False
+    x = i.get('default', _MISSING)
+    if x is not _MISSING and not (_v22(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('exclusiveMinimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('exclusiveMaximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('multipleOf', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('pattern', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not (_v46(x)):
+        return False
+    x = i.get('minItems', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxItems', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('uniqueItems', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('items', _MISSING)
+    if x is not _MISSING and not (_v47(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('label', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRequired', _MISSING)
+    if x is not _MISSING and not (_v15(x)):
+        return False
+    x = i.get('units', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('unit', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('scaleMinimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('scaleMaximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('nullable', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('subtype', _MISSING)
+    if x is not _MISSING and not (_v48(x)):
+        return False
+    x = i.get('sdfType', _MISSING)
+    if x is not _MISSING and not (_v49(x)):
+        return False
+    x = i.get('contentFormat', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    return True
+
+def _v49(i):
+    if not ((isinstance(i, str)) and i == 'byte-string' or (isinstance(i, str)) and i == 'unix-time' or (isinstance(i, str))): return False
+    return True
+
+def _v48(i):
+    if not ((isinstance(i, str)) and i == 'byte-string' or (isinstance(i, str)) and i == 'unix-time' or (isinstance(i, str))): return False
+    return True
+
+def _v47(i):
+    if not (_v50(i) or _v51(i) or _v52(i)): return False
+    return True
+
+def _v52(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v53(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v54(x)):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    return True
+
+def _v54(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    return True
+
+def _v53(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v51(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and x == 'object'):
+        return False
+    x = i.get('required', _MISSING)
+    if x is not _MISSING and not (_v55(x)):
+        return False
+    x = i.get('properties', _MISSING)
+    if x is not _MISSING and not (_v56(x)):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v57(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v58(x)):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    return True
+
+def _v58(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    return True
+
+def _v57(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v56(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v55(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v50(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c1)):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v59(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v60(x)):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    return True
+
+def _v60(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    return True
+
+def _v59(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v46(i):
+    if not ((isinstance(i, str)) and i == 'date-time' or (isinstance(i, str)) and i == 'date' or (isinstance(i, str)) and i == 'time' or (isinstance(i, str)) and i == 'uri' or (isinstance(i, str)) and i == 'uri-reference' or (isinstance(i, str)) and i == 'uuid' or (isinstance(i, str))): return False
+    return True
+
+def _v45(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not (_v22(x)): return False
+    return True
+
+def _v44(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v43(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v42(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v17(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c2)):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v61(x)):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v62(x)):
+        return False
+    x = i.get('const', _MISSING)
+    if x is not _MISSING and not (_v22(x)):
+        return False
+    x = i.get('default', _MISSING)
+    if x is not _MISSING and not (_v22(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('exclusiveMinimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('exclusiveMaximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('multipleOf', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('pattern', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not (_v63(x)):
+        return False
+    x = i.get('minItems', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxItems', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('uniqueItems', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('items', _MISSING)
+    if x is not _MISSING and not (_v64(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('label', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRequired', _MISSING)
+    if x is not _MISSING and not (_v15(x)):
+        return False
+    x = i.get('units', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('unit', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('scaleMinimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('scaleMaximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('nullable', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('subtype', _MISSING)
+    if x is not _MISSING and not (_v65(x)):
+        return False
+    x = i.get('sdfType', _MISSING)
+    if x is not _MISSING and not (_v66(x)):
+        return False
+    x = i.get('contentFormat', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    return True
+
+def _v66(i):
+    if not ((isinstance(i, str)) and i == 'byte-string' or (isinstance(i, str)) and i == 'unix-time' or (isinstance(i, str))): return False
+    return True
+
+def _v65(i):
+    if not ((isinstance(i, str)) and i == 'byte-string' or (isinstance(i, str)) and i == 'unix-time' or (isinstance(i, str))): return False
+    return True
+
+def _v64(i):
+    if not (_v67(i) or _v68(i) or _v69(i)): return False
+    return True
+
+def _v69(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v70(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v71(x)):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    return True
+
+def _v71(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    return True
+
+def _v70(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v68(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and x == 'object'):
+        return False
+    x = i.get('required', _MISSING)
+    if x is not _MISSING and not (_v72(x)):
+        return False
+    x = i.get('properties', _MISSING)
+    if x is not _MISSING and not (_v73(x)):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v74(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v75(x)):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    return True
+
+def _v75(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    return True
+
+def _v74(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v73(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v72(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v67(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c1)):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v76(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v77(x)):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    return True
+
+def _v77(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    return True
+
+def _v76(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v63(i):
+    if not ((isinstance(i, str)) and i == 'date-time' or (isinstance(i, str)) and i == 'date' or (isinstance(i, str)) and i == 'time' or (isinstance(i, str)) and i == 'uri' or (isinstance(i, str)) and i == 'uri-reference' or (isinstance(i, str)) and i == 'uuid' or (isinstance(i, str))): return False
+    return True
+
+def _v62(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not (_v22(x)): return False
+    return True
+
+def _v61(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v13(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v78(x)):
+            return False
+    return True
+
+def _v78(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('label', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRequired', _MISSING)
+    if x is not _MISSING and not (_v15(x)):
+        return False
+    x = i.get('sdfOutputData', _MISSING)
+    if x is not _MISSING and not (_v79(x)):
+        return False
+    x = i.get('sdfData', _MISSING)
+    if x is not _MISSING and not (_v80(x)):
+        return False
+    return True
+
+def _v80(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v79(i):
+    if not (_v15(i) or _v16(i)): return False
+    return True
+
+def _v12(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v81(x)):
+            return False
+    return True
+
+def _v81(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('label', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRequired', _MISSING)
+    if x is not _MISSING and not (_v15(x)):
+        return False
+    x = i.get('sdfInputData', _MISSING)
+    if x is not _MISSING and not (_v79(x)):
+        return False
+    x = i.get('sdfRequiredInputData', _MISSING)
+    if x is not _MISSING and not (_v15(x)):
+        return False
+    x = i.get('sdfOutputData', _MISSING)
+    if x is not _MISSING and not (_v79(x)):
+        return False
+    x = i.get('sdfData', _MISSING)
+    if x is not _MISSING and not (_v82(x)):
+        return False
+    return True
+
+def _v82(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v11(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v83(x)):
+            return False
+    return True
+
+def _v83(i):
+    if not (_v84(i) or _v85(i) or _v86(i)): return False
+    return True
+
+def _v86(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v87(x)):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v88(x)):
+        return False
+    x = i.get('const', _MISSING)
+    if x is not _MISSING and not (_v22(x)):
+        return False
+    x = i.get('default', _MISSING)
+    if x is not _MISSING and not (_v22(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('exclusiveMinimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('exclusiveMaximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('multipleOf', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('pattern', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not (_v89(x)):
+        return False
+    x = i.get('minItems', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxItems', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('uniqueItems', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('items', _MISSING)
+    if x is not _MISSING and not (_v90(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('label', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRequired', _MISSING)
+    if x is not _MISSING and not (_v15(x)):
+        return False
+    x = i.get('units', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('unit', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('scaleMinimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('scaleMaximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('nullable', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('subtype', _MISSING)
+    if x is not _MISSING and not (_v91(x)):
+        return False
+    x = i.get('sdfType', _MISSING)
+    if x is not _MISSING and not (_v92(x)):
+        return False
+    x = i.get('contentFormat', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('observable', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('readable', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('writable', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    return True
+
+def _v92(i):
+    if not ((isinstance(i, str)) and i == 'byte-string' or (isinstance(i, str)) and i == 'unix-time' or (isinstance(i, str))): return False
+    return True
+
+def _v91(i):
+    if not ((isinstance(i, str)) and i == 'byte-string' or (isinstance(i, str)) and i == 'unix-time' or (isinstance(i, str))): return False
+    return True
+
+def _v90(i):
+    if not (_v93(i) or _v94(i) or _v95(i)): return False
+    return True
+
+def _v95(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v96(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v97(x)):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    return True
+
+def _v97(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    return True
+
+def _v96(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v94(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and x == 'object'):
+        return False
+    x = i.get('required', _MISSING)
+    if x is not _MISSING and not (_v98(x)):
+        return False
+    x = i.get('properties', _MISSING)
+    if x is not _MISSING and not (_v99(x)):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v100(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v101(x)):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    return True
+
+def _v101(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    return True
+
+def _v100(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v99(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v98(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v93(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c1)):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v102(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v103(x)):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    return True
+
+def _v103(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    return True
+
+def _v102(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v89(i):
+    if not ((isinstance(i, str)) and i == 'date-time' or (isinstance(i, str)) and i == 'date' or (isinstance(i, str)) and i == 'time' or (isinstance(i, str)) and i == 'uri' or (isinstance(i, str)) and i == 'uri-reference' or (isinstance(i, str)) and i == 'uuid' or (isinstance(i, str))): return False
+    return True
+
+def _v88(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not (_v22(x)): return False
+    return True
+
+def _v87(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v85(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and x == 'object'):
+        return False
+    x = i.get('required', _MISSING)
+    if x is not _MISSING and not (_v104(x)):
+        return False
+    x = i.get('properties', _MISSING)
+    if x is not _MISSING and not (_v105(x)):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v106(x)):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v107(x)):
+        return False
+    x = i.get('const', _MISSING)
+    if x is not _MISSING and not (_v22(x)):
+        return False
+    x = i.get('default', _MISSING)
+    if x is not _MISSING and not (_v22(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('exclusiveMinimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('exclusiveMaximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('multipleOf', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('pattern', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not (_v108(x)):
+        return False
+    x = i.get('minItems', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxItems', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('uniqueItems', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('items', _MISSING)
+    if x is not _MISSING and not (_v109(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('label', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRequired', _MISSING)
+    if x is not _MISSING and not (_v15(x)):
+        return False
+    x = i.get('units', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('unit', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('scaleMinimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('scaleMaximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('nullable', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('subtype', _MISSING)
+    if x is not _MISSING and not (_v110(x)):
+        return False
+    x = i.get('sdfType', _MISSING)
+    if x is not _MISSING and not (_v111(x)):
+        return False
+    x = i.get('contentFormat', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('observable', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('readable', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('writable', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    return True
+
+def _v111(i):
+    if not ((isinstance(i, str)) and i == 'byte-string' or (isinstance(i, str)) and i == 'unix-time' or (isinstance(i, str))): return False
+    return True
+
+def _v110(i):
+    if not ((isinstance(i, str)) and i == 'byte-string' or (isinstance(i, str)) and i == 'unix-time' or (isinstance(i, str))): return False
+    return True
+
+def _v109(i):
+    if not (_v112(i) or _v113(i) or _v114(i)): return False
+    return True
+
+def _v114(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v115(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v116(x)):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    return True
+
+def _v116(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    return True
+
+def _v115(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v113(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and x == 'object'):
+        return False
+    x = i.get('required', _MISSING)
+    if x is not _MISSING and not (_v117(x)):
+        return False
+    x = i.get('properties', _MISSING)
+    if x is not _MISSING and not (_v118(x)):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v119(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v120(x)):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    return True
+
+def _v120(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    return True
+
+def _v119(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v118(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v117(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v112(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c1)):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v121(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v122(x)):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    return True
+
+def _v122(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    return True
+
+def _v121(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v108(i):
+    if not ((isinstance(i, str)) and i == 'date-time' or (isinstance(i, str)) and i == 'date' or (isinstance(i, str)) and i == 'time' or (isinstance(i, str)) and i == 'uri' or (isinstance(i, str)) and i == 'uri-reference' or (isinstance(i, str)) and i == 'uuid' or (isinstance(i, str))): return False
+    return True
+
+def _v107(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not (_v22(x)): return False
+    return True
+
+def _v106(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v105(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v104(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v84(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c2)):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v123(x)):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v124(x)):
+        return False
+    x = i.get('const', _MISSING)
+    if x is not _MISSING and not (_v22(x)):
+        return False
+    x = i.get('default', _MISSING)
+    if x is not _MISSING and not (_v22(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('exclusiveMinimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('exclusiveMaximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('multipleOf', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('pattern', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not (_v125(x)):
+        return False
+    x = i.get('minItems', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxItems', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('uniqueItems', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('items', _MISSING)
+    if x is not _MISSING and not (_v126(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('label', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRequired', _MISSING)
+    if x is not _MISSING and not (_v15(x)):
+        return False
+    x = i.get('units', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('unit', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('scaleMinimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('scaleMaximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('nullable', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('subtype', _MISSING)
+    if x is not _MISSING and not (_v127(x)):
+        return False
+    x = i.get('sdfType', _MISSING)
+    if x is not _MISSING and not (_v128(x)):
+        return False
+    x = i.get('contentFormat', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('observable', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('readable', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('writable', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    return True
+
+def _v128(i):
+    if not ((isinstance(i, str)) and i == 'byte-string' or (isinstance(i, str)) and i == 'unix-time' or (isinstance(i, str))): return False
+    return True
+
+def _v127(i):
+    if not ((isinstance(i, str)) and i == 'byte-string' or (isinstance(i, str)) and i == 'unix-time' or (isinstance(i, str))): return False
+    return True
+
+def _v126(i):
+    if not (_v129(i) or _v130(i) or _v131(i)): return False
+    return True
+
+def _v131(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v132(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v133(x)):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    return True
+
+def _v133(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    return True
+
+def _v132(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v130(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and x == 'object'):
+        return False
+    x = i.get('required', _MISSING)
+    if x is not _MISSING and not (_v134(x)):
+        return False
+    x = i.get('properties', _MISSING)
+    if x is not _MISSING and not (_v135(x)):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v136(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v137(x)):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    return True
+
+def _v137(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    return True
+
+def _v136(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v135(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v134(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v129(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c1)):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v138(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v139(x)):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    return True
+
+def _v139(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    return True
+
+def _v138(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v125(i):
+    if not ((isinstance(i, str)) and i == 'date-time' or (isinstance(i, str)) and i == 'date' or (isinstance(i, str)) and i == 'time' or (isinstance(i, str)) and i == 'uri' or (isinstance(i, str)) and i == 'uri-reference' or (isinstance(i, str)) and i == 'uuid' or (isinstance(i, str))): return False
+    return True
+
+def _v124(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not (_v22(x)): return False
+    return True
+
+def _v123(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v10(i):
+    if not (((isinstance(i, int) and not isinstance(i, bool)) or (isinstance(i, float) and i.is_integer()))): return False
+    if i < 0: return False
+    return True
+
+def _v7(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v140(x)):
+            return False
+    return True
+
+def _v140(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('minItems', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxItems', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('sdfProperty', _MISSING)
+    if x is not _MISSING and not (_v141(x)):
+        return False
+    x = i.get('sdfAction', _MISSING)
+    if x is not _MISSING and not (_v142(x)):
+        return False
+    x = i.get('sdfEvent', _MISSING)
+    if x is not _MISSING and not (_v143(x)):
+        return False
+    x = i.get('sdfData', _MISSING)
+    if x is not _MISSING and not (_v144(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('label', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRequired', _MISSING)
+    if x is not _MISSING and not (_v15(x)):
+        return False
+    x = i.get('sdfObject', _MISSING)
+    if x is not _MISSING and not (_v145(x)):
+        return False
+    x = i.get('sdfThing', _MISSING)
+    if x is not _MISSING and not (_v146(x)):
+        return False
+    return True
+
+def _v146(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v140(x)):
+            return False
+    return True
+
+def _v145(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v9(x)):
+            return False
+    return True
+
+def _v144(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v143(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v78(x)):
+            return False
+    return True
+
+def _v142(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v81(x)):
+            return False
+    return True
+
+def _v141(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v83(x)):
+            return False
+    return True
+
+def _v6(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not ((isinstance(x, str))):
+            return False
+    return True
+
+def _v5(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('title', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('version', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('copyright', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('license', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    return True
+
+def _v4(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v16(x)):
+            return False
+    return True
+
+def _v3(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v78(x)):
+            return False
+    return True
+
+def _v2(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v81(x)):
+            return False
+    return True
+
+def _v1(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v83(x)):
+            return False
+    return True
+
+
+is_valid = _v0
+fragments = {}
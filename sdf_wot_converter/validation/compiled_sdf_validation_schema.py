@@ -0,0 +1,1400 @@
+# Generated from sdf_validation_schema.py by the schema compiler in
+# sdf_wot_converter/validation/compiler.py. Do not edit this file manually;
+# run `python -m sdf_wot_converter.validation.compiler` instead.
+import re
+
+from .compiler import _equal, _in_enum, _multiple_of, _unique
+
+_MISSING = object()
+_c0 = frozenset(['defaultNamespace', 'info', 'namespace', 'sdfAction', 'sdfData', 'sdfEvent', 'sdfObject', 'sdfProperty', 'sdfThing'])
+_c1 = frozenset([])
+_c2 = frozenset(['$comment', 'description', 'label', 'maxItems', 'minItems', 'sdfAction', 'sdfData', 'sdfEvent', 'sdfProperty', 'sdfRef', 'sdfRequired'])
+_c3 = frozenset(['date', 'date-time', 'time', 'uri', 'uri-reference', 'uuid'])
+_c4 = frozenset(['byte-string', 'unix-time'])
+_c5 = frozenset(['$comment', 'const', 'contentFormat', 'default', 'description', 'enum', 'exclusiveMaximum', 'exclusiveMinimum', 'format', 'items', 'label', 'maxItems', 'maxLength', 'maximum', 'minItems', 'minLength', 'minimum', 'multipleOf', 'nullable', 'pattern', 'properties', 'required', 'sdfChoice', 'sdfRef', 'sdfRequired', 'sdfType', 'type', 'uniqueItems', 'unit'])
+_c6 = frozenset(['$comment', 'description', 'enum', 'format', 'maxLength', 'maximum', 'minLength', 'minimum', 'properties', 'required', 'sdfChoice', 'sdfRef', 'type'])
+_c7 = frozenset(['boolean', 'integer', 'number', 'string'])
+_c8 = frozenset(['$comment', 'description', 'enum', 'format', 'maxLength', 'maximum', 'minLength', 'minimum', 'sdfChoice', 'sdfRef', 'type'])
+_c9 = frozenset(['array', 'boolean', 'integer', 'number', 'string'])
+_c10 = frozenset(['$comment', 'const', 'contentFormat', 'default', 'description', 'enum', 'exclusiveMaximum', 'exclusiveMinimum', 'format', 'items', 'label', 'maxItems', 'maxLength', 'maximum', 'minItems', 'minLength', 'minimum', 'multipleOf', 'nullable', 'pattern', 'sdfChoice', 'sdfRef', 'sdfRequired', 'sdfType', 'type', 'uniqueItems', 'unit'])
+_c11 = frozenset(['$comment', 'description', 'label', 'sdfData', 'sdfOutputData', 'sdfRef', 'sdfRequired'])
+_c12 = frozenset(['$comment', 'description', 'label', 'sdfData', 'sdfInputData', 'sdfOutputData', 'sdfRef', 'sdfRequired'])
+_c13 = frozenset(['$comment', 'const', 'contentFormat', 'default', 'description', 'enum', 'exclusiveMaximum', 'exclusiveMinimum', 'format', 'items', 'label', 'maxItems', 'maxLength', 'maximum', 'minItems', 'minLength', 'minimum', 'multipleOf', 'nullable', 'observable', 'pattern', 'properties', 'readable', 'required', 'sdfChoice', 'sdfRef', 'sdfRequired', 'sdfType', 'type', 'uniqueItems', 'unit', 'writable'])
+_c14 = frozenset(['$comment', 'const', 'contentFormat', 'default', 'description', 'enum', 'exclusiveMaximum', 'exclusiveMinimum', 'format', 'items', 'label', 'maxItems', 'maxLength', 'maximum', 'minItems', 'minLength', 'minimum', 'multipleOf', 'nullable', 'observable', 'pattern', 'readable', 'sdfChoice', 'sdfRef', 'sdfRequired', 'sdfType', 'type', 'uniqueItems', 'unit', 'writable'])
+_c15 = frozenset(['$comment', 'description', 'label', 'maxItems', 'minItems', 'sdfAction', 'sdfData', 'sdfEvent', 'sdfObject', 'sdfProperty', 'sdfRef', 'sdfRequired', 'sdfThing'])
+_c16 = frozenset(['copyright', 'license', 'title', 'version'])
+
+
+def _v0(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('sdfProperty', _MISSING)
+    if x is not _MISSING and not (_v1(x)):
+        return False
+    x = i.get('sdfAction', _MISSING)
+    if x is not _MISSING and not (_v2(x)):
+        return False
+    x = i.get('sdfEvent', _MISSING)
+    if x is not _MISSING and not (_v3(x)):
+        return False
+    x = i.get('sdfData', _MISSING)
+    if x is not _MISSING and not (_v4(x)):
+        return False
+    x = i.get('info', _MISSING)
+    if x is not _MISSING and not (_v5(x)):
+        return False
+    x = i.get('namespace', _MISSING)
+    if x is not _MISSING and not (_v6(x)):
+        return False
+    x = i.get('defaultNamespace', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfThing', _MISSING)
+    if x is not _MISSING and not (_v7(x)):
+        return False
+    x = i.get('sdfObject', _MISSING)
+    if x is not _MISSING and not (_v8(x)):
+        return False
+    for k, x in i.items():
+        if k not in _c0 and not (False):
+            return False
+    return True
+
+def _v8(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v9(x)):
+            return False
+    return True
+
+def _v9(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('minItems', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxItems', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('sdfProperty', _MISSING)
+    if x is not _MISSING and not (_v11(x)):
+        return False
+    x = i.get('sdfAction', _MISSING)
+    if x is not _MISSING and not (_v12(x)):
+        return False
+    x = i.get('sdfEvent', _MISSING)
+    if x is not _MISSING and not (_v13(x)):
+        return False
+    x = i.get('sdfData', _MISSING)
+    if x is not _MISSING and not (_v14(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('label', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRequired', _MISSING)
+    if x is not _MISSING and not (_v15(x)):
+        return False
+    for k, x in i.items():
+        if k not in _c2 and not (False):
+            return False
+    return True
+
+def _v15(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v14(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v16(x)):
+            return False
+    return True
+
+def _v16(i):
+    if not (_v17(i) or _v18(i)): return False
+    return True
+
+def _v18(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and x == 'object'):
+        return False
+    x = i.get('required', _MISSING)
+    if x is not _MISSING and not (_v19(x)):
+        return False
+    x = i.get('properties', _MISSING)
+    if x is not _MISSING and not (_v20(x)):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v21(x)):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v22(x)):
+        return False
+    x = i.get('const', _MISSING)
+    if x is not _MISSING and not (_v23(x)):
+        return False
+    x = i.get('default', _MISSING)
+    if x is not _MISSING and not (_v23(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('exclusiveMinimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('exclusiveMaximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('multipleOf', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('pattern', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c3)):
+        return False
+    x = i.get('minItems', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxItems', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('uniqueItems', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('items', _MISSING)
+    if x is not _MISSING and not (_v24(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('label', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRequired', _MISSING)
+    if x is not _MISSING and not (_v15(x)):
+        return False
+    x = i.get('unit', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('nullable', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('sdfType', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c4)):
+        return False
+    x = i.get('contentFormat', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    for k, x in i.items():
+        if k not in _c5 and not (False):
+            return False
+    return True
+
+def _v24(i):
+    if not (_v25(i) or _v26(i)): return False
+    return True
+
+def _v26(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and x == 'object'):
+        return False
+    x = i.get('required', _MISSING)
+    if x is not _MISSING and not (_v27(x)):
+        return False
+    x = i.get('properties', _MISSING)
+    if x is not _MISSING and not (_v28(x)):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v29(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v30(x)):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    for k, x in i.items():
+        if k not in _c6 and not (False):
+            return False
+    return True
+
+def _v30(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v29(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v16(x)):
+            return False
+    return True
+
+def _v28(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v16(x)):
+            return False
+    return True
+
+def _v27(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v25(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c7)):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v31(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v32(x)):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    for k, x in i.items():
+        if k not in _c8 and not (False):
+            return False
+    return True
+
+def _v32(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v31(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v16(x)):
+            return False
+    return True
+
+def _v23(i):
+    if not (((isinstance(i, (int, float)) and not isinstance(i, bool))) or (isinstance(i, str)) or (isinstance(i, bool)) or (i is None) or _v33(i) or _v34(i) or _v35(i) or _v36(i)): return False
+    return True
+
+def _v36(i):
+    if not (isinstance(i, dict)): return False
+    return True
+
+def _v35(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not ((isinstance(x, bool))): return False
+    return True
+
+def _v34(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v33(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not (((isinstance(x, (int, float)) and not isinstance(x, bool)))): return False
+    return True
+
+def _v22(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v21(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v16(x)):
+            return False
+    return True
+
+def _v20(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v16(x)):
+            return False
+    return True
+
+def _v19(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v17(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c9)):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v37(x)):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v38(x)):
+        return False
+    x = i.get('const', _MISSING)
+    if x is not _MISSING and not (_v23(x)):
+        return False
+    x = i.get('default', _MISSING)
+    if x is not _MISSING and not (_v23(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('exclusiveMinimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('exclusiveMaximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('multipleOf', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('pattern', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c3)):
+        return False
+    x = i.get('minItems', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxItems', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('uniqueItems', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('items', _MISSING)
+    if x is not _MISSING and not (_v39(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('label', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRequired', _MISSING)
+    if x is not _MISSING and not (_v15(x)):
+        return False
+    x = i.get('unit', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('nullable', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('sdfType', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c4)):
+        return False
+    x = i.get('contentFormat', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    for k, x in i.items():
+        if k not in _c10 and not (False):
+            return False
+    return True
+
+def _v39(i):
+    if not (_v40(i) or _v41(i)): return False
+    return True
+
+def _v41(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and x == 'object'):
+        return False
+    x = i.get('required', _MISSING)
+    if x is not _MISSING and not (_v42(x)):
+        return False
+    x = i.get('properties', _MISSING)
+    if x is not _MISSING and not (_v43(x)):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v44(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v45(x)):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    for k, x in i.items():
+        if k not in _c6 and not (False):
+            return False
+    return True
+
+def _v45(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v44(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v16(x)):
+            return False
+    return True
+
+def _v43(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v16(x)):
+            return False
+    return True
+
+def _v42(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v40(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c7)):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v46(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v47(x)):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    for k, x in i.items():
+        if k not in _c8 and not (False):
+            return False
+    return True
+
+def _v47(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v46(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v16(x)):
+            return False
+    return True
+
+def _v38(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v37(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v16(x)):
+            return False
+    return True
+
+def _v13(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v48(x)):
+            return False
+    return True
+
+def _v48(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('label', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRequired', _MISSING)
+    if x is not _MISSING and not (_v15(x)):
+        return False
+    x = i.get('sdfOutputData', _MISSING)
+    if x is not _MISSING and not (_v16(x)):
+        return False
+    x = i.get('sdfData', _MISSING)
+    if x is not _MISSING and not (_v49(x)):
+        return False
+    for k, x in i.items():
+        if k not in _c11 and not (False):
+            return False
+    return True
+
+def _v49(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v16(x)):
+            return False
+    return True
+
+def _v12(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v50(x)):
+            return False
+    return True
+
+def _v50(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('label', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRequired', _MISSING)
+    if x is not _MISSING and not (_v15(x)):
+        return False
+    x = i.get('sdfInputData', _MISSING)
+    if x is not _MISSING and not (_v16(x)):
+        return False
+    x = i.get('sdfOutputData', _MISSING)
+    if x is not _MISSING and not (_v16(x)):
+        return False
+    x = i.get('sdfData', _MISSING)
+    if x is not _MISSING and not (_v51(x)):
+        return False
+    for k, x in i.items():
+        if k not in _c12 and not (False):
+            return False
+    return True
+
+def _v51(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v16(x)):
+            return False
+    return True
+
+def _v11(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v52(x)):
+            return False
+    return True
+
+def _v52(i):
+    if not (_v53(i) or _v54(i)): return False
+    return True
+
+def _v54(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and x == 'object'):
+        return False
+    x = i.get('required', _MISSING)
+    if x is not _MISSING and not (_v55(x)):
+        return False
+    x = i.get('properties', _MISSING)
+    if x is not _MISSING and not (_v56(x)):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v57(x)):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v58(x)):
+        return False
+    x = i.get('const', _MISSING)
+    if x is not _MISSING and not (_v23(x)):
+        return False
+    x = i.get('default', _MISSING)
+    if x is not _MISSING and not (_v23(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('exclusiveMinimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('exclusiveMaximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('multipleOf', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('pattern', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c3)):
+        return False
+    x = i.get('minItems', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxItems', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('uniqueItems', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('items', _MISSING)
+    if x is not _MISSING and not (_v59(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('label', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRequired', _MISSING)
+    if x is not _MISSING and not (_v15(x)):
+        return False
+    x = i.get('unit', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('nullable', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('sdfType', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c4)):
+        return False
+    x = i.get('contentFormat', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('observable', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('readable', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('writable', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    for k, x in i.items():
+        if k not in _c13 and not (False):
+            return False
+    return True
+
+def _v59(i):
+    if not (_v60(i) or _v61(i)): return False
+    return True
+
+def _v61(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and x == 'object'):
+        return False
+    x = i.get('required', _MISSING)
+    if x is not _MISSING and not (_v62(x)):
+        return False
+    x = i.get('properties', _MISSING)
+    if x is not _MISSING and not (_v63(x)):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v64(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v65(x)):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    for k, x in i.items():
+        if k not in _c6 and not (False):
+            return False
+    return True
+
+def _v65(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v64(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v16(x)):
+            return False
+    return True
+
+def _v63(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v16(x)):
+            return False
+    return True
+
+def _v62(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v60(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c7)):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v66(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v67(x)):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    for k, x in i.items():
+        if k not in _c8 and not (False):
+            return False
+    return True
+
+def _v67(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v66(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v16(x)):
+            return False
+    return True
+
+def _v58(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v57(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v16(x)):
+            return False
+    return True
+
+def _v56(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v16(x)):
+            return False
+    return True
+
+def _v55(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v53(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c9)):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v68(x)):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v69(x)):
+        return False
+    x = i.get('const', _MISSING)
+    if x is not _MISSING and not (_v23(x)):
+        return False
+    x = i.get('default', _MISSING)
+    if x is not _MISSING and not (_v23(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('exclusiveMinimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('exclusiveMaximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('multipleOf', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('pattern', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c3)):
+        return False
+    x = i.get('minItems', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxItems', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('uniqueItems', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('items', _MISSING)
+    if x is not _MISSING and not (_v70(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('label', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRequired', _MISSING)
+    if x is not _MISSING and not (_v15(x)):
+        return False
+    x = i.get('unit', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('nullable', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('sdfType', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c4)):
+        return False
+    x = i.get('contentFormat', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('observable', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('readable', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('writable', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    for k, x in i.items():
+        if k not in _c14 and not (False):
+            return False
+    return True
+
+def _v70(i):
+    if not (_v71(i) or _v72(i)): return False
+    return True
+
+def _v72(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and x == 'object'):
+        return False
+    x = i.get('required', _MISSING)
+    if x is not _MISSING and not (_v73(x)):
+        return False
+    x = i.get('properties', _MISSING)
+    if x is not _MISSING and not (_v74(x)):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v75(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v76(x)):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    for k, x in i.items():
+        if k not in _c6 and not (False):
+            return False
+    return True
+
+def _v76(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v75(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v16(x)):
+            return False
+    return True
+
+def _v74(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v16(x)):
+            return False
+    return True
+
+def _v73(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v71(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c7)):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfChoice', _MISSING)
+    if x is not _MISSING and not (_v77(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v78(x)):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    for k, x in i.items():
+        if k not in _c8 and not (False):
+            return False
+    return True
+
+def _v78(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v77(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v16(x)):
+            return False
+    return True
+
+def _v69(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v68(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v16(x)):
+            return False
+    return True
+
+def _v10(i):
+    if not (((isinstance(i, int) and not isinstance(i, bool)) or (isinstance(i, float) and i.is_integer()))): return False
+    if i < 0: return False
+    return True
+
+def _v7(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v79(x)):
+            return False
+    return True
+
+def _v79(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('minItems', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('maxItems', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('sdfProperty', _MISSING)
+    if x is not _MISSING and not (_v80(x)):
+        return False
+    x = i.get('sdfAction', _MISSING)
+    if x is not _MISSING and not (_v81(x)):
+        return False
+    x = i.get('sdfEvent', _MISSING)
+    if x is not _MISSING and not (_v82(x)):
+        return False
+    x = i.get('sdfData', _MISSING)
+    if x is not _MISSING and not (_v83(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('label', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('$comment', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRef', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('sdfRequired', _MISSING)
+    if x is not _MISSING and not (_v15(x)):
+        return False
+    x = i.get('sdfObject', _MISSING)
+    if x is not _MISSING and not (_v84(x)):
+        return False
+    x = i.get('sdfThing', _MISSING)
+    if x is not _MISSING and not (_v85(x)):
+        return False
+    for k, x in i.items():
+        if k not in _c15 and not (False):
+            return False
+    return True
+
+def _v85(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v79(x)):
+            return False
+    return True
+
+def _v84(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v9(x)):
+            return False
+    return True
+
+def _v83(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v16(x)):
+            return False
+    return True
+
+def _v82(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v48(x)):
+            return False
+    return True
+
+def _v81(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v50(x)):
+            return False
+    return True
+
+def _v80(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v52(x)):
+            return False
+    return True
+
+def _v6(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not ((isinstance(x, str))):
+            return False
+    return True
+
+def _v5(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('title', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('version', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('copyright', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('license', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    for k, x in i.items():
+        if k not in _c16 and not (False):
+            return False
+    return True
+
+def _v4(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v16(x)):
+            return False
+    return True
+
+def _v3(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v48(x)):
+            return False
+    return True
+
+def _v2(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v50(x)):
+            return False
+    return True
+
+def _v1(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v52(x)):
+            return False
+    return True
+
+
+is_valid = _v0
+fragments = {}
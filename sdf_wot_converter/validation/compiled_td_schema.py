@@ -0,0 +1,1309 @@
+# Generated from td_schema.py by the schema compiler in
+# sdf_wot_converter/validation/compiler.py. Do not edit this file manually;
+# run `python -m sdf_wot_converter.validation.compiler` instead.
+import re
+
+from .compiler import _equal, _in_enum, _multiple_of, _unique
+
+_MISSING = object()
+_c0 = frozenset([])
+_c1 = frozenset(['array', 'boolean', 'integer', 'null', 'number', 'object', 'string'])
+_c2 = re.compile('.+:.*')
+_c3 = frozenset(['oauth2'])
+_c4 = frozenset(['client', 'code', 'device'])
+_c5 = frozenset(['psk'])
+_c6 = frozenset(['bearer'])
+_c7 = frozenset(['auto', 'body', 'cookie', 'header', 'query'])
+_c8 = frozenset(['apikey'])
+_c9 = frozenset(['body', 'cookie', 'header', 'query'])
+_c10 = frozenset(['digest'])
+_c11 = frozenset(['auth', 'auth-int'])
+_c12 = frozenset(['basic'])
+_c13 = frozenset(['combo'])
+_c14 = frozenset(['auto'])
+_c15 = frozenset(['nosec'])
+_c16 = frozenset(['observeallproperties', 'queryallactions', 'readallproperties', 'readmultipleproperties', 'subscribeallevents', 'unobserveallproperties', 'unsubscribeallevents', 'writeallproperties', 'writemultipleproperties'])
+_c17 = re.compile('[0-9]*x[0-9]+')
+_c18 = frozenset(['icon', 'tm:extends'])
+_c19 = frozenset(['subscribeevent', 'unsubscribeevent'])
+_c20 = frozenset(['cancelaction', 'invokeaction', 'queryaction'])
+_c21 = frozenset(['observeproperty', 'readproperty', 'unobserveproperty', 'writeproperty'])
+
+
+def _v0(i):
+    if not (isinstance(i, dict)): return False
+    if 'title' not in i: return False
+    if 'security' not in i: return False
+    if 'securityDefinitions' not in i: return False
+    if '@context' not in i: return False
+    x = i.get('id', _MISSING)
+    if x is not _MISSING and not (_v1(x)):
+        return False
+    x = i.get('title', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('titles', _MISSING)
+    if x is not _MISSING and not (_v2(x)):
+        return False
+    x = i.get('properties', _MISSING)
+    if x is not _MISSING and not (_v3(x)):
+        return False
+    x = i.get('actions', _MISSING)
+    if x is not _MISSING and not (_v4(x)):
+        return False
+    x = i.get('events', _MISSING)
+    if x is not _MISSING and not (_v5(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v6(x)):
+        return False
+    x = i.get('version', _MISSING)
+    if x is not _MISSING and not (_v7(x)):
+        return False
+    x = i.get('links', _MISSING)
+    if x is not _MISSING and not (_v8(x)):
+        return False
+    x = i.get('forms', _MISSING)
+    if x is not _MISSING and not (_v9(x)):
+        return False
+    x = i.get('base', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('securityDefinitions', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('schemaDefinitions', _MISSING)
+    if x is not _MISSING and not (_v11(x)):
+        return False
+    x = i.get('support', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('created', _MISSING)
+    if x is not _MISSING and not (_v12(x)):
+        return False
+    x = i.get('modified', _MISSING)
+    if x is not _MISSING and not (_v13(x)):
+        return False
+    x = i.get('profile', _MISSING)
+    if x is not _MISSING and not (_v14(x)):
+        return False
+    x = i.get('security', _MISSING)
+    if x is not _MISSING and not (_v15(x)):
+        return False
+    x = i.get('uriVariables', _MISSING)
+    if x is not _MISSING and not (_v16(x)):
+        return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v17(x)):
+        return False
+    x = i.get('@context', _MISSING)
+    if x is not _MISSING and not (_v18(x)):
+        return False
+    return True
+
+def _v18(i):
+    if not (_v19(i) or (isinstance(i, str)) and i == 'https://www.w3.org/2022/wot/td/v1.1' or _v20(i) or _v21(i) or (isinstance(i, str)) and i == 'https://www.w3.org/2019/wot/td/v1'): return False
+    return True
+
+def _v21(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    if not any((isinstance(x, str)) and x == 'https://www.w3.org/2019/wot/td/v1' for x in i): return False
+    return True
+
+def _v20(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 2: return False
+    if not any((isinstance(x, str)) and x == 'https://www.w3.org/2022/wot/td/v1.1' for x in i): return False
+    return True
+
+def _v19(i):
+    if not (isinstance(i, list)): return False
+    if len(i) > 0:
+        x = i[0]
+        if not ((isinstance(x, str)) and x == 'https://www.w3.org/2022/wot/td/v1.1'): return False
+    for x in i[1:]:
+        if not (_v22(x)): return False
+    return True
+
+def _v22(i):
+    if not ((isinstance(i, str)) or (isinstance(i, dict))): return False
+    if (isinstance(i, str)) and i == 'https://www.w3.org/2019/wot/td/v1': return False
+    return True
+
+def _v17(i):
+    if (_v23(i)) + (_v24(i)) != 1: return False
+    return True
+
+def _v24(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not (_v25(x)): return False
+    return True
+
+def _v25(i):
+    if not (isinstance(i, str)): return False
+    if i == 'tm:ThingModel': return False
+    return True
+
+def _v23(i):
+    if not (isinstance(i, str)): return False
+    if i == 'tm:ThingModel': return False
+    return True
+
+def _v16(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v26(x)):
+            return False
+    return True
+
+def _v26(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v17(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('title', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v6(x)):
+        return False
+    x = i.get('titles', _MISSING)
+    if x is not _MISSING and not (_v2(x)):
+        return False
+    x = i.get('writeOnly', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('readOnly', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('oneOf', _MISSING)
+    if x is not _MISSING and not (_v27(x)):
+        return False
+    x = i.get('unit', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v28(x)):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('contentEncoding', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('contentMediaType', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c1)):
+        return False
+    x = i.get('items', _MISSING)
+    if x is not _MISSING and not (_v29(x)):
+        return False
+    x = i.get('maxItems', _MISSING)
+    if x is not _MISSING and not (_v30(x)):
+        return False
+    x = i.get('minItems', _MISSING)
+    if x is not _MISSING and not (_v31(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('exclusiveMinimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('exclusiveMaximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v32(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v33(x)):
+        return False
+    x = i.get('multipleOf', _MISSING)
+    if x is not _MISSING and not (_v34(x)):
+        return False
+    x = i.get('properties', _MISSING)
+    if x is not _MISSING and not (_v35(x)):
+        return False
+    x = i.get('required', _MISSING)
+    if x is not _MISSING and not (_v36(x)):
+        return False
+    return True
+
+def _v36(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v35(i):
+    if (isinstance(i, dict)):
+        for k, x in i.items():
+            if k not in _c0 and not (_v26(x)):
+                return False
+    return True
+
+def _v34(i):
+    if not (((isinstance(i, int) and not isinstance(i, bool)) or (isinstance(i, float) and i.is_integer())) or (isinstance(i, (int, float)) and not isinstance(i, bool))): return False
+    if ((isinstance(i, (int, float)) and not isinstance(i, bool))):
+        if i <= 0: return False
+    return True
+
+def _v33(i):
+    if not (((isinstance(i, int) and not isinstance(i, bool)) or (isinstance(i, float) and i.is_integer()))): return False
+    if i < 0: return False
+    return True
+
+def _v32(i):
+    if not (((isinstance(i, int) and not isinstance(i, bool)) or (isinstance(i, float) and i.is_integer()))): return False
+    if i < 0: return False
+    return True
+
+def _v31(i):
+    if not (((isinstance(i, int) and not isinstance(i, bool)) or (isinstance(i, float) and i.is_integer()))): return False
+    if i < 0: return False
+    return True
+
+def _v30(i):
+    if not (((isinstance(i, int) and not isinstance(i, bool)) or (isinstance(i, float) and i.is_integer()))): return False
+    if i < 0: return False
+    return True
+
+def _v29(i):
+    if (_v26(i)) + (_v37(i)) != 1: return False
+    return True
+
+def _v37(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not (_v26(x)): return False
+    return True
+
+def _v28(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    if not _unique(i): return False
+    return True
+
+def _v27(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not (_v26(x)): return False
+    return True
+
+def _v15(i):
+    if ((isinstance(i, str))) + (_v38(i)) != 1: return False
+    return True
+
+def _v38(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v14(i):
+    if ((isinstance(i, str))) + (_v39(i)) != 1: return False
+    return True
+
+def _v39(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v13(i):
+    if not (isinstance(i, str)): return False
+    return True
+
+def _v12(i):
+    if not (isinstance(i, str)): return False
+    return True
+
+def _v11(i):
+    if not (isinstance(i, dict)): return False
+    if len(i) < 1: return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v26(x)):
+            return False
+    return True
+
+def _v10(i):
+    if not (isinstance(i, dict)): return False
+    if len(i) < 1: return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v40(x)):
+            return False
+    return True
+
+def _v40(i):
+    if (_v41(i)) + (_v42(i)) + (_v43(i)) + (_v44(i)) + (_v45(i)) + (_v46(i)) + (_v47(i)) + (_v48(i)) + (_v49(i)) + (_v50(i)) != 1: return False
+    return True
+
+def _v50(i):
+    if not (isinstance(i, dict)): return False
+    if 'scheme' not in i: return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v17(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v6(x)):
+        return False
+    x = i.get('proxy', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('scheme', _MISSING)
+    if x is not _MISSING and not (_v51(x)):
+        return False
+    return True
+
+def _v51(i):
+    if not (isinstance(i, str)): return False
+    if not _c2.search(i): return False
+    return True
+
+def _v49(i):
+    if not (isinstance(i, dict)): return False
+    if 'scheme' not in i: return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v17(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v6(x)):
+        return False
+    x = i.get('proxy', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('scheme', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c3)):
+        return False
+    x = i.get('authorization', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('token', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('refresh', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('scopes', _MISSING)
+    if x is not _MISSING and not (_v52(x)):
+        return False
+    x = i.get('flow', _MISSING)
+    if x is not _MISSING and not (_v53(x)):
+        return False
+    return True
+
+def _v53(i):
+    if not ((isinstance(i, str)) or (isinstance(i, str)) and (isinstance(i, str) and i in _c4)): return False
+    return True
+
+def _v52(i):
+    if (_v54(i)) + ((isinstance(i, str))) != 1: return False
+    return True
+
+def _v54(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v48(i):
+    if not (isinstance(i, dict)): return False
+    if 'scheme' not in i: return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v17(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v6(x)):
+        return False
+    x = i.get('proxy', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('scheme', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c5)):
+        return False
+    x = i.get('identity', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    return True
+
+def _v47(i):
+    if not (isinstance(i, dict)): return False
+    if 'scheme' not in i: return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v17(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v6(x)):
+        return False
+    x = i.get('proxy', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('scheme', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c6)):
+        return False
+    x = i.get('authorization', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('alg', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('in', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c7)):
+        return False
+    x = i.get('name', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    return True
+
+def _v46(i):
+    if not (isinstance(i, dict)): return False
+    if 'scheme' not in i: return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v17(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v6(x)):
+        return False
+    x = i.get('proxy', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('scheme', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c8)):
+        return False
+    x = i.get('in', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c9)):
+        return False
+    x = i.get('name', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    return True
+
+def _v45(i):
+    if not (isinstance(i, dict)): return False
+    if 'scheme' not in i: return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v17(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v6(x)):
+        return False
+    x = i.get('proxy', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('scheme', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c10)):
+        return False
+    x = i.get('qop', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c11)):
+        return False
+    x = i.get('in', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c7)):
+        return False
+    x = i.get('name', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    return True
+
+def _v44(i):
+    if not (isinstance(i, dict)): return False
+    if 'scheme' not in i: return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v17(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v6(x)):
+        return False
+    x = i.get('proxy', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('scheme', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c12)):
+        return False
+    x = i.get('in', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c7)):
+        return False
+    x = i.get('name', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    return True
+
+def _v43(i):
+    if (_v55(i)) + (_v56(i)) != 1: return False
+    return True
+
+def _v56(i):
+    if not (isinstance(i, dict)): return False
+    if 'scheme' not in i: return False
+    if 'allOf' not in i: return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v17(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v6(x)):
+        return False
+    x = i.get('proxy', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('scheme', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c13)):
+        return False
+    x = i.get('allOf', _MISSING)
+    if x is not _MISSING and not (_v57(x)):
+        return False
+    return True
+
+def _v57(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 2: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v55(i):
+    if not (isinstance(i, dict)): return False
+    if 'scheme' not in i: return False
+    if 'oneOf' not in i: return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v17(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v6(x)):
+        return False
+    x = i.get('proxy', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('scheme', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c13)):
+        return False
+    x = i.get('oneOf', _MISSING)
+    if x is not _MISSING and not (_v58(x)):
+        return False
+    return True
+
+def _v58(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 2: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v42(i):
+    if not (isinstance(i, dict)): return False
+    if 'scheme' not in i: return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v17(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v6(x)):
+        return False
+    x = i.get('proxy', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('scheme', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c14)):
+        return False
+    return True
+
+def _v41(i):
+    if not (isinstance(i, dict)): return False
+    if 'scheme' not in i: return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v17(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v6(x)):
+        return False
+    x = i.get('proxy', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('scheme', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c15)):
+        return False
+    return True
+
+def _v9(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not (_v59(x)): return False
+    return True
+
+def _v59(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('op', _MISSING)
+    if x is not _MISSING and not (_v60(x)):
+        return False
+    if not (_v61(i)): return False
+    return True
+
+def _v61(i):
+    if not (isinstance(i, dict)): return False
+    if 'href' not in i: return False
+    x = i.get('op', _MISSING)
+    if x is not _MISSING and not (_v62(x)):
+        return False
+    x = i.get('href', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('contentType', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('contentCoding', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('subprotocol', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('security', _MISSING)
+    if x is not _MISSING and not (_v63(x)):
+        return False
+    x = i.get('scopes', _MISSING)
+    if x is not _MISSING and not (_v64(x)):
+        return False
+    x = i.get('response', _MISSING)
+    if x is not _MISSING and not (_v65(x)):
+        return False
+    x = i.get('additionalResponses', _MISSING)
+    if x is not _MISSING and not (_v66(x)):
+        return False
+    return True
+
+def _v66(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not (_v67(x)): return False
+    return True
+
+def _v67(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('contentType', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('schema', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('success', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    return True
+
+def _v65(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('contentType', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    return True
+
+def _v64(i):
+    if (_v68(i)) + ((isinstance(i, str))) != 1: return False
+    return True
+
+def _v68(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v63(i):
+    if (_v69(i)) + ((isinstance(i, str))) != 1: return False
+    return True
+
+def _v69(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v62(i):
+    if ((isinstance(i, str))) + (_v70(i)) != 1: return False
+    return True
+
+def _v70(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v60(i):
+    if ((isinstance(i, str)) and (isinstance(i, str) and i in _c16)) + (_v71(i)) != 1: return False
+    return True
+
+def _v71(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not ((isinstance(x, str)) and (isinstance(x, str) and x in _c16)): return False
+    return True
+
+def _v8(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not (_v72(x)): return False
+    return True
+
+def _v72(i):
+    if (_v73(i)) + (_v74(i)) != 1: return False
+    return True
+
+def _v74(i):
+    if not (_v75(i)): return False
+    if not (_v76(i)): return False
+    return True
+
+def _v76(i):
+    if (isinstance(i, dict)):
+        if 'rel' not in i: return False
+        x = i.get('rel', _MISSING)
+        if x is not _MISSING and not (x == 'icon'):
+            return False
+        x = i.get('sizes', _MISSING)
+        if x is not _MISSING and not (_v77(x)):
+            return False
+    return True
+
+def _v77(i):
+    if not (isinstance(i, str)): return False
+    if not _c17.search(i): return False
+    return True
+
+def _v75(i):
+    if not (isinstance(i, dict)): return False
+    if 'href' not in i: return False
+    x = i.get('href', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('rel', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('anchor', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    return True
+
+def _v73(i):
+    if not (_v75(i)): return False
+    if not (_v78(i)): return False
+    if not (_v79(i)): return False
+    return True
+
+def _v79(i):
+    if _v80(i): return False
+    return True
+
+def _v80(i):
+    if (isinstance(i, dict)):
+        if 'rel' not in i: return False
+        x = i.get('rel', _MISSING)
+        if x is not _MISSING and not ((isinstance(x, str) and x in _c18)):
+            return False
+    return True
+
+def _v78(i):
+    if _v81(i): return False
+    return True
+
+def _v81(i):
+    if not (isinstance(i, dict)): return False
+    if 'sizes' not in i: return False
+    return True
+
+def _v7(i):
+    if not (isinstance(i, dict)): return False
+    if 'instance' not in i: return False
+    x = i.get('instance', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    return True
+
+def _v6(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not ((isinstance(x, str))):
+            return False
+    return True
+
+def _v5(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v82(x)):
+            return False
+    return True
+
+def _v82(i):
+    if not (isinstance(i, dict)): return False
+    if 'forms' not in i: return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v17(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v6(x)):
+        return False
+    x = i.get('title', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('titles', _MISSING)
+    if x is not _MISSING and not (_v2(x)):
+        return False
+    x = i.get('forms', _MISSING)
+    if x is not _MISSING and not (_v83(x)):
+        return False
+    x = i.get('uriVariables', _MISSING)
+    if x is not _MISSING and not (_v84(x)):
+        return False
+    x = i.get('subscription', _MISSING)
+    if x is not _MISSING and not (_v26(x)):
+        return False
+    x = i.get('data', _MISSING)
+    if x is not _MISSING and not (_v26(x)):
+        return False
+    x = i.get('dataResponse', _MISSING)
+    if x is not _MISSING and not (_v26(x)):
+        return False
+    x = i.get('cancellation', _MISSING)
+    if x is not _MISSING and not (_v26(x)):
+        return False
+    return True
+
+def _v84(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v26(x)):
+            return False
+    return True
+
+def _v83(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not (_v85(x)): return False
+    return True
+
+def _v85(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('op', _MISSING)
+    if x is not _MISSING and not (_v86(x)):
+        return False
+    if not (_v61(i)): return False
+    return True
+
+def _v86(i):
+    if ((isinstance(i, str)) and (isinstance(i, str) and i in _c19)) + (_v87(i)) != 1: return False
+    return True
+
+def _v87(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not ((isinstance(x, str)) and (isinstance(x, str) and x in _c19)): return False
+    return True
+
+def _v4(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v88(x)):
+            return False
+    return True
+
+def _v88(i):
+    if not (isinstance(i, dict)): return False
+    if 'forms' not in i: return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v17(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v6(x)):
+        return False
+    x = i.get('title', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('titles', _MISSING)
+    if x is not _MISSING and not (_v2(x)):
+        return False
+    x = i.get('forms', _MISSING)
+    if x is not _MISSING and not (_v89(x)):
+        return False
+    x = i.get('uriVariables', _MISSING)
+    if x is not _MISSING and not (_v90(x)):
+        return False
+    x = i.get('input', _MISSING)
+    if x is not _MISSING and not (_v26(x)):
+        return False
+    x = i.get('output', _MISSING)
+    if x is not _MISSING and not (_v26(x)):
+        return False
+    x = i.get('safe', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('idempotent', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('synchronous', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    return True
+
+def _v90(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v26(x)):
+            return False
+    return True
+
+def _v89(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not (_v91(x)): return False
+    return True
+
+def _v91(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('op', _MISSING)
+    if x is not _MISSING and not (_v92(x)):
+        return False
+    if not (_v61(i)): return False
+    return True
+
+def _v92(i):
+    if ((isinstance(i, str)) and (isinstance(i, str) and i in _c20)) + (_v93(i)) != 1: return False
+    return True
+
+def _v93(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not ((isinstance(x, str)) and (isinstance(x, str) and x in _c20)): return False
+    return True
+
+def _v3(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v94(x)):
+            return False
+    return True
+
+def _v94(i):
+    if not (isinstance(i, dict)): return False
+    if 'forms' not in i: return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v17(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v6(x)):
+        return False
+    x = i.get('title', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('titles', _MISSING)
+    if x is not _MISSING and not (_v2(x)):
+        return False
+    x = i.get('forms', _MISSING)
+    if x is not _MISSING and not (_v95(x)):
+        return False
+    x = i.get('uriVariables', _MISSING)
+    if x is not _MISSING and not (_v96(x)):
+        return False
+    x = i.get('observable', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('writeOnly', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('readOnly', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    x = i.get('oneOf', _MISSING)
+    if x is not _MISSING and not (_v97(x)):
+        return False
+    x = i.get('unit', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v98(x)):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str)) and (isinstance(x, str) and x in _c1)):
+        return False
+    x = i.get('items', _MISSING)
+    if x is not _MISSING and not (_v99(x)):
+        return False
+    x = i.get('maxItems', _MISSING)
+    if x is not _MISSING and not (_v100(x)):
+        return False
+    x = i.get('minItems', _MISSING)
+    if x is not _MISSING and not (_v101(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('exclusiveMinimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('exclusiveMaximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v102(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v103(x)):
+        return False
+    x = i.get('multipleOf', _MISSING)
+    if x is not _MISSING and not (_v34(x)):
+        return False
+    x = i.get('properties', _MISSING)
+    if x is not _MISSING and not (_v104(x)):
+        return False
+    x = i.get('required', _MISSING)
+    if x is not _MISSING and not (_v105(x)):
+        return False
+    return True
+
+def _v105(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v104(i):
+    if (isinstance(i, dict)):
+        for k, x in i.items():
+            if k not in _c0 and not (_v26(x)):
+                return False
+    return True
+
+def _v103(i):
+    if not (((isinstance(i, int) and not isinstance(i, bool)) or (isinstance(i, float) and i.is_integer()))): return False
+    if i < 0: return False
+    return True
+
+def _v102(i):
+    if not (((isinstance(i, int) and not isinstance(i, bool)) or (isinstance(i, float) and i.is_integer()))): return False
+    if i < 0: return False
+    return True
+
+def _v101(i):
+    if not (((isinstance(i, int) and not isinstance(i, bool)) or (isinstance(i, float) and i.is_integer()))): return False
+    if i < 0: return False
+    return True
+
+def _v100(i):
+    if not (((isinstance(i, int) and not isinstance(i, bool)) or (isinstance(i, float) and i.is_integer()))): return False
+    if i < 0: return False
+    return True
+
+def _v99(i):
+    if (_v26(i)) + (_v106(i)) != 1: return False
+    return True
+
+def _v106(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not (_v26(x)): return False
+    return True
+
+def _v98(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    if not _unique(i): return False
+    return True
+
+def _v97(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not (_v26(x)): return False
+    return True
+
+def _v96(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not (_v26(x)):
+            return False
+    return True
+
+def _v95(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not (_v107(x)): return False
+    return True
+
+def _v107(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('op', _MISSING)
+    if x is not _MISSING and not (_v108(x)):
+        return False
+    if not (_v61(i)): return False
+    return True
+
+def _v108(i):
+    if ((isinstance(i, str)) and (isinstance(i, str) and i in _c21)) + (_v109(i)) != 1: return False
+    return True
+
+def _v109(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not ((isinstance(x, str)) and (isinstance(x, str) and x in _c21)): return False
+    return True
+
+def _v2(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c0 and not ((isinstance(x, str))):
+            return False
+    return True
+
+def _v1(i):
+    if not (isinstance(i, str)): return False
+    return True
+
+def _v110(i):
+    if not (isinstance(i, dict)): return False
+    if 'title' not in i: return False
+    if 'security' not in i: return False
+    if 'securityDefinitions' not in i: return False
+    if '@context' not in i: return False
+    x = i.get('id', _MISSING)
+    if x is not _MISSING and not (_v1(x)):
+        return False
+    x = i.get('title', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('titles', _MISSING)
+    if x is not _MISSING and not (_v2(x)):
+        return False
+    x = i.get('properties', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, dict))):
+        return False
+    x = i.get('actions', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, dict))):
+        return False
+    x = i.get('events', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, dict))):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v6(x)):
+        return False
+    x = i.get('version', _MISSING)
+    if x is not _MISSING and not (_v7(x)):
+        return False
+    x = i.get('links', _MISSING)
+    if x is not _MISSING and not (_v8(x)):
+        return False
+    x = i.get('forms', _MISSING)
+    if x is not _MISSING and not (_v9(x)):
+        return False
+    x = i.get('base', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('securityDefinitions', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('schemaDefinitions', _MISSING)
+    if x is not _MISSING and not (_v11(x)):
+        return False
+    x = i.get('support', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('created', _MISSING)
+    if x is not _MISSING and not (_v12(x)):
+        return False
+    x = i.get('modified', _MISSING)
+    if x is not _MISSING and not (_v13(x)):
+        return False
+    x = i.get('profile', _MISSING)
+    if x is not _MISSING and not (_v14(x)):
+        return False
+    x = i.get('security', _MISSING)
+    if x is not _MISSING and not (_v15(x)):
+        return False
+    x = i.get('uriVariables', _MISSING)
+    if x is not _MISSING and not (_v16(x)):
+        return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v17(x)):
+        return False
+    x = i.get('@context', _MISSING)
+    if x is not _MISSING and not (_v18(x)):
+        return False
+    return True
+
+
+is_valid = _v0
+fragments = {
+    'property_element': _v94,
+    'action_element': _v88,
+    'event_element': _v82,
+    'dataSchema': _v26,
+    'skeleton': _v110,
+}
@@ -0,0 +1,1799 @@
+# Generated from tm_schema.py by the schema compiler in
+# sdf_wot_converter/validation/compiler.py. Do not edit this file manually;
+# run `python -m sdf_wot_converter.validation.compiler` instead.
+import re
+
+from .compiler import _equal, _in_enum, _multiple_of, _unique
+
+_MISSING = object()
+_c0 = re.compile('^.*[{]{2}[ -~]+[}]{2}.*$')
+_c1 = frozenset([])
+_c2 = frozenset(['array', 'boolean', 'integer', 'null', 'number', 'object', 'string'])
+_c3 = re.compile('.+:.*')
+_c4 = frozenset(['client', 'code', 'device'])
+_c5 = frozenset(['oauth2'])
+_c6 = frozenset(['psk'])
+_c7 = frozenset(['auto', 'body', 'cookie', 'header', 'query'])
+_c8 = frozenset(['bearer'])
+_c9 = frozenset(['body', 'cookie', 'header', 'query'])
+_c10 = frozenset(['apikey'])
+_c11 = frozenset(['auth', 'auth-int'])
+_c12 = frozenset(['digest'])
+_c13 = frozenset(['basic'])
+_c14 = frozenset(['combo'])
+_c15 = frozenset(['auto'])
+_c16 = frozenset(['nosec'])
+_c17 = frozenset(['observeallproperties', 'queryallactions', 'readallproperties', 'readmultipleproperties', 'subscribeallevents', 'unobserveallproperties', 'unsubscribeallevents', 'writeallproperties', 'writemultipleproperties'])
+_c18 = re.compile('[0-9]*x[0-9]+')
+_c19 = frozenset(['icon'])
+_c20 = frozenset(['subscribeevent', 'unsubscribeevent'])
+_c21 = frozenset(['cancelaction', 'invokeaction', 'queryaction'])
+_c22 = frozenset(['observeproperty', 'readproperty', 'unobserveproperty', 'writeproperty'])
+
+
+def _v0(i):
+    if not (isinstance(i, dict)): return False
+    if '@context' not in i: return False
+    if '@type' not in i: return False
+    x = i.get('id', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('title', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('titles', _MISSING)
+    if x is not _MISSING and not (_v1(x)):
+        return False
+    x = i.get('properties', _MISSING)
+    if x is not _MISSING and not (_v2(x)):
+        return False
+    x = i.get('actions', _MISSING)
+    if x is not _MISSING and not (_v3(x)):
+        return False
+    x = i.get('events', _MISSING)
+    if x is not _MISSING and not (_v4(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v5(x)):
+        return False
+    x = i.get('version', _MISSING)
+    if x is not _MISSING and not (_v6(x)):
+        return False
+    x = i.get('links', _MISSING)
+    if x is not _MISSING and not (_v7(x)):
+        return False
+    x = i.get('forms', _MISSING)
+    if x is not _MISSING and not (_v8(x)):
+        return False
+    x = i.get('base', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('securityDefinitions', _MISSING)
+    if x is not _MISSING and not (_v9(x)):
+        return False
+    x = i.get('schemaDefinitions', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('support', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('created', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('modified', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('profile', _MISSING)
+    if x is not _MISSING and not (_v11(x)):
+        return False
+    x = i.get('security', _MISSING)
+    if x is not _MISSING and not (_v12(x)):
+        return False
+    x = i.get('uriVariables', _MISSING)
+    if x is not _MISSING and not (_v13(x)):
+        return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v14(x)):
+        return False
+    x = i.get('@context', _MISSING)
+    if x is not _MISSING and not (_v15(x)):
+        return False
+    x = i.get('tm:required', _MISSING)
+    if x is not _MISSING and not (_v16(x)):
+        return False
+    for k in i:
+        if not (_v17(k)): return False
+    return True
+
+def _v17(i):
+    if _v18(i): return False
+    return True
+
+def _v18(i):
+    if not (isinstance(i, str)): return False
+    if not _c0.search(i): return False
+    return True
+
+def _v16(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not (_v19(x)): return False
+    return True
+
+def _v19(i):
+    if not (isinstance(i, str)): return False
+    return True
+
+def _v15(i):
+    if not (_v20(i) or (isinstance(i, str)) and i == 'https://www.w3.org/2022/wot/td/v1.1' or _v21(i) or _v22(i) or (isinstance(i, str)) and i == 'https://www.w3.org/2019/wot/td/v1'): return False
+    return True
+
+def _v22(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    if not any((isinstance(x, str)) and x == 'https://www.w3.org/2019/wot/td/v1' for x in i): return False
+    return True
+
+def _v21(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 2: return False
+    if not any((isinstance(x, str)) and x == 'https://www.w3.org/2022/wot/td/v1.1' for x in i): return False
+    return True
+
+def _v20(i):
+    if not (isinstance(i, list)): return False
+    if len(i) > 0:
+        x = i[0]
+        if not ((isinstance(x, str)) and x == 'https://www.w3.org/2022/wot/td/v1.1'): return False
+    for x in i[1:]:
+        if not (_v23(x)): return False
+    return True
+
+def _v23(i):
+    if not ((isinstance(i, str)) or (isinstance(i, dict))): return False
+    if (isinstance(i, str)) and i == 'https://www.w3.org/2019/wot/td/v1': return False
+    return True
+
+def _v14(i):
+    if ((isinstance(i, str)) and i == 'tm:ThingModel') + (_v24(i)) != 1: return False
+    return True
+
+def _v24(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    if not any(x == 'tm:ThingModel' for x in i): return False
+    return True
+
+def _v13(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v25(x)):
+            return False
+    for k in i:
+        if not (_v26(k)): return False
+    return True
+
+def _v26(i):
+    if _v18(i): return False
+    return True
+
+def _v25(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v27(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('title', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v5(x)):
+        return False
+    x = i.get('titles', _MISSING)
+    if x is not _MISSING and not (_v1(x)):
+        return False
+    x = i.get('writeOnly', _MISSING)
+    if x is not _MISSING and not (_v28(x)):
+        return False
+    x = i.get('readOnly', _MISSING)
+    if x is not _MISSING and not (_v29(x)):
+        return False
+    x = i.get('oneOf', _MISSING)
+    if x is not _MISSING and not (_v30(x)):
+        return False
+    x = i.get('unit', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v31(x)):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('contentEncoding', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('contentMediaType', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not (_v32(x)):
+        return False
+    x = i.get('items', _MISSING)
+    if x is not _MISSING and not (_v33(x)):
+        return False
+    x = i.get('maxItems', _MISSING)
+    if x is not _MISSING and not (_v34(x)):
+        return False
+    x = i.get('minItems', _MISSING)
+    if x is not _MISSING and not (_v35(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (_v36(x)):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (_v37(x)):
+        return False
+    x = i.get('exclusiveMinimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('exclusiveMaximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v38(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v39(x)):
+        return False
+    x = i.get('multipleOf', _MISSING)
+    if x is not _MISSING and not (_v40(x)):
+        return False
+    x = i.get('properties', _MISSING)
+    if x is not _MISSING and not (_v41(x)):
+        return False
+    x = i.get('required', _MISSING)
+    if x is not _MISSING and not (_v42(x)):
+        return False
+    x = i.get('tm:ref', _MISSING)
+    if x is not _MISSING and not (_v43(x)):
+        return False
+    for k in i:
+        if not (_v44(k)): return False
+    return True
+
+def _v44(i):
+    if _v18(i): return False
+    return True
+
+def _v43(i):
+    if not (isinstance(i, str)): return False
+    return True
+
+def _v42(i):
+    if not (_v45(i) or _v18(i)): return False
+    return True
+
+def _v45(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v41(i):
+    if (isinstance(i, dict)):
+        for k, x in i.items():
+            if k not in _c1 and not (_v25(x)):
+                return False
+    return True
+
+def _v40(i):
+    if not (_v46(i) or _v18(i)): return False
+    return True
+
+def _v46(i):
+    if not (((isinstance(i, int) and not isinstance(i, bool)) or (isinstance(i, float) and i.is_integer())) or (isinstance(i, (int, float)) and not isinstance(i, bool))): return False
+    if ((isinstance(i, (int, float)) and not isinstance(i, bool))):
+        if i <= 0: return False
+    return True
+
+def _v39(i):
+    if not (_v47(i) or _v18(i)): return False
+    return True
+
+def _v47(i):
+    if not (((isinstance(i, int) and not isinstance(i, bool)) or (isinstance(i, float) and i.is_integer()))): return False
+    if i < 0: return False
+    return True
+
+def _v38(i):
+    if not (_v48(i) or _v18(i)): return False
+    return True
+
+def _v48(i):
+    if not (((isinstance(i, int) and not isinstance(i, bool)) or (isinstance(i, float) and i.is_integer()))): return False
+    if i < 0: return False
+    return True
+
+def _v37(i):
+    if not (((isinstance(i, (int, float)) and not isinstance(i, bool))) or _v18(i)): return False
+    return True
+
+def _v36(i):
+    if not (((isinstance(i, (int, float)) and not isinstance(i, bool))) or _v18(i)): return False
+    return True
+
+def _v35(i):
+    if not (_v49(i) or _v18(i)): return False
+    return True
+
+def _v49(i):
+    if not (((isinstance(i, int) and not isinstance(i, bool)) or (isinstance(i, float) and i.is_integer()))): return False
+    if i < 0: return False
+    return True
+
+def _v34(i):
+    if not (_v50(i) or _v18(i)): return False
+    return True
+
+def _v50(i):
+    if not (((isinstance(i, int) and not isinstance(i, bool)) or (isinstance(i, float) and i.is_integer()))): return False
+    if i < 0: return False
+    return True
+
+def _v33(i):
+    if (_v25(i)) + (_v51(i)) != 1: return False
+    return True
+
+def _v51(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not (_v25(x)): return False
+    return True
+
+def _v32(i):
+    if not (isinstance(i, str)): return False
+    if not ((isinstance(i, str) and i in _c2) or _v18(i)): return False
+    return True
+
+def _v31(i):
+    if not (_v52(i) or _v18(i)): return False
+    return True
+
+def _v52(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    if not _unique(i): return False
+    return True
+
+def _v30(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not (_v25(x)): return False
+    return True
+
+def _v29(i):
+    if not ((isinstance(i, bool)) or _v18(i)): return False
+    return True
+
+def _v28(i):
+    if not ((isinstance(i, bool)) or _v18(i)): return False
+    return True
+
+def _v27(i):
+    if ((isinstance(i, str))) + (_v53(i)) != 1: return False
+    return True
+
+def _v53(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v12(i):
+    if ((isinstance(i, str))) + (_v54(i)) != 1: return False
+    return True
+
+def _v54(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v11(i):
+    if ((isinstance(i, str))) + (_v55(i)) != 1: return False
+    return True
+
+def _v55(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v10(i):
+    if not (isinstance(i, dict)): return False
+    if len(i) < 1: return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v25(x)):
+            return False
+    for k in i:
+        if not (_v56(k)): return False
+    return True
+
+def _v56(i):
+    if _v18(i): return False
+    return True
+
+def _v9(i):
+    if not (isinstance(i, dict)): return False
+    if len(i) < 1: return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v57(x)):
+            return False
+    for k in i:
+        if not (_v58(k)): return False
+    return True
+
+def _v58(i):
+    if _v18(i): return False
+    return True
+
+def _v57(i):
+    if not (_v59(i) or _v60(i) or _v61(i) or _v62(i) or _v63(i) or _v64(i) or _v65(i) or _v66(i) or _v67(i) or _v68(i)): return False
+    return True
+
+def _v68(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v27(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v5(x)):
+        return False
+    x = i.get('proxy', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('scheme', _MISSING)
+    if x is not _MISSING and not (_v69(x)):
+        return False
+    for k in i:
+        if not (_v70(k)): return False
+    return True
+
+def _v70(i):
+    if _v18(i): return False
+    return True
+
+def _v69(i):
+    if not (isinstance(i, str)): return False
+    if not _c3.search(i): return False
+    return True
+
+def _v67(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v27(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v5(x)):
+        return False
+    x = i.get('proxy', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('scheme', _MISSING)
+    if x is not _MISSING and not (_v71(x)):
+        return False
+    x = i.get('authorization', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('token', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('refresh', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('scopes', _MISSING)
+    if x is not _MISSING and not (_v72(x)):
+        return False
+    x = i.get('flow', _MISSING)
+    if x is not _MISSING and not (_v73(x)):
+        return False
+    x = i.get('tm:ref', _MISSING)
+    if x is not _MISSING and not (_v43(x)):
+        return False
+    for k in i:
+        if not (_v74(k)): return False
+    return True
+
+def _v74(i):
+    if _v18(i): return False
+    return True
+
+def _v73(i):
+    if not ((isinstance(i, str)) or _v75(i)): return False
+    return True
+
+def _v75(i):
+    if not (isinstance(i, str)): return False
+    if not ((isinstance(i, str) and i in _c4) or _v18(i)): return False
+    return True
+
+def _v72(i):
+    if (_v76(i)) + ((isinstance(i, str))) != 1: return False
+    return True
+
+def _v76(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v71(i):
+    if not (isinstance(i, str)): return False
+    if not ((isinstance(i, str) and i in _c5) or _v18(i)): return False
+    return True
+
+def _v66(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v27(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v5(x)):
+        return False
+    x = i.get('proxy', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('scheme', _MISSING)
+    if x is not _MISSING and not (_v77(x)):
+        return False
+    x = i.get('identity', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('tm:ref', _MISSING)
+    if x is not _MISSING and not (_v43(x)):
+        return False
+    for k in i:
+        if not (_v78(k)): return False
+    return True
+
+def _v78(i):
+    if _v18(i): return False
+    return True
+
+def _v77(i):
+    if not (isinstance(i, str)): return False
+    if not ((isinstance(i, str) and i in _c6) or _v18(i)): return False
+    return True
+
+def _v65(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v27(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v5(x)):
+        return False
+    x = i.get('proxy', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('scheme', _MISSING)
+    if x is not _MISSING and not (_v79(x)):
+        return False
+    x = i.get('authorization', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('alg', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('in', _MISSING)
+    if x is not _MISSING and not (_v80(x)):
+        return False
+    x = i.get('name', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('tm:ref', _MISSING)
+    if x is not _MISSING and not (_v43(x)):
+        return False
+    for k in i:
+        if not (_v81(k)): return False
+    return True
+
+def _v81(i):
+    if _v18(i): return False
+    return True
+
+def _v80(i):
+    if not (isinstance(i, str)): return False
+    if not ((isinstance(i, str) and i in _c7) or _v18(i)): return False
+    return True
+
+def _v79(i):
+    if not (isinstance(i, str)): return False
+    if not ((isinstance(i, str) and i in _c8) or _v18(i)): return False
+    return True
+
+def _v64(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v27(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v5(x)):
+        return False
+    x = i.get('proxy', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('scheme', _MISSING)
+    if x is not _MISSING and not (_v82(x)):
+        return False
+    x = i.get('in', _MISSING)
+    if x is not _MISSING and not (_v83(x)):
+        return False
+    x = i.get('name', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('tm:ref', _MISSING)
+    if x is not _MISSING and not (_v43(x)):
+        return False
+    for k in i:
+        if not (_v84(k)): return False
+    return True
+
+def _v84(i):
+    if _v18(i): return False
+    return True
+
+def _v83(i):
+    if not (isinstance(i, str)): return False
+    if not ((isinstance(i, str) and i in _c9) or _v18(i)): return False
+    return True
+
+def _v82(i):
+    if not (isinstance(i, str)): return False
+    if not ((isinstance(i, str) and i in _c10) or _v18(i)): return False
+    return True
+
+def _v63(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v27(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v5(x)):
+        return False
+    x = i.get('proxy', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('scheme', _MISSING)
+    if x is not _MISSING and not (_v85(x)):
+        return False
+    x = i.get('qop', _MISSING)
+    if x is not _MISSING and not (_v86(x)):
+        return False
+    x = i.get('in', _MISSING)
+    if x is not _MISSING and not (_v87(x)):
+        return False
+    x = i.get('name', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('tm:ref', _MISSING)
+    if x is not _MISSING and not (_v43(x)):
+        return False
+    for k in i:
+        if not (_v88(k)): return False
+    return True
+
+def _v88(i):
+    if _v18(i): return False
+    return True
+
+def _v87(i):
+    if not (isinstance(i, str)): return False
+    if not ((isinstance(i, str) and i in _c7) or _v18(i)): return False
+    return True
+
+def _v86(i):
+    if not (isinstance(i, str)): return False
+    if not ((isinstance(i, str) and i in _c11) or _v18(i)): return False
+    return True
+
+def _v85(i):
+    if not (isinstance(i, str)): return False
+    if not ((isinstance(i, str) and i in _c12) or _v18(i)): return False
+    return True
+
+def _v62(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v27(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v5(x)):
+        return False
+    x = i.get('proxy', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('scheme', _MISSING)
+    if x is not _MISSING and not (_v89(x)):
+        return False
+    x = i.get('in', _MISSING)
+    if x is not _MISSING and not (_v90(x)):
+        return False
+    x = i.get('name', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('tm:ref', _MISSING)
+    if x is not _MISSING and not (_v43(x)):
+        return False
+    for k in i:
+        if not (_v91(k)): return False
+    return True
+
+def _v91(i):
+    if _v18(i): return False
+    return True
+
+def _v90(i):
+    if not (isinstance(i, str)): return False
+    if not ((isinstance(i, str) and i in _c7) or _v18(i)): return False
+    return True
+
+def _v89(i):
+    if not (isinstance(i, str)): return False
+    if not ((isinstance(i, str) and i in _c13) or _v18(i)): return False
+    return True
+
+def _v61(i):
+    if (_v92(i)) + (_v93(i)) != 1: return False
+    return True
+
+def _v93(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v27(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v5(x)):
+        return False
+    x = i.get('proxy', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('scheme', _MISSING)
+    if x is not _MISSING and not (_v94(x)):
+        return False
+    x = i.get('allOf', _MISSING)
+    if x is not _MISSING and not (_v95(x)):
+        return False
+    x = i.get('tm:ref', _MISSING)
+    if x is not _MISSING and not (_v43(x)):
+        return False
+    return True
+
+def _v95(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 2: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v94(i):
+    if not (isinstance(i, str)): return False
+    if not ((isinstance(i, str) and i in _c14) or _v18(i)): return False
+    return True
+
+def _v92(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v27(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v5(x)):
+        return False
+    x = i.get('proxy', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('scheme', _MISSING)
+    if x is not _MISSING and not (_v96(x)):
+        return False
+    x = i.get('oneOf', _MISSING)
+    if x is not _MISSING and not (_v97(x)):
+        return False
+    x = i.get('tm:ref', _MISSING)
+    if x is not _MISSING and not (_v43(x)):
+        return False
+    return True
+
+def _v97(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 2: return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v96(i):
+    if not (isinstance(i, str)): return False
+    if not ((isinstance(i, str) and i in _c14) or _v18(i)): return False
+    return True
+
+def _v60(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v27(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v5(x)):
+        return False
+    x = i.get('proxy', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('scheme', _MISSING)
+    if x is not _MISSING and not (_v98(x)):
+        return False
+    for k in i:
+        if not (_v99(k)): return False
+    return True
+
+def _v99(i):
+    if _v18(i): return False
+    return True
+
+def _v98(i):
+    if not (isinstance(i, str)): return False
+    if not ((isinstance(i, str) and i in _c15) or _v18(i)): return False
+    return True
+
+def _v59(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v27(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v5(x)):
+        return False
+    x = i.get('proxy', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('scheme', _MISSING)
+    if x is not _MISSING and not (_v100(x)):
+        return False
+    x = i.get('tm:ref', _MISSING)
+    if x is not _MISSING and not (_v43(x)):
+        return False
+    for k in i:
+        if not (_v101(k)): return False
+    return True
+
+def _v101(i):
+    if _v18(i): return False
+    return True
+
+def _v100(i):
+    if not (isinstance(i, str)): return False
+    if not ((isinstance(i, str) and i in _c16) or _v18(i)): return False
+    return True
+
+def _v8(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not (_v102(x)): return False
+    return True
+
+def _v102(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('op', _MISSING)
+    if x is not _MISSING and not (_v103(x)):
+        return False
+    x = i.get('tm:ref', _MISSING)
+    if x is not _MISSING and not (_v43(x)):
+        return False
+    for k in i:
+        if not (_v104(k)): return False
+    if not (_v105(i)): return False
+    return True
+
+def _v105(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('op', _MISSING)
+    if x is not _MISSING and not (_v106(x)):
+        return False
+    x = i.get('href', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('contentType', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('contentCoding', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('subprotocol', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('security', _MISSING)
+    if x is not _MISSING and not (_v107(x)):
+        return False
+    x = i.get('scopes', _MISSING)
+    if x is not _MISSING and not (_v108(x)):
+        return False
+    x = i.get('response', _MISSING)
+    if x is not _MISSING and not (_v109(x)):
+        return False
+    x = i.get('additionalResponses', _MISSING)
+    if x is not _MISSING and not (_v110(x)):
+        return False
+    for k in i:
+        if not (_v111(k)): return False
+    return True
+
+def _v111(i):
+    if _v18(i): return False
+    return True
+
+def _v110(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not (_v112(x)): return False
+    return True
+
+def _v112(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('contentType', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('schema', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('success', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, bool))):
+        return False
+    return True
+
+def _v109(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('contentType', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    for k in i:
+        if not (_v113(k)): return False
+    return True
+
+def _v113(i):
+    if _v18(i): return False
+    return True
+
+def _v108(i):
+    if (_v114(i)) + ((isinstance(i, str))) != 1: return False
+    return True
+
+def _v114(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v107(i):
+    if (_v115(i)) + ((isinstance(i, str))) != 1: return False
+    return True
+
+def _v115(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v106(i):
+    if ((isinstance(i, str))) + (_v116(i)) != 1: return False
+    return True
+
+def _v116(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v104(i):
+    if _v18(i): return False
+    return True
+
+def _v103(i):
+    if (_v117(i)) + (_v118(i)) != 1: return False
+    return True
+
+def _v118(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not (_v119(x)): return False
+    return True
+
+def _v119(i):
+    if not (isinstance(i, str)): return False
+    if not ((isinstance(i, str) and i in _c17) or _v18(i)): return False
+    return True
+
+def _v117(i):
+    if not (isinstance(i, str)): return False
+    if not ((isinstance(i, str) and i in _c17) or _v18(i)): return False
+    return True
+
+def _v7(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not (_v120(x)): return False
+    return True
+
+def _v120(i):
+    if (_v121(i)) + (_v122(i)) != 1: return False
+    return True
+
+def _v122(i):
+    if not (_v123(i)): return False
+    if not (_v124(i)): return False
+    return True
+
+def _v124(i):
+    if (isinstance(i, dict)):
+        if 'rel' not in i: return False
+        x = i.get('rel', _MISSING)
+        if x is not _MISSING and not (x == 'icon'):
+            return False
+        x = i.get('sizes', _MISSING)
+        if x is not _MISSING and not (_v125(x)):
+            return False
+    return True
+
+def _v125(i):
+    if not (isinstance(i, str)): return False
+    if not _c18.search(i): return False
+    return True
+
+def _v123(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('href', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('rel', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('anchor', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    for k in i:
+        if not (_v126(k)): return False
+    return True
+
+def _v126(i):
+    if _v18(i): return False
+    return True
+
+def _v121(i):
+    if not (_v123(i)): return False
+    if not (_v127(i)): return False
+    if not (_v128(i)): return False
+    return True
+
+def _v128(i):
+    if _v129(i): return False
+    return True
+
+def _v129(i):
+    if (isinstance(i, dict)):
+        if 'rel' not in i: return False
+        x = i.get('rel', _MISSING)
+        if x is not _MISSING and not (_v130(x)):
+            return False
+    return True
+
+def _v130(i):
+    if not ((isinstance(i, str) and i in _c19) or _v18(i)): return False
+    return True
+
+def _v127(i):
+    if _v131(i): return False
+    return True
+
+def _v131(i):
+    if not (isinstance(i, dict)): return False
+    if 'sizes' not in i: return False
+    return True
+
+def _v6(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('instance', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    for k in i:
+        if not (_v132(k)): return False
+    return True
+
+def _v132(i):
+    if _v18(i): return False
+    return True
+
+def _v5(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not ((isinstance(x, str))):
+            return False
+    for k in i:
+        if not (_v133(k)): return False
+    return True
+
+def _v133(i):
+    if _v18(i): return False
+    return True
+
+def _v4(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v134(x)):
+            return False
+    for k in i:
+        if not (_v135(k)): return False
+    return True
+
+def _v135(i):
+    if _v18(i): return False
+    return True
+
+def _v134(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v27(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v5(x)):
+        return False
+    x = i.get('title', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('titles', _MISSING)
+    if x is not _MISSING and not (_v1(x)):
+        return False
+    x = i.get('forms', _MISSING)
+    if x is not _MISSING and not (_v136(x)):
+        return False
+    x = i.get('uriVariables', _MISSING)
+    if x is not _MISSING and not (_v137(x)):
+        return False
+    x = i.get('subscription', _MISSING)
+    if x is not _MISSING and not (_v25(x)):
+        return False
+    x = i.get('data', _MISSING)
+    if x is not _MISSING and not (_v25(x)):
+        return False
+    x = i.get('dataResponse', _MISSING)
+    if x is not _MISSING and not (_v25(x)):
+        return False
+    x = i.get('cancellation', _MISSING)
+    if x is not _MISSING and not (_v25(x)):
+        return False
+    x = i.get('tm:ref', _MISSING)
+    if x is not _MISSING and not (_v43(x)):
+        return False
+    for k in i:
+        if not (_v138(k)): return False
+    return True
+
+def _v138(i):
+    if _v18(i): return False
+    return True
+
+def _v137(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v25(x)):
+            return False
+    for k in i:
+        if not (_v139(k)): return False
+    return True
+
+def _v139(i):
+    if _v18(i): return False
+    return True
+
+def _v136(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not (_v140(x)): return False
+    return True
+
+def _v140(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('op', _MISSING)
+    if x is not _MISSING and not (_v141(x)):
+        return False
+    x = i.get('tm:ref', _MISSING)
+    if x is not _MISSING and not (_v43(x)):
+        return False
+    for k in i:
+        if not (_v142(k)): return False
+    if not (_v105(i)): return False
+    return True
+
+def _v142(i):
+    if _v18(i): return False
+    return True
+
+def _v141(i):
+    if (_v143(i)) + (_v144(i)) != 1: return False
+    return True
+
+def _v144(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not (_v145(x)): return False
+    return True
+
+def _v145(i):
+    if not (isinstance(i, str)): return False
+    if not ((isinstance(i, str) and i in _c20) or _v18(i)): return False
+    return True
+
+def _v143(i):
+    if not (isinstance(i, str)): return False
+    if not ((isinstance(i, str) and i in _c20) or _v18(i)): return False
+    return True
+
+def _v3(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v146(x)):
+            return False
+    for k in i:
+        if not (_v147(k)): return False
+    return True
+
+def _v147(i):
+    if _v18(i): return False
+    return True
+
+def _v146(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v27(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v5(x)):
+        return False
+    x = i.get('title', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('titles', _MISSING)
+    if x is not _MISSING and not (_v1(x)):
+        return False
+    x = i.get('forms', _MISSING)
+    if x is not _MISSING and not (_v148(x)):
+        return False
+    x = i.get('uriVariables', _MISSING)
+    if x is not _MISSING and not (_v149(x)):
+        return False
+    x = i.get('input', _MISSING)
+    if x is not _MISSING and not (_v25(x)):
+        return False
+    x = i.get('output', _MISSING)
+    if x is not _MISSING and not (_v25(x)):
+        return False
+    x = i.get('safe', _MISSING)
+    if x is not _MISSING and not (_v150(x)):
+        return False
+    x = i.get('idempotent', _MISSING)
+    if x is not _MISSING and not (_v151(x)):
+        return False
+    x = i.get('synchronous', _MISSING)
+    if x is not _MISSING and not (_v152(x)):
+        return False
+    x = i.get('tm:ref', _MISSING)
+    if x is not _MISSING and not (_v43(x)):
+        return False
+    for k in i:
+        if not (_v153(k)): return False
+    return True
+
+def _v153(i):
+    if _v18(i): return False
+    return True
+
+def _v152(i):
+    if not ((isinstance(i, bool)) or _v18(i)): return False
+    return True
+
+def _v151(i):
+    if not ((isinstance(i, bool)) or _v18(i)): return False
+    return True
+
+def _v150(i):
+    if not ((isinstance(i, bool)) or _v18(i)): return False
+    return True
+
+def _v149(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v25(x)):
+            return False
+    for k in i:
+        if not (_v154(k)): return False
+    return True
+
+def _v154(i):
+    if _v18(i): return False
+    return True
+
+def _v148(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not (_v155(x)): return False
+    return True
+
+def _v155(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('op', _MISSING)
+    if x is not _MISSING and not (_v156(x)):
+        return False
+    x = i.get('tm:ref', _MISSING)
+    if x is not _MISSING and not (_v43(x)):
+        return False
+    for k in i:
+        if not (_v157(k)): return False
+    if not (_v105(i)): return False
+    return True
+
+def _v157(i):
+    if _v18(i): return False
+    return True
+
+def _v156(i):
+    if (_v158(i)) + (_v159(i)) != 1: return False
+    return True
+
+def _v159(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not (_v160(x)): return False
+    return True
+
+def _v160(i):
+    if not (isinstance(i, str)): return False
+    if not ((isinstance(i, str) and i in _c21) or _v18(i)): return False
+    return True
+
+def _v158(i):
+    if not (isinstance(i, str)): return False
+    if not ((isinstance(i, str) and i in _c21) or _v18(i)): return False
+    return True
+
+def _v2(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v161(x)):
+            return False
+    for k in i:
+        if not (_v162(k)): return False
+    return True
+
+def _v162(i):
+    if _v18(i): return False
+    return True
+
+def _v161(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v27(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v5(x)):
+        return False
+    x = i.get('title', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('titles', _MISSING)
+    if x is not _MISSING and not (_v1(x)):
+        return False
+    x = i.get('forms', _MISSING)
+    if x is not _MISSING and not (_v163(x)):
+        return False
+    x = i.get('uriVariables', _MISSING)
+    if x is not _MISSING and not (_v164(x)):
+        return False
+    x = i.get('observable', _MISSING)
+    if x is not _MISSING and not (_v165(x)):
+        return False
+    x = i.get('writeOnly', _MISSING)
+    if x is not _MISSING and not (_v166(x)):
+        return False
+    x = i.get('readOnly', _MISSING)
+    if x is not _MISSING and not (_v167(x)):
+        return False
+    x = i.get('oneOf', _MISSING)
+    if x is not _MISSING and not (_v168(x)):
+        return False
+    x = i.get('unit', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('enum', _MISSING)
+    if x is not _MISSING and not (_v169(x)):
+        return False
+    x = i.get('format', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('type', _MISSING)
+    if x is not _MISSING and not (_v32(x)):
+        return False
+    x = i.get('items', _MISSING)
+    if x is not _MISSING and not (_v170(x)):
+        return False
+    x = i.get('maxItems', _MISSING)
+    if x is not _MISSING and not (_v171(x)):
+        return False
+    x = i.get('minItems', _MISSING)
+    if x is not _MISSING and not (_v172(x)):
+        return False
+    x = i.get('minimum', _MISSING)
+    if x is not _MISSING and not (_v173(x)):
+        return False
+    x = i.get('maximum', _MISSING)
+    if x is not _MISSING and not (_v174(x)):
+        return False
+    x = i.get('exclusiveMinimum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('exclusiveMaximum', _MISSING)
+    if x is not _MISSING and not (((isinstance(x, (int, float)) and not isinstance(x, bool)))):
+        return False
+    x = i.get('minLength', _MISSING)
+    if x is not _MISSING and not (_v175(x)):
+        return False
+    x = i.get('maxLength', _MISSING)
+    if x is not _MISSING and not (_v176(x)):
+        return False
+    x = i.get('multipleOf', _MISSING)
+    if x is not _MISSING and not (_v40(x)):
+        return False
+    x = i.get('properties', _MISSING)
+    if x is not _MISSING and not (_v177(x)):
+        return False
+    x = i.get('required', _MISSING)
+    if x is not _MISSING and not (_v178(x)):
+        return False
+    x = i.get('tm:ref', _MISSING)
+    if x is not _MISSING and not (_v43(x)):
+        return False
+    for k in i:
+        if not (_v179(k)): return False
+    return True
+
+def _v179(i):
+    if _v18(i): return False
+    return True
+
+def _v178(i):
+    if not (_v180(i) or _v18(i)): return False
+    return True
+
+def _v180(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not ((isinstance(x, str))): return False
+    return True
+
+def _v177(i):
+    if (isinstance(i, dict)):
+        for k, x in i.items():
+            if k not in _c1 and not (_v25(x)):
+                return False
+    return True
+
+def _v176(i):
+    if not (_v181(i) or _v18(i)): return False
+    return True
+
+def _v181(i):
+    if not (((isinstance(i, int) and not isinstance(i, bool)) or (isinstance(i, float) and i.is_integer()))): return False
+    if i < 0: return False
+    return True
+
+def _v175(i):
+    if not (_v182(i) or _v18(i)): return False
+    return True
+
+def _v182(i):
+    if not (((isinstance(i, int) and not isinstance(i, bool)) or (isinstance(i, float) and i.is_integer()))): return False
+    if i < 0: return False
+    return True
+
+def _v174(i):
+    if not (((isinstance(i, (int, float)) and not isinstance(i, bool))) or _v18(i)): return False
+    return True
+
+def _v173(i):
+    if not (((isinstance(i, (int, float)) and not isinstance(i, bool))) or _v18(i)): return False
+    return True
+
+def _v172(i):
+    if not (_v183(i) or _v18(i)): return False
+    return True
+
+def _v183(i):
+    if not (((isinstance(i, int) and not isinstance(i, bool)) or (isinstance(i, float) and i.is_integer()))): return False
+    if i < 0: return False
+    return True
+
+def _v171(i):
+    if not (_v184(i) or _v18(i)): return False
+    return True
+
+def _v184(i):
+    if not (((isinstance(i, int) and not isinstance(i, bool)) or (isinstance(i, float) and i.is_integer()))): return False
+    if i < 0: return False
+    return True
+
+def _v170(i):
+    if (_v25(i)) + (_v185(i)) != 1: return False
+    return True
+
+def _v185(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not (_v25(x)): return False
+    return True
+
+def _v169(i):
+    if not (_v186(i) or _v18(i)): return False
+    return True
+
+def _v186(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    if not _unique(i): return False
+    return True
+
+def _v168(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not (_v25(x)): return False
+    return True
+
+def _v167(i):
+    if not ((isinstance(i, bool)) or _v18(i)): return False
+    return True
+
+def _v166(i):
+    if not ((isinstance(i, bool)) or _v18(i)): return False
+    return True
+
+def _v165(i):
+    if not ((isinstance(i, bool)) or _v18(i)): return False
+    return True
+
+def _v164(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not (_v25(x)):
+            return False
+    for k in i:
+        if not (_v187(k)): return False
+    return True
+
+def _v187(i):
+    if _v18(i): return False
+    return True
+
+def _v163(i):
+    if not (isinstance(i, list)): return False
+    if len(i) < 1: return False
+    for x in i:
+        if not (_v188(x)): return False
+    return True
+
+def _v188(i):
+    if not (isinstance(i, dict)): return False
+    x = i.get('op', _MISSING)
+    if x is not _MISSING and not (_v189(x)):
+        return False
+    x = i.get('tm:ref', _MISSING)
+    if x is not _MISSING and not (_v43(x)):
+        return False
+    for k in i:
+        if not (_v190(k)): return False
+    if not (_v105(i)): return False
+    return True
+
+def _v190(i):
+    if _v18(i): return False
+    return True
+
+def _v189(i):
+    if (_v191(i)) + (_v192(i)) != 1: return False
+    return True
+
+def _v192(i):
+    if not (isinstance(i, list)): return False
+    for x in i:
+        if not (_v193(x)): return False
+    return True
+
+def _v193(i):
+    if not (isinstance(i, str)): return False
+    if not ((isinstance(i, str) and i in _c22) or _v18(i)): return False
+    return True
+
+def _v191(i):
+    if not (isinstance(i, str)): return False
+    if not ((isinstance(i, str) and i in _c22) or _v18(i)): return False
+    return True
+
+def _v1(i):
+    if not (isinstance(i, dict)): return False
+    for k, x in i.items():
+        if k not in _c1 and not ((isinstance(x, str))):
+            return False
+    for k in i:
+        if not (_v194(k)): return False
+    return True
+
+def _v194(i):
+    if _v18(i): return False
+    return True
+
+def _v195(i):
+    if not (isinstance(i, dict)): return False
+    if '@context' not in i: return False
+    if '@type' not in i: return False
+    x = i.get('id', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('title', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('titles', _MISSING)
+    if x is not _MISSING and not (_v1(x)):
+        return False
+    x = i.get('properties', _MISSING)
+    if x is not _MISSING and not (_v196(x)):
+        return False
+    x = i.get('actions', _MISSING)
+    if x is not _MISSING and not (_v197(x)):
+        return False
+    x = i.get('events', _MISSING)
+    if x is not _MISSING and not (_v198(x)):
+        return False
+    x = i.get('description', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('descriptions', _MISSING)
+    if x is not _MISSING and not (_v5(x)):
+        return False
+    x = i.get('version', _MISSING)
+    if x is not _MISSING and not (_v6(x)):
+        return False
+    x = i.get('links', _MISSING)
+    if x is not _MISSING and not (_v7(x)):
+        return False
+    x = i.get('forms', _MISSING)
+    if x is not _MISSING and not (_v8(x)):
+        return False
+    x = i.get('base', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('securityDefinitions', _MISSING)
+    if x is not _MISSING and not (_v9(x)):
+        return False
+    x = i.get('schemaDefinitions', _MISSING)
+    if x is not _MISSING and not (_v10(x)):
+        return False
+    x = i.get('support', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('created', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('modified', _MISSING)
+    if x is not _MISSING and not ((isinstance(x, str))):
+        return False
+    x = i.get('profile', _MISSING)
+    if x is not _MISSING and not (_v11(x)):
+        return False
+    x = i.get('security', _MISSING)
+    if x is not _MISSING and not (_v12(x)):
+        return False
+    x = i.get('uriVariables', _MISSING)
+    if x is not _MISSING and not (_v13(x)):
+        return False
+    x = i.get('@type', _MISSING)
+    if x is not _MISSING and not (_v14(x)):
+        return False
+    x = i.get('@context', _MISSING)
+    if x is not _MISSING and not (_v15(x)):
+        return False
+    x = i.get('tm:required', _MISSING)
+    if x is not _MISSING and not (_v16(x)):
+        return False
+    for k in i:
+        if not (_v17(k)): return False
+    return True
+
+def _v198(i):
+    if not (isinstance(i, dict)): return False
+    for k in i:
+        if not (_v135(k)): return False
+    return True
+
+def _v197(i):
+    if not (isinstance(i, dict)): return False
+    for k in i:
+        if not (_v147(k)): return False
+    return True
+
+def _v196(i):
+    if not (isinstance(i, dict)): return False
+    for k in i:
+        if not (_v162(k)): return False
+    return True
+
+
+is_valid = _v0
+fragments = {
+    'property_element': _v161,
+    'action_element': _v146,
+    'event_element': _v134,
+    'dataSchema': _v25,
+    'skeleton': _v195,
+}
@@ -0,0 +1,675 @@
+"""Compiles the bundled JSON schemas into specialized Python validation functions.
+
+`jsonschema` interprets a schema anew for every document it validates, which is
+comparatively slow for large documents. The compiler in this module walks a
+Draft 7 schema once and generates Python source code containing one function per
+(sub)schema. The resulting validator only answers whether a document is valid;
+if it is not, the caller is supposed to fall back to `jsonschema` to obtain the
+usual error messages.
+
+The compiled validators are conservative: they never accept a document that
+`jsonschema` would reject. Schemas using features the compiler does not support
+raise a `SchemaCompilationError`, in which case `jsonschema` is used exclusively.
+"""
+
+import itertools
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import urllib.parse
+
+from jsonschema import Draft7Validator
+
+
+class SchemaCompilationError(Exception):
+    """Raised when a schema uses a feature that cannot be compiled."""
+
+    pass
+
+
+_OBJECT_KEYWORDS = (
+    "required",
+    "minProperties",
+    "maxProperties",
+    "properties",
+    "patternProperties",
+    "additionalProperties",
+    "propertyNames",
+    "dependencies",
+)
+
+_ARRAY_KEYWORDS = (
+    "minItems",
+    "maxItems",
+    "items",
+    "additionalItems",
+    "uniqueItems",
+    "contains",
+)
+
+_STRING_KEYWORDS = ("minLength", "maxLength", "pattern")
+
+_NUMBER_KEYWORDS = (
+    "minimum",
+    "maximum",
+    "exclusiveMinimum",
+    "exclusiveMaximum",
+    "multipleOf",
+)
+
+_GENERIC_KEYWORDS = (
+    "type",
+    "enum",
+    "const",
+    "allOf",
+    "anyOf",
+    "oneOf",
+    "not",
+    "if",
+    "then",
+    "else",
+    "$ref",
+    "format",
+)
+
+_SUPPORTED_KEYWORDS = frozenset(
+    _OBJECT_KEYWORDS
+    + _ARRAY_KEYWORDS
+    + _STRING_KEYWORDS
+    + _NUMBER_KEYWORDS
+    + _GENERIC_KEYWORDS
+)
+
+_TYPE_EXPRESSIONS = {
+    "object": "isinstance({0}, dict)",
+    "array": "isinstance({0}, list)",
+    "string": "isinstance({0}, str)",
+    "boolean": "isinstance({0}, bool)",
+    "null": "{0} is None",
+    "number": "(isinstance({0}, (int, float)) and not isinstance({0}, bool))",
+    "integer": (
+        "((isinstance({0}, int) and not isinstance({0}, bool))"
+        " or (isinstance({0}, float) and {0}.is_integer()))"
+    ),
+}
+
+_KEYWORD_GROUPS = (
+    ("object", _OBJECT_KEYWORDS),
+    ("array", _ARRAY_KEYWORDS),
+    ("string", _STRING_KEYWORDS),
+    ("number", _NUMBER_KEYWORDS),
+)
+
+_INLINEABLE_KEYWORDS = frozenset(["type", "enum", "const"])
+
+
+def _unbool(element, true=object(), false=object()):
+    if element is True:
+        return true
+    elif element is False:
+        return false
+    return element
+
+
+def _equal(one, two) -> bool:
+    """Strict JSON equality, which (unlike ==) distinguishes booleans from numbers."""
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, list) and isinstance(two, list):
+        return len(one) == len(two) and all(map(_equal, one, two))
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(
+            _equal(value, two[key]) for key, value in one.items()
+        )
+    return _unbool(one) == _unbool(two)
+
+
+def _in_enum(instance, enum: List) -> bool:
+    return any(_equal(instance, value) for value in enum)
+
+
+def _unique(items: List) -> bool:
+    # Uses the loose Python equality on purpose, so that the compiled validator
+    # reports duplicates in every case in which jsonschema might.
+    return not any(one == two for one, two in itertools.combinations(items, 2))
+
+
+def _multiple_of(instance, divisor) -> bool:
+    try:
+        if isinstance(divisor, float):
+            quotient = instance / divisor
+            return int(quotient) == quotient
+        return not instance % divisor
+    except (ArithmeticError, ValueError):
+        return False
+
+
+_RUNTIME_HELPERS = {
+    "_equal": _equal,
+    "_in_enum": _in_enum,
+    "_unique": _unique,
+    "_multiple_of": _multiple_of,
+}
+
+
+def _constant_source(value) -> str:
+    if isinstance(value, re.Pattern):
+        return f"re.compile({value.pattern!r})"
+    if isinstance(value, frozenset):
+        return f"frozenset({sorted(value)!r})"
+    return repr(value)
+
+
+class _SchemaCompiler:
+    def __init__(self, root_schema, validator_class=Draft7Validator):
+        self.root_schema = root_schema
+        self.checked_keywords = frozenset(validator_class.VALIDATORS)
+        self.constants: Dict[str, Any] = {}
+        self._constant_names: Dict[str, str] = {}
+        self.function_names: Dict[int, str] = {}
+        self.function_sources: List[str] = []
+        self._pending: List[Tuple[str, Any]] = []
+
+    def compile(
+        self, fragments: Optional[Dict[str, Any]] = None
+    ) -> Tuple[str, Dict[str, str], str]:
+        entry_point = self.function(self.root_schema)
+        self._generate_pending_functions()
+
+        # Fragments are added afterwards so that their functions do not change the
+        # numbering of the functions of the complete schema.
+        fragment_entry_points = {}
+        for name, schema in (fragments or {}).items():
+            fragment_entry_points[name] = self.function(schema)
+            self._generate_pending_functions()
+
+        return entry_point, fragment_entry_points, "\n\n".join(self.function_sources)
+
+    def _generate_pending_functions(self):
+        while self._pending:
+            name, schema = self._pending.pop()
+            self.function_sources.append(self._function_source(name, schema))
+
+    def constant(self, value) -> str:
+        if isinstance(value, (str, int, float)) and not isinstance(value, bool):
+            return repr(value)
+
+        key = _constant_source(value)
+        if key not in self._constant_names:
+            name = f"_c{len(self.constants)}"
+            self.constants[name] = value
+            self._constant_names[key] = name
+        return self._constant_names[key]
+
+    def _resolve_reference(self, reference: str):
+        if not reference.startswith("#"):
+            raise SchemaCompilationError(f"Unsupported remote $ref {reference}")
+
+        current = self.root_schema
+        pointer = urllib.parse.unquote(reference[1:])
+        for token in pointer.split("/")[1:]:
+            token = token.replace("~1", "/").replace("~0", "~")
+            if isinstance(current, list):
+                token = int(token)
+            try:
+                current = current[token]
+            except (KeyError, IndexError, TypeError):
+                raise SchemaCompilationError(f"Unresolvable $ref {reference}")
+        return current
+
+    def resolve(self, schema):
+        """Follows $ref chains. In Draft 7, all siblings of $ref are ignored."""
+        references = set()
+        while isinstance(schema, dict) and "$ref" in schema:
+            reference = schema["$ref"]
+            if reference in references:
+                raise SchemaCompilationError(f"Circular $ref {reference}")
+            references.add(reference)
+            schema = self._resolve_reference(reference)
+
+        if schema is not self.root_schema and isinstance(schema, dict):
+            if "$id" in schema:
+                raise SchemaCompilationError("Nested $id keywords are not supported")
+
+        return schema
+
+    def _relevant_keywords(self, schema) -> List[str]:
+        keywords = [keyword for keyword in schema if keyword in self.checked_keywords]
+        unsupported = set(keywords) - _SUPPORTED_KEYWORDS
+        if unsupported:
+            raise SchemaCompilationError(
+                f"Unsupported keywords: {', '.join(sorted(unsupported))}"
+            )
+        return keywords
+
+    def function(self, schema) -> str:
+        schema = self.resolve(schema)
+        key = id(schema)
+        if key not in self.function_names:
+            name = f"_v{len(self.function_names)}"
+            self.function_names[key] = name
+            self._pending.append((name, schema))
+        return self.function_names[key]
+
+    def check(self, schema, variable: str) -> str:
+        """Returns an expression evaluating to True if `variable` is valid."""
+        schema = self.resolve(schema)
+
+        if schema is True:
+            return "True"
+        if schema is False:
+            return "False"
+
+        keywords = self._relevant_keywords(schema)
+        if len(keywords) == 0:
+            return "True"
+        if _INLINEABLE_KEYWORDS.issuperset(keywords):
+            return " and ".join(self._simple_conditions(schema, variable))
+
+        return f"{self.function(schema)}({variable})"
+
+    def _type_condition(self, types, variable: str) -> str:
+        if isinstance(types, str):
+            types = [types]
+        try:
+            conditions = [_TYPE_EXPRESSIONS[type].format(variable) for type in types]
+        except KeyError as error:
+            raise SchemaCompilationError(f"Unknown type {error}")
+        return "(" + " or ".join(conditions) + ")"
+
+    def _enum_condition(self, enum, variable: str) -> str:
+        if all(isinstance(value, str) for value in enum):
+            values = self.constant(frozenset(enum))
+            return f"(isinstance({variable}, str) and {variable} in {values})"
+        return f"_in_enum({variable}, {self.constant(list(enum))})"
+
+    def _const_condition(self, const, variable: str) -> str:
+        if isinstance(const, str):
+            return f"{variable} == {self.constant(const)}"
+        return f"_equal({variable}, {self.constant(const)})"
+
+    def _simple_conditions(self, schema, variable: str) -> List[str]:
+        conditions = []
+        if "type" in schema:
+            conditions.append(self._type_condition(schema["type"], variable))
+        if "enum" in schema:
+            conditions.append(self._enum_condition(schema["enum"], variable))
+        if "const" in schema:
+            conditions.append(self._const_condition(schema["const"], variable))
+        return conditions
+
+    def _function_source(self, name: str, schema) -> str:
+        lines = [f"def {name}(i):"]
+        lines.extend("    " + line for line in self._schema_statements(schema))
+        lines.append("    return True")
+        return "\n".join(lines)
+
+    def _schema_statements(self, schema) -> List[str]:
+        if schema is True:
+            return []
+        if schema is False:
+            return ["return False"]
+
+        statements = [
+            f"if not {condition}: return False"
+            for condition in self._simple_conditions(schema, "i")
+        ]
+        statements.extend(self._type_specific_statements(schema))
+        statements.extend(self._combinator_statements(schema))
+        return statements
+
+    def _type_specific_statements(self, schema) -> List[str]:
+        keywords = self._relevant_keywords(schema)
+        statements: List[str] = []
+
+        known_type = schema.get("type")
+        if not isinstance(known_type, str):
+            known_type = None
+        if known_type == "integer":
+            known_type = "number"
+
+        group_statements = {
+            "object": self._object_statements,
+            "array": self._array_statements,
+            "string": self._string_statements,
+            "number": self._number_statements,
+        }
+
+        for group, group_keywords in _KEYWORD_GROUPS:
+            if not any(keyword in keywords for keyword in group_keywords):
+                continue
+            if known_type is not None and known_type != group:
+                # The type check above already rejects all instances to which
+                # these keywords would apply.
+                continue
+
+            block = group_statements[group](schema)
+            if len(block) == 0:
+                continue
+            if known_type == group:
+                statements.extend(block)
+            else:
+                statements.append(f"if {self._type_condition(group, 'i')}:")
+                statements.extend("    " + line for line in block)
+
+        return statements
+
+    def _object_statements(self, schema) -> List[str]:
+        statements = []
+
+        required = schema.get("required", [])
+        for property_name in required:
+            statements.append(f"if {property_name!r} not in i: return False")
+
+        if "minProperties" in schema:
+            statements.append(f"if len(i) < {schema['minProperties']!r}: return False")
+        if "maxProperties" in schema:
+            statements.append(f"if len(i) > {schema['maxProperties']!r}: return False")
+
+        statements.extend(self._property_statements(schema))
+
+        if "propertyNames" in schema:
+            condition = self.check(schema["propertyNames"], "k")
+            if condition != "True":
+                statements.append("for k in i:")
+                statements.append(f"    if not ({condition}): return False")
+
+        statements.extend(self._dependency_statements(schema))
+        return statements
+
+    def _property_statements(self, schema) -> List[str]:
+        statements = []
+
+        properties = schema.get("properties", {})
+        for property_name, subschema in properties.items():
+            condition = self.check(subschema, "x")
+            if condition == "True":
+                continue
+            statements.append(f"x = i.get({property_name!r}, _MISSING)")
+            statements.append(f"if x is not _MISSING and not ({condition}):")
+            statements.append("    return False")
+
+        pattern_properties = schema.get("patternProperties", {})
+        for pattern, subschema in pattern_properties.items():
+            condition = self.check(subschema, "x")
+            if condition == "True":
+                continue
+            regex = self.constant(re.compile(pattern))
+            statements.append("for k, x in i.items():")
+            statements.append(f"    if {regex}.search(k) and not ({condition}):")
+            statements.append("        return False")
+
+        additional_properties = schema.get("additionalProperties", True)
+        condition = self.check(additional_properties, "x")
+        if condition != "True":
+            known_properties = self.constant(frozenset(properties))
+            extra_condition = f"k not in {known_properties}"
+            if pattern_properties:
+                regex = self.constant(re.compile("|".join(pattern_properties)))
+                extra_condition += f" and not {regex}.search(k)"
+            statements.append("for k, x in i.items():")
+            statements.append(f"    if {extra_condition} and not ({condition}):")
+            statements.append("        return False")
+
+        return statements
+
+    def _dependency_statements(self, schema) -> List[str]:
+        statements = []
+
+        for property_name, dependency in schema.get("dependencies", {}).items():
+            if isinstance(dependency, list):
+                conditions = [f"{name!r} not in i" for name in dependency]
+                if not conditions:
+                    continue
+                condition = " or ".join(conditions)
+            else:
+                condition = f"not ({self.check(dependency, 'i')})"
+            statements.append(
+                f"if {property_name!r} in i and ({condition}): return False"
+            )
+
+        return statements
+
+    def _array_statements(self, schema) -> List[str]:
+        statements = []
+
+        if "minItems" in schema:
+            statements.append(f"if len(i) < {schema['minItems']!r}: return False")
+        if "maxItems" in schema:
+            statements.append(f"if len(i) > {schema['maxItems']!r}: return False")
+
+        statements.extend(self._items_statements(schema))
+
+        if schema.get("uniqueItems"):
+            statements.append("if not _unique(i): return False")
+
+        if "contains" in schema:
+            condition = self.check(schema["contains"], "x")
+            statements.append(f"if not any({condition} for x in i): return False")
+
+        return statements
+
+    def _items_statements(self, schema) -> List[str]:
+        statements = []
+
+        items = schema.get("items", {})
+        if isinstance(items, list):
+            for index, subschema in enumerate(items):
+                condition = self.check(subschema, "x")
+                if condition == "True":
+                    continue
+                statements.append(f"if len(i) > {index}:")
+                statements.append(f"    x = i[{index}]")
+                statements.append(f"    if not ({condition}): return False")
+
+            additional_items = schema.get("additionalItems", True)
+            condition = self.check(additional_items, "x")
+            if condition == "False":
+                statements.append(f"if len(i) > {len(items)}: return False")
+            elif condition != "True":
+                statements.append(f"for x in i[{len(items)}:]:")
+                statements.append(f"    if not ({condition}): return False")
+        else:
+            if isinstance(items, bool) and "additionalItems" in schema:
+                raise SchemaCompilationError("additionalItems with boolean items")
+            condition = self.check(items, "x")
+            if condition == "False":
+                statements.append("if i: return False")
+            elif condition != "True":
+                statements.append("for x in i:")
+                statements.append(f"    if not ({condition}): return False")
+
+        return statements
+
+    def _string_statements(self, schema) -> List[str]:
+        statements = []
+
+        if "minLength" in schema:
+            statements.append(f"if len(i) < {schema['minLength']!r}: return False")
+        if "maxLength" in schema:
+            statements.append(f"if len(i) > {schema['maxLength']!r}: return False")
+        if "pattern" in schema:
+            regex = self.constant(re.compile(schema["pattern"]))
+            statements.append(f"if not {regex}.search(i): return False")
+
+        return statements
+
+    def _number_statements(self, schema) -> List[str]:
+        statements = []
+
+        for keyword, operator in [
+            ("minimum", "<"),
+            ("maximum", ">"),
+            ("exclusiveMinimum", "<="),
+            ("exclusiveMaximum", ">="),
+        ]:
+            if keyword in schema:
+                limit = self.constant(schema[keyword])
+                statements.append(f"if i {operator} {limit}: return False")
+
+        if "multipleOf" in schema:
+            divisor = self.constant(schema["multipleOf"])
+            statements.append(f"if not _multiple_of(i, {divisor}): return False")
+
+        return statements
+
+    def _combinator_statements(self, schema) -> List[str]:
+        statements = []
+
+        for subschema in schema.get("allOf", []):
+            condition = self.check(subschema, "i")
+            if condition != "True":
+                statements.append(f"if not ({condition}): return False")
+
+        if "anyOf" in schema:
+            conditions = [self.check(subschema, "i") for subschema in schema["anyOf"]]
+            statements.append(f"if not ({' or '.join(conditions)}): return False")
+
+        if "oneOf" in schema:
+            conditions = [
+                f"({self.check(subschema, 'i')})" for subschema in schema["oneOf"]
+            ]
+            statements.append(f"if {' + '.join(conditions)} != 1: return False")
+
+        if "not" in schema:
+            statements.append(f"if {self.check(schema['not'], 'i')}: return False")
+
+        if "if" in schema:
+            then_condition = self.check(schema.get("then", True), "i")
+            else_condition = self.check(schema.get("else", True), "i")
+            statements.append(f"if {self.check(schema['if'], 'i')}:")
+            statements.append(f"    if not ({then_condition}): return False")
+            statements.append(f"elif not ({else_condition}): return False")
+
+        return statements
+
+
+def generate_source(
+    schema, validator_class=Draft7Validator, fragments: Optional[Dict[str, Any]] = None
+) -> Tuple[str, str, Dict, Dict[str, str]]:
+    """Generates the Python source code of a validation function for the given
+    schema.
+
+    Fragments are subschemas (or schemas whose references point into the given
+    schema) for which additional entry points are generated.
+
+    Returns the name of the entry point function, the generated source code, the
+    constants the generated code refers to, and the names of the entry points of
+    the fragments.
+    """
+    compiler = _SchemaCompiler(schema, validator_class=validator_class)
+    entry_point, fragment_entry_points, source = compiler.compile(fragments)
+    return entry_point, source, compiler.constants, fragment_entry_points
+
+
+def _compile(
+    validator: Draft7Validator,
+    name: Optional[str],
+    fragments: Optional[Dict[str, Any]] = None,
+) -> Tuple[Callable[[Any], bool], Dict[str, Callable[[Any], bool]]]:
+    if getattr(validator, "format_checker", None) is not None:
+        raise SchemaCompilationError("Format checking is not supported")
+
+    entry_point, source, constants, fragment_entry_points = generate_source(
+        validator.schema, validator_class=type(validator), fragments=fragments
+    )
+    namespace: Dict[str, Any] = {
+        "_MISSING": object(),
+        **_RUNTIME_HELPERS,
+        **constants,
+    }
+    filename = f"<compiled schema {name or entry_point}>"
+    exec(compile(source, filename, "exec"), namespace)
+    return namespace[entry_point], {
+        fragment: namespace[function_name]
+        for fragment, function_name in fragment_entry_points.items()
+    }
+
+
+def compile_validator(
+    validator: Draft7Validator, name: Optional[str] = None
+) -> Callable[[Any], bool]:
+    """Compiles the schema of a jsonschema validator into a function that returns
+    whether a document is valid."""
+    is_valid, _ = _compile(validator, name)
+    return is_valid
+
+
+def compile_fragment_validators(
+    validator: Draft7Validator, fragments: Dict[str, Any], name: Optional[str] = None
+) -> Dict[str, Callable[[Any], bool]]:
+    """Compiles the given fragments of the schema of a jsonschema validator into
+    functions that return whether a fragment of a document is valid."""
+    _, fragment_validators = _compile(validator, name, fragments)
+    return fragment_validators
+
+
+def generate_module(
+    schema, schema_module_name: str, fragments: Optional[Dict[str, Any]] = None
+) -> str:
+    """Generates the source code of a Python module providing an `is_valid`
+    function for the given schema and a `fragments` dictionary containing the
+    validation functions of its fragments."""
+    entry_point, source, constants, fragment_entry_points = generate_source(
+        schema, fragments=fragments
+    )
+    lines = [
+        f"# Generated from {schema_module_name}.py by the schema compiler in",
+        "# sdf_wot_converter/validation/compiler.py. Do not edit this file manually;",
+        "# run `python -m sdf_wot_converter.validation.compiler` instead.",
+        "import re",
+        "",
+        "from .compiler import _equal, _in_enum, _multiple_of, _unique",
+        "",
+        "_MISSING = object()",
+    ]
+    lines.extend(
+        f"{name} = {_constant_source(value)}" for name, value in constants.items()
+    )
+    lines.extend(["", "", source, "", "", f"is_valid = {entry_point}"])
+    if fragment_entry_points:
+        lines.append("fragments = {")
+        lines.extend(
+            f"    {fragment!r}: {function_name},"
+            for fragment, function_name in fragment_entry_points.items()
+        )
+        lines.append("}")
+    else:
+        lines.append("fragments = {}")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def compiled_module_name(schema_module_name: str) -> str:
+    return f"compiled_{schema_module_name}"
+
+
+def generate_validator_module(validator_name: str) -> str:
+    """Generates the source code of the compiled module of a bundled validator."""
+    from . import _SCHEMAS, load_schema
+    from .fragments import fragment_schemas
+
+    schema_module_name, _ = _SCHEMAS[validator_name]
+    schema = load_schema(validator_name)
+    return generate_module(
+        schema, schema_module_name, fragments=fragment_schemas(schema)
+    )
+
+
+def main():  # pragma: no cover
+    import os
+    from . import _SCHEMAS
+
+    directory = os.path.dirname(os.path.abspath(__file__))
+
+    for validator_name, (schema_module_name, _) in _SCHEMAS.items():
+        module_source = generate_validator_module(validator_name)
+        file_name = f"{compiled_module_name(schema_module_name)}.py"
+        with open(os.path.join(directory, file_name), "w") as module_file:
+            module_file.write(module_source)
+        print(f"Generated {file_name}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
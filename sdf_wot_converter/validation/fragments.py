@@ -0,0 +1,299 @@
+"""Validation of Thing Descriptions and Thing Models one affordance at a time.
+
+The TD and TM schemas describe interaction affordances in their `definitions`
+(`property_element`, `action_element`, and `event_element`), which are only
+referenced by the `additionalProperties` of the `properties`, `actions`, and
+`events` maps. A document is therefore valid if and only if each of its
+affordances and its skeleton (the document validated against the schema without
+these references) are valid.
+
+Validating these fragments separately makes it possible to stop at the first
+invalid affordance, to collect a bounded number of errors together with their
+location, and to split huge documents into chunks that are validated in parallel.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import importlib
+import itertools
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from jsonpointer import JsonPointer
+from jsonschema import Draft7Validator, ValidationError
+
+from . import _SCHEMAS, get_validator, load_schema
+from .compiler import (
+    SchemaCompilationError,
+    compile_fragment_validators,
+    compiled_module_name,
+)
+
+AFFORDANCE_FRAGMENTS = {
+    "properties": "property_element",
+    "actions": "action_element",
+    "events": "event_element",
+}
+DATA_SCHEMA_FRAGMENT = "dataSchema"
+SKELETON_FRAGMENT = "skeleton"
+
+DEFAULT_CHUNK_SIZE = 256
+
+# Keywords of an affordance map schema which do not apply to the affordances
+# themselves and are therefore retained in the skeleton schema.
+_MAP_KEYWORDS = frozenset(
+    ["type", "propertyNames", "minProperties", "maxProperties", "required"]
+)
+
+# Keywords of the root schema which could apply to the affordance maps in
+# addition to their entries in `properties`.
+_UNSPLITTABLE_ROOT_KEYWORDS = frozenset(
+    [
+        "$ref",
+        "allOf",
+        "anyOf",
+        "oneOf",
+        "not",
+        "if",
+        "patternProperties",
+        "dependencies",
+    ]
+)
+
+FragmentItem = Tuple[str, str, Any]
+
+
+class UnsupportedFragmentError(ValueError):
+    """Raised when a schema cannot be split into the requested fragment."""
+
+    pass
+
+
+class FragmentError(NamedTuple):
+    pointer: str
+    """The JSON pointer of the invalid value in the validated document."""
+    message: str
+    keyword: str
+    """The schema keyword that failed, e.g. "required"."""
+
+
+def _skeleton_schema(schema: Dict) -> Optional[Dict]:
+    if _UNSPLITTABLE_ROOT_KEYWORDS.intersection(schema):
+        return None
+
+    properties = dict(schema.get("properties", {}))
+    for key, fragment in AFFORDANCE_FRAGMENTS.items():
+        map_schema = dict(properties.get(key, {}))
+        reference = map_schema.pop("additionalProperties", None)
+        if reference != {"$ref": f"#/definitions/{fragment}"}:
+            return None
+        if not _MAP_KEYWORDS.issuperset(map_schema):
+            return None
+        properties[key] = map_schema
+
+    # The skeleton is not the schema identified by the $id anymore.
+    skeleton = {key: value for key, value in schema.items() if key != "$id"}
+    skeleton["properties"] = properties
+    return skeleton
+
+
+def fragment_schemas(schema: Dict) -> Dict[str, Dict]:
+    """Returns the fragments of a schema that can be validated separately, or an
+    empty dictionary if the schema does not describe interaction affordances."""
+    definitions = schema.get("definitions", {})
+    names = [*AFFORDANCE_FRAGMENTS.values(), DATA_SCHEMA_FRAGMENT]
+    skeleton = _skeleton_schema(schema)
+    if skeleton is None or not all(name in definitions for name in names):
+        return {}
+
+    fragments = {name: definitions[name] for name in names}
+    fragments[SKELETON_FRAGMENT] = skeleton
+    return fragments
+
+
+def _fragment_schema(validator_name: str, fragment: str) -> Dict:
+    schema = load_schema(validator_name)
+    fragments = fragment_schemas(schema)
+    if fragment not in fragments:
+        raise UnsupportedFragmentError(
+            f'The schema of {validator_name} has no fragment "{fragment}".'
+        )
+
+    if fragment == SKELETON_FRAGMENT:
+        return fragments[fragment]
+    return {
+        "$ref": f"#/definitions/{fragment}",
+        "definitions": schema["definitions"],
+    }
+
+
+@lru_cache(maxsize=None)
+def get_fragment_validator(validator_name: str, fragment: str) -> Draft7Validator:
+    """Returns a jsonschema validator for one fragment of the given schema."""
+    return Draft7Validator(_fragment_schema(validator_name, fragment))
+
+
+@lru_cache(maxsize=None)
+def _fast_fragment_validators(validator_name: str) -> Dict[str, Callable]:
+    schema_module_name, _ = _SCHEMAS[validator_name]
+    module_name = compiled_module_name(schema_module_name)
+    try:
+        module = importlib.import_module(f"{__package__}.{module_name}")
+        return module.fragments
+    except ImportError:
+        pass
+
+    fragments = fragment_schemas(load_schema(validator_name))
+    try:
+        return compile_fragment_validators(
+            get_validator(validator_name), fragments, validator_name
+        )
+    except SchemaCompilationError:
+        return {}
+
+
+def get_fast_fragment_validator(
+    validator_name: str, fragment: str
+) -> Optional[Callable[[Any], bool]]:
+    """Returns a compiled function that determines if a fragment is valid, or None
+    if no such function is available."""
+    return _fast_fragment_validators(validator_name).get(fragment)
+
+
+def validate_fragment(validator_name: str, fragment: str, instance):
+    """Validates a single fragment (e.g., one property affordance), raising the
+    same ValidationError jsonschema would raise."""
+    is_valid = get_fast_fragment_validator(validator_name, fragment)
+    if is_valid is not None and is_valid(instance):
+        return
+
+    get_fragment_validator(validator_name, fragment).validate(instance)
+
+
+def _to_fragment_error(error: ValidationError, pointer: str) -> FragmentError:
+    path = JsonPointer.from_parts(error.absolute_path).path
+    return FragmentError(pointer + path, error.message, error.validator)
+
+
+def _fragment_errors(
+    validator_name: str, item: FragmentItem, max_errors: Optional[int]
+) -> List[FragmentError]:
+    fragment, pointer, instance = item
+    is_valid = get_fast_fragment_validator(validator_name, fragment)
+    if is_valid is not None and is_valid(instance):
+        return []
+
+    errors = get_fragment_validator(validator_name, fragment).iter_errors(instance)
+    return [
+        _to_fragment_error(error, pointer)
+        for error in itertools.islice(errors, max_errors)
+    ]
+
+
+def _validate_chunk(
+    validator_name: str, chunk: Iterable[FragmentItem], max_errors: Optional[int]
+) -> List[FragmentError]:
+    errors: List[FragmentError] = []
+    for item in chunk:
+        remaining = None if max_errors is None else max_errors - len(errors)
+        errors.extend(_fragment_errors(validator_name, item, remaining))
+        if max_errors is not None and len(errors) >= max_errors:
+            break
+    return errors
+
+
+def iter_affordances(document: Dict) -> Iterator[FragmentItem]:
+    """Yields the fragment name, JSON pointer, and value of every affordance of a
+    TD or TM."""
+    if not isinstance(document, dict):
+        return
+
+    for key, fragment in AFFORDANCE_FRAGMENTS.items():
+        affordances = document.get(key)
+        if not isinstance(affordances, dict):
+            # Reported by the validation of the skeleton
+            continue
+        for name, affordance in affordances.items():
+            pointer = JsonPointer.from_parts([key, name]).path
+            yield fragment, pointer, affordance
+
+
+def _chunks(items: Iterator[FragmentItem], chunk_size: int):
+    while True:
+        chunk = list(itertools.islice(items, chunk_size))
+        if len(chunk) == 0:
+            return
+        yield chunk
+
+
+def _validate_chunks_in_parallel(
+    validator_name: str,
+    chunks: Iterator[List[FragmentItem]],
+    max_errors: Optional[int],
+    workers: int,
+) -> List[FragmentError]:
+    errors: List[FragmentError] = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_validate_chunk, validator_name, chunk, max_errors)
+            for chunk in chunks
+        ]
+        for future in futures:
+            errors.extend(future.result())
+            if max_errors is not None and len(errors) >= max_errors:
+                for pending_future in futures:
+                    pending_future.cancel()
+                break
+    return errors
+
+
+def validate_fragments(
+    document: Dict,
+    validator_name="td_validator",
+    max_errors: Optional[int] = None,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    workers=1,
+) -> List[FragmentError]:
+    """Validates a TD or TM fragment by fragment and returns the errors found.
+
+    Args:
+        document (Dict): The Thing Description or Thing Model to validate.
+        validator_name (str, optional): "td_validator" or "tm_validator". Defaults
+        to "td_validator".
+        max_errors (Optional[int], optional): Stop after this many errors have been
+        found; 1 stops at the first invalid affordance. Defaults to None, which
+        collects all errors.
+        chunk_size (int, optional): The number of affordances validated by one
+        worker at a time. Defaults to 256.
+        workers (int, optional): The number of processes validating chunks in
+        parallel. Defaults to 1, which validates in the current process.
+
+    Returns:
+        List[FragmentError]: The errors in document order, each with a JSON pointer
+        to the invalid value. The document is valid if the list is empty.
+    """
+    errors = _fragment_errors(
+        validator_name, (SKELETON_FRAGMENT, "", document), max_errors
+    )
+    remaining = None if max_errors is None else max_errors - len(errors)
+    if remaining is None or remaining > 0:
+        affordances = iter_affordances(document)
+        if workers > 1:
+            chunks = _chunks(affordances, chunk_size)
+            errors += _validate_chunks_in_parallel(
+                validator_name, chunks, remaining, workers
+            )
+        else:
+            errors += _validate_chunk(validator_name, affordances, remaining)
+
+    # Every chunk validated in parallel may contribute up to max_errors errors.
+    return errors[:max_errors]
@@ -1,10 +1,28 @@
 from argparse import Namespace
+import copy
+import io
+import itertools
+import json
 
 import pytest
-from sdf_wot_converter import parse_arguments, use_converter_cli
+import sdf_wot_converter.cli
+from sdf_wot_converter import (
+    convert_wot_td_to_wot_tm,
+    parse_arguments,
+    use_converter_cli,
+)
 import os
+import subprocess
+import sys
 
-from sdf_wot_converter.cli import CommandException, _get_origin_url
+from sdf_wot_converter.cli import CommandException, _get_origin_url, save_model
+from sdf_wot_converter.cli.bulk import DeviceConversionError, InvalidDeviceRecordError
+from sdf_wot_converter.cli.encoding import (
+    JSON_ENCODERS,
+    UnknownJsonEncoderError,
+    get_json_encoder,
+)
+from sdf_wot_converter.cli.streaming import convert_records, read_json_line_records
 
 
 def test_parse_arguments():
@@ -337,3 +355,497 @@ def test_wot_td_sdf_custom_infoblock():
     ]
     parsed_args = parse_arguments(args)
     use_converter_cli(parsed_args)
+
+
+def test_validation_level_argument():
+    parsed_args = parse_arguments(["td-to-tm", "-i", "foo"])
+    assert parsed_args.validation == "full"
+
+    parsed_args = parse_arguments(["--validation", "none", "td-to-tm", "-i", "foo"])
+    assert parsed_args.validation == "none"
+
+    with pytest.raises(SystemExit):
+        parse_arguments(["--validation", "partial", "td-to-tm", "-i", "foo"])
+
+
+def test_td_to_sdf_conversion_without_validation():
+    make_test_output_dir()
+    args = [
+        "--validation",
+        "none",
+        "td-to-sdf",
+        "-i",
+        "examples/wot/example.td.jsonld",
+        "-o",
+        "test_output/example-td-unvalidated.sdf.json",
+        "--mapping-file-output",
+        "test_output/example-td-unvalidated.sdf-mapping.json",
+    ]
+    parsed_args = parse_arguments(args)
+    use_converter_cli(parsed_args)
+
+
+def _write_device_records(path, records):
+    path.write_text("\n".join(json.dumps(record) for record in records) + "\n")
+    return str(path)
+
+
+def _bulk_thing_model(path):
+    thing_model = {
+        "@context": "https://www.w3.org/2022/wot/td/v1.1",
+        "@type": "tm:ThingModel",
+        "title": "Lamp {{NUMBER}}",
+        "securityDefinitions": {"nosec_sc": {"scheme": "nosec"}},
+        "security": "nosec_sc",
+        "base": "{{BASE_ADDRESS}}",
+    }
+    path.write_text(json.dumps(thing_model))
+    return str(path)
+
+
+def test_tm_to_td_bulk_conversion(tmp_path, capsys):
+    placeholder_map_path = tmp_path / "placeholders.json"
+    placeholder_map_path.write_text(json.dumps({"BASE_ADDRESS": "https://a.org"}))
+    devices_path = _write_device_records(
+        tmp_path / "devices.jsonl",
+        [
+            {"placeholder_map": {"NUMBER": 0}, "meta_data": {"id": "urn:lamp:0"}},
+            {"placeholder_map": {"NUMBER": 1, "BASE_ADDRESS": "https://b.org"}},
+        ],
+    )
+    args = [
+        "tm-to-td",
+        "-i",
+        _bulk_thing_model(tmp_path / "lamp.tm.json"),
+        "--placeholder-map",
+        str(placeholder_map_path),
+        "--devices",
+        devices_path,
+    ]
+
+    use_converter_cli(parse_arguments(args))
+
+    lines = capsys.readouterr().out.splitlines()
+    thing_descriptions = [json.loads(line) for line in lines]
+    assert [td["title"] for td in thing_descriptions] == ["Lamp 0", "Lamp 1"]
+    assert [td["base"] for td in thing_descriptions] == [
+        "https://a.org",
+        "https://b.org",
+    ]
+    assert thing_descriptions[0]["id"] == "urn:lamp:0"
+    assert "id" not in thing_descriptions[1]
+
+
+def test_tm_to_td_bulk_conversion_to_shards(tmp_path):
+    devices_path = _write_device_records(
+        tmp_path / "devices.jsonl",
+        [
+            {"placeholder_map": {"NUMBER": number, "BASE_ADDRESS": "https://a.org"}}
+            for number in range(5)
+        ],
+    )
+    output_dir = tmp_path / "output"
+    args = [
+        "tm-to-td",
+        "-i",
+        _bulk_thing_model(tmp_path / "lamp.tm.json"),
+        "--devices",
+        devices_path,
+        "--output-dir",
+        str(output_dir),
+        "--shard-size",
+        "2",
+    ]
+
+    use_converter_cli(parse_arguments(args))
+
+    shards = sorted(os.listdir(output_dir))
+    assert shards == [
+        "thing-descriptions-00000.jsonl",
+        "thing-descriptions-00001.jsonl",
+        "thing-descriptions-00002.jsonl",
+    ]
+    titles = [
+        json.loads(line)["title"]
+        for shard in shards
+        for line in (output_dir / shard).read_text().splitlines()
+    ]
+    assert titles == [f"Lamp {number}" for number in range(5)]
+
+
+def test_tm_to_td_bulk_conversion_errors(tmp_path):
+    thing_model_path = _bulk_thing_model(tmp_path / "lamp.tm.json")
+
+    def convert(records):
+        devices_path = _write_device_records(tmp_path / "devices.jsonl", records)
+        args = ["tm-to-td", "-i", thing_model_path, "--devices", devices_path]
+        use_converter_cli(parse_arguments(args))
+
+    with pytest.raises(InvalidDeviceRecordError, match="Line 2: Unknown fields foo"):
+        convert([{}, {"foo": 1}])
+
+    with pytest.raises(DeviceConversionError, match="Line 1: .*BASE_ADDRESS"):
+        convert([{"placeholder_map": {"NUMBER": 1}}])
+
+
+def test_tm_to_td_bulk_conversion_requires_single_thing_model(tmp_path):
+    thing_model_path = _bulk_thing_model(tmp_path / "lamp.tm.json")
+    devices_path = _write_device_records(tmp_path / "devices.jsonl", [{}])
+
+    with pytest.raises(SystemExit):
+        parse_arguments(
+            ["tm-to-td", "-i", thing_model_path, thing_model_path]
+            + ["--devices", devices_path]
+        )
+
+    collection_path = tmp_path / "collection.json"
+    collection_path.write_text(
+        json.dumps({"lamp": json.loads((tmp_path / "lamp.tm.json").read_text())})
+    )
+    args = ["tm-to-td", "-i", str(collection_path), "--devices", devices_path]
+    with pytest.raises(SystemExit, match="--devices requires a single Thing Model"):
+        use_converter_cli(parse_arguments(args))
+
+
+def _write_batch_inputs(directory):
+    directory.mkdir()
+    for file_name in ["example.sdf.json", "sdfobject-level.sdf.json"]:
+        with open(f"examples/sdf/{file_name}") as example:
+            (directory / file_name).write_text(example.read())
+    (directory / "nested").mkdir()
+    (directory / "nested" / "broken.sdf.json").write_text(
+        json.dumps({"sdfObject": {"Broken": {"sdfProperty": 5}}})
+    )
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_batch_conversion(tmp_path, capsys, monkeypatch, jobs):
+    _write_batch_inputs(tmp_path / "input")
+    monkeypatch.chdir(tmp_path)
+    args = [
+        "batch",
+        "sdf-to-tm",
+        "-i",
+        "input",
+        "-o",
+        "output",
+        "-j",
+        jobs,
+        "--origin-url-base",
+        "https://example.org/models/",
+        "--manifest",
+        "manifest.json",
+    ]
+
+    assert use_converter_cli(parse_arguments(args)) == 1
+
+    manifest = json.loads((tmp_path / "manifest.json").read_text())
+    assert (manifest["succeeded"], manifest["failed"]) == (2, 1)
+    assert [entry["input"] for entry in manifest["files"]] == [
+        "input/example.sdf.json",
+        "input/nested/broken.sdf.json",
+        "input/sdfobject-level.sdf.json",
+    ]
+    assert [entry["outputs"] for entry in manifest["files"]] == [
+        ["example.tm.jsonld"],
+        [],
+        ["sdfobject-level.tm.jsonld"],
+    ]
+    assert manifest["files"][1]["error"].startswith("ValidationError: ")
+    assert "broken.sdf.json: ValidationError" in capsys.readouterr().err
+
+    thing_model = json.loads(
+        (tmp_path / "output" / "sdfobject-level.tm.jsonld").read_text()
+    )
+    assert {
+        "href": "https://example.org/models/input/sdfobject-level.sdf.json",
+        "rel": "alternate",
+    } in thing_model["links"]
+
+
+def test_batch_conversion_of_glob_pattern(tmp_path, monkeypatch):
+    _write_batch_inputs(tmp_path / "input")
+    monkeypatch.chdir(tmp_path)
+    args = ["batch", "sdf-to-tm", "-i", "input/*.sdf.json", "-o", "output"]
+
+    assert use_converter_cli(parse_arguments(args)) == 0
+
+    assert sorted(path.name for path in (tmp_path / "output").iterdir()) == [
+        "example.tm.jsonld",
+        "sdfobject-level.tm.jsonld",
+    ]
+
+
+def test_batch_conversion_output_conflicts(tmp_path, capsys, monkeypatch):
+    (tmp_path / "input").mkdir()
+    with open("examples/wot/example.tm.jsonld") as example:
+        thing_model = example.read()
+    for file_name in ["lamp.tm.json", "lamp.tm.jsonld"]:
+        (tmp_path / "input" / file_name).write_text(thing_model)
+    monkeypatch.chdir(tmp_path)
+    args = ["batch", "tm-to-td", "-i", "input", "-o", "output"]
+
+    with pytest.raises(SystemExit, match="input/lamp.tm.json, input/lamp.tm.jsonld"):
+        use_converter_cli(parse_arguments(args))
+
+    assert not (tmp_path / "output").exists()
+
+
+def test_batch_conversion_keep_going(tmp_path, capsys, monkeypatch):
+    _write_batch_inputs(tmp_path / "input")
+    monkeypatch.chdir(tmp_path)
+    args = ["batch", "sdf-to-tm", "-i", "input", "-o", "output", "--keep-going"]
+
+    assert use_converter_cli(parse_arguments(args)) == 0
+
+    assert "broken.sdf.json: ValidationError" in capsys.readouterr().err
+    assert sorted(path.name for path in (tmp_path / "output").iterdir()) == [
+        "example.tm.jsonld",
+        "sdfobject-level.tm.jsonld",
+    ]
+
+
+def test_json_lines_conversion(tmp_path, capsys):
+    with open("examples/wot/example.td.jsonld") as example:
+        thing_description = json.load(example)
+    input_path = tmp_path / "tds.jsonl"
+    input_path.write_text(
+        "\n".join(
+            [
+                json.dumps(thing_description),
+                "{",
+                "",
+                json.dumps({**thing_description, "title": 42}),
+            ]
+        )
+    )
+    args = ["--input-format", "jsonl", "td-to-tm", "-i", str(input_path)]
+
+    use_converter_cli(parse_arguments(args))
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(records) == 3
+    assert "tm:ThingModel" in records[0]["@type"]
+    assert records[1]["line"] == 2
+    assert records[1]["error"].startswith("JSONDecodeError: ")
+    # The empty line is skipped, but still counted.
+    assert records[2]["line"] == 4
+    assert records[2]["error"].startswith("ValidationError: ")
+
+
+def test_json_lines_output_of_sdf_models(tmp_path):
+    output_path = tmp_path / "sdf.jsonl"
+    args = [
+        "--output-format",
+        "jsonl",
+        "tm-to-sdf",
+        "-i",
+        "examples/wot/example.tm.jsonld",
+        "examples/wot/minimal-example.tm.jsonld",
+        "-o",
+        str(output_path),
+    ]
+
+    use_converter_cli(parse_arguments(args))
+
+    records = [json.loads(line) for line in output_path.read_text().splitlines()]
+    assert len(records) == 2
+    for record in records:
+        assert set(record) == {"sdf_model", "mapping_file"}
+        assert "sdfObject" in record["sdf_model"]
+
+
+def test_json_lines_error_records_of_input_files(tmp_path, capsys):
+    broken_path = tmp_path / "broken.td.jsonld"
+    broken_path.write_text("{")
+    args = [
+        "--output-format",
+        "jsonl",
+        "td-to-tm",
+        "-i",
+        "examples/wot/example.td.jsonld",
+        str(broken_path),
+    ]
+
+    use_converter_cli(parse_arguments(args))
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert "tm:ThingModel" in records[0]["@type"]
+    assert records[1]["input"] == str(broken_path)
+    assert records[1]["error"].startswith("JSONDecodeError: ")
+
+
+def test_json_lines_conversion_does_not_import_batch_module(tmp_path):
+    output_path = tmp_path / "tms.jsonl"
+    code = (
+        "import sys\n"
+        "from sdf_wot_converter import parse_arguments, use_converter_cli\n"
+        "use_converter_cli(parse_arguments(['--output-format', 'jsonl', 'td-to-tm', "
+        f"'-i', 'examples/wot/example.td.jsonld', '-o', {str(output_path)!r}]))\n"
+        "print('sdf_wot_converter.cli.batch' in sys.modules)"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    )
+
+    assert completed.stdout.strip() == "False"
+    assert "tm:ThingModel" in json.loads(output_path.read_text())["@type"]
+
+
+def test_json_lines_output_keeps_origin_url(tmp_path, capsys, monkeypatch):
+    url = "https://example.org/models/sdfobject-level.sdf.json"
+    with open("examples/sdf/sdfobject-level.sdf.json") as example:
+        sdf_model = json.load(example)
+    monkeypatch.setattr(
+        sdf_wot_converter.cli,
+        "_load_model_from_url",
+        lambda _: copy.deepcopy(sdf_model),
+    )
+
+    use_converter_cli(parse_arguments(["sdf-to-tm", "-i", url]))
+    thing_model = json.loads(capsys.readouterr().out)
+    use_converter_cli(
+        parse_arguments(["--output-format", "jsonl", "sdf-to-tm", "-i", url])
+    )
+    streamed_thing_model = json.loads(capsys.readouterr().out)
+
+    assert {"href": url, "rel": "alternate"} in thing_model["links"]
+    assert streamed_thing_model == thing_model
+
+
+def test_json_lines_records_are_converted_lazily():
+    lines = (json.dumps({"number": number}) for number in itertools.count())
+
+    results = convert_records(
+        read_json_line_records(lines), lambda record: record["number"] * 2
+    )
+
+    assert list(itertools.islice(results, 3)) == [0, 2, 4]
+
+
+def test_invalid_json_lines_arguments():
+    for args in [
+        ["--input-format", "jsonl", "--output-format", "json", "td-to-tm", "-i", "a"],
+        ["--input-format", "jsonl", "td-to-tm", "-i", "a", "b"],
+        ["--input-format", "jsonl", "batch", "td-to-tm", "-i", "a", "-o", "b"],
+        ["--input-format", "jsonl", "tm-to-td", "-i", "a", "--devices", "b"],
+        ["--output-format", "jsonl", "tm-to-td", "-i", "a", "--devices", "b"],
+    ]:
+        with pytest.raises(SystemExit):
+            parse_arguments(args)
+
+
+def test_printed_output_is_json(capsys):
+    args = ["td-to-tm", "-i", "examples/wot/example.td.jsonld"]
+    use_converter_cli(parse_arguments(args))
+    printed_output = capsys.readouterr().out
+
+    with open("examples/wot/example.td.jsonld") as thing_description_file:
+        thing_description = json.load(thing_description_file)
+    expected_result = convert_wot_td_to_wot_tm(thing_description)
+
+    assert json.loads(printed_output) == expected_result
+    assert printed_output.startswith('{\n    "')
+
+    use_converter_cli(parse_arguments(["--compact", *args]))
+    compact_output = capsys.readouterr().out
+
+    assert compact_output.count("\n") == 1
+    assert len(compact_output) < len(printed_output)
+    assert json.loads(compact_output) == expected_result
+
+
+@pytest.mark.parametrize("json_encoder", ["auto", *JSON_ENCODERS])
+@pytest.mark.parametrize("indent", [None, 2, 4])
+def test_json_encoders(tmp_path, json_encoder, indent):
+    document = {"title": "L\u00e4mpchen", "values": [1, 2.5, None, True], "empty": {}}
+    output_path = tmp_path / "output.json"
+
+    save_model(
+        str(output_path),
+        document,
+        indent=indent,
+        encoder=get_json_encoder(json_encoder),
+    )
+
+    assert json.loads(output_path.read_text(encoding="utf-8")) == document
+    if json_encoder == "json":
+        assert output_path.read_text(encoding="utf-8") == json.dumps(
+            document,
+            indent=indent,
+            separators=(",", ":") if indent is None else None,
+            ensure_ascii=False,
+        )
+
+
+@pytest.mark.skipif("orjson" not in JSON_ENCODERS, reason="needs orjson")
+@pytest.mark.parametrize("indent", [None, 2])
+def test_json_encoders_write_the_same_bytes(indent):
+    document = {"title": "L\u00e4mpchen \U0001f4a1", "values": [1, "\u00b0C", None]}
+
+    outputs = []
+    for json_encoder in ["json", "orjson"]:
+        output = io.BytesIO()
+        get_json_encoder(json_encoder).dump(document, output, indent)
+        outputs.append(output.getvalue())
+
+    assert outputs[0] == outputs[1]
+    assert "Lämpchen".encode("utf-8") in outputs[0]
+
+
+def test_unknown_json_encoder():
+    with pytest.raises(UnknownJsonEncoderError):
+        get_json_encoder("unknown")
+
+
+@pytest.mark.skipif("orjson" not in JSON_ENCODERS, reason="needs orjson")
+def test_orjson_encoder_indent():
+    args = ["td-to-tm", "-i", "examples/wot/example.td.jsonld"]
+
+    assert get_json_encoder("auto", 4) is JSON_ENCODERS["json"]
+    assert get_json_encoder("auto", 2) is JSON_ENCODERS["orjson"]
+
+    with pytest.raises(SystemExit):
+        parse_arguments(["--json-encoder", "orjson", *args])
+    parse_arguments(["--json-encoder", "orjson", "--indent", "2", *args])
+    parse_arguments(["--json-encoder", "orjson", "--output-format", "jsonl", *args])
+
+
+def test_timings_argument(capsys):
+    args = ["--timings", "td-to-tm", "-i", "examples/wot/example.td.jsonld"]
+    use_converter_cli(parse_arguments(args))
+
+    captured = capsys.readouterr()
+    json.loads(captured.out)
+    table = captured.err.splitlines()
+    assert table[0].split() == ["Phase", "Calls", "Seconds", "Share"]
+    assert [line.split()[0] for line in table[1:]] == [
+        "load",
+        "validation",
+        "resolve",
+        "mapping",
+        "serialization",
+        "other",
+        "total",
+    ]
+
+    with pytest.raises(SystemExit):
+        parse_arguments(["--timings", "serve"])
+
+
+def test_profile_argument(tmp_path):
+    output_prefix = str(tmp_path / "td-to-tm")
+    args = [
+        "--profile",
+        output_prefix,
+        "td-to-tm",
+        "-i",
+        "examples/wot/example.td.jsonld",
+    ]
+    use_converter_cli(parse_arguments([*args, "-o", str(tmp_path / "output.json")]))
+
+    assert os.path.isfile(output_prefix + ".pstats")
+    assert os.path.isfile(output_prefix + ".collapsed")
+
+    with pytest.raises(SystemExit):
+        parse_arguments(["--profile", output_prefix, "serve"])
@@ -0,0 +1,103 @@
+import json
+import pstats
+
+from sdf_wot_converter import convert_wot_td_to_wot_tm
+from sdf_wot_converter.profiling import (
+    COLLAPSED_SUFFIX,
+    PROFILE_ENVIRONMENT_VARIABLE,
+    PSTATS_SUFFIX,
+    collapsed_stacks,
+    profile,
+    profiled,
+)
+
+
+def _function(name):
+    return ("~", 0, name)
+
+
+def test_collapsed_stacks():
+    # main calls first and second, which both call shared for one second each.
+    stats = {
+        _function("main"): (1, 1, 1.0, 6.0, {}),
+        _function("first"): (1, 1, 1.0, 2.0, {_function("main"): (1, 1, 1.0, 2.0)}),
+        _function("second"): (1, 1, 2.0, 3.0, {_function("main"): (1, 1, 2.0, 3.0)}),
+        _function("shared"): (
+            2,
+            2,
+            2.0,
+            2.0,
+            {
+                _function("first"): (1, 1, 1.0, 1.0),
+                _function("second"): (1, 1, 1.0, 1.0),
+            },
+        ),
+    }
+
+    assert collapsed_stacks(stats) == {
+        "main": 1000000,
+        "main;first": 1000000,
+        "main;first;shared": 1000000,
+        "main;second": 2000000,
+        "main;second;shared": 1000000,
+    }
+
+
+def test_collapsed_stacks_of_recursive_functions():
+    recursive = _function("recursive")
+    stats = {
+        _function("main"): (1, 1, 0.0, 3.0, {}),
+        recursive: (
+            3,
+            1,
+            3.0,
+            3.0,
+            {_function("main"): (1, 1, 1.0, 3.0), recursive: (2, 2, 2.0, 2.0)},
+        ),
+    }
+
+    assert collapsed_stacks(stats) == {"main;recursive": 3000000}
+
+
+def _load_json(path):
+    with open(path) as json_file:
+        return json.load(json_file)
+
+
+def test_profile(tmp_path):
+    thing_description = _load_json("examples/wot/example.td.jsonld")
+    output_prefix = str(tmp_path / "profiles" / "td-to-tm")
+
+    with profile(output_prefix):
+        convert_wot_td_to_wot_tm(thing_description)
+
+    functions = {
+        function_name
+        for _, _, function_name in pstats.Stats(output_prefix + PSTATS_SUFFIX).stats
+    }
+    assert "convert_td_to_tm" in functions
+
+    with open(output_prefix + COLLAPSED_SUFFIX) as collapsed_file:
+        lines = collapsed_file.read().splitlines()
+    assert len(lines) > 0
+    assert any("convert_td_to_tm" in line for line in lines)
+    for line in lines:
+        stack, microseconds = line.rsplit(" ", 1)
+        assert int(microseconds) > 0
+
+
+def test_profiled_decorator(tmp_path, monkeypatch):
+    def convert(thing_description):
+        return convert_wot_td_to_wot_tm(thing_description)
+
+    monkeypatch.delenv(PROFILE_ENVIRONMENT_VARIABLE, raising=False)
+    assert profiled()(convert) is convert
+
+    output_prefix = str(tmp_path / "td-to-tm")
+    monkeypatch.setenv(PROFILE_ENVIRONMENT_VARIABLE, output_prefix)
+    profiled_convert = profiled()(convert)
+    thing_description = _load_json("examples/wot/example.td.jsonld")
+
+    assert profiled_convert(thing_description) == convert(thing_description)
+    stats = pstats.Stats(output_prefix + PSTATS_SUFFIX)
+    assert "convert" in {function_name for _, _, function_name in stats.stats}
@@ -0,0 +1,398 @@
+import copy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import os
+import threading
+
+import pytest
+
+from sdf_wot_converter import (
+    convert_sdf_to_wot_tm,
+    convert_wot_tm_to_wot_td,
+    parse_arguments,
+    use_converter_cli,
+)
+from sdf_wot_converter.cli import _get_cache_ttl
+from sdf_wot_converter.cli.defaults import DEFAULT_SERVER_CACHE_TTL
+from sdf_wot_converter.converters import retrieval
+from sdf_wot_converter.converters.retrieval import (
+    DEFAULT_TTL,
+    DocumentRetrievalError,
+    clear_document_cache,
+    configure_document_cache,
+    configure_document_sources,
+    document_cache_info,
+    retrieve_json_document,
+)
+from sdf_wot_converter.converters.sdf_to_tm import SdfRefUrlRetrievalError
+from sdf_wot_converter.converters.wot_common import (
+    clear_thing_model_cache,
+    preload_thing_model,
+    retrieve_thing_model,
+    thing_model_cache_info,
+)
+
+REMOTE_SDF_MODEL = {
+    "info": {"title": "Remote model", "version": "2022-01-01"},
+    "sdfObject": {
+        "Sensor": {
+            "sdfProperty": {
+                "value": {
+                    "label": "Value",
+                    "description": "The measured value.",
+                    "type": "number",
+                    "writable": False,
+                }
+            }
+        }
+    },
+}
+
+BASE_THING_MODEL = {
+    "@context": "https://www.w3.org/2022/wot/td/v1.1",
+    "@type": "tm:ThingModel",
+    "title": "Base",
+    "securityDefinitions": {"nosec_sc": {"scheme": "nosec"}},
+    "security": "nosec_sc",
+    "properties": {
+        "status": {
+            "type": "string",
+            "forms": [{"href": "https://example.org/status"}],
+        }
+    },
+}
+
+
+class _RemoteModelHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        server.requests.append(dict(self.headers))
+
+        if self.headers.get("If-None-Match") == server.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        body = json.dumps(server.document).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/sdf+json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", server.etag)
+        self.send_header("Last-Modified", "Sat, 01 Jan 2022 00:00:00 GMT")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def remote_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _RemoteModelHandler)
+    server.requests = []
+    server.document = REMOTE_SDF_MODEL
+    server.etag = '"1"'
+    server.url = f"http://127.0.0.1:{server.server_port}/model.sdf.json"
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def document_cache():
+    clear_document_cache()
+    clear_thing_model_cache()
+    yield
+    configure_document_cache()
+    configure_document_sources()
+    clear_document_cache()
+    clear_thing_model_cache()
+
+
+def _referencing_sdf_model(url: str, number_of_references: int):
+    return {
+        "namespace": {"remote": url},
+        "defaultNamespace": "remote",
+        "sdfObject": {
+            "Test": {
+                "sdfProperty": {
+                    f"value{index}": {
+                        "sdfRef": "remote:/sdfObject/Sensor/sdfProperty/value"
+                    }
+                    for index in range(number_of_references)
+                }
+            }
+        },
+    }
+
+
+def test_remote_models_are_retrieved_once(remote_server):
+    sdf_model = _referencing_sdf_model(remote_server.url, 200)
+
+    thing_model = convert_sdf_to_wot_tm(sdf_model)
+
+    # All references share the same target, which is only resolved once.
+    assert len(remote_server.requests) == 1
+    assert document_cache_info() == (0, 0, 0, 1)
+    assert len(thing_model["properties"]) == 200
+    assert thing_model["properties"]["value0"] == {
+        "title": "Value",
+        "description": "The measured value.",
+        "type": "number",
+        "readOnly": True,
+        "observable": True,
+    }
+    # The merge of the referencing definitions must not leak into the cache.
+    assert retrieve_json_document(remote_server.url) == REMOTE_SDF_MODEL
+
+
+def test_disk_cache(remote_server, tmp_path):
+    configure_document_cache(directory=str(tmp_path))
+    retrieve_json_document(remote_server.url)
+
+    clear_document_cache()
+    assert retrieve_json_document(remote_server.url) == REMOTE_SDF_MODEL
+
+    assert len(remote_server.requests) == 1
+    assert document_cache_info() == (0, 1, 0, 0)
+
+
+def test_expired_disk_cache_entries_are_revalidated(remote_server, tmp_path):
+    configure_document_cache(directory=str(tmp_path), ttl=0)
+    retrieve_json_document(remote_server.url)
+
+    clear_document_cache()
+    assert retrieve_json_document(remote_server.url) == REMOTE_SDF_MODEL
+
+    assert document_cache_info() == (0, 0, 1, 0)
+    conditional_request = remote_server.requests[1]
+    assert conditional_request["If-None-Match"] == '"1"'
+    assert conditional_request["If-Modified-Since"] == "Sat, 01 Jan 2022 00:00:00 GMT"
+
+    updated_model = {**REMOTE_SDF_MODEL, "info": {"title": "Updated model"}}
+    remote_server.document = updated_model
+    remote_server.etag = '"2"'
+
+    clear_document_cache()
+    assert retrieve_json_document(remote_server.url) == updated_model
+    assert document_cache_info() == (0, 0, 0, 1)
+
+
+def test_concurrent_retrievals_are_counted(remote_server):
+    configure_document_cache(ttl=0)
+
+    def retrieve():
+        for _ in range(10):
+            retrieve_json_document(remote_server.url)
+
+    threads = [threading.Thread(target=retrieve) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    info = document_cache_info()
+    assert info.revalidations + info.downloads == len(remote_server.requests) == 40
+
+
+def test_offline_mode(remote_server, tmp_path):
+    configure_document_cache(directory=str(tmp_path), ttl=0)
+    retrieve_json_document(remote_server.url)
+
+    clear_document_cache()
+    configure_document_cache(directory=str(tmp_path), ttl=0, offline=True)
+    assert retrieve_json_document(remote_server.url) == REMOTE_SDF_MODEL
+    assert len(remote_server.requests) == 1
+
+    clear_document_cache(disk=True)
+    with pytest.raises(DocumentRetrievalError):
+        retrieve_json_document(remote_server.url)
+
+    with pytest.raises(SdfRefUrlRetrievalError):
+        convert_sdf_to_wot_tm(_referencing_sdf_model(remote_server.url, 1))
+
+    assert len(remote_server.requests) == 1
+
+
+def test_failed_retrievals_are_not_cached(remote_server):
+    configure_document_cache(offline=True)
+    with pytest.raises(DocumentRetrievalError):
+        retrieve_json_document(remote_server.url)
+
+    configure_document_cache()
+    assert retrieve_json_document(remote_server.url) == REMOTE_SDF_MODEL
+
+
+def test_remote_model_validation_level(remote_server):
+    remote_server.document = {**REMOTE_SDF_MODEL, "info": "Not an infoblock"}
+    sdf_model = _referencing_sdf_model(remote_server.url, 1)
+
+    with pytest.raises(SdfRefUrlRetrievalError):
+        convert_sdf_to_wot_tm(sdf_model)
+
+    thing_model = convert_sdf_to_wot_tm(sdf_model, validation="none")
+    assert thing_model["properties"]["value0"]["title"] == "Value"
+
+
+def test_document_sources(remote_server, tmp_path):
+    base_path = tmp_path / "base.tm.json"
+    base_path.write_text(json.dumps(BASE_THING_MODEL))
+
+    configure_document_sources(local_files=False)
+    with pytest.raises(DocumentRetrievalError):
+        retrieve_json_document(base_path.as_uri())
+    with pytest.raises(DocumentRetrievalError):
+        convert_wot_tm_to_wot_td(_extending_thing_model(str(base_path), "Thing"))
+    assert retrieve_json_document(remote_server.url) == REMOTE_SDF_MODEL
+
+    clear_document_cache()
+    configure_document_sources(remote_documents=False)
+    with pytest.raises(DocumentRetrievalError):
+        retrieve_json_document(remote_server.url)
+    assert convert_wot_tm_to_wot_td(_extending_thing_model(str(base_path), "Thing"))
+    assert len(remote_server.requests) == 1
+
+
+def _extending_thing_model(href: str, title: str):
+    return {
+        "@context": "https://www.w3.org/2022/wot/td/v1.1",
+        "@type": "tm:ThingModel",
+        "title": title,
+        "links": [{"rel": "tm:extends", "href": href}],
+    }
+
+
+def test_thing_models_from_files_are_cached(tmp_path):
+    base_path = tmp_path / "base.tm.json"
+    base_path.write_text(json.dumps(BASE_THING_MODEL))
+
+    for index in range(10):
+        thing_description = convert_wot_tm_to_wot_td(
+            _extending_thing_model(str(base_path), f"Thing {index}")
+        )
+        assert thing_description["title"] == f"Thing {index}"
+        assert thing_description["properties"]["status"]["type"] == "string"
+
+    assert thing_model_cache_info() == (9, 1, 1)
+
+    modified_thing_model = copy.deepcopy(BASE_THING_MODEL)
+    modified_thing_model["properties"]["status"]["type"] = "integer"
+    base_path.write_text(json.dumps(modified_thing_model))
+    stat_result = os.stat(base_path)
+    os.utime(base_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1))
+
+    thing_description = convert_wot_tm_to_wot_td(
+        _extending_thing_model(str(base_path), "Thing")
+    )
+    assert thing_description["properties"]["status"]["type"] == "integer"
+    assert thing_model_cache_info() == (9, 2, 1)
+
+
+def test_thing_models_from_urls_are_revalidated(remote_server):
+    remote_server.document = BASE_THING_MODEL
+    configure_document_cache(ttl=0)
+
+    for _ in range(3):
+        assert retrieve_thing_model(remote_server.url) == BASE_THING_MODEL
+
+    # Unchanged documents are confirmed by the server, but not parsed again.
+    assert [request.get("If-None-Match") for request in remote_server.requests] == [
+        None,
+        '"1"',
+        '"1"',
+    ]
+    assert thing_model_cache_info() == (2, 1, 1)
+
+    remote_server.document = {**BASE_THING_MODEL, "title": "Updated"}
+    remote_server.etag = '"2"'
+    assert retrieve_thing_model(remote_server.url)["title"] == "Updated"
+    assert thing_model_cache_info() == (2, 2, 1)
+
+
+def test_retrieved_thing_models_are_copies(remote_server):
+    remote_server.document = BASE_THING_MODEL
+
+    retrieve_thing_model(remote_server.url)["title"] = "Modified"
+
+    assert retrieve_thing_model(remote_server.url) == BASE_THING_MODEL
+    assert len(remote_server.requests) == 1
+
+
+def test_preloaded_thing_models():
+    base_url = "https://example.org/base.tm.json"
+    preload_thing_model(base_url, BASE_THING_MODEL)
+    configure_document_cache(offline=True)
+
+    thing_description = convert_wot_tm_to_wot_td(
+        _extending_thing_model(base_url, "Thing")
+    )
+
+    assert thing_description["securityDefinitions"] == {"nosec_sc": {"scheme": "nosec"}}
+    assert thing_model_cache_info().currsize == 1
+
+    clear_thing_model_cache()
+    assert thing_model_cache_info() == (0, 0, 0)
+    with pytest.raises(DocumentRetrievalError):
+        retrieve_thing_model(base_url)
+
+
+def test_cache_arguments():
+    parsed_args = parse_arguments(
+        [
+            "--cache-dir",
+            "cache",
+            "--cache-ttl",
+            "60",
+            "--offline",
+            "sdf-to-tm",
+            "-i",
+            "examples/sdf/example.sdf.json",
+        ]
+    )
+
+    assert parsed_args.cache_dir == "cache"
+    assert parsed_args.cache_ttl == 60
+    assert parsed_args.offline
+
+
+@pytest.mark.parametrize("command", ["sdf-to-tm", "tm-to-td", "td-to-tm"])
+def test_every_command_configures_the_document_cache(tmp_path, command):
+    input_paths = {
+        "sdf-to-tm": "examples/sdf/example.sdf.json",
+        "tm-to-td": "examples/wot/example-with-bindings.tm.jsonld",
+        "td-to-tm": "examples/wot/example.td.jsonld",
+    }
+    cache_directory = str(tmp_path / "cache")
+    use_converter_cli(
+        parse_arguments(
+            [
+                "--cache-dir",
+                cache_directory,
+                "--cache-ttl",
+                "60",
+                "--offline",
+                command,
+                "-i",
+                input_paths[command],
+                "-o",
+                str(tmp_path / "output.json"),
+            ]
+        )
+    )
+
+    assert retrieval._document_cache.directory == cache_directory
+    assert retrieval._document_cache.ttl == 60
+    assert retrieval._document_cache.offline
+
+
+def test_server_cache_ttl():
+    assert _get_cache_ttl(parse_arguments(["serve"])) == DEFAULT_SERVER_CACHE_TTL
+    assert _get_cache_ttl(parse_arguments(["--cache-ttl", "1", "serve"])) == 1
+    assert (
+        _get_cache_ttl(parse_arguments(["td-to-tm", "-i", "example.td.jsonld"]))
+        == DEFAULT_TTL
+    )
@@ -1,10 +1,12 @@
 from jsonschema import ValidationError
 import pytest
 
-from sdf_wot_converter.converters.sdf_to_tm import add_origin_link
+from sdf_wot_converter.converters import sdf_to_tm
+from sdf_wot_converter.converters.sdf_to_tm import SdfRefTable, add_origin_link
 from sdf_wot_converter.converters.tm_to_sdf import convert_wot_tm_collection_to_sdf
 
 from sdf_wot_converter import convert_wot_tm_to_sdf, convert_sdf_to_wot_tm
+from sdf_wot_converter.converters.utility import clone_json
 
 
 def perform_sdf_roundtrip_test(input):
@@ -26,9 +28,15 @@ def perform_sdf_thing_collection_roundtrip_test(
 
 
 def perform_conversion_test(input, expected_result, **kwargs):
+    original_input = clone_json(input)
     actual_result = convert_sdf_to_wot_tm(input, **kwargs)
 
     assert actual_result == expected_result
+    assert input == original_input
+
+    actual_result = convert_sdf_to_wot_tm(input, copy_input=False, **kwargs)
+
+    assert actual_result == expected_result
 
 
 def test_empty_sdf_tm_conversion():
@@ -691,6 +699,42 @@ def test_sdf_tm_looping_sdf_ref():
     )
 
 
+def test_sdf_tm_sdf_refs_are_resolved_once(monkeypatch):
+    sdf_model = {
+        "sdfObject": {
+            "Test": {
+                "sdfProperty": {
+                    f"foo{index}": {"sdfRef": "#/sdfObject/Test/sdfData/bar"}
+                    for index in range(100)
+                },
+                "sdfData": {
+                    "bar": {"sdfRef": "#/sdfObject/Test/sdfData/baz"},
+                    "baz": {"type": "string"},
+                },
+            }
+        }
+    }
+
+    resolved_pointers = []
+
+    def counting_resolve_pointer(document, pointer):
+        resolved_pointers.append(pointer)
+        return resolve_pointer(document, pointer)
+
+    resolve_pointer = sdf_to_tm.resolve_pointer
+    monkeypatch.setattr(sdf_to_tm, "resolve_pointer", counting_resolve_pointer)
+
+    sdf_ref_table = SdfRefTable(sdf_model)
+    for index in range(100):
+        definition = sdf_model["sdfObject"]["Test"]["sdfProperty"][f"foo{index}"]
+        assert sdf_ref_table.resolve(definition) is definition
+
+    assert resolved_pointers == [
+        "/sdfObject/Test/sdfData/bar",
+        "/sdfObject/Test/sdfData/baz",
+    ]
+
+
 def test_sdf_tm_unparsabable_sdf_ref():
     input = {
         "sdfObject": {
@@ -1087,6 +1131,48 @@ def test_sdf_tm_suppress_roundtripping_fields():
     perform_conversion_test(input, expected_result, suppress_roundtripping=True)
 
 
+def test_sdf_tm_suppressed_roundtripping_data_qualities():
+    input = {
+        "sdfObject": {
+            "Sensor": {
+                "sdfProperty": {
+                    "value": {
+                        "label": "Value",
+                        "$comment": "raw",
+                        "type": "string",
+                        "sdfType": "byte-string",
+                        "nullable": False,
+                        "writable": True,
+                        "readable": True,
+                        "maxLength": 8,
+                    }
+                }
+            }
+        }
+    }
+
+    expected_result = {
+        "@context": ["https://www.w3.org/2022/wot/td/v1.1"],
+        "@type": "tm:ThingModel",
+        "properties": {
+            "value": {
+                "title": "Value",
+                "type": "string",
+                "readOnly": False,
+                "writeOnly": False,
+                "maxLength": 8,
+                "observable": True,
+                "$comment": "raw",
+                "sdfType": "byte-string",
+                "nullable": False,
+            }
+        },
+        "tm:optional": ["/properties/value"],
+    }
+
+    perform_conversion_test(input, expected_result, suppress_roundtripping=True)
+
+
 def test_td_tm_illegal_input():
     input = {"info": "hello"}
 
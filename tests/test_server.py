@@ -0,0 +1,211 @@
+import http.client
+import json
+import os
+import socket
+import threading
+
+import pytest
+
+from sdf_wot_converter import convert_wot_td_to_wot_tm, convert_wot_tm_to_sdf
+from sdf_wot_converter.cli import parse_arguments
+from sdf_wot_converter.cli import server as server_module
+from sdf_wot_converter.cli.server import (
+    InvalidConversionRequestError,
+    RequestMetrics,
+    convert_request,
+    create_server,
+)
+from sdf_wot_converter.converters.retrieval import configure_document_sources
+
+
+def _load_json(path):
+    with open(path) as json_file:
+        return json.load(json_file)
+
+
+@pytest.fixture
+def server():
+    server = create_server(port=0, workers=2)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def _request(server, method, path, body=None):
+    host, port = server.server_address[:2]
+    connection = http.client.HTTPConnection(host, port)
+    headers = {}
+    if body is not None:
+        body = body if isinstance(body, bytes) else json.dumps(body).encode()
+        headers["Content-Type"] = "application/json"
+    connection.request(method, path, body=body, headers=headers)
+    response = connection.getresponse()
+    result = response.status, response.read()
+    connection.close()
+    return result
+
+
+def test_convert_request():
+    # The request bodies are converted in place, hence every request gets its own
+    # copy of the example documents.
+    thing_description_path = "examples/wot/example.td.jsonld"
+    thing_model_path = "examples/wot/minimal-example.tm.jsonld"
+
+    assert convert_request(
+        "td-to-tm",
+        {"input": _load_json(thing_description_path), "validation": "inputs"},
+    ) == convert_wot_td_to_wot_tm(_load_json(thing_description_path))
+
+    sdf_model, mapping_file = convert_wot_tm_to_sdf(_load_json(thing_model_path))
+    assert convert_request("tm-to-sdf", {"input": _load_json(thing_model_path)}) == {
+        "sdf_model": sdf_model,
+        "mapping_file": mapping_file,
+    }
+
+    for invalid_request in [[], {}, {"input": {}, "placeholder_map": {}}]:
+        with pytest.raises(InvalidConversionRequestError):
+            convert_request("td-to-tm", invalid_request)
+
+
+def test_server_conversions(server):
+    thing_description = _load_json("examples/wot/example.td.jsonld")
+
+    status, body = _request(server, "POST", "/td-to-tm", {"input": thing_description})
+    assert status == 200
+    assert json.loads(body) == convert_wot_td_to_wot_tm(thing_description)
+
+    status, body = _request(server, "POST", "/td-to-sdf", {"input": thing_description})
+    assert status == 200
+    assert set(json.loads(body)) == {"sdf_model", "mapping_file"}
+
+
+def test_server_errors(server):
+    thing_description = _load_json("examples/wot/example.td.jsonld")
+
+    assert _request(server, "POST", "/td-to-tm", b"{")[0] == 400
+    assert _request(server, "POST", "/td-to-tm", {"model": {}})[0] == 400
+
+    status, body = _request(
+        server, "POST", "/td-to-tm", {"input": {**thing_description, "title": 42}}
+    )
+    assert status == 422
+    assert json.loads(body)["error"].startswith("ValidationError")
+
+    assert _request(server, "GET", "/td-to-tm")[0] == 405
+    assert _request(server, "POST", "/metrics", {})[0] == 405
+    assert _request(server, "POST", "/td-to-td", {"input": {}})[0] == 404
+
+
+def test_server_metrics(server):
+    thing_description = _load_json("examples/wot/example.td.jsonld")
+    for _ in range(3):
+        _request(server, "POST", "/td-to-tm", {"input": thing_description})
+    _request(server, "GET", "/unknown/path")
+
+    status, body = _request(server, "GET", "/metrics?format=json")
+    assert status == 200
+    metrics = json.loads(body)
+    assert {"endpoint": "td-to-tm", "status": 200, "count": 3} in metrics["requests"]
+    assert {"endpoint": "unknown", "status": 404, "count": 1} in metrics["requests"]
+    assert metrics["latency_seconds"]["td-to-tm"]["buckets"]["+Inf"] == 3
+
+    status, body = _request(server, "GET", "/metrics")
+    assert status == 200
+    assert (
+        'sdf_wot_converter_requests_total{endpoint="td-to-tm",status="200"} 3'
+        in body.decode().splitlines()
+    )
+
+
+def test_request_metrics_histogram():
+    metrics = RequestMetrics(buckets=(0.1, 1.0))
+    for seconds in [0.05, 0.1, 0.5, 2.0]:
+        metrics.record("td-to-tm", 200, seconds)
+
+    histogram = metrics.snapshot()["latency_seconds"]["td-to-tm"]
+    assert histogram["buckets"] == {"0.1": 2, "1.0": 3, "+Inf": 4}
+    assert histogram["count"] == 4
+    assert histogram["sum"] == pytest.approx(2.65)
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="requires Unix sockets")
+def test_unix_socket_server(tmp_path):
+    socket_path = str(tmp_path / "converter.sock")
+    server = create_server(unix_socket=socket_path, workers=1)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+
+    try:
+        thing_description = _load_json("examples/wot/example.td.jsonld")
+        body = json.dumps({"input": thing_description}).encode()
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(socket_path)
+            client.sendall(
+                b"POST /td-to-tm HTTP/1.0\r\n"
+                + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                + body
+            )
+            response = b""
+            while True:
+                chunk = client.recv(65536)
+                if not chunk:
+                    break
+                response += chunk
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+    head, _, response_body = response.partition(b"\r\n\r\n")
+    assert head.startswith(b"HTTP/1.0 200")
+    assert json.loads(response_body) == convert_wot_td_to_wot_tm(thing_description)
+
+
+def test_unix_socket_server_requires_unix_sockets(monkeypatch):
+    monkeypatch.setattr(server_module, "unix_sockets_supported", lambda: False)
+
+    with pytest.raises(ValueError, match="Unix sockets are not supported"):
+        create_server(unix_socket="converter.sock")
+
+
+def test_server_without_local_files():
+    thing_model = {
+        "@context": "https://www.w3.org/2022/wot/td/v1.1",
+        "@type": "tm:ThingModel",
+        "links": [
+            {
+                "rel": "tm:extends",
+                "href": os.path.abspath("examples/wot/example-with-bindings.tm.jsonld"),
+            }
+        ],
+    }
+    server = create_server(port=0, workers=1, local_files=False)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+
+    try:
+        status, body = _request(server, "POST", "/tm-to-td", {"input": thing_model})
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+        configure_document_sources()
+
+    assert status == 422
+    assert "is disabled" in json.loads(body)["error"]
+
+
+def test_serve_arguments():
+    args = parse_arguments(["serve", "--unix-socket", "converter.sock", "-j", "8"])
+    assert args.unix_socket == "converter.sock"
+    assert args.workers == 8
+    assert args.local_files and args.remote_documents
+
+    args = parse_arguments(["serve", "--no-local-files", "--no-remote-documents"])
+    assert not args.local_files and not args.remote_documents
+
+    with pytest.raises(SystemExit):
+        parse_arguments(["--input-format", "jsonl", "serve"])
@@ -1,13 +1,22 @@
 from sdf_wot_converter.converters import convert_sdf_to_wot_td
+from sdf_wot_converter.converters.utility import clone_json
 
 
 def perform_conversion_test(input, expected_result, **kwargs):
     sdf_model, sdf_mapping_file = input
+    original_input = clone_json(input)
     actual_result = convert_sdf_to_wot_td(
         sdf_model, sdf_mapping_files=[sdf_mapping_file], **kwargs
     )
 
     assert actual_result == expected_result
+    assert input == original_input
+
+    actual_result = convert_sdf_to_wot_td(
+        sdf_model, sdf_mapping_files=[sdf_mapping_file], copy_input=False, **kwargs
+    )
+
+    assert actual_result == expected_result
 
 
 def test_empty_tm_sdf_conversion():
@@ -1,12 +1,19 @@
 from jsonschema import ValidationError
 import pytest
 from sdf_wot_converter import convert_wot_td_to_wot_tm
+from sdf_wot_converter.converters.utility import clone_json
 
 
 def perform_conversion_test(input, expected_result, **kwargs):
+    original_input = clone_json(input)
     actual_result = convert_wot_td_to_wot_tm(input, **kwargs)
 
     assert actual_result == expected_result
+    assert input == original_input
+
+    actual_result = convert_wot_td_to_wot_tm(input, copy_input=False, **kwargs)
+
+    assert actual_result == expected_result
 
 
 def test_empty_td_tm_conversion():
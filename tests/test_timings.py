@@ -0,0 +1,63 @@
+import json
+import time
+
+import pytest
+
+from sdf_wot_converter import convert_sdf_to_wot_td, convert_wot_td_to_sdf
+from sdf_wot_converter.timings import (
+    OTHER_PHASE,
+    PHASES,
+    phase,
+    record_timings,
+    timed_phase,
+)
+
+
+def _load_json(path):
+    with open(path) as json_file:
+        return json.load(json_file)
+
+
+def test_conversion_phases_are_recorded():
+    sdf_model = _load_json("examples/sdf/example.sdf.json")
+    mapping_file = _load_json("examples/sdf/example.sdf-mapping.json")
+
+    with record_timings() as timings:
+        convert_sdf_to_wot_td(sdf_model, sdf_mapping_files=[mapping_file])
+
+    result = timings.as_dict()
+    assert list(result) == [*PHASES, OTHER_PHASE]
+    for recorded_phase in ["validation", "resolve", "mapping"]:
+        assert result[recorded_phase]["calls"] > 0
+        assert result[recorded_phase]["seconds"] > 0
+    assert sum(timing["seconds"] for timing in result.values()) == pytest.approx(
+        timings.total_seconds
+    )
+
+
+def test_nested_phases_are_attributed_to_the_innermost_phase():
+    @timed_phase("validation")
+    def validate():
+        time.sleep(0.02)
+
+    with record_timings() as timings:
+        with phase("mapping"):
+            validate()
+            validate()
+
+    result = timings.as_dict()
+    assert result["mapping"]["calls"] == 1
+    assert result["validation"]["calls"] == 2
+    assert result["validation"]["seconds"] >= 0.04
+    assert result["mapping"]["seconds"] < result["validation"]["seconds"]
+
+
+def test_timings_are_only_recorded_within_the_block():
+    thing_description = _load_json("examples/wot/example.td.jsonld")
+
+    with record_timings() as timings:
+        pass
+    convert_wot_td_to_sdf(thing_description)
+
+    assert all(calls == 0 for calls in timings.calls.values())
+    assert "validation" in timings.format_table()
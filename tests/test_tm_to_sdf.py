@@ -2,12 +2,19 @@ from jsonschema import ValidationError
 import pytest
 from sdf_wot_converter import convert_wot_tm_to_sdf
 from sdf_wot_converter.converters.tm_to_sdf import convert_wot_tm_collection_to_sdf
+from sdf_wot_converter.converters.utility import clone_json
 
 
 def perform_conversion_test(input, expected_result, **kwargs):
+    original_input = clone_json(input)
     actual_result = convert_wot_tm_to_sdf(input, **kwargs)
 
     assert actual_result == expected_result
+    assert input == original_input
+
+    actual_result = convert_wot_tm_to_sdf(input, copy_input=False, **kwargs)
+
+    assert actual_result == expected_result
 
 
 def test_empty_tm_sdf_conversion():
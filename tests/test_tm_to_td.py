@@ -1,13 +1,26 @@
+import copy
+
 from jsonschema import ValidationError
 import pytest
-from sdf_wot_converter import convert_wot_tm_to_wot_td
-from sdf_wot_converter.converters.wot_common import PlaceholderException
+from sdf_wot_converter import compile_thing_model, convert_wot_tm_to_wot_td
+from sdf_wot_converter.converters.utility import clone_json
+from sdf_wot_converter.converters.wot_common import (
+    PlaceholderException,
+    replace_placeholders,
+    resolve_extension,
+)
 
 
 def perform_conversion_test(input, expected_result, **kwargs):
+    original_input = clone_json(input)
     actual_result = convert_wot_tm_to_wot_td(input, **kwargs)
 
     assert actual_result == expected_result
+    assert input == original_input
+
+    actual_result = convert_wot_tm_to_wot_td(input, copy_input=False, **kwargs)
+
+    assert actual_result == expected_result
 
 
 def test_empty_tm_td_conversion():
@@ -223,6 +236,132 @@ def test_tm_td_with_unreplaced_placeholders():
         convert_wot_tm_to_wot_td(input, placeholder_map=placeholder_map)
 
 
+def test_tm_td_with_embedded_placeholders():
+    input = {
+        "@context": ["https://www.w3.org/2022/wot/td/v1.1"],
+        "@type": "tm:ThingModel",
+        "title": "Thermostat {{THERMOSTAT_NUMBER}}",
+        "security": ["nosec_sc"],
+        "securityDefinitions": {"nosec_sc": {"scheme": "nosec"}},
+        "properties": {
+            "temperature": {
+                "description": 'Says "{{GREETING}}" ({{ENABLED}})',
+                "forms": [{"href": "coap://{{HOST}}:{{PORT}}/temperature"}],
+            }
+        },
+    }
+
+    placeholder_map = {
+        "THERMOSTAT_NUMBER": 4,
+        "GREETING": 'a "quoted" hello',
+        "ENABLED": True,
+        "HOST": "example.org",
+        "PORT": 5683,
+    }
+
+    expected_result = {
+        "@context": ["https://www.w3.org/2022/wot/td/v1.1"],
+        "title": "Thermostat 4",
+        "security": ["nosec_sc"],
+        "securityDefinitions": {"nosec_sc": {"scheme": "nosec"}},
+        "properties": {
+            "temperature": {
+                "description": 'Says "a "quoted" hello" (true)',
+                "forms": [{"href": "coap://example.org:5683/temperature"}],
+            }
+        },
+    }
+
+    perform_conversion_test(input, expected_result, placeholder_map=placeholder_map)
+
+
+def test_unresolved_placeholders_are_reported():
+    thing_model = {
+        "title": "{{TITLE}}",
+        "properties": {
+            "{{NAME}}": {"forms": [{"href": "https://{{HOST}}/{{PATH}}"}]},
+        },
+    }
+
+    with pytest.raises(PlaceholderException) as e_info:
+        replace_placeholders(thing_model, {"TITLE": "Title", "HOST": "example.org"})
+
+    assert e_info.value.unresolved_placeholders == [
+        ("/properties/{{NAME}}", "NAME"),
+        ("/properties/{{NAME}}/forms/0/href", "PATH"),
+    ]
+    assert str(e_info.value) == (
+        "Not all placeholders have been replaced: "
+        "{{NAME}} at /properties/{{NAME}}, "
+        "{{PATH}} at /properties/{{NAME}}/forms/0/href"
+    )
+
+
+def test_malformed_placeholders_are_reported():
+    thing_model = {
+        "title": "{{}}",
+        "description": "{{{{HOST}}}} at {{HOST",
+        "links": [{"href": "https://{{HOST}}/"}],
+    }
+
+    with pytest.raises(PlaceholderException) as e_info:
+        replace_placeholders(thing_model, {"HOST": "example.org"})
+
+    assert e_info.value.unresolved_placeholders == [
+        ("/title", ""),
+        ("/description", ""),
+        ("/description", "HOST"),
+    ]
+
+
+def test_placeholder_member_name_collisions_are_rejected():
+    thing_model = {
+        "properties": {
+            "{{FIRST}}": {"type": "string"},
+            "{{SECOND}}": {"type": "number"},
+        },
+    }
+
+    with pytest.raises(PlaceholderException, match='same member name "status"'):
+        replace_placeholders(thing_model, {"FIRST": "status", "SECOND": "status"})
+
+    with pytest.raises(PlaceholderException, match='same member name "{{SECOND}}"'):
+        replace_placeholders(thing_model, {"FIRST": "{{SECOND}}"})
+
+
+def test_placeholder_replacement_only_copies_modified_values():
+    thing_model = {
+        "title": "{{TITLE}}",
+        "properties": {
+            "status": {"type": "string", "enum": ["on", "off"]},
+            "{{NAME}}": {"type": "number"},
+        },
+        "links": [{"href": "https://example.org"}, {"href": "{{LINK}}"}],
+    }
+    placeholder_map = {
+        "TITLE": "Thing",
+        "NAME": "temperature",
+        "LINK": {"not": "a string"},
+    }
+
+    result = replace_placeholders(thing_model, placeholder_map)
+
+    assert result == {
+        "title": "Thing",
+        "properties": {
+            "status": {"type": "string", "enum": ["on", "off"]},
+            "temperature": {"type": "number"},
+        },
+        "links": [{"href": "https://example.org"}, {"href": {"not": "a string"}}],
+    }
+    assert thing_model["title"] == "{{TITLE}}"
+    status = thing_model["properties"]["status"]
+    assert result["properties"]["status"] is status
+    assert result["links"][0] is thing_model["links"][0]
+    assert result["links"][1]["href"] is not placeholder_map["LINK"]
+    assert replace_placeholders(status, placeholder_map) is status
+
+
 def test_tm_td_extension():
     extension_url = (
         "https://raw.githubusercontent.com/JKRhb/"
@@ -398,6 +537,82 @@ def test_tm_td_tm_ref():
     perform_conversion_test(input, expected_result)
 
 
+def test_tm_td_local_tm_refs_are_independent():
+    input = {
+        "@context": ["https://www.w3.org/2022/wot/td/v1.1"],
+        "@type": "tm:ThingModel",
+        "title": "Thing Title",
+        "security": ["nosec_sc"],
+        "securityDefinitions": {"nosec_sc": {"scheme": "nosec"}},
+        "schemaDefinitions": {
+            "status": {
+                "type": "object",
+                "properties": {"on": {"type": "boolean"}},
+            }
+        },
+        "properties": {
+            "status": {
+                "tm:ref": "#/schemaDefinitions/status",
+                "description": "The current status.",
+                "properties": {"on": {"title": "On"}},
+                "forms": [{"href": "https://example.org/status"}],
+            },
+            "anotherStatus": {
+                "tm:ref": "#/schemaDefinitions/status",
+                "forms": [{"href": "https://example.org/another-status"}],
+            },
+        },
+    }
+    original_input = copy.deepcopy(input)
+
+    expected_status = {
+        "type": "object",
+        "description": "The current status.",
+        "properties": {"on": {"type": "boolean", "title": "On"}},
+        "forms": [{"href": "https://example.org/status"}],
+    }
+    expected_another_status = {
+        "type": "object",
+        "properties": {"on": {"type": "boolean"}},
+        "forms": [{"href": "https://example.org/another-status"}],
+    }
+
+    result = convert_wot_tm_to_wot_td(input)
+
+    assert result["properties"]["status"] == expected_status
+    assert result["properties"]["anotherStatus"] == expected_another_status
+    assert result["schemaDefinitions"] == original_input["schemaDefinitions"]
+    assert input == original_input
+
+
+def test_tm_ref_resolution_only_copies_modified_definitions():
+    thing_model = {
+        "schemaDefinitions": {
+            "unchanged": {"type": "object", "properties": {"a": {"type": "string"}}},
+            "changed": {
+                "type": "object",
+                "properties": {
+                    "a": {"tm:ref": "#/schemaDefinitions/unchanged"},
+                    "b": {"type": "number"},
+                },
+            },
+        },
+    }
+    original_thing_model = copy.deepcopy(thing_model)
+
+    result = resolve_extension(thing_model)
+
+    assert thing_model == original_thing_model
+    definitions = thing_model["schemaDefinitions"]
+    resolved_definitions = result["schemaDefinitions"]
+    assert resolved_definitions["unchanged"] is definitions["unchanged"]
+    assert resolved_definitions["changed"] is not definitions["changed"]
+    resolved_properties = resolved_definitions["changed"]["properties"]
+    assert resolved_properties["a"] == definitions["unchanged"]
+    assert resolved_properties["b"] is definitions["changed"]["properties"]["b"]
+    assert resolve_extension(definitions["unchanged"]) is definitions["unchanged"]
+
+
 def test_tm_td_tm_optional():
     input = {
         "@context": ["https://www.w3.org/2022/wot/td/v1.1"],
@@ -732,3 +947,132 @@ def test_tm_td_tm_optional_removal():
     perform_conversion_test(
         input, expected_result, remove_not_required_affordances=True
     )
+
+
+TEMPLATE_THING_MODEL = {
+    "@context": ["https://www.w3.org/2022/wot/td/v1.1"],
+    "@type": "tm:ThingModel",
+    "title": "Lamp {{NUMBER}}",
+    "version": {"model": "1.0.0"},
+    "securityDefinitions": {"nosec_sc": {"scheme": "nosec"}},
+    "security": ["nosec_sc"],
+    "schemaDefinitions": {"state": {"type": "string", "enum": ["on", "off"]}},
+    "properties": {
+        "status": {
+            "tm:ref": "#/schemaDefinitions/state",
+            "forms": [{"href": "https://{{HOST}}/status"}],
+        },
+        "brightness": {
+            "type": "integer",
+            "maximum": "{{MAXIMUM}}",
+            "forms": [{"href": "https://{{HOST}}/brightness"}],
+        },
+    },
+    "tm:optional": ["/properties/brightness"],
+}
+
+
+def test_thing_model_template_instantiation():
+    thing_model = copy.deepcopy(TEMPLATE_THING_MODEL)
+    template = compile_thing_model(thing_model)
+    # The template must not depend on the input after compilation.
+    thing_model["properties"].clear()
+
+    for number in range(3):
+        placeholder_map = {
+            "NUMBER": number,
+            "HOST": f"lamp{number}.example.org",
+            "MAXIMUM": 100 + number,
+        }
+        meta_data = {"id": f"urn:dev:lamp:{number}", "description": "{{HOST}}"}
+        bindings = {"properties": {"status": {"observable": True}}}
+
+        thing_description = template.instantiate(
+            placeholder_map, meta_data=meta_data, bindings=bindings
+        )
+
+        assert thing_description == convert_wot_tm_to_wot_td(
+            TEMPLATE_THING_MODEL,
+            placeholder_map=placeholder_map,
+            meta_data=meta_data,
+            bindings=bindings,
+        )
+        assert thing_description["title"] == f"Lamp {number}"
+        assert thing_description["description"] == f"lamp{number}.example.org"
+        assert thing_description["version"] == {"model": "1.0.0", "instance": "1.0.0"}
+        assert thing_description["properties"]["brightness"]["maximum"] == 100 + number
+        assert thing_description["properties"]["status"]["observable"]
+
+
+def test_thing_model_template_removes_optional_affordances():
+    template = compile_thing_model(
+        TEMPLATE_THING_MODEL, remove_not_required_affordances=True
+    )
+    placeholder_map = {"NUMBER": 1, "HOST": "example.org", "MAXIMUM": 100}
+
+    thing_description = template.instantiate(placeholder_map)
+    assert list(thing_description["properties"]) == ["status"]
+
+    with pytest.raises(PlaceholderException) as e_info:
+        template.instantiate({"NUMBER": 2, "MAXIMUM": 100})
+    assert e_info.value.unresolved_placeholders == [
+        ("/properties/status/forms/0/href", "HOST"),
+        ("/properties/brightness/forms/0/href", "HOST"),
+    ]
+
+
+def test_thing_model_template_unsupported_inputs():
+    with pytest.raises(ValueError):
+        compile_thing_model({"lamp": TEMPLATE_THING_MODEL})
+
+    thing_model = copy.deepcopy(TEMPLATE_THING_MODEL)
+    thing_model["links"] = [{"rel": "tm:submodel", "href": "#/lamp"}]
+    with pytest.raises(ValueError):
+        compile_thing_model(thing_model)
+
+
+def test_thing_descriptions_are_independent():
+    placeholder_map = {"NUMBER": 1, "HOST": "example.org", "MAXIMUM": 100}
+    bindings = {"properties": {"status": {"forms": [{"href": "coap://status"}]}}}
+    template = compile_thing_model(TEMPLATE_THING_MODEL)
+
+    thing_descriptions = [
+        template.instantiate(placeholder_map, bindings=bindings),
+        template.instantiate(placeholder_map, bindings=bindings),
+        convert_wot_tm_to_wot_td(
+            TEMPLATE_THING_MODEL, placeholder_map=placeholder_map, bindings=bindings
+        ),
+        convert_wot_tm_to_wot_td(
+            TEMPLATE_THING_MODEL,
+            placeholder_map=placeholder_map,
+            bindings=bindings,
+            copy_input=False,
+        ),
+    ]
+    expected_result = clone_json(thing_descriptions[0])
+
+    for thing_description in thing_descriptions:
+        thing_description["properties"]["status"]["forms"].append({"href": "/"})
+        thing_description["properties"]["status"]["enum"].append("dimmed")
+        thing_description["version"]["model"] = "2.0.0"
+        thing_description["schemaDefinitions"]["state"]["enum"].clear()
+
+    assert bindings["properties"]["status"]["forms"] == [{"href": "coap://status"}]
+    assert template.instantiate(placeholder_map, bindings=bindings) == expected_result
+    assert (
+        convert_wot_tm_to_wot_td(
+            TEMPLATE_THING_MODEL, placeholder_map=placeholder_map, bindings=bindings
+        )
+        == expected_result
+    )
+
+
+def test_thing_model_template_shares_values_without_copy_output():
+    template = compile_thing_model(TEMPLATE_THING_MODEL, copy_output=False)
+    placeholder_map = {"NUMBER": 1, "HOST": "example.org", "MAXIMUM": 100}
+
+    first = template.instantiate(placeholder_map)
+    second = template.instantiate(placeholder_map)
+
+    assert first == second
+    assert first["schemaDefinitions"] is second["schemaDefinitions"]
@@ -0,0 +1,510 @@
+import json
+import os
+import subprocess
+import sys
+from typing import List
+
+from jsonschema import Draft7Validator, FormatChecker, ValidationError
+import pytest
+
+from sdf_wot_converter import (
+    convert_sdf_to_wot_td,
+    convert_wot_td_to_sdf,
+    convert_wot_td_to_wot_tm,
+    convert_wot_tm_to_sdf,
+    validation,
+)
+from sdf_wot_converter.validation import ValidationLevelError
+from sdf_wot_converter.validation import cache as validation_cache_module
+from sdf_wot_converter.validation.cache import DEFAULT_MAXSIZE, document_digest
+from sdf_wot_converter.validation.compiler import (
+    SchemaCompilationError,
+    compile_validator,
+    compiled_module_name,
+    generate_validator_module,
+)
+from sdf_wot_converter.validation.fragments import (
+    UnsupportedFragmentError,
+    validate_fragment,
+    validate_fragments,
+)
+
+
+def _loaded_schema_modules(code: str):
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"{code}\n"
+            "import sys\n"
+            "print(sorted(name for name in sys.modules "
+            "if name.endswith('_schema')))",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return completed.stdout.strip()
+
+
+def test_schemas_are_not_loaded_on_import():
+    assert _loaded_schema_modules("import sdf_wot_converter") == "[]"
+
+
+def test_schemas_are_loaded_on_first_use():
+    loaded_modules = _loaded_schema_modules(
+        "from sdf_wot_converter.validation import validate_thing_description\n"
+        "try:\n"
+        "    validate_thing_description({})\n"
+        "except Exception:\n"
+        "    pass"
+    )
+    assert loaded_modules == (
+        "['sdf_wot_converter.validation.compiled_td_schema', "
+        "'sdf_wot_converter.validation.td_schema']"
+    )
+
+
+def test_valid_documents_do_not_need_schemas():
+    loaded_modules = _loaded_schema_modules(
+        "import json\n"
+        "from sdf_wot_converter.validation import validate_thing_description\n"
+        "with open('examples/wot/example.td.jsonld') as example:\n"
+        "    validate_thing_description(json.load(example))"
+    )
+    assert loaded_modules == "['sdf_wot_converter.validation.compiled_td_schema']"
+
+
+def test_legacy_validator_attributes():
+    assert isinstance(validation.td_validator, Draft7Validator)
+    assert validation.td_validator is validation.get_validator("td_validator")
+
+
+@pytest.fixture
+def validated_documents(monkeypatch):
+    validated: List[str] = []
+    validate = validation.validate
+
+    def recording_validate(validator_name: str, document):
+        validated.append(validator_name)
+        validate(validator_name, document)
+
+    monkeypatch.setattr(validation, "validate", recording_validate)
+    return validated
+
+
+def _load_example(path: str):
+    with open(path) as example_file:
+        return json.load(example_file)
+
+
+@pytest.mark.parametrize(
+    "validation_level,expected_validators",
+    [
+        ("full", ["td_validator", "tm_validator", "sdf_validator"]),
+        ("inputs", ["td_validator"]),
+        ("outputs", ["sdf_validator"]),
+        ("none", []),
+    ],
+)
+def test_td_to_sdf_validation_levels(
+    validated_documents, validation_level, expected_validators
+):
+    thing_description = _load_example("examples/wot/example.td.jsonld")
+    convert_wot_td_to_sdf(thing_description, validation=validation_level)
+
+    assert validated_documents == expected_validators
+
+
+# The example model contains an sdfThing with a nested sdfObject, which results
+# in a collection of two TMs and two TDs.
+@pytest.mark.parametrize(
+    "validation_level,expected_validators",
+    [
+        (
+            "full",
+            [
+                "sdf_validator",
+                "sdf_framework_validator",
+                "tm_validator",
+                "tm_validator",
+                "td_validator",
+                "td_validator",
+            ],
+        ),
+        ("inputs", ["sdf_validator", "sdf_framework_validator"]),
+        ("outputs", ["td_validator", "td_validator"]),
+        ("none", []),
+    ],
+)
+def test_sdf_to_td_validation_levels(
+    validated_documents, validation_level, expected_validators
+):
+    sdf_model = _load_example("examples/sdf/example.sdf.json")
+    mapping_file = _load_example("examples/sdf/example.sdf-mapping.json")
+    convert_sdf_to_wot_td(
+        sdf_model, sdf_mapping_files=[mapping_file], validation=validation_level
+    )
+
+    assert validated_documents == expected_validators
+
+
+def test_tm_to_sdf_validates_unchanged_model_once(validated_documents):
+    thing_model = _load_example("examples/wot/example.tm.jsonld")
+    convert_wot_tm_to_sdf(thing_model)
+
+    assert validated_documents == ["tm_validator", "sdf_validator"]
+
+
+def test_skipped_input_validation():
+    invalid_thing_description = {
+        "@context": "https://www.w3.org/2022/wot/td/v1.1",
+        "title": "Thing without security information",
+    }
+
+    with pytest.raises(ValidationError):
+        convert_wot_td_to_wot_tm(invalid_thing_description)
+
+    assert convert_wot_td_to_wot_tm(invalid_thing_description, validation="none") == {
+        **invalid_thing_description,
+        "@type": "tm:ThingModel",
+    }
+
+
+def test_unknown_validation_level():
+    with pytest.raises(ValidationLevelError):
+        convert_wot_td_to_wot_tm({}, validation="partial")
+
+
+@pytest.mark.parametrize("validator_name", list(validation._SCHEMAS))
+def test_compiled_modules_are_up_to_date(validator_name):
+    schema_module_name, _ = validation._SCHEMAS[validator_name]
+    module_path = os.path.join(
+        os.path.dirname(validation.__file__),
+        f"{compiled_module_name(schema_module_name)}.py",
+    )
+    with open(module_path) as module_file:
+        module_source = module_file.read()
+
+    assert module_source == generate_validator_module(validator_name), (
+        "The compiled validators are outdated. "
+        "Run `python -m sdf_wot_converter.validation.compiler`."
+    )
+
+
+_KEYWORD_TEST_SCHEMA = {
+    "definitions": {
+        "positive": {"type": "number", "exclusiveMinimum": 0},
+        "tree": {
+            "type": "object",
+            "properties": {
+                "children": {"type": "array", "items": {"$ref": "#/definitions/tree"}}
+            },
+        },
+    },
+    "type": "object",
+    "required": ["name"],
+    "minProperties": 1,
+    "maxProperties": 6,
+    "properties": {
+        "name": {"type": "string", "minLength": 1, "maxLength": 5, "pattern": "^a"},
+        "count": {"type": "integer", "minimum": 1, "maximum": 10, "multipleOf": 2},
+        "ratio": {"$ref": "#/definitions/positive", "type": "string"},
+        "kind": {"enum": ["x", 1, None, [True]]},
+        "flag": {"const": False},
+        "tags": {
+            "type": "array",
+            "items": [{"type": "string"}],
+            "additionalItems": {"type": "number"},
+            "minItems": 1,
+            "maxItems": 3,
+            "uniqueItems": True,
+            "contains": {"const": "a"},
+        },
+        "tree": {"$ref": "#/definitions/tree"},
+        "choice": {
+            "oneOf": [{"type": "string"}, {"maxLength": 2}],
+            "anyOf": [{"type": "string"}, {"type": "null"}],
+            "not": {"const": "forbidden"},
+        },
+        "conditional": {
+            "if": {"type": "string"},
+            "then": {"minLength": 2},
+            "else": {"type": "integer"},
+        },
+    },
+    "patternProperties": {"^x-": {"type": "boolean"}},
+    "additionalProperties": False,
+    "propertyNames": {"maxLength": 12},
+    "dependencies": {"count": ["name"], "ratio": {"required": ["count"]}},
+}
+
+_KEYWORD_TEST_INSTANCES = [
+    {"name": "ab"},
+    {"name": ""},
+    {"name": "abcdef"},
+    {"name": "ba"},
+    {},
+    [],
+    "a",
+    {"name": "a", "count": 4},
+    {"name": "a", "count": 4.0},
+    {"name": "a", "count": 3},
+    {"name": "a", "count": 12},
+    {"name": "a", "count": True},
+    {"name": "a", "ratio": 1, "count": 2},
+    {"name": "a", "ratio": 0, "count": 2},
+    {"name": "a", "ratio": 1},
+    {"name": "a", "kind": "x"},
+    {"name": "a", "kind": 1.0},
+    {"name": "a", "kind": True},
+    {"name": "a", "kind": None},
+    {"name": "a", "kind": [True]},
+    {"name": "a", "kind": [1]},
+    {"name": "a", "flag": False},
+    {"name": "a", "flag": 0},
+    {"name": "a", "tags": ["a"]},
+    {"name": "a", "tags": ["a", 1]},
+    {"name": "a", "tags": ["a", "b"]},
+    {"name": "a", "tags": [1, "a"]},
+    {"name": "a", "tags": ["b"]},
+    {"name": "a", "tags": ["a", 1, 1]},
+    {"name": "a", "tags": []},
+    {"name": "a", "tree": {"children": [{"children": []}]}},
+    {"name": "a", "tree": {"children": [{"children": "none"}]}},
+    {"name": "a", "choice": "abc"},
+    {"name": "a", "choice": "ab"},
+    {"name": "a", "choice": None},
+    {"name": "a", "choice": "forbidden"},
+    {"name": "a", "conditional": "ab"},
+    {"name": "a", "conditional": "a"},
+    {"name": "a", "conditional": 1},
+    {"name": "a", "conditional": 1.5},
+    {"name": "a", "x-test": True},
+    {"name": "a", "x-test": 1},
+    {"name": "a", "unknown": 1},
+    {"name": "a", "x-very-long-name": True},
+]
+
+
+@pytest.mark.parametrize("instance", _KEYWORD_TEST_INSTANCES)
+def test_compiled_validator_agrees_with_jsonschema(instance):
+    validator = Draft7Validator(_KEYWORD_TEST_SCHEMA)
+    is_valid = compile_validator(validator)
+
+    assert is_valid(instance) == validator.is_valid(instance)
+
+
+def test_compiled_validators_accept_examples():
+    for example_path, validator_name in [
+        ("examples/wot/example.td.jsonld", "td_validator"),
+        ("examples/wot/example.tm.jsonld", "tm_validator"),
+        ("examples/wot/example-with-placeholders.tm.jsonld", "tm_validator"),
+        ("examples/sdf/example.sdf.json", "sdf_validator"),
+        ("examples/sdf/example.sdf.json", "sdf_framework_validator"),
+    ]:
+        document = _load_example(example_path)
+        assert validation.get_fast_validator(validator_name)(document)
+
+
+def test_compiled_validation_error_messages():
+    invalid_thing_description = _load_example("examples/wot/example.td.jsonld")
+    del invalid_thing_description["security"]
+
+    assert not validation.get_fast_validator("td_validator")(invalid_thing_description)
+
+    with pytest.raises(ValidationError) as error:
+        validation.validate_thing_description(invalid_thing_description)
+
+    expected_error = next(
+        validation.get_validator("td_validator").iter_errors(invalid_thing_description)
+    )
+    assert error.value.message == expected_error.message
+
+
+def test_unsupported_schema_features():
+    with pytest.raises(SchemaCompilationError):
+        compile_validator(Draft7Validator({"$ref": "https://example.org/schema"}))
+
+    with pytest.raises(SchemaCompilationError):
+        compile_validator(
+            Draft7Validator({"format": "uri"}, format_checker=FormatChecker())
+        )
+
+
+@pytest.fixture
+def validation_cache():
+    validation.clear_validation_cache()
+    validation.set_validation_cache_size(DEFAULT_MAXSIZE)
+    yield
+    validation.set_validation_cache_size(0)
+    validation.clear_validation_cache()
+
+
+def test_validation_cache_is_disabled_by_default(monkeypatch):
+    def fail(document):
+        raise AssertionError("The digest of the document was computed")
+
+    monkeypatch.setattr(validation, "_validation_cache", None)
+    monkeypatch.setattr(validation_cache_module, "document_digest", fail)
+    validation.validate_thing_description(
+        _load_example("examples/wot/example.td.jsonld")
+    )
+    assert validation.validation_cache_info().misses == 0
+
+
+def test_validation_cache_hits(validation_cache):
+    thing_description = _load_example("examples/wot/example.td.jsonld")
+
+    validation.validate_thing_description(thing_description)
+    validation.validate_thing_description(dict(reversed(thing_description.items())))
+    with pytest.raises(ValidationError):
+        validation.validate_sdf_model(thing_description)
+
+    cache_info = validation.validation_cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 2
+    assert cache_info.currsize == 1
+
+
+def test_validation_cache_detects_modifications(validation_cache):
+    thing_description = _load_example("examples/wot/example.td.jsonld")
+    validation.validate_thing_description(thing_description)
+
+    del thing_description["security"]
+    with pytest.raises(ValidationError):
+        validation.validate_thing_description(thing_description)
+
+    with pytest.raises(ValidationError):
+        validation.validate_thing_description(thing_description)
+
+    assert validation.validation_cache_info().hits == 0
+
+
+def test_validation_cache_size(validation_cache):
+    validation.set_validation_cache_size(2)
+    documents = [_load_example("examples/wot/example.td.jsonld") for _ in range(3)]
+    for index, document in enumerate(documents):
+        document["title"] = f"Thing {index}"
+        validation.validate_thing_description(document)
+
+    validation.validate_thing_description(documents[0])
+    assert validation.validation_cache_info() == (0, 4, 2, 2)
+
+    validation.validate_thing_description(documents[2])
+    assert validation.validation_cache_info().hits == 1
+
+    validation.set_validation_cache_size(0)
+    validation.validate_thing_description(documents[2])
+    assert validation.validation_cache_info() == (1, 4, 0, 0)
+
+
+def test_repeated_conversions_use_validation_cache(validation_cache):
+    sdf_model = _load_example("examples/sdf/example.sdf.json")
+    mapping_file = _load_example("examples/sdf/example.sdf-mapping.json")
+
+    convert_sdf_to_wot_td(sdf_model, sdf_mapping_files=[mapping_file])
+    first_run = validation.validation_cache_info()
+    convert_sdf_to_wot_td(sdf_model, sdf_mapping_files=[mapping_file])
+    second_run = validation.validation_cache_info()
+
+    # SDF model, SDF framework, two TMs, and two TDs
+    assert first_run.hits == 0
+    assert first_run.misses == 6
+    assert second_run.hits == 6
+    assert second_run.misses == 6
+
+
+@pytest.mark.parametrize(
+    "one,other",
+    [
+        ({"value": 1}, {"value": 1.0}),
+        ({"value": 1}, {"value": True}),
+        ({"value": None}, {"value": float("nan")}),
+        ({"value": None}, {"value": float("inf")}),
+        ({"value": "null"}, {"value": None}),
+        ({"value": 2**70}, {"value": 2**70 + 1}),
+    ],
+)
+def test_document_digests_distinguish_values(one, other):
+    assert document_digest(one) != document_digest(other)
+    assert document_digest(one) == document_digest(json.loads(json.dumps(one)))
+
+
+@pytest.mark.skipif(validation_cache_module.orjson is None, reason="needs orjson")
+def test_document_digests_serialize_null_once(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("The document was serialized with json")
+
+    monkeypatch.setattr(validation_cache_module.json, "dumps", fail)
+    document_digest({"type": "null", "value": None})
+
+
+def _invalid_thing_description():
+    thing_description = _load_example("examples/wot/example.td.jsonld")
+    del thing_description["security"]
+    del thing_description["properties"]["status"]["forms"]
+    thing_description["properties"]["brightness"] = {
+        "type": "integer",
+        "readOnly": "yes",
+        "forms": [{"href": "https://mylamp.example.com/brightness"}],
+    }
+    thing_description["actions"]["fade/in"] = {
+        "input": {"type": "duration"},
+        "forms": [{"href": "https://mylamp.example.com/fade"}],
+    }
+    return thing_description
+
+
+def test_fragment_validation_of_valid_documents():
+    thing_description = _load_example("examples/wot/example.td.jsonld")
+    thing_model = _load_example("examples/wot/example.tm.jsonld")
+
+    assert validate_fragments(thing_description) == []
+    assert validate_fragments(thing_model, validator_name="tm_validator") == []
+
+
+def test_fragment_validation_errors():
+    errors = validate_fragments(_invalid_thing_description())
+
+    assert [(error.pointer, error.keyword) for error in errors] == [
+        ("", "required"),
+        ("/properties/status", "required"),
+        ("/properties/brightness/readOnly", "type"),
+        ("/actions/fade~1in/input/type", "enum"),
+    ]
+    assert errors[0].message == "'security' is a required property"
+
+
+def test_fragment_validation_early_exit():
+    thing_description = _invalid_thing_description()
+
+    assert validate_fragments(thing_description, max_errors=1) == [
+        ("", "'security' is a required property", "required")
+    ]
+
+    thing_description["security"] = "basic_sc"
+    errors = validate_fragments(thing_description, max_errors=2)
+    assert [error.pointer for error in errors] == [
+        "/properties/status",
+        "/properties/brightness/readOnly",
+    ]
+
+
+def test_parallel_fragment_validation():
+    thing_description = _invalid_thing_description()
+
+    assert validate_fragments(
+        thing_description, chunk_size=1, workers=2
+    ) == validate_fragments(thing_description)
+    assert len(validate_fragments(thing_description, max_errors=3, workers=2)) == 3
+
+
+def test_single_fragment_validation():
+    validate_fragment("td_validator", "dataSchema", {"type": "string"})
+
+    with pytest.raises(ValidationError):
+        validate_fragment("td_validator", "dataSchema", {"type": "duration"})
+
+    with pytest.raises(UnsupportedFragmentError):
+        validate_fragment("sdf_validator", "property_element", {})